@@ -1,7 +1,6 @@
 """Checks for various circumstances."""
 from __future__ import annotations
 
-import asyncio
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from logging import debug, info
@@ -9,12 +8,13 @@ from pathlib import Path
 
 from pydantic import HttpUrl
 
+from repod.action.trace import trace
 from repod.common.enums import ActionStateEnum, ArchitectureEnum, PkgTypeEnum
 from repod.config.settings import UrlValidationSettings
 from repod.errors import RepoManagementFileError
 from repod.files import Package
 from repod.files.pkginfo import PkgInfoV2, PkgType
-from repod.repo.management import OutputPackageBase
+from repod.repo.management import ManagementRepoIndex, OutputPackageBase
 from repod.repo.package.repofile import filename_parts
 from repod.verification import PacmanKeyVerifier
 from repod.version.alpm import pkg_vercmp
@@ -50,6 +50,30 @@ class Check(ABC):
         """
         pass
 
+    def run(self) -> ActionStateEnum:
+        """Call the Check and trace it, if a Tracer is set (see repod.action.trace).
+
+        Returns
+        -------
+        ActionStateEnum
+            ActionStateEnum.SUCCESS if the check passed successfully,
+            ActionStateEnum.FAILED otherwise
+        """
+        with trace(action=self, category="check"):
+            return self()
+
+    def item_count(self) -> int | None:
+        """Return the number of items (e.g. packages or pkgbases) checked by the Check.
+
+        The item count is recorded when tracing the Check. Checks of countable items should override this method.
+
+        Returns
+        -------
+        int | None
+            The number of items checked by the Check, or None if the Check does not check countable items
+        """
+        return None
+
 
 class PacmanKeyPackagesSignatureVerificationCheck(Check):
     """Verify a list of package signatures using pacman-key.
@@ -73,6 +97,16 @@ class PacmanKeyPackagesSignatureVerificationCheck(Check):
         """
         self.packages = packages
 
+    def item_count(self) -> int:
+        """Return the number of packages verified by the Check.
+
+        Returns
+        -------
+        int
+            The number of packages verified by the Check
+        """
+        return len(self.packages)
+
     def __call__(self) -> ActionStateEnum:
         """Use an instance of PacmanKeyVerifier to verify a package and its signature.
 
@@ -338,31 +372,21 @@ class PkgbasesVersionUpdateCheck(Check):
 
         debug("Running check to test whether all pkgbases are being upgraded, not downgraded...")
 
-        current_names_versions = [
-            {"name": c_pkgbase.base, "version": c_pkgbase.version}  # type: ignore[attr-defined]
-            for c_pkgbase in self.current_pkgbases
-        ]
+        current_versions: dict[str, str] = {}
+        for c_pkgbase in self.current_pkgbases:
+            current_versions.setdefault(c_pkgbase.base, str(c_pkgbase.version))  # type: ignore[attr-defined]
 
         for pkgbase in self.new_pkgbases:
             name = pkgbase.base  # type: ignore[attr-defined]
             version = pkgbase.version  # type: ignore[attr-defined]
-            if name in [c_dict.get("name") for c_dict in current_names_versions]:
-                c_version = [
-                    str(c_dict.get("version")) for c_dict in current_names_versions if str(c_dict.get("name")) == name
-                ][0]
-                if (
-                    pkg_vercmp(
-                        c_version,
-                        version,
-                    )
-                    >= 0
-                ):
-                    info(
-                        f"The version of {name} currently "
-                        f"in the repository is newer than the provided one: {c_version} vs. {version}"
-                    )
-                    self.state = ActionStateEnum.FAILED
-                    return self.state
+            c_version = current_versions.get(name)
+            if c_version is not None and pkg_vercmp(c_version, version) >= 0:
+                info(
+                    f"The version of {name} currently "
+                    f"in the repository is newer than the provided one: {c_version} vs. {version}"
+                )
+                self.state = ActionStateEnum.FAILED
+                return self.state
 
         self.state = ActionStateEnum.SUCCESS
         return self.state
@@ -379,6 +403,8 @@ class PackagesNewOrUpdatedCheck(Check):
         A list of updated OutputPackageBase instances
     current_pkgbases: list[OutputPackageBase]
         A list of current OutputPackageBase instances
+    index: ManagementRepoIndex
+        A ManagementRepoIndex used for looking up packages in directory
     """
 
     def __init__(
@@ -386,6 +412,7 @@ class PackagesNewOrUpdatedCheck(Check):
         directory: Path,
         new_pkgbases: list[OutputPackageBase],
         current_pkgbases: list[OutputPackageBase],
+        index: ManagementRepoIndex | None = None,
     ) -> None:
         """Initialize an instance of PackagesNewOrUpdatedCheck.
 
@@ -397,10 +424,14 @@ class PackagesNewOrUpdatedCheck(Check):
             A list of updated OutputPackageBase instances
         current_pkgbases: list[OutputPackageBase]
             A list of current OutputPackageBase instances
+        index: ManagementRepoIndex | None
+            An optional ManagementRepoIndex shared with other Tasks and Checks (defaults to None, which creates a new
+            one)
         """
         self.directory = directory
         self.new_pkgbases = new_pkgbases
         self.current_pkgbases = current_pkgbases
+        self.index = index or ManagementRepoIndex()
 
     def __call__(self) -> ActionStateEnum:
         """Check, that packages are new or updated.
@@ -415,60 +446,39 @@ class PackagesNewOrUpdatedCheck(Check):
 
         debug("Running check to test that all packages are either new or updated...")
 
-        current_pkgbases = [
-            {
-                "name": c_pkgbase.base,  # type: ignore[attr-defined]
-                "packages": [pkg.name for pkg in c_pkgbase.packages],  # type: ignore[attr-defined]
-                "version": c_pkgbase.version,  # type: ignore[attr-defined]
-            }
-            for c_pkgbase in self.current_pkgbases
-        ]
-        new_pkgbases = [
-            {
-                "name": pkgbase.base,  # type: ignore[attr-defined]
-                "packages": [pkg.name for pkg in pkgbase.packages],  # type: ignore[attr-defined]
-                "version": pkgbase.version,  # type: ignore[attr-defined]
-            }
-            for pkgbase in self.new_pkgbases
-        ]
-
-        for pkgbase in new_pkgbases:
-            target_pkgbase_file = self.directory / Path(str(pkgbase.get("name")) + ".json")
-
-            for package in pkgbase.get("packages", []):
-                target_package_file = self.directory / "pkgnames" / Path(package + ".json")
-                target_package_pkgbase = target_package_file.resolve().name.replace(".json", "")
-                original_pkgbase_in_new_pkgbases = any(
-                    True for pkgbase in new_pkgbases if pkgbase.get("name") == target_package_pkgbase
-                )
-                original_pkgbase_provides_package = any(
-                    [
-                        True
-                        for pkgbase in new_pkgbases
-                        if pkgbase.get("name") == target_package_pkgbase and package in str(pkgbase.get("packages"))
-                    ]
-                )
+        current_names = {c_pkgbase.base for c_pkgbase in self.current_pkgbases}  # type: ignore[attr-defined]
+        new_packages: dict[str, set[str]] = defaultdict(set)
+        for pkgbase in self.new_pkgbases:
+            new_packages[pkgbase.base].update(pkg.name for pkg in pkgbase.packages)  # type: ignore[attr-defined]
+
+        for pkgbase in self.new_pkgbases:
+            name = pkgbase.base  # type: ignore[attr-defined]
+            target_pkgbase_file = self.directory / f"{name}.json"
+
+            for package in (pkg.name for pkg in pkgbase.packages):  # type: ignore[attr-defined]
+                target_package_file = self.index.get_package_target(directory=self.directory, name=package)
+                # the package is new or remains in the same pkgbase
+                if not target_package_file or target_package_file == target_pkgbase_file:
+                    continue
+
+                target_package_pkgbase = target_package_file.stem
 
                 # the pkgbase of the new package does not match an existing pkgbase (in current_pkgbases or
                 # new_pkgbases), but a file exists and provides a version newer than the one added
-                if (
-                    target_package_file.is_symlink()
-                    and target_package_file.resolve() != target_pkgbase_file
-                    and pkgbase.get("name") not in [pkgbase.get("name") for pkgbase in current_pkgbases]
-                ):
+                if name not in current_names:
                     try:
-                        old_pkgbase = asyncio.run(OutputPackageBase.from_file(target_package_file.resolve()))
+                        old_pkgbase = self.index.read_pkgbase(path=target_package_file)
                     except RepoManagementFileError as e:
                         info(e)
                         self.state = ActionStateEnum.FAILED
                         return self.state
 
                     old_version = old_pkgbase.get_version()
-                    new_version = str(pkgbase.get("version"))
+                    new_version = str(pkgbase.version)  # type: ignore[attr-defined]
 
                     if pkg_vercmp(old_version, new_version) >= 0:
                         info(
-                            f"The version of the added {package} (provided by pkgbase {pkgbase.get('name')}) "
+                            f"The version of the added {package} (provided by pkgbase {name}) "
                             "is newer or equal to the one already in the repository (provided by pkgbase "
                             f"{target_package_pkgbase}): {old_version} (old) vs. {new_version} (new)"
                         )
@@ -477,18 +487,11 @@ class PackagesNewOrUpdatedCheck(Check):
 
                 # the pkgbase of the new package does not match an existing pkgbase and the update also does not
                 # remove the package from the previous pkgbase
-                if (
-                    target_package_file.is_symlink()
-                    and target_package_file.resolve() != target_pkgbase_file
-                    and (
-                        not original_pkgbase_in_new_pkgbases
-                        or (original_pkgbase_in_new_pkgbases and original_pkgbase_provides_package)
-                    )
-                ):
+                if target_package_pkgbase not in new_packages or package in new_packages[target_package_pkgbase]:
                     info(
                         f"The package {package} is currently provided by "
                         f"pkgbase {target_package_pkgbase}, but the new pkgbase "
-                        f"{pkgbase.get('name')} now tries to provide it, "
+                        f"{name} now tries to provide it, "
                         f"without removing the package from the pkgbase {target_package_pkgbase}."
                     )
                     self.state = ActionStateEnum.FAILED
@@ -726,6 +729,8 @@ class UniqueInRepoGroupCheck(Check):
         A list of packages to look for in the management repository directories contained in repo_management_dirs
     repo_management_dirs: dict[Path, list[Path]]
         A dict describing a repository name and all of its management repository directories
+    index: ManagementRepoIndex
+        A ManagementRepoIndex used for looking up pkgbases and packages in the management repository directories
     """
 
     def __init__(
@@ -733,6 +738,7 @@ class UniqueInRepoGroupCheck(Check):
         pkgbase_names: list[str],
         package_names: list[str],
         repo_management_dirs: dict[Path, list[Path]],
+        index: ManagementRepoIndex | None = None,
     ) -> None:
         """Initialize an instance of UniqueInRepoGroupCheck.
 
@@ -744,10 +750,14 @@ class UniqueInRepoGroupCheck(Check):
             A list of packages to look for in the management repository directories contained in repo_management_dirs
         repo_management_dirs: dict[Path, list[Path]]
             A dict describing a repository name and all of its management repository directories
+        index: ManagementRepoIndex | None
+            An optional ManagementRepoIndex shared with other Tasks and Checks (defaults to None, which creates a new
+            one)
         """
         self.pkgbase_names = pkgbase_names
         self.package_names = package_names
         self.repo_management_dirs = repo_management_dirs
+        self.index = index or ManagementRepoIndex()
 
     def __call__(self) -> ActionStateEnum:
         """Check, that lists of pkgbase and package names are unique among a group of management repository directories.
@@ -766,15 +776,11 @@ class UniqueInRepoGroupCheck(Check):
         for repo, management_dirs in self.repo_management_dirs.items():
             for management_dir in management_dirs:
                 for pkgbase in self.pkgbase_names:
-                    file = management_dir / f"{pkgbase}.json"
-                    tmp_file = management_dir / f"{pkgbase}.json.tmp"
-                    if file.exists() or tmp_file.exists():
+                    if self.index.has_pkgbase(directory=management_dir, name=pkgbase, with_tmp=True):
                         existing_pkgbases[str(repo)].append(pkgbase)
 
                 for package in self.package_names:
-                    file = management_dir / "pkgnames" / f"{package}.json"
-                    tmp_file = management_dir / "pkgnames" / f"{package}.json.tmp"
-                    if file.exists() or tmp_file.exists():
+                    if self.index.has_package(directory=management_dir, name=package, with_tmp=True):
                         existing_packages[str(repo)].append(package)
 
         self.state = ActionStateEnum.SUCCESS
@@ -0,0 +1,196 @@
+"""Executors for running Tasks and their dependencies."""
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from logging import debug, info
+
+from repod.action.task import Task
+from repod.common.enums import ActionStateEnum
+from repod.errors import TaskError
+
+
+class TaskExecutor:
+    """An executor, that runs a Task and all of its (transitive) dependency Tasks concurrently.
+
+    The dependency graph is derived from the dependencies of each Task. Each Task in the graph is run exactly once, in
+    a pool of worker threads, as soon as all of its dependency Tasks have been run successfully. Tasks, that do not
+    depend on each other (directly or indirectly), may run at the same time. Pre and post checks of a Task are run
+    together with the Task (see Task.run()).
+
+    If any Task fails, no further Tasks are started and all Tasks depending on a failed Task are set to
+    ActionStateEnum.FAILED_DEPENDENCY (analogous to calling the Task directly).
+
+    Tasks, that rely on other Tasks having been run before them, must list them in their dependencies, as the order of
+    dependencies only defines the order in which independent Tasks are started, but not in which they finish.
+
+    Attributes
+    ----------
+    task: Task
+        The Task to run
+    workers: int | None
+        The optional maximum number of worker threads (defaults to None, which uses the default of ThreadPoolExecutor)
+    tasks: list[Task]
+        All Tasks of the dependency graph of task in topological order (dependencies before the Tasks depending on
+        them), with task being the last item
+    dependents: dict[Task, list[Task]]
+        A dict of each Task in tasks and the Tasks that directly depend on it
+    """
+
+    def __init__(self, task: Task, workers: int | None = None):
+        """Initialize an instance of TaskExecutor.
+
+        Parameters
+        ----------
+        task: Task
+            The Task to run
+        workers: int | None
+            The optional maximum number of worker threads (defaults to None, which uses the default of
+            ThreadPoolExecutor)
+
+        Raises
+        ------
+        TaskError
+            If the dependency graph of task contains a cycle
+        """
+        self.task = task
+        self.workers = workers
+        self.tasks: list[Task] = []
+        self.dependents: dict[Task, list[Task]] = {}
+
+        visiting: set[Task] = set()
+
+        def visit(current: Task) -> None:
+            if current in self.dependents:
+                return
+            if current in visiting:
+                raise TaskError(f"The dependencies of Task {current} contain a cycle!")
+
+            visiting.add(current)
+            for dependency in current.dependencies:
+                visit(dependency)
+                if current not in self.dependents[dependency]:
+                    self.dependents[dependency].append(current)
+            visiting.remove(current)
+
+            self.dependents[current] = []
+            self.tasks.append(current)
+
+        visit(task)
+
+    def __call__(self) -> ActionStateEnum:
+        """Run all Tasks of the dependency graph.
+
+        Returns
+        -------
+        ActionStateEnum
+            The state of task: ActionStateEnum.SUCCESS if all Tasks ran successfully, ActionStateEnum.FAILED_DEPENDENCY
+            if any of its (transitive) dependency Tasks failed, or the state of task if it failed itself
+        """
+        debug(f"Running {len(self.tasks)} Tasks of {self.task}...")
+
+        started = self.run_tasks()
+        self.fail_dependents(started=started)
+
+        return self.task.state
+
+    def run_tasks(self) -> set[Task]:
+        """Run the Tasks of the dependency graph in a pool of worker threads.
+
+        Each Task is started as soon as all of its dependency Tasks have been run successfully. Once any Task failed, no
+        further Tasks are started.
+
+        Returns
+        -------
+        set[Task]
+            The Tasks that have been started
+        """
+        remaining = {task: len(set(task.dependencies)) for task in self.tasks}
+        failed = False
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(task.run): task for task in self.tasks if remaining[task] == 0}
+            started = set(futures.values())
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = futures.pop(future)
+                    if future.result() != ActionStateEnum.SUCCESS:
+                        info(f"Task {task} failed with state {task.state}!")
+                        failed = True
+                        continue
+
+                    for dependent in self.get_ready_dependents(task=task, remaining=remaining):
+                        if not failed:
+                            started.add(dependent)
+                            futures[executor.submit(dependent.run)] = dependent
+
+        return started
+
+    def get_ready_dependents(self, task: Task, remaining: dict[Task, int]) -> list[Task]:
+        """Mark a Task as run successfully for the Tasks depending on it and return those, that are ready to run.
+
+        Parameters
+        ----------
+        task: Task
+            A Task that has been run successfully
+        remaining: dict[Task, int]
+            A dict of each Task and the number of its dependency Tasks, that have not been run successfully yet (the
+            numbers of the Tasks depending on task are decreased)
+
+        Returns
+        -------
+        list[Task]
+            The Tasks depending on task, that have no remaining dependency Tasks
+        """
+        ready = []
+        for dependent in self.dependents[task]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+        return ready
+
+    def fail_dependents(self, started: set[Task]) -> None:
+        """Set the state of Tasks, that have not been started due to a failed dependency Task, to FAILED_DEPENDENCY.
+
+        Parameters
+        ----------
+        started: set[Task]
+            The Tasks that have been started
+        """
+        for task in self.tasks:
+            if task not in started and any(
+                dependency.state != ActionStateEnum.SUCCESS for dependency in task.dependencies
+            ):
+                task.state = ActionStateEnum.FAILED_DEPENDENCY
+
+    def undo(self) -> ActionStateEnum:
+        """Undo all Tasks of the dependency graph in reverse topological order.
+
+        Each Task is undone exactly once and after all Tasks depending on it have been undone.
+
+        Returns
+        -------
+        ActionStateEnum
+            The state of task after undoing it: ActionStateEnum.NOT_STARTED if undoing all Tasks is successful,
+            ActionStateEnum.FAILED_UNDO_DEPENDENCY if undoing of any of its (transitive) dependency Tasks failed,
+            ActionStateEnum.FAILED_UNDO_TASK if undoing task failed
+        """
+        dependencies_undone = True
+
+        for task in reversed(self.tasks):
+            task.undo_dependencies = False
+            try:
+                state = task.undo()
+            finally:
+                task.undo_dependencies = True
+
+            if task is not self.task and state != ActionStateEnum.NOT_STARTED:
+                info(f"Undoing Task {task} failed with state {state}!")
+                dependencies_undone = False
+
+        if not dependencies_undone and self.task.state == ActionStateEnum.NOT_STARTED:
+            self.task.state = ActionStateEnum.FAILED_UNDO_DEPENDENCY
+
+        return self.task.state
@@ -4,12 +4,14 @@ from __future__ import annotations
 import asyncio
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import groupby
 from logging import debug, info
+from multiprocessing import get_context
 from operator import attrgetter
 from pathlib import Path
 from re import sub
-from shutil import copy2
+from tarfile import ReadError
 
 from orjson import JSONEncodeError, dumps
 from pydantic import AnyUrl, BaseModel, ValidationError, validator
@@ -27,11 +29,14 @@ from repod.action.check import (
     StabilityLayerCheck,
     UniqueInRepoGroupCheck,
 )
+from repod.action.trace import trace
 from repod.archive.archive import CopySourceDestination
+from repod.archive.index import ArchiveIndex
 from repod.common.enums import (
     ActionStateEnum,
     ArchitectureEnum,
     CompressionTypeEnum,
+    FilePlacementEnum,
     FilesVersionEnum,
     PackageDescVersionEnum,
     PkgVerificationTypeEnum,
@@ -39,29 +44,178 @@ from repod.common.enums import (
     RepoFileEnum,
     RepoTypeEnum,
 )
-from repod.common.models import FileName
+from repod.common.models import FileName, PkgName, PkgVer
 from repod.config import PackageRepo, SystemSettings, UserSettings
 from repod.config.defaults import ORJSON_OPTION
 from repod.config.settings import UrlValidationSettings
 from repod.errors import (
     RepoManagementFileError,
-    RepoManagementFileNotFoundError,
+    RepoManagementValidationError,
     TaskError,
 )
-from repod.files import Package
+from repod.files import Package, PackageCache
 from repod.files.buildinfo import Installed
-from repod.repo import OutputPackageBase, SyncDatabase
+from repod.files.common import place_file
+from repod.repo import (
+    ManagementRepoCatalog,
+    ManagementRepoIndex,
+    OutputPackageBase,
+    SyncDatabase,
+)
 from repod.repo.package import RepoDbTypeEnum, RepoFile
 from repod.repo.package.repofile import relative_to_shared_base
 
 
+def read_package_from_file(
+    package_paths: list[Path],
+    cache: PackageCache | None = None,
+    lazy_mtree: bool = False,
+) -> Package:
+    """Read a Package from a package file and its optional signature file.
+
+    This function is a synchronous wrapper around Package.from_file(), which can be used in worker processes.
+
+    Parameters
+    ----------
+    package_paths: list[Path]
+        A list of one (package file) or two (package file and signature file) Paths
+    cache: PackageCache | None
+        An optional PackageCache to use (defaults to None)
+    lazy_mtree: bool
+        Whether to parse the .MTREE file of the package file only on first access (defaults to False)
+
+    Raises
+    ------
+    RepoManagementFileError
+        If the package file (or its signature file) can not be read
+
+    Returns
+    -------
+    Package
+        A Package representing the metadata contained in the package file and the optional signature file
+    """
+    return asyncio.run(
+        Package.from_file(
+            package=package_paths[0],
+            signature=package_paths[1] if len(package_paths) == 2 else None,
+            cache=cache,
+            lazy_mtree=lazy_mtree,
+        )
+    )
+
+
+def read_packages_from_files(
+    package_paths: list[list[Path]],
+    workers: int | None = 1,
+    cache: PackageCache | None = None,
+    lazy_mtree: bool = False,
+) -> list[Package]:
+    """Read Packages from package files and their optional signature files, optionally using a process pool.
+
+    If workers is 1 (or only one package file is provided), the package files are read serially in the current process.
+    Otherwise they are read concurrently in a pool of worker processes, which are started using the forkserver start
+    method.
+    In both cases the Packages are returned in the order of package_paths and the errors of all failing package files
+    (including validation errors and failing worker processes) are reported.
+
+    Parameters
+    ----------
+    package_paths: list[list[Path]]
+        A list of lists of one (package file) or two (package file and signature file) Paths
+    workers: int | None
+        The number of worker processes to use (defaults to 1). If None, the number of CPUs is used
+    cache: PackageCache | None
+        An optional PackageCache to use (defaults to None)
+    lazy_mtree: bool
+        Whether to parse the .MTREE files of the package files only on first access (defaults to False)
+
+    Raises
+    ------
+    RepoManagementFileError
+        If any of the package files (or their signature files) can not be read or validated
+
+    Returns
+    -------
+    list[Package]
+        A list of Packages in the order of package_paths
+    """
+    results: list[Package | Exception] = []
+
+    if workers == 1 or len(package_paths) < 2:
+        debug(f"Reading {len(package_paths)} package file(s) serially...")
+        for paths in package_paths:
+            try:
+                results.append(read_package_from_file(package_paths=paths, cache=cache, lazy_mtree=lazy_mtree))
+            except Exception as e:
+                results.append(e)
+    else:
+        debug(f"Reading {len(package_paths)} package files using {workers or 'all available'} worker processes...")
+        # NOTE: Tasks may run in threads of an executor, so worker processes are not forked from the (multithreaded)
+        # current process, but started from a single-threaded fork server
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("forkserver")) as executor:
+            futures = [executor.submit(read_package_from_file, paths, cache, lazy_mtree) for paths in package_paths]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                # NOTE: errors of single package files (e.g. ValidationError) and of the pool (e.g. BrokenProcessPool)
+                # are collected, so that they are reported with the respective package file
+                except Exception as e:
+                    results.append(e)
+
+    errors = [
+        f"{paths[0]}: {result}" for paths, result in zip(package_paths, results) if not isinstance(result, Package)
+    ]
+    if errors:
+        raise RepoManagementFileError(
+            f"An error occured while reading {len(errors)} of {len(package_paths)} package files!\n" + "\n".join(errors)
+        )
+
+    return results  # type: ignore[return-value]
+
+
+def get_build_requirements(
+    pkgbases: list[OutputPackageBase],
+) -> dict[str, tuple[PkgName, PkgVer, ArchitectureEnum]]:
+    """Return the unique build requirements of a list of OutputPackageBases.
+
+    Split packages and rebuilds of several pkgbases share most of their build requirements, which are therefore only
+    validated once.
+
+    Parameters
+    ----------
+    pkgbases: list[OutputPackageBase]
+        A list of OutputPackageBase instances for which to return build requirements
+
+    Raises
+    ------
+    ValidationError
+        If any of the build requirements can not be validated
+
+    Returns
+    -------
+    dict[str, tuple[PkgName, PkgVer, ArchitectureEnum]]
+        A dict of "name-version-architecture" strings of all build requirements and their models
+    """
+    requirements = sorted(
+        {
+            requirement
+            for pkgbase in pkgbases
+            for requirement in pkgbase.buildinfo.installed  # type: ignore[attr-defined]
+        }
+    )
+    return dict(zip(requirements, Installed.as_models(requirements)))
+
+
 def read_build_requirements_from_archive_dir(
     pkgbases: list[OutputPackageBase],
     archive_dir: Path | None,
     pkgs_in_archive: set[str],
+    archive_index: ArchiveIndex | None = None,
 ) -> None:
     """Read build requirements of a list of OutputPackageBases from an archive directory.
 
+    If archive_index has been built, build requirements are looked up in it instead of in archive_dir.
+
     Parameters
     ----------
     pkgbases: list[OutputPackageBase]
@@ -70,31 +224,46 @@ def read_build_requirements_from_archive_dir(
         An optional archive directory, from which to read package information
     pkgs_in_archive: set[str]
         A set of strings to which matching build requirements in the archive are appended
+    archive_index: ArchiveIndex | None
+        An optional ArchiveIndex of archive_dir (defaults to None)
+
+    Raises
+    ------
+    TaskError
+        If a package file in archive_dir has an invalid file name
+        or if archive_index can not be queried
     """
     if not archive_dir:
         return
 
-    for pkgbase in pkgbases:
-        for pkgname, pkgver, architecture in Installed.as_models(
-            pkgbase.buildinfo.installed  # type: ignore[attr-defined]
-        ):
-            requirement = f"{pkgname.pkgname}-{pkgver.pkgver}-{architecture.value}"
-            if requirement not in pkgs_in_archive:
-                pkg_archive_dir = archive_dir / pkgname.pkgname[0] / pkgname.pkgname
-                paths = [path for path in pkg_archive_dir.glob(f"{requirement}*") if path.suffix != ".sig"]
-                if len(paths) == 1:
-                    try:
-                        FileName(filename=paths[0].name)
-                    except ValidationError as e:
-                        raise TaskError(e)
+    requirements = get_build_requirements(pkgbases=pkgbases)
 
-                    pkgs_in_archive.add(requirement)
+    if archive_index and archive_index.exists():
+        debug(f"Looking up build requirements in archive index {archive_index.path}...")
+        try:
+            pkgs_in_archive.update(archive_index.get_requirements(requirements=requirements))
+        except RepoManagementFileError as e:
+            raise TaskError(e)
+        return
+
+    for requirement, (pkgname, _, _) in requirements.items():
+        if requirement not in pkgs_in_archive:
+            pkg_archive_dir = archive_dir / pkgname.pkgname[0] / pkgname.pkgname
+            paths = [path for path in pkg_archive_dir.glob(f"{requirement}*") if path.suffix != ".sig"]
+            if len(paths) == 1:
+                try:
+                    FileName(filename=paths[0].name)
+                except ValidationError as e:
+                    raise TaskError(e)
+
+                pkgs_in_archive.add(requirement)
 
 
 def read_build_requirements_from_management_repo_dirs(
     pkgbases: list[OutputPackageBase],
     management_directories: list[Path],
     pkgs_in_repo: set[str],
+    index: ManagementRepoIndex | None = None,
 ) -> None:
     """Read build requirements of a list of OutputPackageBases from management repository directories.
 
@@ -106,45 +275,36 @@ def read_build_requirements_from_management_repo_dirs(
         A list of management repository directories, from which to read package information
     pkgs_in_repo: set[str]
         A set of strings to which matching build requirements in the management repository directories are appended
+    index: ManagementRepoIndex | None
+        An optional ManagementRepoIndex of the management repository directories (defaults to None, which creates a
+        new one)
 
     Raises
     ------
     TaskError
         If an error occurs while reading a file from the management repository directories
     """
-    for pkgbase in pkgbases:
-        for pkgname, pkgver, architecture in Installed.as_models(
-            pkgbase.buildinfo.installed  # type: ignore[attr-defined]
-        ):
-            requirement = f"{pkgname.pkgname}-{pkgver.pkgver}-{architecture.value}"
-            if requirement not in pkgs_in_repo:
-                for directory in management_directories:
-                    debug(
-                        f"Searching for {pkgbase.base}'s build requirement "  # type: ignore[attr-defined]
-                        f"{requirement} in management repository directory {directory}..."
-                    )
-                    file = directory / "pkgnames" / f"{pkgname.pkgname}.json"
-                    if file.exists():
-                        try:
-                            current_pkgbase = asyncio.run(OutputPackageBase.from_file(path=file))
-                        except RepoManagementFileError as e:
-                            raise TaskError(e)
-
-                        current_pkg_arch = [
-                            ArchitectureEnum(pkg.arch)
-                            for pkg in current_pkgbase.packages  # type: ignore[attr-defined]
-                            if pkg.name == pkgname.pkgname
-                        ][0]
-                        debug(
-                            f"Found {pkgname.pkgname}-"
-                            f"{current_pkgbase.version}-{current_pkg_arch}..."  # type: ignore[attr-defined]
-                        )
-
-                        if (
-                            current_pkgbase.version == pkgver.pkgver  # type: ignore[attr-defined]
-                            and current_pkg_arch == architecture
-                        ):
-                            pkgs_in_repo.add(requirement)
+    index = index or ManagementRepoIndex()
+    requirements = get_build_requirements(pkgbases=pkgbases)
+    debug(
+        f"Searching for {len(requirements)} unique build requirements of {len(pkgbases)} pkgbases in management "
+        f"repository directories {', '.join(str(directory) for directory in management_directories)}..."
+    )
+
+    for requirement, (pkgname, pkgver, architecture) in requirements.items():
+        if requirement in pkgs_in_repo:
+            continue
+
+        for directory in management_directories:
+            try:
+                version = index.get_package_version(directory=directory, package=pkgname.pkgname)
+            except RepoManagementFileError as e:
+                raise TaskError(e)
+
+            if version == (pkgver.pkgver, architecture.value):
+                debug(f"Found {requirement} in management repository directory {directory}...")
+                pkgs_in_repo.add(requirement)
+                break
 
 
 def read_pkgbases_from_stability_layers(
@@ -156,6 +316,7 @@ def read_pkgbases_from_stability_layers(
     current_package_names: list[str],
     pkgbases_above: list[OutputPackageBase],
     pkgbases_below: list[OutputPackageBase],
+    index: ManagementRepoIndex | None = None,
 ) -> None:
     """Read the pkgbases from all available stability layers.
 
@@ -178,16 +339,19 @@ def read_pkgbases_from_stability_layers(
         A list of OutputPackageBase objects to which to append the objects read from the layers above the default
     pkgbases_below: list[OutputPackageBase]
         A list of OutputPackageBase objects to which to append the objects read from the layers below the default
+    index: ManagementRepoIndex | None
+        An optional ManagementRepoIndex of the management repository directories (defaults to None, which creates a
+        new one)
 
     Raises
     ------
     RepoManagementFileError
         If OutputPackageBase.from_file raises
     """
+    index = index or ManagementRepoIndex()
     for name in pkgbase_names:
-        current_pkgbase_file = directory / Path(name + ".json")
-        if current_pkgbase_file.exists():
-            current_pkgbase = asyncio.run(OutputPackageBase.from_file(current_pkgbase_file))
+        current_pkgbase = index.get_pkgbase(directory=directory, name=name)
+        if current_pkgbase:
             current_filenames += [
                 package.filename for package in current_pkgbase.packages  # type: ignore[attr-defined]
             ]
@@ -196,15 +360,11 @@ def read_pkgbases_from_stability_layers(
             ]
             current_pkgbases.append(current_pkgbase)
 
-        for path in stability_layer_dirs[0]:
-            path_above = path / Path(name + ".json")
-            if path_above.exists():
-                pkgbases_above.append(asyncio.run(OutputPackageBase.from_file(path_above)))
+        for path in index.find_pkgbase(directories=stability_layer_dirs[0], name=name):
+            pkgbases_above.append(index.read_pkgbase(path=path / f"{name}.json"))
 
-        for path in stability_layer_dirs[1]:
-            path_below = path / Path(name + ".json")
-            if path_below.exists():
-                pkgbases_below.append(asyncio.run(OutputPackageBase.from_file(path_below)))
+        for path in index.find_pkgbase(directories=stability_layer_dirs[1], name=name):
+            pkgbases_below.append(index.read_pkgbase(path=path / f"{name}.json"))
 
 
 class SourceDestination(BaseModel):
@@ -337,12 +497,16 @@ class Task(ABC):
     state: ActionStateEnum
         A member of ActionStateEnum indicating whether the Task is unstarted, started, failed, failed in any of the pre
         or post checks or successfully finished (defaults to ActionStateEnum.NOT_STARTED)
+    undo_dependencies: bool
+        A boolean value indicating whether dependency_undo() undoes the dependency Tasks (defaults to True). It is
+        unset by callers, that undo the dependency Tasks themselves (e.g. TaskExecutor)
     """
 
     dependencies: list[Task] = []
     pre_checks: list[Check] = []
     post_checks: list[Check] = []
     state: ActionStateEnum = ActionStateEnum.NOT_STARTED
+    undo_dependencies: bool = True
 
     def __call__(self) -> ActionStateEnum:  # pragma: no cover
         """Call a Task.
@@ -367,26 +531,47 @@ class Task(ABC):
                 self.state = ActionStateEnum.FAILED_DEPENDENCY
                 return self.state
 
-        if self.state == ActionStateEnum.SUCCESS:
-            return self.state
+        return self.run()
 
-        self.state = ActionStateEnum.STARTED
+    def run(self) -> ActionStateEnum:  # pragma: no cover
+        """Run a Task, whose dependency Tasks have already been run successfully.
 
-        for check in self.pre_checks:
-            if check() != ActionStateEnum.SUCCESS:
-                self.state = ActionStateEnum.FAILED_PRE_CHECK
-                return self.state
+        A Task is run in the following order:
+        - the Checks listed in pre_checks
+        - its own do() method
+        - the Checks listed in post_checks
 
-        if self.do() != ActionStateEnum.SUCCESS_TASK:
+        If a Tracer is set (see repod.action.trace), the Task (including its Checks) is traced.
+
+        Returns
+        -------
+        ActionStateEnum
+            ActionStateEnum.SUCCESS if the Task executed successfully (or is run again after running successfully)
+            ActionStateEnum.FAILED_PRE_CHECK if any of the Checks in pre_checks fails,
+            ActionStateEnum.FAILED_TASK if the do() method of the Task fails,
+            ActionStateEnum.FAILED_POST_CHECK if  any of the Checks in post_checks fails,
+        """
+        if self.state == ActionStateEnum.SUCCESS:
             return self.state
 
-        for check in self.post_checks:
-            if check() != ActionStateEnum.SUCCESS:
-                self.state = ActionStateEnum.FAILED_POST_CHECK
+        with trace(action=self, category="task"):
+            self.state = ActionStateEnum.STARTED
+
+            for check in self.pre_checks:
+                if check.run() != ActionStateEnum.SUCCESS:
+                    self.state = ActionStateEnum.FAILED_PRE_CHECK
+                    return self.state
+
+            if self.do() != ActionStateEnum.SUCCESS_TASK:
                 return self.state
 
-        self.state = ActionStateEnum.SUCCESS
-        return self.state
+            for check in self.post_checks:
+                if check.run() != ActionStateEnum.SUCCESS:
+                    self.state = ActionStateEnum.FAILED_POST_CHECK
+                    return self.state
+
+            self.state = ActionStateEnum.SUCCESS
+            return self.state
 
     @abstractmethod
     def do(self) -> ActionStateEnum:  # pragma: no cover
@@ -431,12 +616,27 @@ class Task(ABC):
             The ActionStateEnum member before calling the method,
             ActionStateEnum.FAILED_UNDO_DEPENDENCY if undoing of any of the dependency Tasks failed
         """
+        if not self.undo_dependencies:
+            return self.state
+
         for dependency in reversed(self.dependencies):
             if dependency.undo() != ActionStateEnum.NOT_STARTED:
                 self.state = ActionStateEnum.FAILED_UNDO_DEPENDENCY
 
         return self.state
 
+    def item_count(self) -> int | None:  # pragma: no cover
+        """Return the number of items (e.g. packages or files) processed by the Task.
+
+        The item count is recorded when tracing the Task. Tasks processing items should override this method.
+
+        Returns
+        -------
+        int | None
+            The number of items processed by the Task, or None if the Task does not process countable items
+        """
+        return None
+
     def is_done(self) -> bool:  # pragma: no cover
         """Return the done state of the Task as a boolean value.
 
@@ -465,6 +665,11 @@ class CreateOutputPackageBasesTask(Task):
         An optional dict, providing pkgbases and their source URLs (defaults to None)
     debug_repo: bool
         A boolean value indicating whether a debug repository is targetted
+    workers: int | None
+        The number of worker processes used for reading package files (1 reads them serially in the current process,
+        None uses the number of CPUs)
+    package_cache: PackageCache | None
+        An optional PackageCache used when reading package files
     """
 
     def __init__(
@@ -476,6 +681,8 @@ class CreateOutputPackageBasesTask(Task):
         pkgbase_urls: dict[str, AnyUrl] | None = None,
         package_verification: PkgVerificationTypeEnum | None = None,
         dependencies: list[Task] | None = None,
+        workers: int | None = 1,
+        package_cache: PackageCache | None = None,
     ):
         """Initialize an instance of CreateOutputPackageBasesTask.
 
@@ -496,6 +703,11 @@ class CreateOutputPackageBasesTask(Task):
             The type of package verification to be run against the package (defaults to None)
         dependencies: list[Task] | None
             An optional list of Task instances that are run before this task (defaults to None)
+        workers: int | None
+            The number of worker processes used for reading package files (defaults to 1, which reads them serially in
+            the current process). If None, the number of CPUs is used
+        package_cache: PackageCache | None
+            An optional PackageCache used when reading package files (defaults to None)
         """
         pre_checks: list[Check] = []
         post_checks: list[Check] = []
@@ -504,6 +716,8 @@ class CreateOutputPackageBasesTask(Task):
 
         self.architecture = architecture
         self.debug_repo = debug_repo
+        self.workers = workers
+        self.package_cache = package_cache
 
         if dependencies is not None:
             self.dependencies = dependencies
@@ -532,26 +746,23 @@ class CreateOutputPackageBasesTask(Task):
             ActionStateEnum.SUCCESS_TASK if the Task ran successfully,
             ActionStateEnum.FAILED_TASK otherwise.
         """
-        packages: list[Package] = []
-
         debug(f"Running Task to create a list of OutputPackageBase instances using {self.package_paths}...")
         self.state = ActionStateEnum.STARTED_TASK
 
-        packages_and_paths: list[tuple[Package, Path]] = []
-        for package_list in self.package_paths:
-            try:
-                package = asyncio.run(
-                    Package.from_file(
-                        package=package_list[0],
-                        signature=package_list[1] if len(package_list) == 2 else None,
-                    )
-                )
-                packages.append(package)
-                packages_and_paths.append((package, package_list[0]))
-            except RepoManagementFileError as e:
-                info(e)
-                self.state = ActionStateEnum.FAILED_TASK
-                return self.state
+        try:
+            # NOTE: only the paths of the files in the packages are used, so the .MTREE files are parsed lazily
+            packages = read_packages_from_files(
+                package_paths=self.package_paths,
+                workers=self.workers,
+                cache=self.package_cache,
+                lazy_mtree=True,
+            )
+        except RepoManagementFileError as e:
+            info(e)
+            self.state = ActionStateEnum.FAILED_TASK
+            return self.state
+
+        packages_and_paths = [(package, package_list[0]) for package, package_list in zip(packages, self.package_paths)]
 
         for key, group in groupby(packages, attrgetter("pkginfo.base")):
             debug(f"Create OutputPackageBase representing pkgbase {key}")
@@ -561,7 +772,7 @@ class CreateOutputPackageBasesTask(Task):
                     outputpackagebase.base,  # type: ignore[attr-defined]
                 )
                 self.pkgbases.append(outputpackagebase)
-            except (ValueError, RuntimeError) as e:
+            except (ValueError, RuntimeError, RepoManagementFileError, RepoManagementValidationError) as e:
                 info(e)
                 self.state = ActionStateEnum.FAILED_TASK
                 return self.state
@@ -573,6 +784,16 @@ class CreateOutputPackageBasesTask(Task):
         self.state = ActionStateEnum.SUCCESS_TASK
         return self.state
 
+    def item_count(self) -> int:
+        """Return the number of packages read by the Task.
+
+        Returns
+        -------
+        int
+            The number of packages read by the Task
+        """
+        return len(self.package_paths)
+
     def undo(self) -> ActionStateEnum:
         """Undo the creation of OutputPackageBase instances.
 
@@ -810,6 +1031,16 @@ class WriteOutputPackageBasesToTmpFileInDirTask(Task):
         self.state = ActionStateEnum.SUCCESS_TASK
         return self.state
 
+    def item_count(self) -> int:
+        """Return the number of pkgbases written by the Task.
+
+        Returns
+        -------
+        int
+            The number of pkgbases written by the Task
+        """
+        return len(self.pkgbases)
+
     def undo(self) -> ActionStateEnum:
         """Undo the writing of OutputPackageBase instances to temporary JSON files in a directory.
 
@@ -855,12 +1086,26 @@ class MoveTmpFilesTask(Task):
         A boolean value indicating whether input is derived from a dependency Task (defaults to False)
     dependencies: list[Task] | None
         An optional list of Task instances that are run before this task (defaults to None)
+    catalog: ManagementRepoCatalog | None
+        An optional ManagementRepoCatalog, which is updated with the pkgbases of a
+        WriteOutputPackageBasesToTmpFileInDirTask dependency (defaults to None)
+    catalog_updated: bool
+        A boolean value indicating whether catalog has been updated (defaults to False)
+    directory: Path | None
+        The management repository directory of the pkgbases of a WriteOutputPackageBasesToTmpFileInDirTask dependency
+        (defaults to None)
+    pkgbases: list[OutputPackageBase]
+        The pkgbases of a WriteOutputPackageBasesToTmpFileInDirTask dependency
+    file_placement: FilePlacementEnum
+        A member of FilePlacementEnum, which defines how backups of destinations are created
     """
 
     def __init__(
         self,
         paths: list[list[Path]] | None = None,
         dependencies: list[Task] | None = None,
+        catalog: ManagementRepoCatalog | None = None,
+        file_placement: FilePlacementEnum = FilePlacementEnum.COPY,
     ):
         """Initialize an instance of MoveTmpFilesTask.
 
@@ -874,9 +1119,22 @@ class MoveTmpFilesTask(Task):
             An optional list of Path lists which represent the source and destination for each file to be moved
         dependencies: list[Task] | None
             An optional list of Task instances that are run before this task (defaults to None)
+        catalog: ManagementRepoCatalog | None
+            An optional ManagementRepoCatalog, which is updated with the pkgbases of a
+            WriteOutputPackageBasesToTmpFileInDirTask dependency in the same transaction in which their files are moved
+            (defaults to None)
+        file_placement: FilePlacementEnum
+            A member of FilePlacementEnum, which defines how backups of destinations are created (defaults to
+            FilePlacementEnum.COPY). As destinations are replaced by moving files onto them, backups can safely be
+            created as hardlinks.
         """
         self.paths = []
         self.input_from_dependency = False
+        self.catalog = catalog
+        self.file_placement = file_placement
+        self.catalog_updated = False
+        self.directory: Path | None = None
+        self.pkgbases: list[OutputPackageBase] = []
 
         if dependencies is not None:
             self.dependencies = dependencies
@@ -936,6 +1194,9 @@ class MoveTmpFilesTask(Task):
                                 info(e)
                                 self.state = ActionStateEnum.FAILED_TASK
                                 return self.state
+                            if self.catalog:
+                                self.directory = dependency.directory
+                                self.pkgbases = dependency.pkgbases
                             break
                         case ActionStateEnum.SUCCESS if isinstance(dependency, WriteSyncDbsToTmpFilesInDirTask):
                             try:
@@ -965,26 +1226,71 @@ class MoveTmpFilesTask(Task):
 
         self.state = ActionStateEnum.STARTED_TASK
 
+        if not self.catalog or not self.directory:
+            self.state = ActionStateEnum.SUCCESS_TASK if self.move_files() else ActionStateEnum.FAILED_TASK
+            return self.state
+
+        debug(f"Updating management repository catalog {self.catalog.path} while moving files...")
+        moved = False
+        try:
+            with self.catalog.transaction() as connection:
+                self.catalog.write_pkgbases(connection=connection, directory=self.directory, pkgbases=self.pkgbases)
+                moved = self.move_files()
+                if not moved:
+                    raise TaskError(f"Rolling back update of management repository catalog {self.catalog.path}...")
+        except (RepoManagementFileError, TaskError) as e:
+            info(e)
+            if not moved:
+                self.state = ActionStateEnum.FAILED_TASK
+                return self.state
+
+            # NOTE: the JSON files are the single source of truth, so a failed commit only leaves the catalog outdated
+            info(f"The management repository catalog {self.catalog.path} is outdated and must be rebuilt!")
+        else:
+            self.catalog_updated = True
+
+        self.state = ActionStateEnum.SUCCESS_TASK
+        return self.state
+
+    def move_files(self) -> bool:
+        """Move all files from their source to their destination (with potential backup of destination).
+
+        Returns
+        -------
+        bool
+            True if all files have been moved, False otherwise
+        """
         for source_destination in self.paths:
             if source_destination.destination.exists():
                 debug(f"Backing up {source_destination.destination} to {source_destination.destination_backup}...")
                 try:
-                    copy2(src=source_destination.destination, dst=source_destination.destination_backup)
+                    place_file(
+                        source=source_destination.destination,
+                        destination=source_destination.destination_backup,
+                        placement=self.file_placement,
+                    )
                 except Exception as e:
                     info(e)
-                    self.state = ActionStateEnum.FAILED_TASK
-                    return self.state
+                    return False
                 source_destination.backup_done = True
 
             try:
                 source_destination.source.rename(source_destination.destination)
             except Exception as e:
                 info(e)
-                self.state = ActionStateEnum.FAILED_TASK
-                return self.state
+                return False
 
-        self.state = ActionStateEnum.SUCCESS_TASK
-        return self.state
+        return True
+
+    def item_count(self) -> int:
+        """Return the number of files moved by the Task.
+
+        Returns
+        -------
+        int
+            The number of files moved by the Task
+        """
+        return len(self.paths)
 
     def undo(self) -> ActionStateEnum:
         """Undo the moving of a file from source to destination.
@@ -1034,7 +1340,13 @@ class MoveTmpFilesTask(Task):
                     debug(f"Moving {source_destination.destination} back to {source_destination.source}...")
                     source_destination.destination.rename(source_destination.source)
                     self.state = ActionStateEnum.NOT_STARTED
-                case (ActionStateEnum.FAILED_TASK, True, False, False, False):
+                case (ActionStateEnum.FAILED_TASK, True, False, False, False) | (
+                    ActionStateEnum.FAILED_TASK,
+                    True,
+                    True,
+                    False,
+                    False,
+                ):
                     self.state = ActionStateEnum.NOT_STARTED
                 case (ActionStateEnum.FAILED_TASK, True, True, True, True):
                     debug(
@@ -1047,6 +1359,18 @@ class MoveTmpFilesTask(Task):
                     info(f"Can not undo moving of files {self.paths}!")
                     self.state = ActionStateEnum.FAILED_UNDO_TASK
 
+        if self.catalog and self.directory and self.catalog_updated:
+            debug(f"Restoring pkgbases in management repository catalog {self.catalog.path}...")
+            try:
+                self.catalog.update_from_directory(
+                    directory=self.directory,
+                    names=[pkgbase.base for pkgbase in self.pkgbases],  # type: ignore[attr-defined]
+                )
+            except RepoManagementFileError as e:
+                info(e)
+                info(f"The management repository catalog {self.catalog.path} is outdated and must be rebuilt!")
+            self.catalog_updated = False
+
         self.dependency_undo()
         return self.state
 
@@ -1159,7 +1483,7 @@ class FilesToRepoDirTask(Task):
                 return self.state
 
             try:
-                repo_file.copy_from(path=file_path)
+                repo_file.copy_from(path=file_path, placement=self.settings.file_placement)
                 repo_file.link()
             except RepoManagementFileError as e:
                 info(e)
@@ -1169,6 +1493,16 @@ class FilesToRepoDirTask(Task):
         self.state = ActionStateEnum.SUCCESS_TASK
         return self.state
 
+    def item_count(self) -> int:
+        """Return the number of files copied by the Task.
+
+        Returns
+        -------
+        int
+            The number of files copied by the Task
+        """
+        return len(self.files)
+
     def undo(self) -> ActionStateEnum:
         """Undo copying files to a package pool directory and creating symlinks in a package repository directory.
 
@@ -1249,6 +1583,11 @@ class WriteSyncDbsToTmpFilesInDirTask(Task):
     ----------
     compression: CompressionTypeEnum
         A member of CompressionTypeEnum which is used as compression type for the repository sync databases
+    compression_level: int | None
+        An optional compression level which is used for the repository sync databases
+    compression_workers: int | None
+        The number of threads which are used for compressing the repository sync databases (None uses the number of
+        CPUs)
     desc_version: PackageDescVersionEnum
         A member of PackageDescVersionEnum which is used to set the PackageDesc version to write to file
     files_version: FilesVersionEnum
@@ -1263,6 +1602,12 @@ class WriteSyncDbsToTmpFilesInDirTask(Task):
         A Path for the temporary symlink to the default repository sync database
     files_syncdb_symlink_path: Path
         A Path for the temporary symlink to the files repository sync database
+    default_syncdb_current_path: Path
+        A Path to the current default repository sync database (via its symlink)
+    files_syncdb_current_path: Path
+        A Path to the current files repository sync database (via its symlink)
+    incremental: bool
+        Whether to copy unchanged pkgbases from the current repository sync databases
     dependencies: list[Task] | None
         An optional list of Task lists which are executed before this Task (defaults to None)
     """
@@ -1274,10 +1619,17 @@ class WriteSyncDbsToTmpFilesInDirTask(Task):
         files_version: FilesVersionEnum,
         management_repo_dir: Path,
         package_repo_dir: Path,
+        incremental: bool = False,
+        compression_level: int | None = None,
+        compression_workers: int | None = 1,
         dependencies: list[Task] | None = None,
     ):
         """Initialize an instance of WriteSyncDbsToTmpFilesInDirTask.
 
+        If incremental is True and instances of CreateOutputPackageBasesTask are provided in dependencies, only the
+        pkgbases created by them (and those not yet found in the current repository sync databases) are written from
+        the JSON files in management_repo_dir, while all others are copied from the current repository sync databases.
+
         Parameters
         ----------
         compression: CompressionTypeEnum
@@ -1290,10 +1642,21 @@ class WriteSyncDbsToTmpFilesInDirTask(Task):
             A Path to a directory in a management repository from which to read JSON files
         package_repo_dir: Path
             A Path to a directory in a package repository to write files to
+        incremental: bool
+            Whether to copy unchanged pkgbases from the current repository sync databases (defaults to False)
+        compression_level: int | None
+            An optional compression level which is used for the repository sync databases (defaults to None, which uses
+            the default of the compression type)
+        compression_workers: int | None
+            The number of threads which are used for compressing the repository sync databases (defaults to 1).
+            If None, the number of CPUs is used.
         dependencies: list[Task] | None
             An optional list of Task lists which are executed before this Task (defaults to None)
         """
         self.compression = compression
+        self.compression_level = compression_level
+        self.compression_workers = compression_workers
+        self.incremental = incremental
         self.desc_version = desc_version
         self.files_version = files_version
         self.management_repo_dir = management_repo_dir
@@ -1307,6 +1670,8 @@ class WriteSyncDbsToTmpFilesInDirTask(Task):
             + ".tmp"
         )
         self.files_syncdb_symlink_path = package_repo_dir / Path(package_repo_dir.parent.name + ".files.tmp")
+        self.default_syncdb_current_path = package_repo_dir / Path(package_repo_dir.parent.name + ".db")
+        self.files_syncdb_current_path = package_repo_dir / Path(package_repo_dir.parent.name + ".files")
         if dependencies:
             self.dependencies = dependencies
 
@@ -1331,6 +1696,8 @@ class WriteSyncDbsToTmpFilesInDirTask(Task):
                 database=self.default_syncdb_path,
                 database_type=RepoDbTypeEnum.DEFAULT,
                 compression_type=self.compression,
+                compression_level=self.compression_level,
+                compression_workers=self.compression_workers,
                 desc_version=self.desc_version,
                 files_version=self.files_version,
             )
@@ -1338,6 +1705,8 @@ class WriteSyncDbsToTmpFilesInDirTask(Task):
                 database=self.files_syncdb_path,
                 database_type=RepoDbTypeEnum.FILES,
                 compression_type=self.compression,
+                compression_level=self.compression_level,
+                compression_workers=self.compression_workers,
                 desc_version=self.desc_version,
                 files_version=self.files_version,
             )
@@ -1346,10 +1715,42 @@ class WriteSyncDbsToTmpFilesInDirTask(Task):
             self.state = ActionStateEnum.FAILED_TASK
             return self.state
 
+        pkgbases: list[str] | None = None
+        if self.incremental:
+            for dependency in self.dependencies:
+                if isinstance(dependency, CreateOutputPackageBasesTask):
+                    if dependency.state != ActionStateEnum.SUCCESS:
+                        self.state = ActionStateEnum.FAILED_DEPENDENCY
+                        return self.state
+                    pkgbases = (pkgbases or []) + [
+                        pkgbase.base for pkgbase in dependency.pkgbases  # type: ignore[attr-defined]
+                    ]
+
+        if pkgbases is not None:
+            debug(f"Only writing changed pkgbases {pkgbases} from the management repository...")
+
         try:
-            asyncio.run(default_sync_db.stream_management_repo(path=self.management_repo_dir))
-            asyncio.run(files_sync_db.stream_management_repo(path=self.management_repo_dir))
-        except (IsADirectoryError, RepoManagementFileNotFoundError) as e:
+            asyncio.run(
+                SyncDatabase.stream_management_repo_to_databases(
+                    path=self.management_repo_dir,
+                    databases=[
+                        (
+                            default_sync_db,
+                            self.default_syncdb_current_path
+                            if pkgbases is not None and self.default_syncdb_current_path.exists()
+                            else None,
+                        ),
+                        (
+                            files_sync_db,
+                            self.files_syncdb_current_path
+                            if pkgbases is not None and self.files_syncdb_current_path.exists()
+                            else None,
+                        ),
+                    ],
+                    pkgbases=pkgbases,
+                )
+            )
+        except (IsADirectoryError, ReadError, RepoManagementFileError) as e:
             info(e)
             self.state = ActionStateEnum.FAILED_TASK
             return self.state
@@ -1508,6 +1909,9 @@ class ConsolidateOutputPackageBasesTask(Task):
     url_validation_settings: UrlValidationSettings | None
         An optional instance of UrlValidationSettings providing settings for validating the source URLs of pkgbases
         (defaults to None)
+    index: ManagementRepoIndex
+        A ManagementRepoIndex of management repository directories, that may be shared with other Tasks of a
+        transaction
     """
 
     def __init__(
@@ -1517,6 +1921,7 @@ class ConsolidateOutputPackageBasesTask(Task):
         url_validation_settings: UrlValidationSettings | None = None,
         pkgbases: list[OutputPackageBase] | None = None,
         dependencies: list[Task] | None = None,
+        index: ManagementRepoIndex | None = None,
     ):
         """Initialize an instance of ConsolidateOutputPackageBasesTask.
 
@@ -1536,12 +1941,18 @@ class ConsolidateOutputPackageBasesTask(Task):
             (defaults to None)
         dependencies: list[Task] | None
             An optional list of Task instances that are run before this task (defaults to None)
+        index: ManagementRepoIndex | None
+            An optional ManagementRepoIndex of management repository directories, that may be shared with other Tasks of
+            a transaction (defaults to None, which creates a new one)
         """
         self.directory = directory
         if not self.directory or not self.directory.exists():
             raise RuntimeError("The provided directory must exist!")
 
         self.stability_layer_dirs = stability_layer_dirs
+        self.index = index or ManagementRepoIndex()
+        # NOTE: post_checks are added when running the Task and must not be added to the list shared by all Tasks
+        self.post_checks = []
 
         self.url_validation_settings = url_validation_settings
         self.input_from_dependency = False
@@ -1618,6 +2029,7 @@ class ConsolidateOutputPackageBasesTask(Task):
                 current_package_names=self.current_package_names,
                 pkgbases_above=pkgbases_above,
                 pkgbases_below=pkgbases_below,
+                index=self.index,
             )
         except RepoManagementFileError as e:
             info(e)
@@ -1651,6 +2063,7 @@ class ConsolidateOutputPackageBasesTask(Task):
                 directory=self.directory,
                 new_pkgbases=self.pkgbases,
                 current_pkgbases=current_pkgbases,
+                index=self.index,
             ),
         )
 
@@ -1658,6 +2071,16 @@ class ConsolidateOutputPackageBasesTask(Task):
 
         return self.state
 
+    def item_count(self) -> int:
+        """Return the number of pkgbases consolidated by the Task.
+
+        Returns
+        -------
+        int
+            The number of pkgbases consolidated by the Task
+        """
+        return len(self.pkgbases)
+
     def undo(self) -> ActionStateEnum:
         """Undo Task to consolidate OutputPackageBase instances with those from a management repository directory.
 
@@ -1966,6 +2389,15 @@ class AddToArchiveTask(Task):
     ----------
     files: list[CopySourceDestination]
         A list of CopySourceDestination that represents the sources and destinations (in the archive)
+    archive_index: ArchiveIndex | None
+        An optional ArchiveIndex of the archive directory, which is updated if it has been built
+    file_placement: FilePlacementEnum
+        A member of FilePlacementEnum, which defines how files are placed in the archive directory
+    objects_dir: Path | None
+        An optional content-addressed object directory, in which files are stored by their SHA-256 checksum, while the
+        files in the archive directory are symlinks to them
+    objects: list[Path]
+        The files created in objects_dir by the Task (defaults to [])
     """
 
     def __init__(
@@ -1973,6 +2405,9 @@ class AddToArchiveTask(Task):
         archive_dir: Path,
         filenames: list[Path] | None = None,
         dependencies: list[Task] | None = None,
+        archive_index: ArchiveIndex | None = None,
+        file_placement: FilePlacementEnum = FilePlacementEnum.COPY,
+        objects_dir: Path | None = None,
     ):
         """Initialize an instance of AddToArchiveTask.
 
@@ -1987,6 +2422,15 @@ class AddToArchiveTask(Task):
             An optional list of file Paths (defaults to None)
         dependencies: list[Task] | None
             An optional list of Task instances that are run before this task (defaults to None)
+        archive_index: ArchiveIndex | None
+            An optional ArchiveIndex of archive_dir, which is updated if it has been built (defaults to None)
+        file_placement: FilePlacementEnum
+            A member of FilePlacementEnum, which defines how files are placed in archive_dir (defaults to
+            FilePlacementEnum.COPY)
+        objects_dir: Path | None
+            An optional content-addressed object directory, in which files are stored by their SHA-256 checksum, while
+            the files in archive_dir are symlinks to them (defaults to None). The SHA-256 checksums of package files
+            are derived from instances of CreateOutputPackageBasesTask, that FilesToRepoDirTask dependencies depend on
 
         Raises
         ------
@@ -1998,6 +2442,10 @@ class AddToArchiveTask(Task):
             raise RuntimeError("An archive directory must be provided!")
 
         self.archive_dir = archive_dir
+        self.archive_index = archive_index
+        self.file_placement = file_placement
+        self.objects_dir = objects_dir
+        self.objects: list[Path] = []
 
         self.input_from_dependency = False
 
@@ -2034,6 +2482,7 @@ class AddToArchiveTask(Task):
             ActionStateEnum.SUCCESS_TASK if the Task ran successfully,
             ActionStateEnum.FAILED_TASK otherwise
         """
+        sha256sums: dict[str, str] = {}
         if self.input_from_dependency and len(self.dependencies) > 0:
             debug("Getting pkgbases from the output of another Task...")
             for dependency in self.dependencies:  # pragma: no branch
@@ -2043,6 +2492,7 @@ class AddToArchiveTask(Task):
                             CopySourceDestination.from_archive_dir(source=filename, output_dir=self.archive_dir)
                             for filename in dependency.files
                         ]
+                        sha256sums.update(self.get_sha256sums(dependency=dependency))
                     else:
                         self.state = ActionStateEnum.FAILED_DEPENDENCY
                         return self.state
@@ -2053,12 +2503,82 @@ class AddToArchiveTask(Task):
         )
         self.state = ActionStateEnum.STARTED_TASK
 
-        for cp_source_destination in self.files:
-            cp_source_destination.copy_file()
+        self.archive_files(sha256sums=sha256sums)
+
+        if self.archive_index and self.archive_index.exists():
+            debug(f"Adding archived files to archive index {self.archive_index.path}...")
+            try:
+                self.archive_index.add_files(paths=[obj.destination for obj in self.files])
+            except RepoManagementFileError as e:
+                info(e)
+                self.state = ActionStateEnum.FAILED_TASK
+                return self.state
 
         self.state = ActionStateEnum.SUCCESS_TASK
         return self.state
 
+    def get_sha256sums(self, dependency: FilesToRepoDirTask) -> dict[str, str]:
+        """Return the SHA-256 checksums of the package files of a FilesToRepoDirTask dependency.
+
+        The checksums are derived from the instances of CreateOutputPackageBasesTask, that dependency depends on. They
+        are only required for storing files in objects_dir.
+
+        Parameters
+        ----------
+        dependency: FilesToRepoDirTask
+            A FilesToRepoDirTask, that the Task depends on
+
+        Returns
+        -------
+        dict[str, str]
+            A dict of the SHA-256 checksum of each package file (by file name), which is empty if objects_dir is not set
+        """
+        if not self.objects_dir:
+            return {}
+
+        return {
+            package.filename: package.sha256sum
+            for pkgbases_task in dependency.dependencies
+            if isinstance(pkgbases_task, CreateOutputPackageBasesTask)
+            for pkgbase in pkgbases_task.pkgbases
+            for package in pkgbase.packages  # type: ignore[attr-defined]
+        }
+
+    def archive_files(self, sha256sums: dict[str, str]) -> None:
+        """Place the files in the archive directory.
+
+        If objects_dir is set, the files are stored in it and symlinked to from the archive directory, else they are
+        placed in the archive directory directly.
+
+        Parameters
+        ----------
+        sha256sums: dict[str, str]
+            A dict of the known SHA-256 checksums of files (by file name), which do not need to be calculated when
+            storing the files in objects_dir
+        """
+        for cp_source_destination in self.files:
+            if not self.objects_dir:
+                cp_source_destination.copy_file(placement=self.file_placement)
+                continue
+
+            object_path = cp_source_destination.store_file(
+                objects_dir=self.objects_dir,
+                sha256sum=sha256sums.get(cp_source_destination.source.name),
+                placement=self.file_placement,
+            )
+            if object_path:
+                self.objects.append(object_path)
+
+    def item_count(self) -> int:
+        """Return the number of files archived by the Task.
+
+        Returns
+        -------
+        int
+            The number of files archived by the Task
+        """
+        return len(self.files)
+
     def undo(self) -> ActionStateEnum:
         """Undo the archiving of files.
 
@@ -2084,6 +2604,17 @@ class AddToArchiveTask(Task):
 
         for cp_source_destination in self.files:
             cp_source_destination.remove_destination()
+        for object_path in self.objects:
+            object_path.unlink(missing_ok=True)
+        self.objects.clear()
+
+        if self.archive_index and self.archive_index.exists():
+            debug(f"Removing archived files from archive index {self.archive_index.path}...")
+            try:
+                self.archive_index.remove_files(paths=[obj.destination for obj in self.files])
+            except RepoManagementFileError as e:
+                info(e)
+                info(f"The archive index {self.archive_index.path} is outdated and must be rebuilt!")
 
         if self.input_from_dependency:
             self.files.clear()
@@ -2114,6 +2645,11 @@ class ReproducibleBuildEnvironmentTask(Task):
     pkgs_in_transaction: list[str]
         A list of pkgname-pkgver-architecture strings that represent all build requirement matches in the current
         transaction
+    index: ManagementRepoIndex
+        A ManagementRepoIndex of management repository directories, that may be shared with other Tasks of a
+        transaction
+    archive_index: ArchiveIndex | None
+        An optional ArchiveIndex of archive_dir, which is used instead of archive_dir if it has been built
     """
 
     def __init__(
@@ -2122,6 +2658,8 @@ class ReproducibleBuildEnvironmentTask(Task):
         management_directories: list[Path],
         pkgbases: list[OutputPackageBase] | None = None,
         dependencies: list[Task] | None = None,
+        index: ManagementRepoIndex | None = None,
+        archive_index: ArchiveIndex | None = None,
     ):
         """Initialize an instance of ReproducibleBuildEnvironmentTask.
 
@@ -2137,6 +2675,12 @@ class ReproducibleBuildEnvironmentTask(Task):
             An optional list of OutputPackageBase instances to compare to those in a management repository directory
         dependencies: list[Task] | None
             An optional list of Task instances that are run before this task (defaults to None)
+        index: ManagementRepoIndex | None
+            An optional ManagementRepoIndex of management repository directories, that may be shared with other Tasks of
+            a transaction (defaults to None, which creates a new one)
+        archive_index: ArchiveIndex | None
+            An optional ArchiveIndex of archive_dir, which is used instead of archive_dir if it has been built (defaults
+            to None)
         """
         if not management_directories:
             raise RuntimeError("At least one management repository directory must be provided!")
@@ -2144,8 +2688,12 @@ class ReproducibleBuildEnvironmentTask(Task):
         if not all([directory and directory.exists() for directory in management_directories]):
             raise RuntimeError("The provided management repository directories must exist!")
         self.management_directories = management_directories
+        self.index = index or ManagementRepoIndex()
+        # NOTE: post_checks are added when running the Task and must not be added to the list shared by all Tasks
+        self.post_checks = []
 
         self.archive_dir = archive_dir
+        self.archive_index = archive_index
 
         self.input_from_dependency = False
 
@@ -2201,6 +2749,7 @@ class ReproducibleBuildEnvironmentTask(Task):
                 pkgbases=self.pkgbases,
                 management_directories=self.management_directories,
                 pkgs_in_repo=self.pkgs_in_repo,
+                index=self.index,
             )
         except TaskError as e:
             info(e)
@@ -2212,6 +2761,7 @@ class ReproducibleBuildEnvironmentTask(Task):
                 pkgbases=self.pkgbases,
                 archive_dir=self.archive_dir,
                 pkgs_in_archive=self.pkgs_in_archive,
+                archive_index=self.archive_index,
             )
         except TaskError as e:
             info(e)
@@ -2296,6 +2846,9 @@ class RepoGroupTask(Task):
         A list of all package names, retrieved from pkgbases
     repo_management_dirs: dict[Path, list[Path]]
         A dict of repository name and respective management repository directory Paths
+    index: ManagementRepoIndex
+        A ManagementRepoIndex of management repository directories, that may be shared with other Tasks of a
+        transaction
     """
 
     def __init__(
@@ -2303,6 +2856,7 @@ class RepoGroupTask(Task):
         repositories: list[PackageRepo],
         pkgbases: list[OutputPackageBase] | None = None,
         dependencies: list[Task] | None = None,
+        index: ManagementRepoIndex | None = None,
     ):
         """Initialize an instance of RepoGroupTask.
 
@@ -2316,8 +2870,14 @@ class RepoGroupTask(Task):
             An optional list of OutputPackageBase instances from which all pkgbase and package names are retrieved
         dependencies: list[Task] | None
             An optional list of Task instances that are run before this task (defaults to None)
+        index: ManagementRepoIndex | None
+            An optional ManagementRepoIndex of management repository directories, that may be shared with other Tasks of
+            a transaction (defaults to None, which creates a new one)
         """
         self.repositories = repositories
+        self.index = index or ManagementRepoIndex()
+        # NOTE: post_checks are added when running the Task and must not be added to the list shared by all Tasks
+        self.post_checks = []
 
         self.input_from_dependency = False
 
@@ -2386,6 +2946,7 @@ class RepoGroupTask(Task):
                 pkgbase_names=self.pkgbase_names,
                 package_names=self.package_names,
                 repo_management_dirs=self.repo_management_dirs,
+                index=self.index,
             )
         )
 
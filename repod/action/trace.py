@@ -0,0 +1,245 @@
+"""Tracing of Tasks and Checks."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from logging import debug
+from os import getpid
+from pathlib import Path
+from resource import RUSAGE_CHILDREN, getrusage
+from threading import Lock, get_ident
+from time import perf_counter, thread_time
+from typing import Any, Iterator, Protocol
+
+from orjson import dumps
+from pydantic import BaseModel
+
+from repod.common.enums import ActionStateEnum
+
+THREAD_IO_PATH = Path("/proc/thread-self/io")
+
+
+class TraceableAction(Protocol):
+    """The protocol of actions (i.e. Tasks and Checks), that can be traced."""
+
+    state: ActionStateEnum
+
+    def item_count(self) -> int | None:
+        """Return the number of items processed by the action."""
+
+
+class TraceEvent(BaseModel):
+    """A record of a single run of a Task or Check.
+
+    Attributes
+    ----------
+    name: str
+        The name of the traced action (i.e. its class name)
+    category: str
+        The category of the traced action (e.g. "task" or "check")
+    thread: int
+        The identifier of the thread the action ran in
+    start: float
+        The start time of the action in seconds, relative to the creation of the Tracer
+    duration: float
+        The wall time of the action in seconds
+    cpu_time: float
+        The CPU time used by the thread running the action in seconds
+    children_cpu_time: float
+        The CPU time in seconds of child processes, that terminated while the action ran (e.g. worker processes)
+    bytes_read: int | None
+        The amount of bytes read by the thread running the action, or None if it is not available
+    bytes_written: int | None
+        The amount of bytes written by the thread running the action, or None if it is not available
+    items: int | None
+        The number of items processed by the action (e.g. packages or files), or None if it is not available
+    state: str
+        The name of the ActionStateEnum member of the action after running it
+    """
+
+    name: str
+    category: str
+    thread: int
+    start: float
+    duration: float
+    cpu_time: float
+    children_cpu_time: float
+    bytes_read: int | None
+    bytes_written: int | None
+    items: int | None
+    state: str
+
+
+def read_thread_io() -> tuple[int, int] | None:
+    """Read the amount of bytes read and written by the current thread.
+
+    The amounts include all data passed through read and write system calls (regardless of whether it is cached).
+
+    Returns
+    -------
+    tuple[int, int] | None
+        The amounts of bytes read and written by the current thread, or None if they can not be read (e.g. on systems
+        without a /proc filesystem)
+    """
+    try:
+        io = dict(line.split(": ") for line in THREAD_IO_PATH.read_text().splitlines())
+        return int(io["rchar"]), int(io["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def read_children_cpu_time() -> float:
+    """Read the CPU time used by all terminated child processes of the current process.
+
+    Returns
+    -------
+    float
+        The user and system CPU time of all terminated child processes in seconds
+    """
+    usage = getrusage(RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class Tracer:
+    """A collector of TraceEvents of Tasks and Checks.
+
+    A Tracer is thread-safe, so that concurrently running Tasks can be traced. Only the resources used by the thread
+    running an action are attributed to it, with the exception of the CPU time of child processes, which can not be
+    attributed to a single thread.
+
+    Attributes
+    ----------
+    start: float
+        The value of the performance counter when the Tracer was created
+    events: list[TraceEvent]
+        The TraceEvents collected by the Tracer
+    """
+
+    def __init__(self) -> None:
+        """Initialize an instance of Tracer."""
+        self.start = perf_counter()
+        self.events: list[TraceEvent] = []
+        self._lock = Lock()
+
+    @contextmanager
+    def trace(self, action: TraceableAction, category: str) -> Iterator[None]:
+        """Trace an action run in the context.
+
+        Parameters
+        ----------
+        action: TraceableAction
+            A Task or Check, whose state and item count are recorded after leaving the context
+        category: str
+            The category of the action (e.g. "task" or "check")
+        """
+        io_start = read_thread_io()
+        children_cpu_start = read_children_cpu_time()
+        cpu_start = thread_time()
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            cpu_time = thread_time() - cpu_start
+            children_cpu_time = read_children_cpu_time() - children_cpu_start
+            io_end = read_thread_io()
+
+            event = TraceEvent(
+                name=type(action).__name__,
+                category=category,
+                thread=get_ident(),
+                start=start - self.start,
+                duration=duration,
+                cpu_time=cpu_time,
+                children_cpu_time=children_cpu_time,
+                bytes_read=io_end[0] - io_start[0] if io_start and io_end else None,
+                bytes_written=io_end[1] - io_start[1] if io_start and io_end else None,
+                items=action.item_count(),
+                state=action.state.name or str(action.state),
+            )
+            with self._lock:
+                self.events.append(event)
+
+    def to_trace_event_format(self) -> dict[str, Any]:
+        """Return the collected TraceEvents in the Trace Event Format.
+
+        The Trace Event Format can be viewed using e.g. chrome://tracing or https://ui.perfetto.dev.
+
+        Returns
+        -------
+        dict[str, Any]
+            A dict with a list of complete events ("ph": "X") with timestamps and durations in microseconds
+        """
+        pid = getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": event.name,
+                    "cat": event.category,
+                    "ph": "X",
+                    "ts": round(event.start * 1e6),
+                    "dur": round(event.duration * 1e6),
+                    "pid": pid,
+                    "tid": event.thread,
+                    "args": event.dict(exclude={"name", "category", "thread", "start", "duration"}),
+                }
+                for event in sorted(self.events, key=lambda event: event.start)
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the collected TraceEvents to a JSON file in the Trace Event Format.
+
+        Parameters
+        ----------
+        path: Path
+            The file to write to
+        """
+        debug(f"Writing {len(self.events)} trace events to {path}...")
+        path.write_bytes(dumps(self.to_trace_event_format()))
+
+
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer | None:
+    """Return the Tracer used for tracing Tasks and Checks.
+
+    Returns
+    -------
+    Tracer | None
+        The Tracer, or None if tracing is disabled
+    """
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Set the Tracer used for tracing Tasks and Checks.
+
+    Parameters
+    ----------
+    tracer: Tracer | None
+        A Tracer, or None to disable tracing
+    """
+    global _tracer
+    _tracer = tracer
+
+
+@contextmanager
+def trace(action: TraceableAction, category: str) -> Iterator[None]:
+    """Trace an action run in the context, if a Tracer is set.
+
+    Parameters
+    ----------
+    action: TraceableAction
+        A Task or Check, whose state and item count are recorded after leaving the context
+    category: str
+        The category of the action (e.g. "task" or "check")
+    """
+    tracer = get_tracer()
+    if not tracer:
+        yield
+        return
+
+    with tracer.trace(action=action, category=category):
+        yield
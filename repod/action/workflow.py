@@ -1,10 +1,11 @@
 """Workflows describing common repository actions."""
-from logging import debug
+from logging import debug, info
 from pathlib import Path
 from sys import exit, stderr
 
 from pydantic import AnyUrl
 
+from repod.action.executor import TaskExecutor
 from repod.action.task import (
     AddToArchiveTask,
     AddToRepoTask,
@@ -23,6 +24,7 @@ from repod.action.task import (
     WriteOutputPackageBasesToTmpFileInDirTask,
     WriteSyncDbsToTmpFilesInDirTask,
 )
+from repod.archive.index import ArchiveIndex
 from repod.common.enums import (
     ActionStateEnum,
     ArchitectureEnum,
@@ -31,6 +33,9 @@ from repod.common.enums import (
     RepoTypeEnum,
 )
 from repod.config.settings import ArchiveSettings, SystemSettings, UserSettings
+from repod.errors import RepoManagementFileError
+from repod.files import PackageCache
+from repod.repo import ManagementRepoCatalog, ManagementRepoIndex
 
 
 def exit_on_error(message: str) -> None:
@@ -46,6 +51,119 @@ def exit_on_error(message: str) -> None:
     exit(1)
 
 
+def get_management_repo_catalog(
+    settings: SystemSettings | UserSettings,
+    repo_name: Path,
+    repo_architecture: ArchitectureEnum | None,
+) -> ManagementRepoCatalog | None:
+    """Return the ManagementRepoCatalog of the management repository of a repository, if one is configured.
+
+    Parameters
+    ----------
+    settings: SystemSettings | UserSettings
+        Settings object to retrieve data about the repository from
+    repo_name: Path
+        The name of the repository
+    repo_architecture: ArchitectureEnum | None
+        The optional architecture of the repository
+
+    Returns
+    -------
+    ManagementRepoCatalog | None
+        The ManagementRepoCatalog covering the management repository directories of all repositories, that use the
+        same management repository as the repository, or None if the management repository has no catalog
+    """
+    management_repo = settings.get_repo_management_repo(name=repo_name, architecture=repo_architecture)
+    if not management_repo.catalog:
+        return None
+
+    return ManagementRepoCatalog(
+        path=management_repo.catalog,
+        repo_types=settings.get_management_repo_types(management_repo=management_repo),
+    )
+
+
+def rebuild_management_repo_catalog(
+    settings: SystemSettings | UserSettings,
+    repo_name: Path,
+    repo_architecture: ArchitectureEnum | None,
+) -> None:
+    """Rebuild the catalog of the management repository of a repository from its JSON files.
+
+    Parameters
+    ----------
+    settings: SystemSettings | UserSettings
+        Settings object to retrieve data about the repository from
+    repo_name: Path
+        The name of the repository
+    repo_architecture: ArchitectureEnum | None
+        The optional architecture of the repository
+    """
+    catalog = get_management_repo_catalog(settings=settings, repo_name=repo_name, repo_architecture=repo_architecture)
+    if not catalog:
+        exit_on_error(f"The management repository of the repository {repo_name} does not use a catalog!")
+        return
+
+    try:
+        count = catalog.rebuild(directories=list(catalog.repo_types))
+    except RepoManagementFileError as e:
+        exit_on_error(f"An error occured while trying to rebuild a management repository catalog: {e}")
+        return
+
+    info(f"Added {count} pkgbases to management repository catalog {catalog.path}.")
+
+
+def get_archive_index(archiving: ArchiveSettings | bool | None) -> ArchiveIndex | None:
+    """Return the ArchiveIndex of the package archive directory of a repository, if one is configured.
+
+    Parameters
+    ----------
+    archiving: ArchiveSettings | bool | None
+        The archiving settings of a repository
+
+    Returns
+    -------
+    ArchiveIndex | None
+        The ArchiveIndex of the package archive directory, or None if archiving is disabled or no index is configured
+    """
+    if not isinstance(archiving, ArchiveSettings) or not archiving.index:
+        return None
+
+    return ArchiveIndex(path=archiving.index, archive_dir=archiving.packages)
+
+
+def rebuild_archive_index(
+    settings: SystemSettings | UserSettings,
+    repo_name: Path,
+    repo_architecture: ArchitectureEnum | None,
+) -> None:
+    """Rebuild the index of the package archive directory of a repository from its package files.
+
+    Parameters
+    ----------
+    settings: SystemSettings | UserSettings
+        Settings object to retrieve data about the repository from
+    repo_name: Path
+        The name of the repository
+    repo_architecture: ArchitectureEnum | None
+        The optional architecture of the repository
+    """
+    archive_index = get_archive_index(
+        archiving=settings.get_repo(name=repo_name, architecture=repo_architecture).archiving
+    )
+    if not archive_index:
+        exit_on_error(f"The package archive of the repository {repo_name} does not use an index!")
+        return
+
+    try:
+        count = archive_index.rebuild()
+    except RepoManagementFileError as e:
+        exit_on_error(f"An error occured while trying to rebuild an archive index: {e}")
+        return
+
+    info(f"Added {count} package files to archive index {archive_index.path}.")
+
+
 def add_packages_dryrun(
     settings: SystemSettings | UserSettings,
     files: list[Path],
@@ -87,6 +205,12 @@ def add_packages_dryrun(
                 debug_repo=debug_repo,
                 package_verification=settings.package_verification,
                 pkgbase_urls=pkgbase_urls,
+                workers=settings.package_workers,
+                package_cache=(
+                    PackageCache(**settings.package_cache.dict())  # type: ignore[union-attr]
+                    if settings.package_cache
+                    else None
+                ),
             )
         ],
     )
@@ -138,6 +262,8 @@ def add_packages(
     repo = settings.get_repo(name=repo_name, architecture=repo_architecture)
 
     add_to_repo_dependencies: list[Task] = []
+    # NOTE: Tasks checking the management repositories must finish before the management repository is altered
+    check_tasks: list[Task] = []
 
     management_repo_dir = settings.get_repo_path(
         repo_dir_type=RepoDirTypeEnum.MANAGEMENT,
@@ -167,7 +293,14 @@ def add_packages(
         debug_repo=debug_repo,
         pkgbase_urls=pkgbase_urls,
         package_verification=settings.package_verification,
+        workers=settings.package_workers,
+        package_cache=(
+            PackageCache(**settings.package_cache.dict())  # type: ignore[union-attr]
+            if settings.package_cache
+            else None
+        ),
     )
+    management_repo_index = ManagementRepoIndex()
     consolidateoutputpackagebases = ConsolidateOutputPackageBasesTask(
         directory=management_repo_dir,
         stability_layer_dirs=settings.get_management_repo_stability_paths(
@@ -183,6 +316,7 @@ def add_packages(
         dependencies=[
             outputpackagebasestask,
         ],
+        index=management_repo_index,
     )
 
     package_files_task = FilesToRepoDirTask(
@@ -196,6 +330,7 @@ def add_packages(
             staging=staging_repo,
             testing=testing_repo,
         ),
+        dependencies=[outputpackagebasestask],
     )
 
     if repo.build_requirements_exist:
@@ -205,35 +340,45 @@ def add_packages(
             dependencies=[
                 outputpackagebasestask,
             ],
+            index=management_repo_index,
+            archive_index=get_archive_index(archiving=repo.archiving),
         )
-        add_to_repo_dependencies.append(reproduciblebuildenvironmenttask)
+        check_tasks.append(reproduciblebuildenvironmenttask)
 
     if repo.group:
-        add_to_repo_dependencies.append(
+        check_tasks.append(
             RepoGroupTask(
                 repositories=settings.get_repos_by_group(group=repo.group, exclude_repo=repo),
                 dependencies=[
                     outputpackagebasestask,
                 ],
+                index=management_repo_index,
             )
         )
+    add_to_repo_dependencies += check_tasks
 
-    add_to_repo_dependencies.append(
-        MoveTmpFilesTask(
-            dependencies=[
-                consolidateoutputpackagebases,
-                WriteOutputPackageBasesToTmpFileInDirTask(
-                    directory=management_repo_dir,
-                    dumps_option=settings.get_repo_management_repo(
-                        name=repo_name, architecture=repo_architecture
-                    ).json_dumps_option,
-                    dependencies=[
-                        outputpackagebasestask,
-                    ],
-                ),
-            ]
+    management_repo_task = MoveTmpFilesTask(
+        catalog=get_management_repo_catalog(
+            settings=settings,
+            repo_name=repo_name,
+            repo_architecture=repo_architecture,
         ),
+        dependencies=[
+            consolidateoutputpackagebases,
+            WriteOutputPackageBasesToTmpFileInDirTask(
+                directory=management_repo_dir,
+                dumps_option=settings.get_repo_management_repo(
+                    name=repo_name, architecture=repo_architecture
+                ).json_dumps_option,
+                dependencies=[
+                    outputpackagebasestask,
+                ],
+            ),
+        ]
+        + check_tasks,
+        file_placement=settings.file_placement,
     )
+    add_to_repo_dependencies.append(management_repo_task)
     add_to_repo_dependencies.append(package_files_task)
 
     add_to_archive_dependencies = [
@@ -252,6 +397,7 @@ def add_packages(
                 staging=staging_repo,
                 testing=testing_repo,
             ),
+            dependencies=[outputpackagebasestask],
         )
         add_to_repo_dependencies.append(signature_files_task)
         add_to_archive_dependencies.append(signature_files_task)
@@ -261,12 +407,21 @@ def add_packages(
             dependencies=[
                 WriteSyncDbsToTmpFilesInDirTask(
                     compression=settings.get_repo_database_compression(name=repo_name, architecture=repo_architecture),
+                    compression_level=settings.get_repo_database_compression_level(
+                        name=repo_name,
+                        architecture=repo_architecture,
+                    ),
+                    compression_workers=settings.database_compression_workers,
                     desc_version=settings.syncdb_settings.desc_version,
                     files_version=settings.syncdb_settings.files_version,
                     management_repo_dir=management_repo_dir,
                     package_repo_dir=package_repo_dir,
+                    incremental=settings.syncdb_settings.incremental,
+                    # NOTE: the sync databases are written from the updated management repository
+                    dependencies=[outputpackagebasestask, management_repo_task],
                 ),
             ],
+            file_placement=settings.file_placement,
         ),
     )
     if isinstance(repo.archiving, ArchiveSettings):
@@ -274,12 +429,16 @@ def add_packages(
             AddToArchiveTask(
                 archive_dir=repo.archiving.packages,
                 dependencies=add_to_archive_dependencies,  # type: ignore[arg-type]
+                archive_index=get_archive_index(archiving=repo.archiving),
+                file_placement=settings.file_placement,
+                objects_dir=repo.archiving.objects,
             )
         )
 
     add_to_repo_task = AddToRepoTask(dependencies=add_to_repo_dependencies)
-    if add_to_repo_task() != ActionStateEnum.SUCCESS:
-        add_to_repo_task.undo()
+    add_to_repo_executor = TaskExecutor(task=add_to_repo_task)
+    if add_to_repo_executor() != ActionStateEnum.SUCCESS:
+        add_to_repo_executor.undo()
         exit_on_error("An error occured while trying to add packages to a repository!")
         return
 
@@ -332,6 +491,11 @@ def write_sync_databases(
         dependencies=[
             WriteSyncDbsToTmpFilesInDirTask(
                 compression=settings.get_repo_database_compression(name=repo_name, architecture=repo_architecture),
+                compression_level=settings.get_repo_database_compression_level(
+                    name=repo_name,
+                    architecture=repo_architecture,
+                ),
+                compression_workers=settings.database_compression_workers,
                 desc_version=settings.syncdb_settings.desc_version,
                 files_version=settings.syncdb_settings.files_version,
                 management_repo_dir=settings.get_repo_path(
@@ -356,6 +520,7 @@ def write_sync_databases(
                 ),
             ),
         ],
+        file_placement=settings.file_placement,
     )
     if movetmpfilestask() != ActionStateEnum.SUCCESS:
         movetmpfilestask.undo()
@@ -1,13 +1,36 @@
 """Functionality for package archiving."""
 from __future__ import annotations
 
+from logging import debug
 from pathlib import Path
-from shutil import copy2
+from tempfile import NamedTemporaryFile
 
 from pydantic import BaseModel, validator
 
+from repod.common.enums import FilePlacementEnum
 from repod.errors import RepoManagementValidationError
-from repod.repo.package.repofile import filename_parts
+from repod.files.common import DigestReader, place_file
+from repod.repo.package.repofile import filename_parts, relative_to_shared_base
+
+
+def get_object_path(objects_dir: Path, sha256sum: str) -> Path:
+    """Return the path of a file in a content-addressed object directory.
+
+    Files are stored below a subdirectory named after the first two characters of their SHA-256 checksum.
+
+    Parameters
+    ----------
+    objects_dir: Path
+        A content-addressed object directory
+    sha256sum: str
+        The SHA-256 checksum of the file
+
+    Returns
+    -------
+    Path
+        The path of the file below objects_dir
+    """
+    return objects_dir / sha256sum[:2] / sha256sum
 
 
 class CopySourceDestination(BaseModel):
@@ -86,13 +109,85 @@ class CopySourceDestination(BaseModel):
             source=source, destination=output_dir / parts["name"][0] / parts["name"] / source.name
         )
 
-    def copy_file(self) -> None:
+    def copy_file(self, placement: FilePlacementEnum = FilePlacementEnum.COPY) -> None:
         """Copy the file from source to destination.
 
         The required destination directory structure is created automatically.
+
+        Parameters
+        ----------
+        placement: FilePlacementEnum
+            A member of FilePlacementEnum, which defines how the file is placed at destination (defaults to
+            FilePlacementEnum.COPY)
+        """
+        self.destination.parent.mkdir(mode=int("0755", base=8), parents=True, exist_ok=True)
+        place_file(source=self.source, destination=self.destination, placement=placement)
+
+    def store_file(
+        self,
+        objects_dir: Path,
+        sha256sum: str | None = None,
+        placement: FilePlacementEnum = FilePlacementEnum.COPY,
+    ) -> Path | None:
+        """Store the file from source in a content-addressed object directory and link to it from destination.
+
+        The file is only placed in objects_dir, if no file with the same SHA-256 checksum exists there yet. It is placed
+        using a uniquely named temporary file, so that the same file can be stored by several processes concurrently.
+        Destination is (re)created as a relative symlink to the file in objects_dir.
+        The required directory structures are created automatically.
+
+        Parameters
+        ----------
+        objects_dir: Path
+            A content-addressed object directory
+        sha256sum: str | None
+            The SHA-256 checksum of source (defaults to None). If None, it is calculated from source
+        placement: FilePlacementEnum
+            A member of FilePlacementEnum, which defines how the file is placed in objects_dir (defaults to
+            FilePlacementEnum.COPY)
+
+        Returns
+        -------
+        Path | None
+            The path of the file in objects_dir if it has been created, None if it existed already
         """
+        if not sha256sum:
+            with DigestReader(path=self.source) as reader:
+                sha256sum = reader.digests()[1]
+
+        object_path = get_object_path(objects_dir=objects_dir, sha256sum=sha256sum)
+        created: Path | None = None
+        if object_path.exists():
+            debug(f"Using existing file {object_path} for {self.source}...")
+        else:
+            debug(f"Storing {self.source} as {object_path}...")
+            object_path.parent.mkdir(mode=int("0755", base=8), parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                dir=object_path.parent,
+                prefix=f".{object_path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as object_tmp_file:
+                object_tmp_path = Path(object_tmp_file.name)
+
+            try:
+                place_file(source=self.source, destination=object_tmp_path, placement=placement)
+                # NOTE: another process may have stored a file with the same contents in the meantime
+                if object_path.exists():
+                    debug(f"Using existing file {object_path} for {self.source}...")
+                    object_tmp_path.unlink()
+                else:
+                    object_tmp_path.rename(object_path)
+                    created = object_path
+            except BaseException:
+                object_tmp_path.unlink(missing_ok=True)
+                raise
+
         self.destination.parent.mkdir(mode=int("0755", base=8), parents=True, exist_ok=True)
-        copy2(src=self.source, dst=self.destination)
+        self.destination.unlink(missing_ok=True)
+        self.destination.symlink_to(relative_to_shared_base(path_a=object_path, path_b=self.destination))
+
+        return created
 
     def remove_destination(self) -> None:
         """Remove the destination file.
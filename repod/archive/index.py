@@ -0,0 +1,284 @@
+"""A persistent SQLite index of package archives."""
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from logging import debug
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from repod.common.models import FileName
+from repod.errors import RepoManagementFileError
+from repod.repo.package.repofile import filename_parts
+
+ARCHIVE_INDEX_SCHEMA_VERSION = 1
+ARCHIVE_INDEX_SCHEMA = """
+CREATE TABLE files (
+    filename TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    requirement TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX files_requirement ON files (requirement);
+"""
+# NOTE: stay well below the default maximum number of host parameters of SQLite (999 before 3.32.0)
+ARCHIVE_INDEX_QUERY_CHUNK_SIZE = 500
+
+
+def get_archive_index_entry(path: Path) -> tuple[str, str, str] | None:
+    """Return the index entry of an archived package file.
+
+    Parameters
+    ----------
+    path: Path
+        A file in a package archive directory
+
+    Returns
+    -------
+    tuple[str, str, str] | None
+        The filename, package name and "name-version-architecture" string of a package file, or None if path is a
+        signature file or not a valid package file name
+    """
+    if path.suffix == ".sig":
+        return None
+
+    try:
+        FileName(filename=path.name)
+        parts = filename_parts(file=path)
+    except (ValidationError, ValueError):
+        debug(f"Skipping file {path}, as it is not a package file...")
+        return None
+
+    return (path.name, parts["name"], f"{parts['name']}-{parts['version']}-{parts['arch']}")
+
+
+class ArchiveIndex:
+    """A persistent SQLite index of the package files in a package archive directory.
+
+    The index holds the filename, package name and "name-version-architecture" string of all package files in an
+    archive directory, so that the existence of specific package versions can be looked up without scanning the
+    archive directory. It is updated whenever files are added to the archive and can be rebuilt from the archive
+    directory at any time, which remains the single source of truth.
+
+    As an index, that does not cover all package files in the archive directory, would hide existing packages, it is
+    only used once it has been built (see exists()).
+
+    Attributes
+    ----------
+    path: Path
+        The absolute path of the SQLite database file of the index
+    archive_dir: Path
+        The package archive directory covered by the index
+    """
+
+    def __init__(self, path: Path, archive_dir: Path) -> None:
+        """Initialize an instance of ArchiveIndex.
+
+        Parameters
+        ----------
+        path: Path
+            The absolute path of the SQLite database file of the index
+        archive_dir: Path
+            The package archive directory covered by the index
+        """
+        self.path = path
+        self.archive_dir = archive_dir
+
+    def exists(self) -> bool:
+        """Return whether the index has been built.
+
+        Returns
+        -------
+        bool
+            True if the SQLite database file of the index exists, False otherwise
+        """
+        return self.path.exists()
+
+    def connect(self) -> sqlite3.Connection:
+        """Connect to the SQLite database of the index and create its schema if required.
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the database can not be opened or if its schema version does not match ARCHIVE_INDEX_SCHEMA_VERSION
+
+        Returns
+        -------
+        sqlite3.Connection
+            A connection to the database, in which transactions are handled explicitly
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA journal_mode = WAL")
+            schema_version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if schema_version == 0:
+                connection.execute("BEGIN IMMEDIATE")
+                # NOTE: another process may have created the schema while waiting for the write lock
+                if connection.execute("PRAGMA user_version").fetchone()[0] == 0:
+                    debug(f"Creating schema of archive index {self.path}...")
+                    for statement in ARCHIVE_INDEX_SCHEMA.split(";"):
+                        connection.execute(statement)
+                    connection.execute(f"PRAGMA user_version = {ARCHIVE_INDEX_SCHEMA_VERSION}")
+                connection.execute("COMMIT")
+                schema_version = ARCHIVE_INDEX_SCHEMA_VERSION
+        except (OSError, sqlite3.Error) as e:
+            raise RepoManagementFileError(f"Unable to open the archive index {self.path}: {e}")
+
+        if schema_version != ARCHIVE_INDEX_SCHEMA_VERSION:
+            connection.close()
+            raise RepoManagementFileError(
+                f"The archive index {self.path} uses schema version {schema_version} instead of "
+                f"{ARCHIVE_INDEX_SCHEMA_VERSION} and must be rebuilt!"
+            )
+
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Provide a connection with an exclusive write transaction, that is committed when leaving the context.
+
+        The transaction is rolled back if an exception is raised in the context.
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the database can not be opened or if the transaction can not be started or committed
+
+        Yields
+        ------
+        sqlite3.Connection
+            A connection to the database with an active transaction
+        """
+        connection = self.connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            yield connection
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise RepoManagementFileError(f"Unable to update the archive index {self.path}: {e}")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    def add_files(self, paths: Iterable[Path]) -> None:
+        """Add package files to the index.
+
+        Signature files and files, that are not package files, are skipped.
+
+        Parameters
+        ----------
+        paths: Iterable[Path]
+            Package files in the archive directory
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the index can not be updated
+        """
+        with self.transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO files (filename, name, requirement) VALUES (?, ?, ?)",
+                [entry for entry in (get_archive_index_entry(path=path) for path in paths) if entry],
+            )
+
+    def remove_files(self, paths: Iterable[Path]) -> None:
+        """Remove package files from the index.
+
+        Parameters
+        ----------
+        paths: Iterable[Path]
+            Package files in the archive directory
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the index can not be updated
+        """
+        with self.transaction() as connection:
+            connection.executemany("DELETE FROM files WHERE filename = ?", [(path.name,) for path in paths])
+
+    def rebuild(self) -> int:
+        """Rebuild the index from the package files in the archive directory.
+
+        All existing entries of the index are removed. If the schema version of the index does not match
+        ARCHIVE_INDEX_SCHEMA_VERSION, the database file is recreated.
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the index can not be written
+
+        Returns
+        -------
+        int
+            The number of package files written to the index
+        """
+        try:
+            self.connect().close()
+        except RepoManagementFileError as e:
+            debug(f"Recreating archive index {self.path}: {e}")
+            for path in [self.path, Path(f"{self.path}-wal"), Path(f"{self.path}-shm")]:
+                path.unlink(missing_ok=True)
+
+        debug(f"Adding package files in {self.archive_dir} to archive index {self.path}...")
+        with self.transaction() as connection:
+            connection.execute("DELETE FROM files")
+            count = connection.executemany(
+                "INSERT OR REPLACE INTO files (filename, name, requirement) VALUES (?, ?, ?)",
+                (
+                    entry
+                    for entry in (
+                        get_archive_index_entry(path=path) for path in self.archive_dir.glob("*/*/*") if path.is_file()
+                    )
+                    if entry
+                ),
+            ).rowcount
+
+        return count
+
+    def get_requirements(self, requirements: Iterable[str]) -> set[str]:
+        """Return those of a set of "name-version-architecture" strings, that have a package file in the archive.
+
+        Parameters
+        ----------
+        requirements: Iterable[str]
+            "name-version-architecture" strings (e.g. build requirements of packages) to look up
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the index can not be queried
+
+        Returns
+        -------
+        set[str]
+            The "name-version-architecture" strings of requirements, for which a package file exists in the archive
+        """
+        lookups = sorted(set(requirements))
+        found: set[str] = set()
+
+        connection = self.connect()
+        try:
+            for start in range(0, len(lookups), ARCHIVE_INDEX_QUERY_CHUNK_SIZE):
+                end = start + ARCHIVE_INDEX_QUERY_CHUNK_SIZE
+                chunk = lookups[start:end]
+                found.update(
+                    row[0]
+                    for row in connection.execute(
+                        f"SELECT DISTINCT requirement FROM files WHERE requirement IN ({', '.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                )
+        except sqlite3.Error as e:
+            raise RepoManagementFileError(f"Unable to query the archive index {self.path}: {e}")
+        finally:
+            connection.close()
+
+        return found
@@ -67,6 +67,14 @@ class ArgParseFactory:
             An ArgumentParser instance specific for the repod-file script
         """
         instance = cls(description="File actions for packages, management repository and sync databases.")
+        instance.parser.add_argument(
+            "--profile-output",
+            type=cls.string_to_writable_file_path,
+            help=(
+                "write the wall and CPU time, bytes read and written and item counts of all tasks and checks to a "
+                "JSON file in the Trace Event Format"
+            ),
+        )
         subcommands = instance.parser.add_subparsers(dest="subcommand")
 
         package = subcommands.add_parser(name="package", help="interact with package files")
@@ -94,6 +102,44 @@ class ArgParseFactory:
         repo_parser = subcommands.add_parser(name="repo", help="interact with repositories")
         repo_subcommands = repo_parser.add_subparsers(dest="repo")
 
+        repo_archiveindex_parser = repo_subcommands.add_parser(
+            name="archiveindex",
+            help="rebuild the index of a repository's package archive from its package files",
+        )
+        repo_archiveindex_parser.add_argument(
+            "name",
+            type=Path,
+            help=("name of repository, whose package archive index to rebuild"),
+        )
+        repo_archiveindex_parser.add_argument(
+            "-a",
+            "--architecture",
+            type=ArchitectureEnum,
+            help=(
+                "target a repository with a specific architecture "
+                "(if multiple of the same name but differing architecture exist)"
+            ),
+        )
+
+        repo_catalog_parser = repo_subcommands.add_parser(
+            name="catalog",
+            help="rebuild the catalog of a repository's management repository from its JSON files",
+        )
+        repo_catalog_parser.add_argument(
+            "name",
+            type=Path,
+            help=("name of repository, whose management repository catalog to rebuild"),
+        )
+        repo_catalog_parser.add_argument(
+            "-a",
+            "--architecture",
+            type=ArchitectureEnum,
+            help=(
+                "target a repository with a specific architecture "
+                "(if multiple of the same name but differing architecture exist)"
+            ),
+        )
+
         repo_importdb_parser = repo_subcommands.add_parser(
             name="importdb",
             help="import state from a repository sync database",
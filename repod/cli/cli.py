@@ -9,16 +9,19 @@ from unittest.mock import patch
 from orjson import dumps
 
 from repod import export_schemas
+from repod.action.trace import Tracer, set_tracer
 from repod.action.workflow import (
     add_packages,
     add_packages_dryrun,
+    rebuild_archive_index,
+    rebuild_management_repo_catalog,
     write_sync_databases,
 )
 from repod.cli import argparse
 from repod.common.enums import RepoDirTypeEnum, RepoTypeEnum
 from repod.config import SystemSettings, UserSettings
 from repod.config.defaults import ORJSON_OPTION
-from repod.files import Package
+from repod.files import Package, PackageCache
 from repod.repo import SyncDatabase
 
 
@@ -58,11 +61,17 @@ def repod_file_package(args: Namespace, settings: SystemSettings | UserSettings)
     pretty = ORJSON_OPTION if hasattr(args, "pretty") and args.pretty else 0
     match args.package:
         case "inspect":
+            package_cache = (
+                PackageCache(**settings.package_cache.dict())  # type: ignore[union-attr]
+                if settings.package_cache
+                else None
+            )
             for package_path in args.file:
                 model = asyncio.run(
                     Package.from_file(
                         package=package_path,
                         signature=Path(str(package_path) + ".sig") if args.with_signature else None,
+                        cache=package_cache,
                     )
                 )
 
@@ -116,6 +125,23 @@ def repod_file_repo_importpkg(args: Namespace, settings: SystemSettings | UserSe
     )
 
 
+async def import_sync_database(database: SyncDatabase, path: Path) -> None:
+    """Write the pkgbases of a sync database to JSON files in a management repository directory.
+
+    Each JSON file is written as soon as its pkgbase has been read completely from the sync database.
+
+    Parameters
+    ----------
+    database: SyncDatabase
+        The sync database to read pkgbases from
+    path: Path
+        The management repository directory to write JSON files to
+    """
+    async for base, outputpackagebase in database.outputpackagebases():
+        with open(path / f"{base}.json", "wb") as output_file:
+            output_file.write(dumps(outputpackagebase.dict(), option=ORJSON_OPTION))
+
+
 def repod_file_repo(args: Namespace, settings: SystemSettings | UserSettings) -> None:
     """Handle repository related actions from the repod-file script.
 
@@ -132,6 +158,18 @@ def repod_file_repo(args: Namespace, settings: SystemSettings | UserSettings) ->
         If an invalid subcommand is provided.
     """
     match args.repo:
+        case "archiveindex":
+            rebuild_archive_index(
+                settings=settings,
+                repo_name=args.name,
+                repo_architecture=args.architecture,
+            )
+        case "catalog":
+            rebuild_management_repo_catalog(
+                settings=settings,
+                repo_name=args.name,
+                repo_architecture=args.architecture,
+            )
         case "importdb":
             management_repo_dir = settings.get_repo_path(
                 repo_dir_type=RepoDirTypeEnum.MANAGEMENT,
@@ -143,15 +181,16 @@ def repod_file_repo(args: Namespace, settings: SystemSettings | UserSettings) ->
                     testing=args.testing,
                 ),
             )
-            for base, outputpackagebase in asyncio.run(
-                SyncDatabase(
-                    database=args.file,
-                    desc_version=settings.syncdb_settings.desc_version,
-                    files_version=settings.syncdb_settings.files_version,
-                ).outputpackagebases()
-            ):
-                with open(management_repo_dir / f"{base}.json", "wb") as output_file:
-                    output_file.write(dumps(outputpackagebase.dict(), option=ORJSON_OPTION))
+            asyncio.run(
+                import_sync_database(
+                    database=SyncDatabase(
+                        database=args.file,
+                        desc_version=settings.syncdb_settings.desc_version,
+                        files_version=settings.syncdb_settings.files_version,
+                    ),
+                    path=management_repo_dir,
+                )
+            )
         case "importpkg":
             repod_file_repo_importpkg(args=args, settings=settings)
         case "writedb":
@@ -218,15 +257,23 @@ def repod_file() -> None:
         settings = SystemSettings() if args.system else UserSettings()
     debug(f"Settings: {settings}")
 
-    match args.subcommand:
-        case "package":
-            repod_file_package(args=args, settings=settings)  # type: ignore[arg-type]
-        case "repo":
-            repod_file_repo(args=args, settings=settings)  # type: ignore[arg-type]
-        case "schema":
-            repod_file_schema(args=args)
-        case _:
-            exit_on_error(
-                message="No subcommand specified!\n",
-                argparser=argparse.ArgParseFactory.repod_file(),
-            )
+    tracer = Tracer() if hasattr(args, "profile_output") and args.profile_output else None
+    set_tracer(tracer)
+
+    try:
+        match args.subcommand:
+            case "package":
+                repod_file_package(args=args, settings=settings)  # type: ignore[arg-type]
+            case "repo":
+                repod_file_repo(args=args, settings=settings)  # type: ignore[arg-type]
+            case "schema":
+                repod_file_schema(args=args)
+            case _:
+                exit_on_error(
+                    message="No subcommand specified!\n",
+                    argparser=argparse.ArgParseFactory.repod_file(),
+                )
+    finally:
+        if tracer:
+            set_tracer(None)
+            tracer.write(path=args.profile_output)
@@ -191,6 +191,29 @@ class CompressionTypeEnum(Enum):
         return [".files", ".files.tar"] + [".files.tar." + name.value for name in cls if len(name.value) > 0]
 
 
+class FilePlacementEnum(Enum):
+    """An Enum to distinguish different strategies for placing copies of files (e.g. in package pools or archives).
+
+    Strategies other than COPY fall back to the next cheaper one, if placing a file using them is not possible (e.g.
+    because the file system does not support it). The last resort is a plain copy.
+
+    Attributes
+    ----------
+    COPY: str
+        Copy the data of a file
+    REFLINK: str
+        Clone the data of a file using a reflink (copy-on-write, e.g. on btrfs or xfs), or copy it in the kernel using
+        copy_file_range
+    HARDLINK: str
+        Clone the data of a file using a reflink, or create a hardlink to it (on the same file system), or copy it in
+        the kernel using copy_file_range
+    """
+
+    COPY = "copy"
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+
+
 class FilesVersionEnum(IntEnum):
     """An IntEnum to distinguish different version of Files.
 
@@ -1,7 +1,9 @@
 """Pydantic models shared throughout the codebase."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable, ClassVar, Iterator
 
 from email_validator import EmailNotValidError, validate_email
 from pydantic import (
@@ -10,9 +12,10 @@ from pydantic import (
     NonNegativeInt,
     PositiveInt,
     conint,
-    constr,
+    errors,
     validator,
 )
+from pydantic.validators import str_validator
 
 from repod.common.regex import (
     ARCHITECTURE,
@@ -24,12 +27,121 @@ from repod.common.regex import (
     PACKAGE_NAME,
     PACKAGER_NAME,
     PKGREL,
+    REGEX_MATCH_CACHE_SIZE,
     SHA256,
     VERSION,
+    match_regex,
 )
 from repod.version import alpm
 
 
+class CachedConstrainedStr(str):
+    """A string type for pydantic models, that is validated against a regular expression.
+
+    The regular expression is compiled only once (see repod.common.regex.compile_regex()) and the results of the
+    validation are cached (see repod.common.regex.match_regex()), so that validating the same value repeatedly (e.g. the
+    same dependency in many packages) is cheap.
+
+    This is a template class and should not be used directly. Instead create derived classes using cached_constr().
+
+    Attributes
+    ----------
+    regex: str
+        The regular expression, that values are matched against
+    """
+
+    regex: ClassVar[str]
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[..., Any]]:
+        """Yield the validators of the type.
+
+        Yields
+        ------
+        Callable[..., Any]
+            A validator of the type
+        """
+        yield str_validator
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: dict[str, Any]) -> None:
+        """Add the regular expression of the type to the JSON schema of a field.
+
+        Parameters
+        ----------
+        field_schema: dict[str, Any]
+            The JSON schema of a field
+        """
+        field_schema.update(pattern=cls.regex)
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        """Validate a string against the regular expression of the type.
+
+        Parameters
+        ----------
+        value: str
+            A string
+
+        Raises
+        ------
+        errors.StrRegexError
+            If value does not match the regular expression
+
+        Returns
+        -------
+        str
+            The validated string
+        """
+        if not match_regex(pattern=cls.regex, value=value):
+            raise errors.StrRegexError(pattern=cls.regex)
+
+        return value
+
+
+@lru_cache(maxsize=None)
+def cached_constr(regex: str) -> type[str]:
+    """Return a string type for pydantic models, that is validated against a regular expression, caching the results.
+
+    This is used instead of pydantic's constr(), so that a type (and its compiled regular expression) only exists once
+    per regular expression and the validation of repeated values is cached.
+
+    Parameters
+    ----------
+    regex: str
+        A regular expression
+
+    Returns
+    -------
+    type[str]
+        A class derived from CachedConstrainedStr
+    """
+    return type("CachedConstrainedStrValue", (CachedConstrainedStr,), {"regex": regex})
+
+
+@lru_cache(maxsize=REGEX_MATCH_CACHE_SIZE)
+def validate_packager_email(email: str) -> str | None:
+    """Validate the email of a packager and cache the result.
+
+    Parameters
+    ----------
+    email: str
+        An email address
+
+    Returns
+    -------
+    str | None
+        A string describing why email is invalid, or None if it is valid
+    """
+    try:
+        validate_email(email, check_deliverability=False)
+    except EmailNotValidError as e:
+        return str(e)
+
+    return None
+
+
 class Arch(BaseModel):
     """A model describing a single 'arch' attribute.
 
@@ -40,7 +152,7 @@ class Arch(BaseModel):
         identifies a package's architecture
     """
 
-    arch: constr(regex=f"^{ARCHITECTURE}$")  # type: ignore[valid-type]  # noqa: F722
+    arch: cached_constr(regex=f"^{ARCHITECTURE}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class Backup(BaseModel):
@@ -95,7 +207,7 @@ class Base(BaseModel):
         identifies a package's pkgbase
     """
 
-    base: constr(regex=f"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
+    base: cached_constr(regex=f"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class BuildDate(BaseModel):
@@ -186,7 +298,7 @@ class FileName(BaseModel):
         identifies a package's file name
     """
 
-    filename: constr(regex=f"^{PACKAGE_FILENAME}$")  # type: ignore[valid-type]  # noqa: F722
+    filename: cached_constr(regex=f"^{PACKAGE_FILENAME}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class FileList(BaseModel):
@@ -241,7 +353,7 @@ class Groups(BaseModel):
         identifies a package's groups
     """
 
-    groups: list[constr(regex=f"^{PACKAGE_NAME}$")] | None  # type: ignore[valid-type]  # noqa: F722
+    groups: list[cached_constr(regex=f"^{PACKAGE_NAME}$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class ISize(BaseModel):
@@ -293,7 +405,7 @@ class Md5Sum(BaseModel):
         identifies a package's md5 checksum
     """
 
-    md5sum: constr(regex=MD5)  # type: ignore[valid-type]
+    md5sum: cached_constr(regex=MD5)  # type: ignore[valid-type]
 
 
 class Name(BaseModel):
@@ -306,7 +418,7 @@ class Name(BaseModel):
         identifies a package's name
     """
 
-    name: constr(regex=f"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
+    name: cached_constr(regex=f"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class Options(BaseModel):
@@ -320,7 +432,7 @@ class Options(BaseModel):
         An optional list of strings representing makepkg.conf OPTIONS used during the creation of a package
     """
 
-    options: list[constr(regex=rf"^{OPTIONS}$")] | None  # type: ignore[valid-type]  # noqa: F722
+    options: list[cached_constr(regex=rf"^{OPTIONS}$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class Packager(BaseModel):
@@ -333,7 +445,7 @@ class Packager(BaseModel):
         identifies a package's packager
     """
 
-    packager: constr(regex=(rf"^{PACKAGER_NAME}\s<(.*)>$"))  # type: ignore[valid-type]  # noqa: F722
+    packager: cached_constr(regex=(rf"^{PACKAGER_NAME}\s<(.*)>$"))  # type: ignore[valid-type]  # noqa: F722
 
     @validator("packager")
     def validate_packager_has_valid_email(cls: Packager, packager: str) -> str:  # noqa: N805
@@ -355,10 +467,9 @@ class Packager(BaseModel):
             A validated Packager UID string
         """
         email = packager.replace(">", "").split("<")[1]
-        try:
-            validate_email(email, check_deliverability=False)
-        except EmailNotValidError as e:
-            raise ValueError(f"The packager email is not valid: {email}\n{e}") from e
+        error = validate_packager_email(email=email)
+        if error is not None:
+            raise ValueError(f"The packager email is not valid: {email}\n{error}")
 
         return packager
 
@@ -373,7 +484,7 @@ class PgpSig(BaseModel):
         identifies a package's PGP signature
     """
 
-    pgpsig: constr(regex=f"^{BASE64}$") | None  # type: ignore[valid-type]  # noqa: F722
+    pgpsig: cached_constr(regex=f"^{BASE64}$") | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class PkgBase(BaseModel):
@@ -387,7 +498,7 @@ class PkgBase(BaseModel):
         A string representing the pkgbase of a package
     """
 
-    pkgbase: constr(regex=rf"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
+    pkgbase: cached_constr(regex=rf"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class PkgDesc(BaseModel):
@@ -413,7 +524,7 @@ class PkgName(BaseModel):
         A string representing the pkgname of a package
     """
 
-    pkgname: constr(regex=rf"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
+    pkgname: cached_constr(regex=rf"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class Provides(BaseModel):
@@ -476,7 +587,7 @@ class Sha256Sum(BaseModel):
         which identifies a package's sha256 checksum
     """
 
-    sha256sum: constr(regex=SHA256)  # type: ignore[valid-type]
+    sha256sum: cached_constr(regex=SHA256)  # type: ignore[valid-type]
 
 
 class OptDepends(BaseModel):
@@ -542,7 +653,7 @@ class PkgRel(BaseModel):
         A string representing the pkgrel (package release version) of a package
     """
 
-    pkgrel: constr(regex=rf"^{PKGREL}$")  # type: ignore[valid-type]  # noqa: F722
+    pkgrel: cached_constr(regex=rf"^{PKGREL}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class PkgVer(BaseModel):
@@ -556,7 +667,7 @@ class PkgVer(BaseModel):
         A string representing the pkgver (upstream package version) of a package
     """
 
-    pkgver: constr(regex=rf"^({VERSION})$")  # type: ignore[valid-type]  # noqa: F722
+    pkgver: cached_constr(regex=rf"^({VERSION})$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class Version(BaseModel):
@@ -569,7 +680,7 @@ class Version(BaseModel):
         identifies a package's version (this is the accumulation of epoch, pkgver and pkgrel)
     """
 
-    version: constr(regex=rf"^({EPOCH}|){VERSION}-{PKGREL}$")  # type: ignore[valid-type]  # noqa: F722
+    version: cached_constr(regex=rf"^({EPOCH}|){VERSION}-{PKGREL}$")  # type: ignore[valid-type]  # noqa: F722
 
     def get_epoch(self: Version) -> Epoch | None:
         """Return the epoch of the version.
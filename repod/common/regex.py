@@ -1,4 +1,7 @@
 """Regular expressions used for matching strings in packages and sync databases."""
+import re
+from functools import lru_cache
+
 from repod.common.enums import (
     ArchitectureEnum,
     tar_compression_types_for_filename_regex,
@@ -34,3 +37,86 @@ PACKAGE_FILENAME = (
     rf"(.pkg.tar)({tar_compression_types_for_filename_regex()})"
 )
 SIGNATURE_FILENAME = rf"{PACKAGE_FILENAME}(.sig)"
+INSTALLED = rf"({PACKAGE_NAME})-({EPOCH}|){VERSION}-{PKGREL}-{ARCHITECTURE}"
+REGEX_MATCH_CACHE_SIZE = 2**16
+
+
+@lru_cache(maxsize=None)
+def compile_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a regular expression once and return it from a central registry on subsequent calls.
+
+    Parameters
+    ----------
+    pattern: str
+        A regular expression
+
+    Returns
+    -------
+    re.Pattern[str]
+        The compiled regular expression
+    """
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=REGEX_MATCH_CACHE_SIZE)
+def match_regex(pattern: str, value: str) -> bool:
+    """Match a string against a regular expression (from the beginning of the string) and cache the result.
+
+    The results of the REGEX_MATCH_CACHE_SIZE most recently matched combinations of pattern and value are cached, as
+    the same values (e.g. names of dependencies or versions) are validated repeatedly.
+
+    Parameters
+    ----------
+    pattern: str
+        A regular expression (which is retrieved using compile_regex())
+    value: str
+        A string to match against pattern
+
+    Returns
+    -------
+    bool
+        True if value matches pattern, False otherwise
+    """
+    return compile_regex(pattern=pattern).match(value) is not None
+
+
+def compile_list_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a regular expression, that matches a list of strings, which each match pattern and end on a newline.
+
+    Each string is matched atomically (using a lookahead and a backreference), so that a string not matching pattern
+    does not lead to backtracking into the matches of all previous strings.
+
+    Parameters
+    ----------
+    pattern: str
+        A regular expression (without anchors and without a group named "entry") that a single string has to match
+
+    Returns
+    -------
+    re.Pattern[str]
+        A compiled regular expression, that is used with fullmatch_list()
+    """
+    return compile_regex(pattern=rf"((?=(?P<entry>({pattern})\n))(?P=entry))*")
+
+
+def fullmatch_list(regex: re.Pattern[str], values: list[str]) -> bool:
+    """Check in a single pass, whether all strings in a list fully match a regular expression.
+
+    Parameters
+    ----------
+    regex: re.Pattern[str]
+        A regular expression compiled using compile_list_regex()
+    values: list[str]
+        A list of strings to match
+
+    Returns
+    -------
+    bool
+        True if all strings in values fully match the regular expression, False otherwise
+    """
+    if not values:
+        return True
+
+    data = "\n".join(values) + "\n"
+    # NOTE: a newline in any of the strings would split it into several ones
+    return data.count("\n") == len(values) and regex.fullmatch(data) is not None
@@ -8,12 +8,25 @@ from pathlib import Path
 from orjson import OPT_APPEND_NEWLINE, OPT_INDENT_2, OPT_SORT_KEYS
 from xdg.BaseDirectory import xdg_config_home, xdg_state_home
 
-from repod.common.enums import ArchitectureEnum, CompressionTypeEnum, SettingsTypeEnum
+from repod.common.enums import (
+    ArchitectureEnum,
+    CompressionTypeEnum,
+    FilePlacementEnum,
+    SettingsTypeEnum,
+)
 
 DEFAULT_ARCHITECTURE = ArchitectureEnum.ANY
 DEFAULT_BUILD_REQUIREMENTS_EXIST: bool = True
 DEFAULT_DATABASE_COMPRESSION = CompressionTypeEnum.GZIP
+DATABASE_COMPRESSION_LEVELS: dict[CompressionTypeEnum, tuple[int, int]] = {
+    CompressionTypeEnum.BZIP2: (1, 9),
+    CompressionTypeEnum.GZIP: (0, 9),
+    CompressionTypeEnum.LZMA: (0, 9),
+    CompressionTypeEnum.ZSTANDARD: (-131072, 22),
+}
+DEFAULT_FILE_PLACEMENT = FilePlacementEnum.COPY
 DEFAULT_NAME = "default"
+DEFAULT_PACKAGE_CACHE_MAX_SIZE = 512 * 1024 * 1024
 
 ORJSON_OPTION = OPT_INDENT_2 | OPT_APPEND_NEWLINE | OPT_SORT_KEYS
 
@@ -54,3 +67,7 @@ SOURCE_ARCHIVE_DIR = {
     SettingsTypeEnum.SYSTEM: Path("/var/lib/repod/archive/source/"),
     SettingsTypeEnum.USER: Path(xdg_state_home + "/repod/archive/source/"),
 }
+PACKAGE_CACHE_DIR = {
+    SettingsTypeEnum.SYSTEM: Path("/var/lib/repod/cache/package/"),
+    SettingsTypeEnum.USER: Path(xdg_state_home + "/repod/cache/package/"),
+}
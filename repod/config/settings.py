@@ -23,6 +23,7 @@ from pydantic.env_settings import SettingsSourceCallable
 from repod.common.enums import (
     ArchitectureEnum,
     CompressionTypeEnum,
+    FilePlacementEnum,
     FilesVersionEnum,
     PackageDescVersionEnum,
     PkgVerificationTypeEnum,
@@ -31,13 +32,17 @@ from repod.common.enums import (
     SettingsTypeEnum,
 )
 from repod.config.defaults import (
+    DATABASE_COMPRESSION_LEVELS,
     DEFAULT_ARCHITECTURE,
     DEFAULT_BUILD_REQUIREMENTS_EXIST,
     DEFAULT_DATABASE_COMPRESSION,
+    DEFAULT_FILE_PLACEMENT,
     DEFAULT_NAME,
+    DEFAULT_PACKAGE_CACHE_MAX_SIZE,
     MANAGEMENT_REPO_BASE,
     ORJSON_OPTION,
     PACKAGE_ARCHIVE_DIR,
+    PACKAGE_CACHE_DIR,
     PACKAGE_POOL_BASE,
     PACKAGE_REPO_BASE,
     SETTINGS_LOCATION,
@@ -119,16 +124,71 @@ class Architecture(BaseModel):
     architecture: ArchitectureEnum | None
 
 
+def raise_on_invalid_database_compression_level(compression: CompressionTypeEnum, level: int) -> None:
+    """Raise on a compression level, that is not supported by a compression type.
+
+    Parameters
+    ----------
+    compression: CompressionTypeEnum
+        A member of CompressionTypeEnum
+    level: int
+        A compression level
+
+    Raises
+    ------
+    ValueError
+        If the compression type does not support compression levels or level is out of its range
+    """
+    if compression not in DATABASE_COMPRESSION_LEVELS:
+        raise ValueError(f"The database compression {compression.value} does not support a compression level!")
+
+    minimum, maximum = DATABASE_COMPRESSION_LEVELS[compression]
+    if not minimum <= level <= maximum:
+        raise ValueError(
+            f"The database compression level {level} is not in the range of {minimum} to {maximum} supported by the "
+            f"database compression {compression.value}!"
+        )
+
+
 class DatabaseCompression(BaseModel):
-    """Compression type for repository sync databases.
+    """Compression type and level for repository sync databases.
 
     Attributes
     ----------
     database_compression: CompressionTypeEnum
         A member of CompressionTypeEnum (defaults to DEFAULT_DATABASE_COMPRESSION)
+    database_compression_level: int | None
+        An optional compression level (defaults to None, which uses the default of the compression type)
     """
 
     database_compression: CompressionTypeEnum | None
+    database_compression_level: int | None
+
+    @root_validator(skip_on_failure=True)
+    def validate_database_compression_level(cls, values: dict[str, Any]) -> dict[str, Any]:
+        """Validate the database compression level against the database compression.
+
+        Parameters
+        ----------
+        values: dict[str, Any]
+            A dict with all values of the instance
+
+        Raises
+        ------
+        ValueError
+            If the database compression does not support the database compression level
+
+        Returns
+        -------
+        dict[str, Any]
+            The unchanged values of the instance
+        """
+        compression = values.get("database_compression")
+        level = values.get("database_compression_level")
+        if compression is not None and level is not None:
+            raise_on_invalid_database_compression_level(compression=compression, level=level)
+
+        return values
 
 
 class BuildRequirementsExist(BaseModel):
@@ -181,20 +241,28 @@ class ArchiveSettings(BaseModel):
         The Path of the directory below which source files are archived (defaults to
         SOURCE_ARCHIVE_DIR[SettingsTypeEnum.USER] in user mode and SOURCE_ARCHIVE_DIR[SettingsTypeEnum.SYSTEM] in
         system mode)
+    index: Path | None
+        The optional absolute path of an SQLite database file, which is used as index of the package files in packages
+        (defaults to None)
+    objects: Path | None
+        The optional absolute path of a directory, in which the package files and their signatures are stored by their
+        SHA-256 checksum, while the files in packages are symlinks to them (defaults to None)
     """
 
     packages: Path
     sources: Path
+    index: Path | None = None
+    objects: Path | None = None
 
-    @validator("packages", "sources")
-    def validate_paths(cls, path: Path) -> Path:
+    @validator("packages", "sources", "index", "objects")
+    def validate_paths(cls, path: Path | None) -> Path | None:
         """Validate and expand archive paths.
 
         If path starts with `~` the validation attempts to expand it to an absolute Path.
 
         Parameters
         ----------
-        path: Path
+        path: Path | None
             A path to validate
 
         Raises
@@ -205,9 +273,12 @@ class ArchiveSettings(BaseModel):
 
         Returns
         -------
-        Path
-            A validated, absolute Path
+        Path | None
+            A validated, absolute Path, or None if no path is provided
         """
+        if path is None:
+            return path
+
         if str(path).startswith("~"):
             try:
                 debug(f"Expanding user home in archive path {path}...")
@@ -221,6 +292,60 @@ class ArchiveSettings(BaseModel):
         return path
 
 
+class PackageCacheSettings(BaseModel):
+    """Settings for the persistent cache of package metadata.
+
+    Attributes
+    ----------
+    directory: Path
+        The Path of the directory in which package metadata is cached (defaults to
+        PACKAGE_CACHE_DIR[SettingsTypeEnum.USER] in user mode and PACKAGE_CACHE_DIR[SettingsTypeEnum.SYSTEM] in system
+        mode)
+    max_size: PositiveInt
+        The maximum size of the cache in bytes (defaults to DEFAULT_PACKAGE_CACHE_MAX_SIZE)
+    verify_checksum: bool
+        Whether to verify the SHA-256 checksum of a package file before using its cached metadata (defaults to False)
+    """
+
+    directory: Path
+    max_size: PositiveInt = DEFAULT_PACKAGE_CACHE_MAX_SIZE
+    verify_checksum: bool = False
+
+    @validator("directory")
+    def validate_directory(cls, directory: Path) -> Path:
+        """Validate and expand the cache directory.
+
+        If directory starts with `~` the validation attempts to expand it to an absolute Path.
+
+        Parameters
+        ----------
+        directory: Path
+            A directory to validate
+
+        Raises
+        ------
+        ValueError
+            If a Path starting with `~` can not be expanded to an absolute Path
+            or if a relative Path not starting with `~` is provided
+
+        Returns
+        -------
+        Path
+            A validated, absolute Path
+        """
+        if str(directory).startswith("~"):
+            try:
+                debug(f"Expanding user home in package cache directory {directory}...")
+                directory = directory.expanduser()
+            except RuntimeError:
+                raise ValueError(f"The package cache directory can not be expanded to an absolute path: {directory}")
+
+        if not directory.is_absolute():
+            raise ValueError("The package cache directory must be absolute!")
+
+        return directory
+
+
 class SyncDbSettings(BaseModel):
     """Settings for repository sync databases.
 
@@ -230,10 +355,14 @@ class SyncDbSettings(BaseModel):
         The desc version to export to (defaults to PackageDescVersionEnum.DEFAULT)
     files_version: FilesVersionEnum
         The files version to export to (defaults to FilesVersionEnum.DEFAULT)
+    incremental: bool
+        Whether to only re-render pkgbases changed when adding packages and to copy all others from the existing sync
+        databases (defaults to False)
     """
 
     desc_version: PackageDescVersionEnum = PackageDescVersionEnum.DEFAULT
     files_version: FilesVersionEnum = FilesVersionEnum.DEFAULT
+    incremental: bool = False
 
 
 class UrlValidationSettings(BaseModel):
@@ -314,11 +443,54 @@ class ManagementRepo(BaseModel):
         A URL describing the VCS upstream of the management repository
     json_dumps_option: int
         An option for orjson (see https://github.com/ijl/orjson#option) on how to serialize data
+    catalog: Path | None
+        The optional absolute path of an SQLite database file, which is used as catalog of the management repository
+        (defaults to None)
     """
 
     directory: Path
     url: AnyUrl | None
     json_dumps_option: int = ORJSON_OPTION
+    catalog: Path | None = None
+
+    @validator("catalog")
+    def validate_catalog(cls, catalog: Path | None) -> Path | None:
+        """Validate and expand the catalog path.
+
+        If catalog starts with `~` the validation attempts to expand it to an absolute Path.
+
+        Parameters
+        ----------
+        catalog: Path | None
+            An optional path of an SQLite database file to validate
+
+        Raises
+        ------
+        ValueError
+            If a Path starting with `~` can not be expanded to an absolute Path
+            or if a relative Path not starting with `~` is provided
+
+        Returns
+        -------
+        Path | None
+            A validated, absolute Path or None
+        """
+        if catalog is None:
+            return catalog
+
+        if str(catalog).startswith("~"):
+            try:
+                debug(f"Expanding user home in management repository catalog {catalog}...")
+                catalog = catalog.expanduser()
+            except RuntimeError:
+                raise ValueError(
+                    f"The management repository catalog can not be expanded to an absolute path: {catalog}"
+                )
+
+        if not catalog.is_absolute():
+            raise ValueError("The management repository catalog must be absolute!")
+
+        return catalog
 
     @validator("url")
     def validate_url(cls, url: AnyUrl | None) -> AnyUrl | None:
@@ -366,6 +538,9 @@ class PackageRepo(Architecture, BuildRequirementsExist, DatabaseCompression, Pac
         (False/ None).
     database_compression: CompressionTypeEnum
         A member of CompressionTypeEnum (defaults to DEFAULT_DATABASE_COMPRESSION)
+    database_compression_level: int | None
+        An optional compression level for the database compression. If unset, the application-wide one is used, if the
+        database compression matches the application-wide one.
     debug: Path | None
         The optional name of a debug repository associated with a package repository
     package_pool: Path | None
@@ -680,6 +855,29 @@ class PackageRepo(Architecture, BuildRequirementsExist, DatabaseCompression, Pac
 
         return dirs
 
+    def get_management_repo_types(self) -> dict[Path, RepoTypeEnum]:
+        """Return all management repository directories of the PackageRepo and the type of their repository.
+
+        Returns
+        -------
+        dict[Path, RepoTypeEnum]
+            A dict of Paths, representing all management repository directories that the repository uses, and the
+            member of RepoTypeEnum, that identifies the type of their repository
+        """
+        repo_types: dict[Path, RepoTypeEnum] = {self._stable_management_repo_dir: RepoTypeEnum.STABLE}
+        if self.debug:
+            repo_types[self._debug_management_repo_dir] = RepoTypeEnum.STABLE_DEBUG
+        if self.staging:
+            repo_types[self._staging_management_repo_dir] = RepoTypeEnum.STAGING
+            if self.debug:
+                repo_types[self._staging_debug_management_repo_dir] = RepoTypeEnum.STAGING_DEBUG
+        if self.testing:
+            repo_types[self._testing_management_repo_dir] = RepoTypeEnum.TESTING
+            if self.debug:
+                repo_types[self._testing_debug_management_repo_dir] = RepoTypeEnum.TESTING_DEBUG
+
+        return repo_types
+
     def get_all_package_repo_dirs(self) -> list[Path]:
         """Return all package repository directories of the PackageRepo.
 
@@ -906,10 +1104,21 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
     database_compression: CompressionTypeEnum
         A member of CompressionTypeEnum which defines the default database compression for any package repository
         without a database compression set (defaults to DEFAULT_DATABASE_COMPRESSION).
+    database_compression_level: int | None
+        An optional compression level, that (if set) defines the compression level for any package repository, which
+        uses the same database compression and does not define a compression level itself.
+    database_compression_workers: PositiveInt | None
+        An optional positive integer, which defines the number of threads used for compressing gzip and zstandard
+        compressed repository sync databases (1 compresses them on a single thread). If unset, the number of CPUs is
+        used.
     archiving: ArchiveSettings | None
         An optional instance of ArchiveSettings, that (if set) defines the archiving options for each package
         repository, which does not define one itself.
         If unset, a default one is created during validation.
+    file_placement: FilePlacementEnum
+        A member of FilePlacementEnum which defines how package files are placed in package pools and archives and how
+        backups of files in management repositories and package repositories are created (defaults to
+        DEFAULT_FILE_PLACEMENT).
     management_repo: ManagementRepo | None
         An optional ManagementRepo, that (if set) defines a management repository setup for each package repository
         which does not define one itself.
@@ -923,6 +1132,12 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
     package_verification: PkgVerificationTypeEnum | None
         An optional member of PkgVerificationTypeEnum, which defines which verification scheme to apply for the detached
         package signatures.
+    package_cache: PackageCacheSettings | None
+        An optional PackageCacheSettings instance, that (if set) enables a persistent cache for package metadata.
+        If set to True, default PackageCacheSettings are created during validation.
+    package_workers: PositiveInt | None
+        An optional positive integer, which defines the number of worker processes used for reading package files when
+        adding packages (1 reads them serially). If unset, the number of CPUs is used.
     repositories: list[PackageRepo]
         A list of PackageRepos that each define a binary package repository (with optional debug, staging and testing
         locations). Each may define optional overrides for Architecture, ManagementRepo, PackagePool and SourcePool
@@ -959,10 +1174,14 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
 
     architecture: ArchitectureEnum = DEFAULT_ARCHITECTURE
     database_compression: CompressionTypeEnum = DEFAULT_DATABASE_COMPRESSION
+    database_compression_workers: PositiveInt | None
     archiving: ArchiveSettings | bool | None
+    file_placement: FilePlacementEnum = DEFAULT_FILE_PLACEMENT
     management_repo: ManagementRepo | None
     repositories: list[PackageRepo] = []
+    package_cache: PackageCacheSettings | bool | None
     package_verification: PkgVerificationTypeEnum | None
+    package_workers: PositiveInt | None
     syncdb_settings: SyncDbSettings = SyncDbSettings()
 
     class Config:
@@ -1030,6 +1249,33 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
 
         return archiving
 
+    @validator("package_cache")
+    def validate_package_cache(cls, package_cache: PackageCacheSettings | bool | None) -> PackageCacheSettings | None:
+        """Validate the PackageCacheSettings and return a default if requested.
+
+        Parameters
+        ----------
+        package_cache: PackageCacheSettings | bool | None
+            An optional PackageCacheSettings instance or optional boolean value indicating whether to use default
+            package cache settings. When providing True, default package cache settings are used, when providing None
+            or False, no package cache is used
+
+        Returns
+        -------
+        PackageCacheSettings | None
+            The instance's PackageCacheSettings, a default one or None
+        """
+        match package_cache:
+            case True:
+                debug("Setting up default package cache...")
+                package_cache = get_default_package_cache_settings(settings_type=cls._settings_type)
+            case False:
+                package_cache = None
+            case _:
+                pass
+
+        return package_cache
+
     @validator("build_requirements_exist")
     def validate_build_requirements_exist(cls, build_requirements_exist: bool | None) -> bool:
         """Validate settings whether build requirements must exist and set defaults.
@@ -1123,6 +1369,7 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
             archiving=values.get("archiving"),
             build_requirements_exist=values.get("build_requirements_exist"),  # type: ignore[arg-type]
             database_compression=values.get("database_compression"),  # type: ignore[arg-type]
+            database_compression_level=values.get("database_compression_level"),
             management_repo=values.get("management_repo"),  # type: ignore[arg-type]
             package_pool=to_absolute_path(
                 path=values.get("package_pool") or cls._package_pool_base / DEFAULT_NAME,
@@ -1234,6 +1481,7 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
         archiving: ArchiveSettings | None,
         build_requirements_exist: bool,
         database_compression: CompressionTypeEnum,
+        database_compression_level: int | None,
         management_repo: ManagementRepo,
         package_pool: Path,
         repositories: list[PackageRepo],
@@ -1255,6 +1503,8 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
             The settings-wide default build_requirements_exist value
         database_compression: CompressionTypeEnum
             The settings-wide default database compression
+        database_compression_level: int | None
+            The optional settings-wide default database compression level
         management_repo: ManagementRepo
             The settings-wide default management repo
         package_pool: Path
@@ -1264,6 +1514,11 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
         source_pool: Path
             The settings-wide default source_pool
 
+        Raises
+        ------
+        ValueError
+            If the database compression of a repository does not support its database compression level
+
         Returns
         -------
         list[PackageRepo]
@@ -1281,6 +1536,13 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
             if not repo.database_compression and database_compression:
                 debug(f"Using global database compression ({database_compression.value}) for repo {repo.name}.")
                 repo.database_compression = database_compression
+            if repo.database_compression_level is None and repo.database_compression == database_compression:
+                repo.database_compression_level = database_compression_level
+            if repo.database_compression_level is not None:
+                raise_on_invalid_database_compression_level(
+                    compression=repo.database_compression,
+                    level=repo.database_compression_level,
+                )
             if repo.build_requirements_exist is None:
                 repo.build_requirements_exist = build_requirements_exist
             if not repo.management_repo and management_repo:
@@ -1876,6 +2138,28 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
         repo = self.get_repo(name=name, architecture=architecture)
         return repo.database_compression  # type: ignore[return-value]
 
+    def get_repo_database_compression_level(
+        self,
+        name: Path,
+        architecture: ArchitectureEnum | None,
+    ) -> int | None:
+        """Return the database compression level of a repository.
+
+        Parameters
+        ----------
+        name: Path
+            The name of the repository
+        architecture: ArchitectureEnum | None
+            An optional member of ArchitectureEnum to define the CPU architecture of the repository
+
+        Returns
+        -------
+        int | None
+            The optional database compression level of the repository identified by name and architecture
+        """
+        repo = self.get_repo(name=name, architecture=architecture)
+        return repo.database_compression_level
+
     def get_repo_path(
         self,
         repo_dir_type: RepoDirTypeEnum,
@@ -2087,6 +2371,27 @@ class Settings(Architecture, BaseSettings, BuildRequirementsExist, DatabaseCompr
         repo = self.get_repo(name=name, architecture=architecture)
         return repo.management_repo  # type: ignore[return-value]
 
+    def get_management_repo_types(self, management_repo: ManagementRepo) -> dict[Path, RepoTypeEnum]:
+        """Return the management repository directories of all PackageRepos using a ManagementRepo.
+
+        Parameters
+        ----------
+        management_repo: ManagementRepo
+            A ManagementRepo
+
+        Returns
+        -------
+        dict[Path, RepoTypeEnum]
+            A dict of Paths, representing the management repository directories of all PackageRepos using
+            management_repo, and the member of RepoTypeEnum, that identifies the type of their repository
+        """
+        repo_types: dict[Path, RepoTypeEnum] = {}
+        for repo in self.repositories:
+            if repo.management_repo == management_repo:
+                repo_types.update(repo.get_management_repo_types())
+
+        return repo_types
+
     def get_repos_by_group(
         self,
         group: PositiveInt | None,
@@ -2304,6 +2609,35 @@ def get_default_packagerepo(settings_type: SettingsTypeEnum) -> PackageRepo:
             raise RuntimeError("Invalid settings_type provided for creating a default PackageRepo!")
 
 
+def get_default_package_cache_settings(settings_type: SettingsTypeEnum) -> PackageCacheSettings:
+    """Return a default PackageCacheSettings.
+
+    If settings_type is SettingsTypeEnum.SYSTEM, a PackageCacheSettings using the system wide default directory is
+    returned.
+    If settings_type is SettingsTypeEnum.USER, a PackageCacheSettings using the per-user default directory is returned.
+
+    Parameters
+    ----------
+    settings_type: SettingsTypeEnum
+        A settings type based upon which the PackageCacheSettings is created
+
+    Raises
+    ------
+    RuntimeError
+        If an invalid SettingsTypeEnum member is provided
+
+    Returns
+    -------
+    PackageCacheSettings
+        A PackageCacheSettings instance with defaults based upon settings_type
+    """
+    match settings_type:
+        case SettingsTypeEnum.USER | SettingsTypeEnum.SYSTEM:
+            return PackageCacheSettings(directory=PACKAGE_CACHE_DIR[settings_type])
+        case _:
+            raise RuntimeError("Invalid settings_type provided for creating a default PackageCacheSettings!")
+
+
 def get_default_archive_settings(settings_type: SettingsTypeEnum) -> ArchiveSettings:
     """Return a default ArchiveSettings.
 
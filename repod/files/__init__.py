@@ -6,7 +6,7 @@ from repod.files.buildinfo import export_schemas as buildinfo_export_schemas
 from repod.files.common import extract_file_from_tarfile, open_tarfile  # noqa: F401
 from repod.files.mtree import MTree, MTreeEntry  # noqa: F401
 from repod.files.mtree import export_schemas as mtree_export_schemas
-from repod.files.package import Package  # noqa: F401
+from repod.files.package import Package, PackageCache  # noqa: F401
 from repod.files.package import export_schemas as package_export_schemas
 from repod.files.pkginfo import PkgInfo  # noqa: F401
 from repod.files.pkginfo import export_schemas as pkginfo_export_schemas
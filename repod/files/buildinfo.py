@@ -6,7 +6,7 @@ from pathlib import Path
 from re import fullmatch
 from typing import Any
 
-from pydantic import BaseModel, NonNegativeInt, constr, root_validator, validator
+from pydantic import BaseModel, NonNegativeInt, root_validator, validator
 
 from repod.common.enums import ArchitectureEnum, FieldTypeEnum
 from repod.common.models import (
@@ -16,15 +16,19 @@ from repod.common.models import (
     PkgName,
     SchemaVersionV1,
     SchemaVersionV2,
+    cached_constr,
 )
 from repod.common.regex import (
     ARCHITECTURE,
     BUILDENVS,
     EPOCH,
+    INSTALLED,
     PACKAGE_NAME,
     PKGREL,
     SHA256,
     VERSION,
+    compile_list_regex,
+    fullmatch_list,
 )
 from repod.errors import RepoManagementError
 
@@ -45,6 +49,7 @@ BUILDINFO_ASSIGNMENTS: dict[str, tuple[str, FieldTypeEnum]] = {
     "pkgver": ("pkgver", FieldTypeEnum.STRING),
     "startdir": ("startdir", FieldTypeEnum.STRING),
 }
+INSTALLED_LIST_REGEX = compile_list_regex(pattern=INSTALLED)
 
 
 class BuildDate(BaseModel):
@@ -104,7 +109,7 @@ class BuildEnv(BaseModel):
         A list of strings as described by makepkg.conf's BUILDENV option
     """
 
-    buildenv: list[constr(regex=rf"^{BUILDENVS}$")]  # type: ignore[valid-type]  # noqa: F722
+    buildenv: list[cached_constr(regex=rf"^{BUILDENVS}$")]  # type: ignore[valid-type]  # noqa: F722
 
 
 class BuildTool(BaseModel):
@@ -116,7 +121,7 @@ class BuildTool(BaseModel):
         The package name of the build tool used to create a package
     """
 
-    buildtool: constr(regex=rf"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
+    buildtool: cached_constr(regex=rf"^{PACKAGE_NAME}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class BuildToolVer(BaseModel):
@@ -141,9 +146,51 @@ class Installed(BaseModel):
         during the creation of a package
     """
 
-    installed: list[  # type: ignore[valid-type]
-        constr(regex=rf"^({PACKAGE_NAME})-({EPOCH}|){VERSION}-{PKGREL}-{ARCHITECTURE}$")  # noqa: F722
-    ]
+    installed: list[str]
+
+    class Config:
+        """Configuration for the JSON schema of Installed."""
+
+        @staticmethod
+        def schema_extra(schema: dict[str, Any], model: type[Installed]) -> None:
+            """Add the pattern, that the entries of the installed attribute are validated against, to the JSON schema.
+
+            Parameters
+            ----------
+            schema: dict[str, Any]
+                The JSON schema of the model
+            model: type[Installed]
+                The model
+            """
+            schema["properties"]["installed"]["items"]["pattern"] = f"^{INSTALLED}$"
+
+    @validator("installed")
+    def validate_installed(cls, installed: list[str]) -> list[str]:
+        """Validate the installed attribute.
+
+        All entries are validated in a single pass using INSTALLED_LIST_REGEX. Only if this fails, the entries are
+        validated one by one to find the invalid ones.
+
+        Parameters
+        ----------
+        installed: list[str]
+            A list of strings representing <package_name>-<epoch><version>-<pkgrel>-<architecture>
+
+        Raises
+        ------
+        ValueError
+            If any of the entries in installed is invalid
+
+        Returns
+        -------
+        list[str]
+            The validated list of strings
+        """
+        if not fullmatch_list(regex=INSTALLED_LIST_REGEX, values=installed):
+            invalid = [entry for entry in installed if not fullmatch_list(regex=INSTALLED_LIST_REGEX, values=[entry])]
+            raise ValueError(f"The following installed packages are invalid: {invalid}")
+
+        return installed
 
     @classmethod
     def as_models(cls, installed: list[str]) -> list[tuple[PkgName, PkgVer, ArchitectureEnum]]:
@@ -185,7 +232,7 @@ class PkgArch(BaseModel):
         A valid CPU architecture for a package
     """
 
-    pkgarch: constr(regex=rf"^{ARCHITECTURE}$")  # type: ignore[valid-type]  # noqa: F722
+    pkgarch: cached_constr(regex=rf"^{ARCHITECTURE}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class PkgBuildSha256Sum(BaseModel):
@@ -197,7 +244,7 @@ class PkgBuildSha256Sum(BaseModel):
         A string representing a SHA-256 checksum for a PKGBUILD of a package
     """
 
-    pkgbuild_sha256sum: constr(regex=rf"{SHA256}")  # type: ignore[valid-type]
+    pkgbuild_sha256sum: cached_constr(regex=rf"{SHA256}")  # type: ignore[valid-type]
 
 
 class PkgVer(BaseModel):
@@ -212,7 +259,7 @@ class PkgVer(BaseModel):
         A valid package version string which includes epoch, version and pkgrel
     """
 
-    pkgver: constr(regex=rf"^({EPOCH}|){VERSION}-{PKGREL}$")  # type: ignore[valid-type]  # noqa: F722
+    pkgver: cached_constr(regex=rf"^({EPOCH}|){VERSION}-{PKGREL}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class StartDir(BaseModel):
@@ -272,23 +319,24 @@ class BuildInfo(BaseModel):
             An instance of BuildInfo
         """
         entries: dict[str, int | str | list[str]] = {}
+        values: dict[str, list[str]] = {}
 
-        for line in data:
-            [key, value] = [x.strip() for x in line.strip().split("=")]
+        # NOTE: split the data only once and group the values by key, so that type assignments are only looked up once
+        # per key (and not per line)
+        for line in data.read().splitlines():
+            key, _, value = line.partition("=")
+            values.setdefault(key.strip(), []).append(value.strip())
 
+        for key, key_values in values.items():
             assignment_key = BUILDINFO_ASSIGNMENTS.get(key)
             if isinstance(assignment_key, tuple):
                 match assignment_key[1]:
                     case FieldTypeEnum.INT:
-                        entries[assignment_key[0]] = int(value)
+                        entries[assignment_key[0]] = int(key_values[-1])
                     case FieldTypeEnum.STRING:
-                        entries[assignment_key[0]] = str(value)
+                        entries[assignment_key[0]] = key_values[-1]
                     case FieldTypeEnum.STRING_LIST:
-                        entry = entries.get(assignment_key[0])
-                        if entry is not None and isinstance(entry, list):
-                            entry.append(str(value))
-                        else:
-                            entries[assignment_key[0]] = [str(value)]
+                        entries[assignment_key[0]] = key_values
                     # NOTE: the catch all can never be reached but is here to satisfy our tooling
                     case _:  # pragma: no cover
                         continue
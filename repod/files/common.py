@@ -1,26 +1,58 @@
 """Common function and tools to work with files."""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from fcntl import ioctl
+from functools import lru_cache
 from gzip import BadGzipFile
 from gzip import open as gzip_open
-from io import BytesIO, StringIO
+from hashlib import md5, sha256
+from io import SEEK_SET, BytesIO, RawIOBase, StringIO
 from logging import debug
+from os import cpu_count, link
+from os.path import samefile
 from pathlib import Path
+from shutil import SameFileError, copy2, copystat
+from struct import pack
 from tarfile import ReadError, TarFile
 from tarfile import open as tarfile_open
-from typing import IO, Literal
+from time import time
+from typing import IO, Any, Literal
+from zlib import DEFLATED, MAX_WBITS, Z_FINISH, Z_SYNC_FLUSH, compressobj, crc32
 
 import magic
 from pyzstd import CParameter, ZstdDict, ZstdFile
 
-from repod.common.enums import CompressionTypeEnum
+from repod.common.enums import CompressionTypeEnum, FilePlacementEnum
 from repod.errors import RepoManagementFileError, RepoManagementFileNotFoundError
 
+DIGEST_CHUNK_SIZE = 1024 * 1024
+GZIP_BLOCK_SIZE = 128 * 1024
+GZIP_DICTIONARY_SIZE = 32 * 1024
+GZIP_DEFAULT_LEVEL = 9
+COMPRESSION_MAGIC_NUMBERS = {
+    b"BZh": CompressionTypeEnum.BZIP2,
+    b"\x1f\x8b": CompressionTypeEnum.GZIP,
+    b"\xfd7zXZ\x00": CompressionTypeEnum.LZMA,
+    b"\x28\xb5\x2f\xfd": CompressionTypeEnum.ZSTANDARD,
+}
+TAR_MAGIC_NUMBER = b"ustar"
+TAR_MAGIC_NUMBER_OFFSET = 257
+# NOTE: the FICLONE ioctl request number (_IOW(0x94, 9, int)) from linux/fs.h
+FICLONE = 0x40049409
+COPY_FILE_RANGE_CHUNK_SIZE = 1024 * 1024 * 1024
+TARFILE_COMPRESSION_LEVEL_ARGUMENTS = {
+    CompressionTypeEnum.BZIP2: "compresslevel",
+    CompressionTypeEnum.GZIP: "compresslevel",
+    CompressionTypeEnum.LZMA: "preset",
+}
+
 
 class ZstdTarFile(TarFile):
     """A class to provide reading and writing of zstandard files using TarFile functionality."""
 
     def __init__(  # type: ignore[no-untyped-def]
         self,
-        name: str | Path,
+        name: str | Path | IO[bytes],
         mode: Literal["r", "a", "w", "x"] = "r",
         level_or_option: None | int | dict[CParameter, int] = None,
         zstd_dict: ZstdDict | None = None,
@@ -28,7 +60,7 @@ class ZstdTarFile(TarFile):
     ) -> None:
         """Initialize an instance of ZstdTarFile."""
         self.zstd_file = ZstdFile(
-            filename=name,
+            filename=name,  # type: ignore[arg-type]
             mode=mode,
             level_or_option=level_or_option,
             zstd_dict=zstd_dict,
@@ -48,13 +80,406 @@ class ZstdTarFile(TarFile):
             self.zstd_file.close()
 
 
-def compression_type_of_tarfile(path: Path) -> CompressionTypeEnum:
-    """Retrieve the compression type of a tar file.
+class DigestReader(RawIOBase):
+    """A readable and seekable binary file, that calculates MD5 and SHA-256 digests of its contents while being read.
+
+    The digests are updated from the same buffer in the order of the file's contents and each byte is only digested
+    once, regardless of how often it is read (e.g. due to seeking backwards). Bytes, that are skipped by seeking
+    forward, are digested in chunks of chunk_size once data beyond them is read, or when calling digests().
+    This allows to calculate the checksums of a file while reading it with e.g. a TarFile, so that the file is not
+    read twice and memory usage is bounded by chunk_size.
+
+    Attributes
+    ----------
+    name: str
+        The name of the file
+    chunk_size: int
+        The size of chunks in which to read data, that has been skipped by seeking forward (defaults to
+        DIGEST_CHUNK_SIZE)
+    """
+
+    def __init__(self, path: Path, chunk_size: int = DIGEST_CHUNK_SIZE) -> None:
+        """Initialize an instance of DigestReader.
+
+        Parameters
+        ----------
+        path: Path
+            The path to a file to read
+        chunk_size: int
+            The size of chunks in which to read data, that has been skipped by seeking forward (defaults to
+            DIGEST_CHUNK_SIZE)
+        """
+        self.name = str(path)
+        self.chunk_size = chunk_size
+        self._file = open(path, "rb")
+        # NOTE: MD5 sums are still part of the PackageV1 API
+        self._md5 = md5()  # nosec: B324
+        self._sha256 = sha256()
+        self._digested = 0
+
+    def readable(self) -> bool:
+        """Return whether the file is readable.
+
+        Returns
+        -------
+        bool
+            Always True
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """Return whether the file is seekable.
+
+        Returns
+        -------
+        bool
+            Always True
+        """
+        return True
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """Change the stream position.
+
+        Parameters
+        ----------
+        offset: int
+            The offset to seek to (relative to whence)
+        whence: int
+            The reference point for offset (defaults to SEEK_SET)
+
+        Returns
+        -------
+        int
+            The new absolute position
+        """
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        """Return the current stream position.
+
+        Returns
+        -------
+        int
+            The current absolute position
+        """
+        return self._file.tell()
+
+    def _update(self, data: bytes | memoryview) -> None:
+        """Update the digests with data.
+
+        Parameters
+        ----------
+        data: bytes | memoryview
+            The data with which to update the digests
+        """
+        self._md5.update(data)
+        self._sha256.update(data)
+        self._digested += len(data)
+
+    def _digest_until(self, position: int | None = None) -> None:
+        """Digest the not yet digested contents of the file up to position in chunks of chunk_size.
+
+        The stream position is not changed by this method.
+
+        Parameters
+        ----------
+        position: int | None
+            The position up to which to digest the file (defaults to None, which digests up to the end of the file)
+        """
+        if position is not None and position <= self._digested:
+            return
+
+        current = self._file.tell()
+        self._file.seek(self._digested)
+        while position is None or self._digested < position:
+            chunk = self._file.read(
+                self.chunk_size if position is None else min(self.chunk_size, position - self._digested)
+            )
+            if not chunk:
+                break
+            self._update(chunk)
+        self._file.seek(current)
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        """Read bytes into a pre-allocated buffer and update the digests with all not yet digested bytes.
+
+        Parameters
+        ----------
+        buffer: bytearray | memoryview
+            A pre-allocated, writable buffer
+
+        Returns
+        -------
+        int
+            The number of bytes read
+        """
+        position = self._file.tell()
+        self._digest_until(position=position)
+        size = self._file.readinto(buffer)
+        if position + size > self._digested:
+            start = self._digested - position
+            self._update(memoryview(buffer)[start:size])
+        return size
+
+    def digests(self) -> tuple[str, str]:
+        """Digest the remaining contents of the file and return the MD5 and SHA-256 checksums.
+
+        Returns
+        -------
+        tuple[str, str]
+            The MD5 and the SHA-256 checksum of the file's contents
+        """
+        self._digest_until()
+        return (self._md5.hexdigest(), self._sha256.hexdigest())
+
+    def close(self) -> None:
+        """Close the file."""
+        try:
+            self._file.close()
+        finally:
+            super().close()
+
+
+def compress_gzip_block(data: bytes, dictionary: bytes, level: int, last: bool) -> bytes:
+    """Compress a block of data to a raw deflate stream, that can be concatenated with those of its neighbours.
+
+    Parameters
+    ----------
+    data: bytes
+        The data to compress
+    dictionary: bytes
+        The data preceding the block, which is used as dictionary (may be empty)
+    level: int
+        The compression level to use
+    last: bool
+        Whether the block is the last one of the stream
+
+    Returns
+    -------
+    bytes
+        The raw deflate stream of the block, ending on a byte boundary (using a sync flush), or terminating the
+        stream if last is True
+    """
+    compressor = (
+        compressobj(level, DEFLATED, -MAX_WBITS, zdict=dictionary)
+        if dictionary
+        else compressobj(level, DEFLATED, -MAX_WBITS)
+    )
+    return compressor.compress(data) + compressor.flush(Z_FINISH if last else Z_SYNC_FLUSH)
+
+
+class ParallelGzipFile(RawIOBase):
+    """A writable binary file, that compresses its contents to a gzip file using several threads.
+
+    Like pigz, the data is split into blocks of block_size, which are compressed concurrently, each using the last 32
+    KiB of the preceding block as dictionary. The raw deflate streams of the blocks are concatenated to a single gzip
+    member, which can be decompressed by any gzip implementation.
+    The compression happens in a thread pool, as zlib releases the GIL while compressing.
+
+    Attributes
+    ----------
+    name: str
+        The name of the file
+    level: int
+        The compression level to use (defaults to GZIP_DEFAULT_LEVEL)
+    block_size: int
+        The size of the blocks in which data is compressed (defaults to GZIP_BLOCK_SIZE)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        mode: Literal["w", "x"] = "w",
+        level: int | None = None,
+        workers: int | None = None,
+        block_size: int = GZIP_BLOCK_SIZE,
+    ) -> None:
+        """Initialize an instance of ParallelGzipFile.
+
+        Parameters
+        ----------
+        path: Path
+            The path to a file to write
+        mode: Literal["w", "x"]
+            The mode to open the file with (defaults to "w")
+        level: int | None
+            An optional compression level to use (defaults to None, which uses GZIP_DEFAULT_LEVEL)
+        workers: int | None
+            An optional number of threads to use (defaults to None, which uses the number of CPUs)
+        block_size: int
+            The size of the blocks in which data is compressed (defaults to GZIP_BLOCK_SIZE)
+        """
+        self.name = str(path)
+        self.level = level if level is not None else GZIP_DEFAULT_LEVEL
+        self.block_size = block_size
+        self._file = open(path, f"{mode}b")
+        self._workers = workers or cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self._workers)
+        self._pending: deque[Future[bytes]] = deque()
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._crc = 0
+        self._size = 0
+        self._file.write(
+            pack(
+                "<BBBBIBB",
+                0x1F,
+                0x8B,
+                DEFLATED,
+                0,
+                int(time()),
+                2 if self.level == 9 else (4 if self.level == 1 else 0),
+                255,
+            )
+        )
+
+    def writable(self) -> bool:
+        """Return whether the file is writable.
+
+        Returns
+        -------
+        bool
+            Always True
+        """
+        return True
+
+    def tell(self) -> int:
+        """Return the number of uncompressed bytes written.
+
+        Returns
+        -------
+        int
+            The number of uncompressed bytes written
+        """
+        return self._size + len(self._buffer)
+
+    def _submit(self, block: bytes, last: bool = False) -> None:
+        """Submit a block for compression and write the compressed blocks, that are done, in order.
+
+        At most twice the number of workers of blocks are pending at any time.
+
+        Parameters
+        ----------
+        block: bytes
+            The block of data to compress
+        last: bool
+            Whether the block is the last one of the stream (defaults to False)
+        """
+        self._crc = crc32(block, self._crc)
+        self._size += len(block)
+        self._pending.append(
+            self._executor.submit(compress_gzip_block, block, self._dictionary, self.level, last),
+        )
+        self._dictionary = block[-GZIP_DICTIONARY_SIZE:]
+
+        while self._pending and (len(self._pending) > 2 * self._workers or self._pending[0].done() or last):
+            self._file.write(self._pending.popleft().result())
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        """Write data to the file.
+
+        Parameters
+        ----------
+        data: bytes
+            The data to write
+
+        Returns
+        -------
+        int
+            The number of bytes written
+        """
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[: self.block_size])
+            del self._buffer[: self.block_size]
+            self._submit(block=block)
+        return len(data)
+
+    def close(self) -> None:
+        """Compress the remaining data, write the gzip trailer and close the file."""
+        if self.closed:
+            return
+
+        try:
+            self._submit(block=bytes(self._buffer), last=True)
+            self._buffer.clear()
+            self._file.write(pack("<II", self._crc & 0xFFFFFFFF, self._size & 0xFFFFFFFF))
+        finally:
+            self._executor.shutdown()
+            self._file.close()
+            super().close()
+
+
+class ParallelGzipTarFile(TarFile):
+    """A class to provide writing of gzip compressed files using TarFile functionality and several threads."""
+
+    def __init__(  # type: ignore[no-untyped-def]
+        self,
+        name: Path,
+        mode: Literal["w", "x"] = "w",
+        level: int | None = None,
+        workers: int | None = None,
+        **kwargs,
+    ) -> None:
+        """Initialize an instance of ParallelGzipTarFile."""
+        self.gzip_file = ParallelGzipFile(path=name, mode=mode, level=level, workers=workers)
+        super().__init__(fileobj=self.gzip_file, mode="w", **kwargs)
+
+    def close(self) -> None:
+        """Close the file."""
+        try:
+            super().close()
+        finally:
+            self.gzip_file.close()
+
+
+def compression_type_from_magic_number(data: bytes) -> CompressionTypeEnum | None:
+    """Retrieve the compression type of a tar file from the magic number at the start of its data.
+
+    Parameters
+    ----------
+    data: bytes
+        The first bytes of a file (at least TAR_MAGIC_NUMBER_OFFSET + 5 bytes are required to detect uncompressed tar
+        files)
+
+    Returns
+    -------
+    CompressionTypeEnum | None
+        A member of CompressionTypeEnum, that reflects the compression type of the data or None if no known magic
+        number is found
+    """
+    for magic_number, compression in COMPRESSION_MAGIC_NUMBERS.items():
+        if data.startswith(magic_number):
+            return compression
+
+    tar_magic_number_end = TAR_MAGIC_NUMBER_OFFSET + len(TAR_MAGIC_NUMBER)
+    if data[TAR_MAGIC_NUMBER_OFFSET:tar_magic_number_end] == TAR_MAGIC_NUMBER:
+        return CompressionTypeEnum.NONE
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_magic() -> magic.Magic:
+    """Return a cached instance of magic.Magic, which is used to detect the types of files.
+
+    Returns
+    -------
+    magic.Magic
+        An instance of magic.Magic, that reports all matching types of a file
+    """
+    return magic.Magic(keep_going=True)
+
+
+def compression_type_from_libmagic(path: Path, data: bytes) -> CompressionTypeEnum:
+    """Retrieve the compression type of a tar file using libmagic.
 
     Parameters
     ----------
     path: Path
         The path to a tar file
+    data: bytes
+        The first bytes of the tar file
 
     Raises
     ------
@@ -66,16 +491,12 @@ def compression_type_of_tarfile(path: Path) -> CompressionTypeEnum:
     CompressionTypeEnum
         A member of CompressionTypeEnum, that reflects the compression type of tar file at path
     """
-    with open(path, "rb") as f:
-        file_start_bytes: bytes = f.read(2048)
-
     # Try and detect the instance of the libmagic shared library (loaded via
     # ctypes) used by the magic.py shipped with file.
     if hasattr(magic, "_libraries"):  # pragma: no cover
-        types = magic.detect_from_content(file_start_bytes).name  # type: ignore[attr-defined]
+        types = magic.detect_from_content(data).name  # type: ignore[attr-defined]
     else:
-        m = magic.Magic(keep_going=True)
-        types = m.from_buffer(file_start_bytes)
+        types = get_magic().from_buffer(data)
     types = types.lower().strip(",")
     debug(f"Types of file {path} detected as: {types}")
 
@@ -96,15 +517,64 @@ def compression_type_of_tarfile(path: Path) -> CompressionTypeEnum:
         )
 
 
+def compression_type_of_tarfile(path: Path, fileobj: IO[bytes] | None = None) -> CompressionTypeEnum:
+    """Retrieve the compression type of a tar file.
+
+    The compression type is detected using the magic number at the start of the file, while libmagic is only used as
+    a fallback, if no known magic number is found.
+
+    Parameters
+    ----------
+    path: Path
+        The path to a tar file
+    fileobj: IO[bytes] | None
+        An optional, seekable file object representing path, which is used instead of opening path (its stream position
+        is not changed)
+
+    Raises
+    ------
+    RepoManagementFileError
+        If an unknown compression type is encountered
+
+    Returns
+    -------
+    CompressionTypeEnum
+        A member of CompressionTypeEnum, that reflects the compression type of tar file at path
+    """
+    file_start_bytes: bytes
+    if fileobj:
+        position = fileobj.tell()
+        file_start_bytes = fileobj.read(2048)
+        fileobj.seek(position)
+    else:
+        with open(path, "rb") as f:
+            file_start_bytes = f.read(2048)
+
+    compression = compression_type_from_magic_number(data=file_start_bytes)
+    if compression is not None:
+        debug(f"Compression type of file {path} detected as: {compression}")
+        return compression
+
+    return compression_type_from_libmagic(path=path, data=file_start_bytes)
+
+
 def open_tarfile(
     path: Path,
     compression: CompressionTypeEnum | None = None,
     mode: Literal["r", "w", "x"] = "r",
+    fileobj: IO[bytes] | None = None,
+    level: int | None = None,
+    workers: int | None = 1,
 ) -> TarFile:
     """Open a file as a TarFile.
 
     This function distinguishes between bzip2, gzip, lzma and zstandard compression depending on file suffix.
     The detection can be overridden by providing either a file suffix or compression type.
+    If a file object is provided, it is used instead of opening path (e.g. a DigestReader to calculate checksums while
+    reading).
+    When writing, an optional compression level may be provided. Gzip and zstandard compressed files may be written
+    using several threads (zstandard uses its own worker threads, gzip uses a ParallelGzipTarFile, unless fileobj is
+    provided).
 
     Parameters
     ----------
@@ -117,6 +587,14 @@ def open_tarfile(
         "r" - open file for reading
         "w" - open file for writing
         "x" - create file
+    fileobj: IO[bytes] | None
+        An optional, seekable file object representing path, that is used for reading or writing instead of path
+    level: int | None
+        An optional compression level to use when writing (defaults to None, which uses the default of the compression
+        type)
+    workers: int | None
+        The number of threads to use for compressing when writing gzip or zstandard compressed files (defaults to 1).
+        If None, the number of CPUs is used.
 
     Raises
     ------
@@ -139,19 +617,29 @@ def open_tarfile(
     if path.is_symlink():
         path = path.resolve()
 
-    compression_type = compression if compression else compression_type_of_tarfile(path=path)
+    compression_type = compression if compression else compression_type_of_tarfile(path=path, fileobj=fileobj)
+
+    options: dict[Any, Any] = {}
+    if mode != "r" and level is not None and compression_type in TARFILE_COMPRESSION_LEVEL_ARGUMENTS:
+        options[TARFILE_COMPRESSION_LEVEL_ARGUMENTS[compression_type]] = level
 
     match compression_type:
+        case CompressionTypeEnum.GZIP if mode != "r" and workers != 1 and not fileobj:
+            return ParallelGzipTarFile(name=path, mode=mode, level=level, workers=workers)
         case CompressionTypeEnum.NONE | CompressionTypeEnum.BZIP2 | CompressionTypeEnum.GZIP | CompressionTypeEnum.LZMA:
             try:
-                return tarfile_open(name=path, mode=f"{mode}:{compression_type.value}")
+                return tarfile_open(name=path, mode=f"{mode}:{compression_type.value}", fileobj=fileobj, **options)
             except ReadError as e:
                 raise RepoManagementFileError(
                     f"An error occured attempting to read tar file {path} using compression type "
                     f"{compression_type.value}.\n{e}"
                 )
         case CompressionTypeEnum.ZSTANDARD:
-            return ZstdTarFile(name=path, mode=mode)
+            if mode != "r" and level is not None:
+                options[CParameter.compressionLevel] = level
+            if mode != "r" and workers != 1:
+                options[CParameter.nbWorkers] = workers or cpu_count() or 1
+            return ZstdTarFile(name=fileobj if fileobj else path, mode=mode, level_or_option=options or None)
         case _:
             raise RepoManagementFileError(
                 f"Unknown compression type {compression_type} encountered while attempting to open file {path}!"
@@ -240,6 +728,42 @@ def names_in_tarfile(tarfile: TarFile, names: list[str] | set[str]) -> bool:
         return False
 
 
+def read_files_from_tarfile(tarfile: TarFile, names: list[str] | set[str]) -> dict[str, bytes]:
+    """Read the data of files from a TarFile by sequentially iterating over its members.
+
+    The iteration stops as soon as all requested files are found, so that only the part of the (compressed) tar file
+    up to the last requested file is read. This is useful for reading metadata files, that are located at the
+    beginning of a tar file (e.g. .BUILDINFO, .MTREE and .PKGINFO of a package file), without decompressing the
+    entire file.
+
+    Parameters
+    ----------
+    tarfile: TarFile
+        A TarFile to read files from
+    names: list[str] | set[str]
+        A list or set of names of files to read
+
+    Returns
+    -------
+    dict[str, bytes]
+        A dict with the names of all found files as keys and their data as values (members with a requested name, that
+        are not files, are not considered)
+    """
+    remaining = set(names)
+    files: dict[str, bytes] = {}
+
+    debug(f"Reading files {remaining} from {str(tarfile.name)}...")
+    for member in tarfile:
+        if member.name in remaining and member.isfile():
+            extracted = tarfile.extractfile(member)
+            files[member.name] = extracted.read()  # type: ignore[union-attr]
+            remaining.discard(member.name)
+            if not remaining:
+                break
+
+    return files
+
+
 def read_text_from_file(path: str | Path) -> StringIO:
     """Read text from a file and return it in a StringIO.
 
@@ -265,3 +789,143 @@ def read_text_from_file(path: str | Path) -> StringIO:
         return StringIO(initial_value=path.read_text())
     except FileNotFoundError as e:
         raise RepoManagementFileNotFoundError(e)
+
+
+def reflink_file(source: Path, destination: Path) -> bool:
+    """Create a file as reflink (copy-on-write clone) of another file using the FICLONE ioctl.
+
+    Reflinks are supported by e.g. btrfs and xfs, if source and destination are located on the same file system.
+
+    Parameters
+    ----------
+    source: Path
+        The file to clone
+    destination: Path
+        The file to create (must not exist)
+
+    Returns
+    -------
+    bool
+        True if destination has been created as reflink of source, False otherwise (destination does not exist)
+    """
+    try:
+        with open(source, "rb") as source_file, open(destination, "xb") as destination_file:
+            ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+    except FileExistsError:
+        return False
+    except OSError as e:
+        debug(f"Unable to create {destination} as reflink of {source}: {e}")
+        destination.unlink(missing_ok=True)
+        return False
+
+    return True
+
+
+def hardlink_file(source: Path, destination: Path) -> bool:
+    """Create a file as hardlink of another file.
+
+    Parameters
+    ----------
+    source: Path
+        The file to link to
+    destination: Path
+        The file to create (must not exist)
+
+    Returns
+    -------
+    bool
+        True if destination has been created as hardlink of source, False otherwise (e.g. if source and destination are
+        not located on the same file system)
+    """
+    try:
+        link(source, destination)
+    except OSError as e:
+        debug(f"Unable to create {destination} as hardlink of {source}: {e}")
+        return False
+
+    return True
+
+
+def copy_file_in_kernel(source: Path, destination: Path) -> bool:
+    """Copy a file using copy_file_range, which copies data in the kernel (or on the server for network file systems).
+
+    Parameters
+    ----------
+    source: Path
+        The file to copy
+    destination: Path
+        The file to create (must not exist)
+
+    Returns
+    -------
+    bool
+        True if source has been copied to destination, False otherwise (destination does not exist)
+    """
+    try:
+        # NOTE: copy_file_range is only available on Linux
+        from os import copy_file_range
+    except ImportError:
+        debug(f"Unable to copy {source} to {destination} using copy_file_range, as it is not available...")
+        return False
+
+    try:
+        with open(source, "rb") as source_file, open(destination, "xb") as destination_file:
+            while copy_file_range(source_file.fileno(), destination_file.fileno(), COPY_FILE_RANGE_CHUNK_SIZE):
+                pass
+    except FileExistsError:
+        return False
+    except OSError as e:
+        debug(f"Unable to copy {source} to {destination} using copy_file_range: {e}")
+        destination.unlink(missing_ok=True)
+        return False
+
+    return True
+
+
+def place_file(source: Path, destination: Path, placement: FilePlacementEnum = FilePlacementEnum.COPY) -> None:
+    """Place a copy of a file, that shares its data with the original if possible.
+
+    Apart from FilePlacementEnum.HARDLINK, which may create destination as hardlink of source, destination is created as
+    a separate file with the same contents, permission bits and timestamps as source (analogous to shutil.copy2()). An
+    existing destination is replaced.
+
+    Parameters
+    ----------
+    source: Path
+        The file to copy
+    destination: Path
+        The file to create
+    placement: FilePlacementEnum
+        A member of FilePlacementEnum, which defines the cheapest strategy for placing destination (defaults to
+        FilePlacementEnum.COPY, which copies the data of source)
+
+    Raises
+    ------
+    OSError
+        If source can not be copied to destination
+        or if source and destination are the same file
+    """
+    if placement == FilePlacementEnum.COPY:
+        copy2(src=source, dst=destination)
+        return
+
+    if destination.exists():
+        if samefile(source, destination):
+            raise SameFileError(f"{source} and {destination} are the same file!")
+        destination.unlink()
+
+    if reflink_file(source=source, destination=destination):
+        debug(f"Created {destination} as reflink of {source}...")
+        copystat(src=source, dst=destination)
+        return
+
+    if placement == FilePlacementEnum.HARDLINK and hardlink_file(source=source, destination=destination):
+        debug(f"Created {destination} as hardlink of {source}...")
+        return
+
+    if copy_file_in_kernel(source=source, destination=destination):
+        debug(f"Copied {source} to {destination} using copy_file_range...")
+        copystat(src=source, dst=destination)
+        return
+
+    copy2(src=source, dst=destination)
@@ -3,21 +3,89 @@ from __future__ import annotations
 
 import io
 import re
+from array import array
+from gzip import BadGzipFile, decompress
+from itertools import pairwise
 from logging import debug
 from pathlib import Path
+from sys import intern
+from typing import Any, Iterator
 
 from pydantic import (
     BaseModel,
     NonNegativeFloat,
     NonNegativeInt,
+    PrivateAttr,
     ValidationError,
     conint,
-    constr,
+    parse_obj_as,
 )
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+
+from repod.common.models import SchemaVersionV1, cached_constr
+from repod.common.regex import (
+    ABSOLUTE_MTREE_PATH,
+    MD5,
+    RELATIVE_MTREE_PATH,
+    SHA256,
+    compile_list_regex,
+    fullmatch_list,
+)
+from repod.errors import RepoManagementFileError, RepoManagementValidationError
+
+MTREE_ARRAY_TYPECODES = {
+    "uids": "H",
+    "gids": "H",
+    "sizes": "q",
+    "times": "d",
+}
+MTREE_CHECKSUMS_REGEX = re.compile(r"[a-f0-9]*")
+MTREE_DIGEST_MD5 = 1
+MTREE_DIGEST_SHA256 = 2
+MTREE_ENTRY_TYPES = ("block", "char", "dir", "fifo", "file", "link", "socket")
+MTREE_INTERNAL_FILE_NAMES = frozenset({"/.BUILDINFO", "/.INSTALL", "/.MTREE", "/.PKGINFO"})
+MTREE_KEYWORDS = {
+    "type": "types",
+    "mode": "modes",
+    "uid": "uids",
+    "gid": "gids",
+    "size": "sizes",
+    "time": "times",
+    "md5digest": "md5s",
+    "sha256digest": "sha256s",
+}
+# NOTE: RELATIVE_MTREE_PATH also matches ABSOLUTE_MTREE_PATH, alternating between the two would lead to exponential
+# backtracking on invalid data
+MTREE_LINKS_REGEX = compile_list_regex(pattern=RELATIVE_MTREE_PATH)
+MTREE_MODE = r"[01234567]{3,4}"
+MTREE_MODES_REGEX = compile_list_regex(pattern=MTREE_MODE)
+MTREE_NAMES_REGEX = compile_list_regex(pattern=ABSOLUTE_MTREE_PATH)
+
+
+def decode_mtree_path(path: str) -> str:
+    """Decode a path in mtree representation.
+
+    The mtree format allows for encoding characters using a block of backslash and three octal digits (see
+    https://man.archlinux.org/man/mtree.5#General_Format).
+    This function finds and replaces occurences of these encoded characters.
+
+    Parameters
+    ----------
+    path: str
+        A path in mtree representation
 
-from repod.common.models import SchemaVersionV1
-from repod.common.regex import ABSOLUTE_MTREE_PATH, MD5, RELATIVE_MTREE_PATH, SHA256
-from repod.errors import RepoManagementValidationError
+    Returns
+    -------
+    str
+        The decoded path
+    """
+    if "\\" not in path or len(re.findall(r"\\[0-9A-F]{3}", path)) == 0:
+        return path
+
+    output_path = path.encode("latin1").decode("unicode-escape").encode("latin1").decode("utf8")
+    debug(f"Converted MTree path {path} to {output_path}.")
+    return output_path
 
 
 class SystemGID(BaseModel):
@@ -41,7 +109,7 @@ class LinkTarget(BaseModel):
         An optional string representing a relative or absolute file
     """
 
-    link: constr(  # type: ignore[valid-type]
+    link: cached_constr(  # type: ignore[valid-type]
         regex=rf"^({RELATIVE_MTREE_PATH}|{ABSOLUTE_MTREE_PATH})$"  # noqa: F722
     ) | None
 
@@ -55,7 +123,7 @@ class Md5(BaseModel):
         An optional string representing an MD5 checksum
     """
 
-    md5: constr(regex=rf"^{MD5}$") | None  # type: ignore[valid-type]  # noqa: F722
+    md5: cached_constr(regex=rf"^{MD5}$") | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class FileMode(BaseModel):
@@ -67,7 +135,7 @@ class FileMode(BaseModel):
         A three or four digit long string, consisting only of valid file modes
     """
 
-    mode: constr(regex=r"^[01234567]{3,4}$")  # type: ignore[valid-type]  # noqa: F722
+    mode: cached_constr(regex=rf"^{MTREE_MODE}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class MTreeEntryName(BaseModel):
@@ -82,7 +150,7 @@ class MTreeEntryName(BaseModel):
         A string representing an absolute file location in mtree format
     """
 
-    name: constr(regex=rf"^{ABSOLUTE_MTREE_PATH}$")  # type: ignore[valid-type]  # noqa: F722
+    name: cached_constr(regex=rf"^{ABSOLUTE_MTREE_PATH}$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class Sha256(BaseModel):
@@ -94,7 +162,7 @@ class Sha256(BaseModel):
         An optional string representing a SHA-256 checksum
     """
 
-    sha256: constr(regex=rf"^{SHA256}$") | None  # type: ignore[valid-type]  # noqa: F722
+    sha256: cached_constr(regex=rf"^{SHA256}$") | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class FileSize(BaseModel):
@@ -130,7 +198,7 @@ class MTreeEntryType(BaseModel):
         A string representing a valid mtree type (one of block, char, dir, fifo, file, link or socket)
     """
 
-    type_: constr(regex=r"^(block|char|dir|fifo|file|link|socket)$")  # type: ignore[valid-type]  # noqa: F722
+    type_: cached_constr(regex=r"^(block|char|dir|fifo|file|link|socket)$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class SystemUID(BaseModel):
@@ -171,13 +239,7 @@ class MTreeEntry(BaseModel):
         if not hasattr(self, "name"):
             raise RuntimeError("It is not possible to retrieve a file path from the template class MTreeEntry!")
 
-        output_name = self.name
-
-        if len(re.findall(r"\\[0-9A-F]{3}", output_name)) > 0:
-            output_name = output_name.encode("latin1").decode("unicode-escape").encode("latin1").decode("utf8")
-            debug(f"Converted MTree path {self.name} to {output_name}.")
-
-        return Path(output_name)
+        return Path(decode_mtree_path(self.name))
 
     def get_link_path(self, resolve: bool = False) -> Path | None:
         """Return the link as a Path.
@@ -209,10 +271,7 @@ class MTreeEntry(BaseModel):
         if output_name is None:
             return output_name
 
-        if len(re.findall(r"\\[0-9A-F]{3}", output_name)) > 0:
-            output_name = output_name.encode("latin1").decode("unicode-escape").encode("latin1").decode("utf8")
-            debug(f"Converted MTree path {self.name} to {output_name}.")  # type: ignore[attr-defined]
-
+        output_name = decode_mtree_path(output_name)
         output_path = Path(output_name)
 
         if not resolve or output_path.is_absolute():
@@ -287,16 +346,239 @@ class MTreeEntryV1(
     pass
 
 
+def validate_mtree_strings(
+    names: list[str],
+    links: dict[int, str],
+    modes: list[str | None],
+    md5s: list[str | None],
+    sha256s: list[str | None],
+) -> None:
+    """Validate the names, link targets, file modes and checksums of mtree entries in bulk.
+
+    Parameters
+    ----------
+    names: list[str]
+        The absolute file locations of the entries in mtree format
+    links: dict[int, str]
+        The link targets of entries (by index of the entry)
+    modes: list[str | None]
+        The file modes of the entries
+    md5s: list[str | None]
+        The optional MD5 checksums of the entries
+    sha256s: list[str | None]
+        The optional SHA-256 checksums of the entries
+
+    Raises
+    ------
+    ValueError
+        If any of the values is invalid
+    TypeError
+        If a file mode is missing
+    """
+    if not fullmatch_list(regex=MTREE_NAMES_REGEX, values=names):
+        raise ValueError("Invalid name")
+    if not fullmatch_list(regex=MTREE_LINKS_REGEX, values=list(links.values())):
+        raise ValueError("Invalid link")
+    if not fullmatch_list(regex=MTREE_MODES_REGEX, values=modes):  # type: ignore[arg-type]
+        raise ValueError("Invalid mode")
+    for checksums, length in ((md5s, 32), (sha256s, 64)):
+        present = [checksum for checksum in checksums if checksum is not None]
+        if any(len(checksum) != length for checksum in present):
+            raise ValueError("Invalid checksum length")
+        if not MTREE_CHECKSUMS_REGEX.fullmatch("".join(present)):
+            raise ValueError("Invalid checksum")
+
+
+def pack_mtree_numbers(
+    uids: list[int | str | None],
+    gids: list[int | str | None],
+    sizes: list[int | str | None],
+    times: list[float | str | None],
+) -> tuple[bytes, bytes, bytes, bytes]:
+    """Validate the user IDs, group IDs, file sizes and timestamps of mtree entries in bulk and pack them in arrays.
+
+    Parameters
+    ----------
+    uids: list[int | str | None]
+        The user IDs of the entries
+    gids: list[int | str | None]
+        The group IDs of the entries
+    sizes: list[int | str | None]
+        The optional file sizes of the entries
+    times: list[float | str | None]
+        The timestamps of the entries
+
+    Raises
+    ------
+    ValueError
+        If any of the values is invalid
+    OverflowError
+        If any of the values does not fit in its array
+    TypeError
+        If a required value is missing
+
+    Returns
+    -------
+    tuple[bytes, bytes, bytes, bytes]
+        The arrays (see MTREE_ARRAY_TYPECODES) of user IDs, group IDs, file sizes (-1 for entries without file size) and
+        timestamps
+    """
+    uid_array = array(MTREE_ARRAY_TYPECODES["uids"], map(int, uids))  # type: ignore[arg-type]
+    gid_array = array(MTREE_ARRAY_TYPECODES["gids"], map(int, gids))  # type: ignore[arg-type]
+    if max(uid_array, default=0) >= 1000 or max(gid_array, default=0) >= 1000:
+        raise ValueError("Invalid uid or gid")
+    size_values = [int(size) if size is not None else None for size in sizes]
+    if min((size for size in size_values if size is not None), default=0) < 0:
+        raise ValueError("Invalid size")
+    size_array = array(MTREE_ARRAY_TYPECODES["sizes"], (size if size is not None else -1 for size in size_values))
+    time_array = array(MTREE_ARRAY_TYPECODES["times"], map(float, times))  # type: ignore[arg-type]
+    if min(time_array, default=0) < 0:
+        raise ValueError("Invalid time")
+
+    return uid_array.tobytes(), gid_array.tobytes(), size_array.tobytes(), time_array.tobytes()
+
+
+def validate_mtree_entries(
+    names: list[str],
+    links: dict[int, str],
+    types: list[str | None],
+    modes: list[str | None],
+    uids: list[int | str | None],
+    gids: list[int | str | None],
+    sizes: list[int | str | None],
+    times: list[float | str | None],
+    md5s: list[str | None],
+    sha256s: list[str | None],
+) -> None:
+    """Validate the attributes of mtree entries one by one as MTreeEntryV1.
+
+    Parameters
+    ----------
+    names: list[str]
+        The absolute file locations of the entries in mtree format
+    links: dict[int, str]
+        The link targets of entries (by index of the entry)
+    types: list[str | None]
+        The types of the entries
+    modes: list[str | None]
+        The file modes of the entries
+    uids: list[int | str | None]
+        The user IDs of the entries
+    gids: list[int | str | None]
+        The group IDs of the entries
+    sizes: list[int | str | None]
+        The optional file sizes of the entries
+    times: list[float | str | None]
+        The timestamps of the entries
+    md5s: list[str | None]
+        The optional MD5 checksums of the entries
+    sha256s: list[str | None]
+        The optional SHA-256 checksums of the entries
+
+    Raises
+    ------
+    RepoManagementValidationError
+        If an entry can not be validated
+    """
+    for index, name in enumerate(names):
+        try:
+            MTreeEntryV1(
+                gid=gids[index],
+                link=links.get(index),
+                md5=md5s[index],
+                mode=modes[index],
+                name=name,
+                sha256=sha256s[index],
+                size=sizes[index],
+                time=times[index],
+                type_=types[index],
+                uid=uids[index],
+            )
+        except ValidationError as validation_error:
+            raise RepoManagementValidationError(
+                f"An error occured when validating mtree data!\nEntry: {name}\n{validation_error}"
+            )
+
+
 class MTree(BaseModel):
     """A class to describe an mtree file.
 
+    The entries of an mtree file are kept in a private, compact, columnar representation: The (interned) names, link
+    targets and file modes of all entries are kept as strings, while all other attributes are kept as typed arrays (see
+    MTREE_ARRAY_TYPECODES) in bytes and checksums are kept in their binary representation.
+    Instances of MTreeEntryV1 are only created when iterating over the entries. The dict, JSON and JSON schema
+    representations of an MTree list its entries.
+
+    An MTree created using from_gzip() only keeps the gzip-compressed mtree data and parses it on first access: The
+    names of the entries are parsed by get_paths(), while all other attributes are only parsed (using parse()) when
+    accessing the entries. Until then the respective private attributes are None.
+
     Attributes
     ----------
-    files: list[File]
-        A list of File instances, representing the entries in an mtree file
+    entries: list[MTreeEntryV1]
+        A list of MTreeEntryV1 instances, representing the entries in an mtree file
     """
 
-    entries: list[MTreeEntry]
+    _names: list[str] | None = PrivateAttr(default=None)
+    _links: dict[int, str] | None = PrivateAttr(default=None)
+    _types: bytes | None = PrivateAttr(default=None)
+    _modes: list[str] | None = PrivateAttr(default=None)
+    _uids: bytes | None = PrivateAttr(default=None)
+    _gids: bytes | None = PrivateAttr(default=None)
+    _sizes: bytes | None = PrivateAttr(default=None)
+    _times: bytes | None = PrivateAttr(default=None)
+    _digests: bytes | None = PrivateAttr(default=None)
+    _md5s: bytes | None = PrivateAttr(default=None)
+    _sha256s: bytes | None = PrivateAttr(default=None)
+    _data: bytes | None = PrivateAttr(default=None)
+
+    class Config:
+        """Configuration for the JSON schema of MTree."""
+
+        @staticmethod
+        def schema_extra(schema: dict[str, Any], model: type[MTree]) -> None:
+            """Describe the entries instead of the private, columnar representation of an MTree in the JSON schema.
+
+            Parameters
+            ----------
+            schema: dict[str, Any]
+                The JSON schema of model
+            model: type[MTree]
+                The MTree class
+            """
+            schema["properties"] = {"entries": {"title": "Entries", "type": "array", "items": MTreeEntryV1.schema()}}
+            schema["required"] = ["entries"]
+
+    def __init__(self, **data: Any) -> None:
+        """Initialize an instance of MTree from a list of entries.
+
+        Parameters
+        ----------
+        data: Any
+            Keyword arguments, that provide the key "entries" with a list of MTreeEntryV1 instances (or their dict
+            representations)
+
+        Raises
+        ------
+        ValidationError
+            If the entries are not provided or can not be validated
+        """
+        super().__init__()
+        if "entries" not in data:
+            raise ValidationError([ErrorWrapper(MissingError(), loc="entries")], self.__class__)
+
+        self.update_columns(model=MTree.from_entries(entries=parse_obj_as(list[MTreeEntryV1], data["entries"])))
+
+    def update_columns(self, model: MTree) -> None:
+        """Update the columnar representation of the entries of the MTree with the one of another MTree.
+
+        Parameters
+        ----------
+        model: MTree
+            An MTree, whose entries are used
+        """
+        for key in self.__private_attributes__:
+            setattr(self, key, getattr(model, key))
 
     @classmethod
     def from_file(cls, data: io.StringIO) -> MTree:
@@ -310,89 +592,318 @@ class MTree(BaseModel):
         Raises
         ------
         RepoManagementValidationError
-            If a ValidationError occurs during validation of the data
+            If the data can not be validated
 
         Returns
         -------
         MTree
             An instance of MTree, derived from data
         """
-
-        def sanitize_mtree_pairs(
-            settings_list: list[list[str]],
-            settings_dict: dict[str, float | int | str],
-        ) -> None:
-            """Sanitize mtree pairs in a list and add them to a dict.
-
-            Parameters
-            ----------
-            settings_list: list[list[str]]
-                A list of string lists, that represent mtree key-value pairs
-            settings_dict: dict[str, float | int | str]
-                A dict to which sanitized mtree key-value pairs are added
-            """
-            for setting in settings_list:
-                settings_key = setting[0]
-                setting_value = setting[1].strip("\n")
-                match settings_key:
-                    case "gid" | "uid" | "size":
-                        settings_dict[settings_key] = int(setting_value)
-                    case "time":
-                        settings_dict[settings_key] = float(setting_value)
-                    case "type":
-                        # NOTE: do not overload type()
-                        settings_dict["type_"] = setting_value
-                    case "mode":
-                        # NOTE: ensure that file modes are zero-filled and of length 4
-                        settings_dict[settings_key] = setting_value.zfill(4)
-                    case "md5digest" | "sha1digest" | "sha256digest" | "sha384digest" | "sha512digest":
-                        # NOTE: only use the name of the digest as key to be more flexible in reusing the model
-                        settings_dict[settings_key.replace("digest", "")] = setting_value
-                    case _:
-                        settings_dict[settings_key] = setting_value
-
-        base_settings: dict[str, float | int | str] = {}
-        entries: list[MTreeEntry] = []
+        base_settings: dict[str, str] = {}
+        names: list[str] = []
+        links: dict[int, str] = {}
+        columns: dict[str, list[str | None]] = {key: [] for key in MTREE_KEYWORDS.values()}
 
         for line in data:
             if line.startswith("/set"):
-                settings_list = [assignment.split("=") for assignment in line.split(" ")[1:]]
-                sanitize_mtree_pairs(settings_list=settings_list, settings_dict=base_settings)
+                base_settings.update(assignment.split("=", 1) for assignment in line.split()[1:])
 
             elif line.startswith("."):
-                file_settings: dict[str, float | int | str] = {}
-                file_settings["name"] = line.split()[0][1:]
-
-                # provide a list of all settings in an entry line (skip empty assigments due to multiple whitespace)
-                settings_list = [assignment.split("=") for assignment in line.split()[1:] if assignment]
-                sanitize_mtree_pairs(settings_list=settings_list, settings_dict=file_settings)
-
-                try:
-                    entries.append(
-                        MTreeEntryV1(
-                            gid=file_settings.get("gid") or base_settings.get("gid"),
-                            link=file_settings.get("link"),
-                            md5=file_settings.get("md5") or base_settings.get("md5"),
-                            mode=file_settings.get("mode") or base_settings.get("mode"),
-                            name=file_settings.get("name"),
-                            sha256=file_settings.get("sha256") or base_settings.get("sha256"),
-                            size=file_settings.get("size") or base_settings.get("size"),
-                            time=file_settings.get("time") or base_settings.get("time"),
-                            type_=file_settings.get("type_") or base_settings.get("type_"),
-                            uid=file_settings.get("uid") or base_settings.get("uid"),
-                        )
-                    )
-                except ValidationError as e:
-                    raise RepoManagementValidationError(
-                        f"An error occured when validating mtree data!\n"
-                        f"Basic settings: {base_settings}\n"
-                        f"File settings: {file_settings}\n"
-                        f"{e}"
-                    )
+                name, *assignments = line.split()
+                # NOTE: skip empty assigments due to multiple whitespace
+                file_settings = dict(assignment.split("=", 1) for assignment in assignments if assignment)
+
+                if "link" in file_settings:
+                    links[len(names)] = file_settings["link"]
+                names.append(name[1:])
+                for keyword, key in MTREE_KEYWORDS.items():
+                    columns[key].append(file_settings.get(keyword) or base_settings.get(keyword))
             else:
                 continue
 
-        return MTree(entries=entries)
+        # NOTE: ensure that file modes are zero-filled and of length 4
+        columns["modes"] = [mode.zfill(4) if mode is not None else None for mode in columns["modes"]]
+
+        return cls.from_columns(names=names, links=links, **columns)  # type: ignore[arg-type]
+
+    @classmethod
+    def from_gzip(cls, data: bytes) -> MTree:
+        """Create an instance of MTree from gzip-compressed mtree data, that is only parsed on first access.
+
+        Parameters
+        ----------
+        data: bytes
+            The gzip-compressed contents of an mtree file
+
+        Returns
+        -------
+        MTree
+            An instance of MTree, that parses data on first access
+        """
+        model = cls.construct()
+        model._data = data
+        return model
+
+    def decompress(self) -> io.StringIO:
+        """Decompress the gzip-compressed mtree data of an MTree created using from_gzip().
+
+        Raises
+        ------
+        RuntimeError
+            If the MTree has not been created using from_gzip()
+        RepoManagementFileError
+            If the mtree data can not be decompressed
+
+        Returns
+        -------
+        io.StringIO
+            A text stream representing the contents of the mtree file
+        """
+        if self._data is None:
+            raise RuntimeError("The MTree does not provide any mtree data to parse!")
+
+        try:
+            return io.StringIO(initial_value=decompress(self._data).decode("utf-8"))
+        except (BadGzipFile, EOFError, UnicodeDecodeError) as e:
+            raise RepoManagementFileError(f"An error occured trying to read mtree data\n{e}\n")
+
+    def parse(self) -> None:
+        """Parse all attributes of the entries of an MTree created using from_gzip(), if that did not happen yet.
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the mtree data can not be decompressed
+        RepoManagementValidationError
+            If the mtree data can not be validated
+        """
+        if self._types is not None:
+            return
+
+        debug("Parsing all attributes of the entries of mtree data...")
+        self.update_columns(model=MTree.from_file(data=self.decompress()))
+
+    def parse_names(self) -> None:
+        """Parse the names of the entries of an MTree created using from_gzip(), if that did not happen yet.
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the mtree data can not be decompressed
+        RepoManagementValidationError
+            If the names can not be validated
+        """
+        if self._names is not None:
+            return
+
+        debug("Parsing the names of the entries of mtree data...")
+        names = [intern(line.split(maxsplit=1)[0][1:]) for line in self.decompress() if line.startswith(".")]
+        if not fullmatch_list(regex=MTREE_NAMES_REGEX, values=names):
+            invalid_names = [name for name in names if not fullmatch_list(regex=MTREE_NAMES_REGEX, values=[name])]
+            raise RepoManagementValidationError(
+                f"An error occured when validating mtree data!\nInvalid names: {invalid_names}"
+            )
+
+        self._names = names
+
+    @classmethod
+    def from_entries(cls, entries: list[MTreeEntryV1]) -> MTree:
+        """Create an instance of MTree from a list of MTreeEntryV1.
+
+        Parameters
+        ----------
+        entries: list[MTreeEntryV1]
+            A list of MTreeEntryV1 instances
+
+        Raises
+        ------
+        RepoManagementValidationError
+            If the entries can not be validated
+
+        Returns
+        -------
+        MTree
+            An instance of MTree, derived from entries
+        """
+        return cls.from_columns(
+            names=[entry.name for entry in entries],
+            links={index: entry.link for index, entry in enumerate(entries) if entry.link is not None},
+            types=[entry.type_ for entry in entries],
+            modes=[entry.mode for entry in entries],
+            uids=[entry.uid for entry in entries],
+            gids=[entry.gid for entry in entries],
+            sizes=[entry.size for entry in entries],
+            times=[entry.time for entry in entries],
+            md5s=[entry.md5 for entry in entries],
+            sha256s=[entry.sha256 for entry in entries],
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        names: list[str],
+        links: dict[int, str],
+        types: list[str | None],
+        modes: list[str | None],
+        uids: list[int | str | None],
+        gids: list[int | str | None],
+        sizes: list[int | str | None],
+        times: list[float | str | None],
+        md5s: list[str | None],
+        sha256s: list[str | None],
+    ) -> MTree:
+        """Create an instance of MTree from lists of the attributes of its entries.
+
+        All attributes are validated in bulk. Only if this fails, the entries are validated one by one as MTreeEntryV1
+        to find the invalid entry.
+
+        Parameters
+        ----------
+        names: list[str]
+            The absolute file locations of the entries in mtree format
+        links: dict[int, str]
+            The link targets of entries (by index of the entry)
+        types: list[str | None]
+            The types of the entries
+        modes: list[str | None]
+            The file modes of the entries
+        uids: list[int | str | None]
+            The user IDs of the entries
+        gids: list[int | str | None]
+            The group IDs of the entries
+        sizes: list[int | str | None]
+            The optional file sizes of the entries
+        times: list[float | str | None]
+            The timestamps of the entries
+        md5s: list[str | None]
+            The optional MD5 checksums of the entries
+        sha256s: list[str | None]
+            The optional SHA-256 checksums of the entries
+
+        Raises
+        ------
+        RepoManagementValidationError
+            If the attributes can not be validated
+
+        Returns
+        -------
+        MTree
+            An instance of MTree, derived from the attributes of its entries
+        """
+        try:
+            validate_mtree_strings(names=names, links=links, modes=modes, md5s=md5s, sha256s=sha256s)
+            model = cls.construct()
+            model._uids, model._gids, model._sizes, model._times = pack_mtree_numbers(
+                uids=uids, gids=gids, sizes=sizes, times=times
+            )
+            model._names = [intern(name) for name in names]
+            model._links = links
+            model._types = bytes(MTREE_ENTRY_TYPES.index(type_) for type_ in types)  # type: ignore[arg-type]
+            model._modes = [intern(mode) for mode in modes]  # type: ignore[arg-type]
+            model._digests = bytes(
+                (MTREE_DIGEST_MD5 if md5 is not None else 0) | (MTREE_DIGEST_SHA256 if sha256 is not None else 0)
+                for md5, sha256 in zip(md5s, sha256s)
+            )
+            model._md5s = b"".join(bytes.fromhex(md5) if md5 is not None else bytes(16) for md5 in md5s)
+            model._sha256s = b"".join(bytes.fromhex(sha256) if sha256 is not None else bytes(32) for sha256 in sha256s)
+        except (OverflowError, TypeError, ValueError) as e:
+            validate_mtree_entries(
+                names=names,
+                links=links,
+                types=types,
+                modes=modes,
+                uids=uids,
+                gids=gids,
+                sizes=sizes,
+                times=times,
+                md5s=md5s,
+                sha256s=sha256s,
+            )
+            raise RepoManagementValidationError(f"An error occured when validating mtree data!\n{e}")
+
+        return model
+
+    def iter_entries(self) -> Iterator[MTreeEntryV1]:
+        """Iterate over the entries of the MTree.
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the mtree data of an MTree created using from_gzip() can not be decompressed
+        RepoManagementValidationError
+            If the mtree data of an MTree created using from_gzip() can not be validated
+
+        Yields
+        ------
+        MTreeEntryV1
+            An entry of the MTree
+        """
+        self.parse()
+
+        uids, gids, sizes, times = (
+            memoryview(getattr(self, f"_{key}")).cast(MTREE_ARRAY_TYPECODES[key])
+            for key in ("uids", "gids", "sizes", "times")
+        )
+        md5_offsets = pairwise(range(0, len(self._md5s) + 1, 16))  # type: ignore[arg-type]
+        md5s = (self._md5s[start:end] for start, end in md5_offsets)  # type: ignore[index]
+        sha256_offsets = pairwise(range(0, len(self._sha256s) + 1, 32))  # type: ignore[arg-type]
+        sha256s = (self._sha256s[start:end] for start, end in sha256_offsets)  # type: ignore[index]
+
+        for index, (name, md5, sha256) in enumerate(zip(self._names, md5s, sha256s)):  # type: ignore[arg-type]
+            digests = self._digests[index]  # type: ignore[index]
+            yield MTreeEntryV1.construct(
+                gid=gids[index],
+                link=self._links.get(index),  # type: ignore[union-attr]
+                md5=md5.hex() if digests & MTREE_DIGEST_MD5 else None,
+                mode=self._modes[index],  # type: ignore[index]
+                name=name,
+                sha256=sha256.hex() if digests & MTREE_DIGEST_SHA256 else None,
+                size=sizes[index] if sizes[index] >= 0 else None,
+                time=times[index],
+                type_=MTREE_ENTRY_TYPES[self._types[index]],  # type: ignore[index]
+                uid=uids[index],
+            )
+
+    @property
+    def entries(self) -> list[MTreeEntryV1]:
+        """Return the entries of the MTree.
+
+        Returns
+        -------
+        list[MTreeEntryV1]
+            A list of all entries of the MTree
+        """
+        return list(self.iter_entries())
+
+    def dict(self, **kwargs: Any) -> dict[str, Any]:  # type: ignore[override]
+        """Return a dict representation of the MTree, which lists the dict representations of its entries.
+
+        Parameters
+        ----------
+        kwargs: Any
+            Keyword arguments passed on to the dict() method of each entry
+
+        Returns
+        -------
+        dict[str, Any]
+            A dict with the key "entries", that lists the dict representation of each entry
+        """
+        return {"entries": [entry.dict(**kwargs) for entry in self.iter_entries()]}
+
+    def json(self, **kwargs: Any) -> str:  # type: ignore[override]
+        """Return a JSON representation of the MTree, which lists the dict representations of its entries.
+
+        Parameters
+        ----------
+        kwargs: Any
+            Keyword arguments passed on to the JSON encoder (e.g. indent)
+
+        Returns
+        -------
+        str
+            A JSON object with the key "entries", that lists the dict representation of each entry
+        """
+        return self.__config__.json_dumps(self.dict(), default=self.__json_encoder__, **kwargs)
 
     def get_paths(self, show_all: bool = False) -> list[Path]:
         """Return the list of Paths described by the entries of the MTree.
@@ -402,21 +913,25 @@ class MTree(BaseModel):
         show_all: bool
             Also show files that are not installed on target systems (defaults to False)
 
+        Raises
+        ------
+        RepoManagementFileError
+            If the mtree data of an MTree created using from_gzip() can not be decompressed
+        RepoManagementValidationError
+            If the names in the mtree data of an MTree created using from_gzip() can not be validated
+
         Returns
         -------
         list[Path]
             A list of Paths
         """
-        path_list: list[Path] = []
-
-        for entry in self.entries:
-            path = entry.get_file_path()
-            if path in [Path("/.BUILDINFO"), Path("/.INSTALL"), Path("/.MTREE"), Path("/.PKGINFO")] and not show_all:
-                continue
-
-            path_list.append(path)
+        self.parse_names()
 
-        return path_list
+        return [
+            Path(decode_mtree_path(name))
+            for name in self._names  # type: ignore[union-attr]
+            if show_all or name not in MTREE_INTERNAL_FILE_NAMES
+        ]
 
 
 def export_schemas(output: Path | str) -> None:
@@ -1,10 +1,15 @@
 """Handling of package files and their contents."""
 from __future__ import annotations
 
+import os
+import pickle  # nosec: B403
 from base64 import b64encode
-from hashlib import md5, sha256
+from hashlib import sha256
+from io import StringIO
 from logging import debug, info
 from pathlib import Path
+from stat import S_ISREG, S_IWGRP, S_IWOTH
+from tempfile import NamedTemporaryFile
 from typing import Any
 
 from pydantic import BaseModel
@@ -12,7 +17,7 @@ from pydantic import BaseModel
 from repod.common.models import CSize, FileName, Md5Sum, PgpSig, Sha256Sum
 from repod.errors import RepoManagementFileError
 from repod.files.buildinfo import BuildInfo
-from repod.files.common import extract_file_from_tarfile, names_in_tarfile, open_tarfile
+from repod.files.common import DigestReader, open_tarfile, read_files_from_tarfile
 from repod.files.mtree import MTree
 from repod.files.pkginfo import PkgInfo
 
@@ -21,6 +26,12 @@ PACKAGE_VERSIONS = {
         "required": {".BUILDINFO", ".MTREE", ".PKGINFO"},
     },
 }
+PACKAGE_CACHE_DIR_MODE = "0700"
+# NOTE: once the accumulated size of all cache entries exceeds the maximum size, entries are evicted until this ratio of
+# the maximum size is reached, so that the cache directory is not scanned for each added entry
+PACKAGE_CACHE_EVICTION_RATIO = 0.9
+PACKAGE_CACHE_FILE_SUFFIX = ".pickle"
+PACKAGE_CACHE_VERSION = 4
 
 
 class Package(BaseModel):
@@ -31,21 +42,39 @@ class Package(BaseModel):
     """
 
     @classmethod
-    async def from_file(cls, package: Path, signature: Path | None = None) -> Package:
+    async def from_file(
+        cls,
+        package: Path,
+        signature: Path | None = None,
+        cache: PackageCache | None = None,
+        lazy_mtree: bool = False,
+    ) -> Package:
         """Create a Package from a package file and an optional signature.
 
+        If a PackageCache is provided, a cached Package for the package file is used instead of reading the package file
+        and newly created Packages are added to the cache.
+
+        If lazy_mtree is True, the .MTREE file of the package file is only kept in its gzip-compressed form and parsed
+        on first access (see MTree.from_gzip()). This way workflows, that only require the paths of the files in a
+        package, never parse (or validate) the remaining attributes of the .MTREE file.
+
         Parameters
         ----------
         package: Path
             The path to a package file
         signature: Path | None
             The optional path to a signature file for package
+        cache: PackageCache | None
+            An optional PackageCache to retrieve the Package from or to add it to (defaults to None)
+        lazy_mtree: bool
+            Whether to parse the .MTREE file only on first access (defaults to False)
 
         Raises
         ------
         RepoManagementFileError
             If the signature file does not match the package file.
             If the signature file does not exist.
+            If the .MTREE file can not be read (only if lazy_mtree is False).
 
         Returns
         -------
@@ -53,8 +82,6 @@ class Package(BaseModel):
             A Package representing the metadata contained in package and the optional signature file
         """
         package_version = 0
-        package_md5sum = ""
-        package_sha256sum = ""
         pgpsig: str | None = None
 
         if signature:
@@ -72,51 +99,43 @@ class Package(BaseModel):
         else:
             info(f"No signature file for package {package} provided, commencing without...")
 
-        debug(f"Creating checksums for package {package}...")
-        with open(package, "rb") as package_file:
-            package_bytes = package_file.read()
-            # NOTE: MD5 sums are still part of the PackageV1 API
-            package_md5sum = md5(package_bytes).hexdigest()  # nosec: B324
-            package_sha256sum = sha256(package_bytes).hexdigest()
+        if cache:
+            cached_model = cache.get_package(package=package, pgpsig=pgpsig, lazy_mtree=lazy_mtree)
+            if cached_model:
+                return cached_model
 
-        debug(f"Opening package file {package} for reading...")
-        with open_tarfile(package) as tarfile:
+        debug(f"Opening package file {package} for reading and creating checksums...")
+        with DigestReader(path=package) as package_file, open_tarfile(
+            package, fileobj=package_file  # type: ignore[arg-type]
+        ) as tarfile:
+            files = read_files_from_tarfile(
+                tarfile=tarfile,
+                names=set().union(*[version["required"] for version in PACKAGE_VERSIONS.values()]),
+            )
             for version in range(len(PACKAGE_VERSIONS), 0, -1):
                 debug(f"Testing data against Package version {version}...")
-                if names_in_tarfile(tarfile=tarfile, names=PACKAGE_VERSIONS[version]["required"]):
+                if PACKAGE_VERSIONS[version]["required"].issubset(files):
                     debug(f"Package version {version} matches provided data!")
                     package_version = version
                     break
 
             match package_version:
                 case 1:
-                    return PackageV1(
-                        buildinfo=BuildInfo.from_file(
-                            data=await extract_file_from_tarfile(  # type: ignore[arg-type]
-                                tarfile=tarfile,
-                                file=".BUILDINFO",
-                                as_stringio=True,
-                            )
-                        ),
+                    mtree = MTree.from_gzip(data=files[".MTREE"])
+                    if not lazy_mtree:
+                        parse_mtree(package=package, mtree=mtree)
+
+                    buildinfo = BuildInfo.from_file(data=StringIO(initial_value=files[".BUILDINFO"].decode("utf-8")))
+                    pkginfo = PkgInfo.from_file(data=StringIO(initial_value=files[".PKGINFO"].decode("utf-8")))
+                    package_md5sum, package_sha256sum = package_file.digests()
+                    model = PackageV1(
+                        buildinfo=buildinfo,
                         csize=package.stat().st_size,
                         filename=package.name,
                         md5sum=package_md5sum,
-                        mtree=MTree.from_file(
-                            data=await extract_file_from_tarfile(  # type: ignore[arg-type]
-                                tarfile=tarfile,
-                                file=".MTREE",
-                                as_stringio=True,
-                                gzip_compressed=True,
-                            ),
-                        ),
+                        mtree=mtree,
                         pgpsig=pgpsig,
-                        pkginfo=PkgInfo.from_file(
-                            data=await extract_file_from_tarfile(  # type: ignore[arg-type]
-                                tarfile=tarfile,
-                                file=".PKGINFO",
-                                as_stringio=True,
-                            ),
-                        ),
+                        pkginfo=pkginfo,
                         sha256sum=package_sha256sum,
                     )
                 case _:
@@ -124,6 +143,11 @@ class Package(BaseModel):
                         f"The provided file {package} does not match any known package versions!"
                     )
 
+        if cache:
+            cache.put(package=package, model=model)
+
+        return model
+
     def top_level_dict(self) -> dict[str, Any]:
         """Flatten the keys and values tracked by Package (one level deep) and return them in a dict.
 
@@ -172,6 +196,306 @@ class PackageV1(CSize, FileName, Md5Sum, Package, PgpSig, Sha256Sum):
     pkginfo: PkgInfo
 
 
+def is_trusted_file(stat: os.stat_result) -> bool:
+    """Return whether a file (or directory) is owned by the current user and not writable by group or others.
+
+    Parameters
+    ----------
+    stat: os.stat_result
+        The result of stat() or lstat() for a file or directory
+
+    Returns
+    -------
+    bool
+        True if the file is owned by the current user and not writable by group or others, False otherwise
+    """
+    return stat.st_uid == os.getuid() and not stat.st_mode & (S_IWGRP | S_IWOTH)
+
+
+class PackageCache:
+    """A persistent, size-bounded cache of Package instances, keyed by the identity of their package files.
+
+    The identity of a package file is derived from its absolute path, size, modification time, inode and device. Any
+    change to a package file therefore automatically invalidates its cache entry. As the identity also includes
+    PACKAGE_CACHE_VERSION (which is increased whenever the representation of Package changes), cache entries of
+    earlier versions are not used. Each entry is stored as a separate file in the cache directory, which allows
+    concurrent use by several processes.
+    If the accumulated size of all entries exceeds max_size, the least recently used entries are removed.
+
+    NOTE: Entries are stored without PGP signature (pgpsig), as the signature file is not part of a package file's
+    identity.
+
+    NOTE: Entries are serialized using pickle, which allows to skip any validation when reading them. The cache
+    directory is created with PACKAGE_CACHE_DIR_MODE. A cache directory (or entry), that is not owned by the current
+    user or is writable by group or others, is not used, as untrusted users could otherwise inject code.
+
+    The accumulated size of all entries is only determined from the cache directory once per instance and is afterwards
+    tracked when adding entries. Once it exceeds max_size, the least recently used entries are removed until
+    PACKAGE_CACHE_EVICTION_RATIO of max_size is reached.
+
+    Attributes
+    ----------
+    directory: Path
+        The absolute path of the cache directory
+    max_size: int
+        The maximum accumulated size of all cache entries in bytes
+    verify_checksum: bool
+        Whether to verify the SHA-256 checksum of a package file against the one of its cache entry before using it
+    """
+
+    def __init__(self, directory: Path, max_size: int, verify_checksum: bool = False) -> None:
+        """Initialize an instance of PackageCache.
+
+        Parameters
+        ----------
+        directory: Path
+            The absolute path of the cache directory (created if it does not exist)
+        max_size: int
+            The maximum accumulated size of all cache entries in bytes
+        verify_checksum: bool
+            Whether to verify the SHA-256 checksum of a package file against the one of its cache entry before using it
+            (defaults to False)
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self.verify_checksum = verify_checksum
+        self._directory_trusted = False
+        self._size: int | None = None
+
+    def check_directory(self) -> bool:
+        """Check whether the cache directory exists and can be trusted.
+
+        Once the cache directory has been found to be trusted, the result is kept for the lifetime of the instance.
+
+        Returns
+        -------
+        bool
+            True if the cache directory exists, is owned by the current user and is not writable by group or others,
+            False otherwise
+        """
+        if self._directory_trusted:
+            return True
+
+        try:
+            stat = self.directory.stat()
+        except OSError as e:
+            debug(f"Unable to use package cache directory {self.directory}: {e}")
+            return False
+
+        if not is_trusted_file(stat=stat):
+            info(
+                f"Not using package cache directory {self.directory}, as it is not owned by the current user or "
+                "writable by group or others!"
+            )
+            return False
+
+        self._directory_trusted = True
+        return True
+
+    def entry_path(self, package: Path) -> Path:
+        """Return the Path of the cache entry for a package file.
+
+        Parameters
+        ----------
+        package: Path
+            The path to a package file
+
+        Returns
+        -------
+        Path
+            The Path of the cache entry, that is derived from the identity of package
+        """
+        package = package.resolve()
+        stat = package.stat()
+        identity = f"{PACKAGE_CACHE_VERSION}:{package}:{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}:{stat.st_dev}"
+        return self.directory / f"{sha256(identity.encode('utf-8')).hexdigest()}{PACKAGE_CACHE_FILE_SUFFIX}"
+
+    def get(self, package: Path) -> Package | None:
+        """Return the cached Package of a package file.
+
+        Cache entries, that can not be read or do not match the SHA-256 checksum of the package file (if verify_checksum
+        is True), are removed.
+
+        Parameters
+        ----------
+        package: Path
+            The path to a package file
+
+        Returns
+        -------
+        Package | None
+            The cached Package (without pgpsig) if there is a valid and trusted cache entry for package, else None
+        """
+        path = self.entry_path(package=package)
+        if not self.check_directory():
+            return None
+
+        try:
+            stat = path.lstat()
+        except FileNotFoundError:
+            debug(f"No cache entry for package {package} found...")
+            return None
+
+        if not S_ISREG(stat.st_mode) or not is_trusted_file(stat=stat):
+            info(
+                f"Not using cache entry {path} of package {package}, as it is not a regular file owned by the current "
+                "user or is writable by group or others!"
+            )
+            return None
+
+        try:
+            model = pickle.loads(path.read_bytes())  # nosec: B301
+        except Exception as e:
+            debug(f"Removing unreadable cache entry {path} of package {package}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if not isinstance(model, Package):
+            debug(f"Removing cache entry {path} of package {package}, as it does not contain a Package...")
+            path.unlink(missing_ok=True)
+            return None
+
+        if self.verify_checksum:
+            with DigestReader(path=package) as package_file:
+                if package_file.digests()[1] != model.sha256sum:  # type: ignore[attr-defined]
+                    debug(f"Removing cache entry {path}, as its checksum does not match package {package}...")
+                    path.unlink(missing_ok=True)
+                    return None
+
+        debug(f"Using cache entry {path} for package {package}...")
+        os.utime(path)
+        return model
+
+    def get_package(self, package: Path, pgpsig: str | None = None, lazy_mtree: bool = False) -> Package | None:
+        """Return the cached Package of a package file with an optional PGP signature.
+
+        Parameters
+        ----------
+        package: Path
+            The path to a package file
+        pgpsig: str | None
+            An optional PGP signature (in base64 representation) to add to the cached Package (defaults to None)
+        lazy_mtree: bool
+            Whether to parse the .MTREE file of the cached Package only on first access (defaults to False)
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the .MTREE file of the cached Package can not be read (only if lazy_mtree is False)
+
+        Returns
+        -------
+        Package | None
+            The cached Package (with pgpsig) if there is a valid and trusted cache entry for package, else None
+        """
+        model = self.get(package=package)
+        if not model:
+            return None
+
+        if not lazy_mtree:
+            parse_mtree(package=package, mtree=model.mtree)  # type: ignore[attr-defined]
+
+        return model.copy(update={"pgpsig": pgpsig})
+
+    def put(self, package: Path, model: Package) -> None:
+        """Add the Package of a package file to the cache and remove least recently used entries if required.
+
+        Errors writing to the cache are only logged, as the cache is not required for the operation of repod.
+
+        Parameters
+        ----------
+        package: Path
+            The path to a package file
+        model: Package
+            The Package created from package
+        """
+        path = self.entry_path(package=package)
+        debug(f"Adding cache entry {path} for package {package}...")
+
+        try:
+            self.directory.mkdir(mode=int(PACKAGE_CACHE_DIR_MODE, base=8), parents=True, exist_ok=True)
+            if not self.check_directory():
+                return
+            with NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as tmp_file:
+                size = tmp_file.write(
+                    pickle.dumps(model.copy(update={"pgpsig": None}), protocol=pickle.HIGHEST_PROTOCOL)
+                )
+            os.replace(tmp_file.name, path)
+        except OSError as e:
+            debug(f"Unable to add cache entry {path} for package {package}: {e}")
+            return
+
+        if self._size is None:
+            self._size = sum(entry[1] for entry in self.get_entries())
+        else:
+            self._size += size
+
+        if self._size > self.max_size:
+            self.evict(size=int(self.max_size * PACKAGE_CACHE_EVICTION_RATIO))
+
+    def get_entries(self) -> list[tuple[int, int, Path]]:
+        """Return all cache entries.
+
+        Returns
+        -------
+        list[tuple[int, int, Path]]
+            A list of the modification time (in nanoseconds), size and Path of each cache entry
+        """
+        entries = []
+        for path in self.directory.glob(f"*{PACKAGE_CACHE_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        return entries
+
+    def evict(self, size: int | None = None) -> None:
+        """Remove the least recently used cache entries until their accumulated size is below a size.
+
+        Parameters
+        ----------
+        size: int | None
+            The accumulated size of all cache entries in bytes, that must not be exceeded after eviction (defaults to
+            None, which uses max_size)
+        """
+        if size is None:
+            size = self.max_size
+
+        entries = self.get_entries()
+        total_size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= size:
+                break
+            debug(f"Evicting cache entry {path}...")
+            path.unlink(missing_ok=True)
+            total_size -= entry_size
+
+        self._size = total_size
+
+
+def parse_mtree(package: Path, mtree: MTree) -> None:
+    """Parse all attributes of the entries of the MTree of a package file.
+
+    Parameters
+    ----------
+    package: Path
+        The path to the package file, that mtree has been read from
+    mtree: MTree
+        An MTree created using MTree.from_gzip()
+
+    Raises
+    ------
+    RepoManagementFileError
+        If the .MTREE file can not be read
+    """
+    try:
+        mtree.parse()
+    except RepoManagementFileError as e:
+        raise RepoManagementFileError(f"An error occured trying to read .MTREE of {package}\n{e}\n")
+
+
 def export_schemas(output: Path | str) -> None:
     """Export the JSON schema of selected pydantic models to an output directory.
 
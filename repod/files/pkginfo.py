@@ -6,7 +6,7 @@ from logging import debug
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, constr
+from pydantic import BaseModel
 
 from repod.common.enums import FieldTypeEnum, PkgTypeEnum
 from repod.common.models import (
@@ -31,6 +31,7 @@ from repod.common.models import (
     SchemaVersionV2,
     Url,
     Version,
+    cached_constr,
 )
 from repod.common.regex import VERSION
 from repod.errors import RepoManagementError, RepoManagementFileError
@@ -233,7 +234,7 @@ class FakerootVersion(BaseModel):
         A string representing a version of fakeroot
     """
 
-    fakeroot_version: constr(regex=rf"^({VERSION})$")  # type: ignore[valid-type]  # noqa: F722
+    fakeroot_version: cached_constr(regex=rf"^({VERSION})$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class MakepkgVersion(BaseModel):
@@ -245,7 +246,7 @@ class MakepkgVersion(BaseModel):
         A string representing a version of makepkg
     """
 
-    makepkg_version: constr(regex=rf"^({VERSION})$")  # type: ignore[valid-type]  # noqa: F722
+    makepkg_version: cached_constr(regex=rf"^({VERSION})$")  # type: ignore[valid-type]  # noqa: F722
 
 
 class PkgType(BaseModel):
@@ -294,10 +295,36 @@ class PkgInfo(BaseModel):
         """
         pkg_info_version = 0
         entries: dict[str, int | str | list[str | dict[str, Any]]] = {}
+        values: dict[str, list[str]] = {}
+
+        # NOTE: split the data only once and group the values by key, so that type assignments are only looked up once
+        # per key (and not per line)
+        for line in data.read().splitlines():
+            if line.startswith("#"):
+                key, value, field_type = parse_pairs(line=line)
+                pairs_to_entries(key=key, value=value, field_type=field_type, entries=entries)
+                continue
+
+            extracted_key, separator, value = line.strip().partition(" = ")
+            if not separator:
+                raise RepoManagementFileError(f"An error occurred while trying to parse the .PKGINFO line {line}")
+            values.setdefault(extracted_key.strip(), []).append(value.strip())
+
+        for extracted_key, key_values in values.items():
+            assignment_key = PKGINFO_ASSIGNMENTS.get(extracted_key)
+            if assignment_key is None:
+                raise RepoManagementFileError(
+                    f"An error occured parsing the .PKGINFO key '{extracted_key}'! "
+                    f"The key {extracted_key} can not be found in the type assignments for .PKGINFO keywords."
+                )
+
+            key, field_type = assignment_key
+            if field_type == FieldTypeEnum.STRING_LIST:
+                entries[key] = key_values  # type: ignore[assignment]
+                continue
 
-        for line in data:
-            key, value, field_type = parse_pairs(line=line)
-            pairs_to_entries(key=key, value=value, field_type=field_type, entries=entries)
+            for value in key_values:
+                pairs_to_entries(key=key, value=value, field_type=field_type, entries=entries)
 
         for version in range(len(PKGINFO_VERSIONS), 0, -1):
             debug(f"Testing data against .PKGINFO version {version}.")
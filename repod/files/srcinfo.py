@@ -5,7 +5,7 @@ from io import StringIO
 from logging import debug
 from pathlib import Path
 
-from pydantic import BaseModel, HttpUrl, ValidationError, conlist, constr
+from pydantic import BaseModel, HttpUrl, ValidationError, conlist
 
 from repod.common.enums import FieldTypeEnum
 from repod.common.models import (
@@ -28,6 +28,7 @@ from repod.common.models import (
     Provides,
     Replaces,
     Url,
+    cached_constr,
 )
 from repod.common.regex import (
     ARCHITECTURE,
@@ -193,7 +194,7 @@ class B2Sums(BaseModel):
         An optional list of blake2 checksum or 'SKIP' strings
     """
 
-    b2sums: list[constr(regex=f"^({B2}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
+    b2sums: list[cached_constr(regex=f"^({B2}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class CkSums(BaseModel):
@@ -205,7 +206,7 @@ class CkSums(BaseModel):
         An optional list of CRC-32 checksum or 'SKIP' strings
     """
 
-    cksums: list[constr(regex=f"^({CK}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
+    cksums: list[cached_constr(regex=f"^({CK}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class Changelog(BaseModel):
@@ -241,7 +242,7 @@ class Md5Sums(BaseModel):
         An optional list of MD5 checksum or 'SKIP' strings
     """
 
-    md5sums: list[constr(regex=f"^({MD5}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
+    md5sums: list[cached_constr(regex=f"^({MD5}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class Noextract(BaseModel):
@@ -265,7 +266,7 @@ class Sha1Sums(BaseModel):
         An optional list of SHA-1 checksum or 'SKIP' strings
     """
 
-    sha1sums: list[constr(regex=f"^({SHA1}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
+    sha1sums: list[cached_constr(regex=f"^({SHA1}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class Sha224Sums(BaseModel):
@@ -277,7 +278,7 @@ class Sha224Sums(BaseModel):
         An optional list of SHA-224 checksum or 'SKIP' strings
     """
 
-    sha224sums: list[constr(regex=f"^({SHA224}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
+    sha224sums: list[cached_constr(regex=f"^({SHA224}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class Sha256Sums(BaseModel):
@@ -289,7 +290,7 @@ class Sha256Sums(BaseModel):
         An optional list of SHA-256 checksum or 'SKIP' strings
     """
 
-    sha256sums: list[constr(regex=f"^({SHA256}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
+    sha256sums: list[cached_constr(regex=f"^({SHA256}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class Sha384Sums(BaseModel):
@@ -301,7 +302,7 @@ class Sha384Sums(BaseModel):
         An optional list of SHA-384 checksum or 'SKIP' strings
     """
 
-    sha384sums: list[constr(regex=f"^({SHA384}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
+    sha384sums: list[cached_constr(regex=f"^({SHA384}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class Sha512Sums(BaseModel):
@@ -313,7 +314,7 @@ class Sha512Sums(BaseModel):
         An optional list of SHA-512 checksum or 'SKIP' strings
     """
 
-    sha512sums: list[constr(regex=f"^({SHA512}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
+    sha512sums: list[cached_constr(regex=f"^({SHA512}|SKIP)$")] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class Source(BaseModel):
@@ -337,7 +338,7 @@ class ValidPGPKeys(BaseModel):
         An optional list of PGP key ID strings
     """
 
-    validpgpkeys: list[constr(regex=PGP_KEY_ID)] | None  # type: ignore[valid-type]  # noqa: F722
+    validpgpkeys: list[cached_constr(regex=PGP_KEY_ID)] | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class OptionalArch(BaseModel):
@@ -349,7 +350,7 @@ class OptionalArch(BaseModel):
         An optional architecture string of a package
     """
 
-    arch: constr(regex=f"^{ARCHITECTURE}$") | None  # type: ignore[valid-type]  # noqa: F722
+    arch: cached_constr(regex=f"^{ARCHITECTURE}$") | None  # type: ignore[valid-type]  # noqa: F722
 
 
 class OptionalLicense(BaseModel):
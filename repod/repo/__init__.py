@@ -3,6 +3,8 @@ from pathlib import Path
 
 from repod.repo.management import (  # noqa: F401
     Files,
+    ManagementRepoCatalog,
+    ManagementRepoIndex,
     OutputPackage,
     OutputPackageBase,
     PackageDesc,
@@ -1,4 +1,6 @@
 """Handling of repod management repositories."""
+from repod.repo.management.catalog import ManagementRepoCatalog  # noqa: F401
+from repod.repo.management.index import ManagementRepoIndex  # noqa: F401
 from repod.repo.management.outputpackage import (  # noqa: F401
     Files,
     OutputBuildInfo,
@@ -0,0 +1,556 @@
+"""A persistent SQLite catalog of management repository directories."""
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from logging import debug
+from pathlib import Path
+from re import split
+
+from pydantic import BaseModel
+
+from repod.common.enums import RepoTypeEnum
+from repod.errors import RepoManagementFileError
+from repod.repo.management.outputpackage import OutputPackageBase
+
+CATALOG_SCHEMA_VERSION = 1
+CATALOG_SCHEMA = """
+CREATE TABLE pkgbases (
+    id INTEGER PRIMARY KEY,
+    directory TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    architecture TEXT NOT NULL,
+    repo_type TEXT,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    packager TEXT NOT NULL,
+    source_url TEXT,
+    UNIQUE (directory, name)
+);
+CREATE INDEX pkgbases_name ON pkgbases (name);
+CREATE TABLE packages (
+    id INTEGER PRIMARY KEY,
+    pkgbase_id INTEGER NOT NULL REFERENCES pkgbases (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    arch TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    builddate INTEGER NOT NULL,
+    csize INTEGER NOT NULL,
+    isize INTEGER NOT NULL
+);
+CREATE INDEX packages_pkgbase_id ON packages (pkgbase_id);
+CREATE INDEX packages_name ON packages (name);
+CREATE TABLE dependencies (
+    pkgbase_id INTEGER NOT NULL REFERENCES pkgbases (id) ON DELETE CASCADE,
+    package_id INTEGER REFERENCES packages (id) ON DELETE CASCADE,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX dependencies_pkgbase_id ON dependencies (pkgbase_id);
+CREATE INDEX dependencies_name ON dependencies (name, type);
+CREATE TABLE files (
+    package_id INTEGER NOT NULL REFERENCES packages (id) ON DELETE CASCADE,
+    path TEXT NOT NULL
+);
+CREATE INDEX files_package_id ON files (package_id);
+CREATE INDEX files_path ON files (path);
+"""
+PACKAGE_DEPENDENCY_TYPES = ["checkdepends", "conflicts", "depends", "optdepends", "provides", "replaces"]
+PKGBASE_DEPENDENCY_TYPES = ["makedepends"]
+CATALOG_ENTRY_COLUMNS = (
+    "pkgbases.directory, pkgbases.repository, pkgbases.architecture, pkgbases.repo_type, pkgbases.name, "
+    "pkgbases.version"
+)
+
+
+class CatalogEntry(BaseModel):
+    """A pkgbase (or one of its packages) found in a ManagementRepoCatalog.
+
+    Attributes
+    ----------
+    directory: Path
+        The management repository directory of the pkgbase
+    repository: str
+        The name of the repository of the pkgbase (the name of directory)
+    architecture: str
+        The CPU architecture of the repository of the pkgbase (the name of the parent of directory)
+    repo_type: RepoTypeEnum | None
+        The optional type (stability layer) of the repository of the pkgbase
+    pkgbase: str
+        The name of the pkgbase
+    version: str
+        The version of the pkgbase
+    package: str | None
+        The optional name of a package of the pkgbase (defaults to None)
+    """
+
+    directory: Path
+    repository: str
+    architecture: str
+    repo_type: RepoTypeEnum | None
+    pkgbase: str
+    version: str
+    package: str | None = None
+
+
+def get_dependency_name(value: str) -> str:
+    """Return the name of a dependency (without version requirement or description).
+
+    Parameters
+    ----------
+    value: str
+        A dependency string (e.g. "foo>=1.0.0-1" or "foo: for bar support")
+
+    Returns
+    -------
+    str
+        The name of the dependency
+    """
+    return split(r"[<>=:]", value, maxsplit=1)[0].strip()
+
+
+class ManagementRepoCatalog:
+    """A persistent SQLite catalog of the pkgbases in management repository directories.
+
+    The catalog holds the pkgbases, packages, dependencies and files of all JSON files in a management repository, so
+    that they can be queried using indexes instead of reading JSON files. It is updated in a transaction whenever JSON
+    files are moved to a management repository directory and can be rebuilt from the JSON files at any time, which
+    remain the single source of truth.
+
+    Attributes
+    ----------
+    path: Path
+        The absolute path of the SQLite database file of the catalog
+    repo_types: dict[Path, RepoTypeEnum]
+        A dict of management repository directories and the type (stability layer) of their repository
+    """
+
+    def __init__(self, path: Path, repo_types: dict[Path, RepoTypeEnum] | None = None) -> None:
+        """Initialize an instance of ManagementRepoCatalog.
+
+        Parameters
+        ----------
+        path: Path
+            The absolute path of the SQLite database file of the catalog (created if it does not exist)
+        repo_types: dict[Path, RepoTypeEnum] | None
+            An optional dict of management repository directories and the type (stability layer) of their repository
+            (defaults to None)
+        """
+        self.path = path
+        self.repo_types = repo_types or {}
+
+    def connect(self) -> sqlite3.Connection:
+        """Connect to the SQLite database of the catalog and create its schema if required.
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the database can not be opened or if its schema version does not match CATALOG_SCHEMA_VERSION
+
+        Returns
+        -------
+        sqlite3.Connection
+            A connection to the database, in which transactions are handled explicitly
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, isolation_level=None)
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.execute("PRAGMA journal_mode = WAL")
+            schema_version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if schema_version == 0:
+                connection.execute("BEGIN IMMEDIATE")
+                # NOTE: another process may have created the schema while waiting for the write lock
+                if connection.execute("PRAGMA user_version").fetchone()[0] == 0:
+                    debug(f"Creating schema of management repository catalog {self.path}...")
+                    for statement in CATALOG_SCHEMA.split(";"):
+                        connection.execute(statement)
+                    connection.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+                connection.execute("COMMIT")
+                schema_version = CATALOG_SCHEMA_VERSION
+        except (OSError, sqlite3.Error) as e:
+            raise RepoManagementFileError(f"Unable to open the management repository catalog {self.path}: {e}")
+
+        if schema_version != CATALOG_SCHEMA_VERSION:
+            connection.close()
+            raise RepoManagementFileError(
+                f"The management repository catalog {self.path} uses schema version {schema_version} instead of "
+                f"{CATALOG_SCHEMA_VERSION} and must be rebuilt!"
+            )
+
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Provide a connection with an exclusive write transaction, that is committed when leaving the context.
+
+        The transaction is rolled back if an exception is raised in the context.
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the database can not be opened or if the transaction can not be started or committed
+
+        Yields
+        ------
+        sqlite3.Connection
+            A connection to the database with an active transaction
+        """
+        connection = self.connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            yield connection
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise RepoManagementFileError(f"Unable to update the management repository catalog {self.path}: {e}")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    def write_pkgbases(
+        self,
+        connection: sqlite3.Connection,
+        directory: Path,
+        pkgbases: list[OutputPackageBase],
+    ) -> None:
+        """Write pkgbases of a management repository directory to the catalog, replacing existing ones of same name.
+
+        All other pkgbases of directory, whose JSON file has been removed from directory, are removed from the catalog
+        (see remove_missing_pkgbases()).
+
+        Parameters
+        ----------
+        connection: sqlite3.Connection
+            A connection to the database of the catalog with an active transaction
+        directory: Path
+            The management repository directory of the pkgbases
+        pkgbases: list[OutputPackageBase]
+            The pkgbases to write
+        """
+        names = [pkgbase.base for pkgbase in pkgbases]  # type: ignore[attr-defined]
+        self.remove_missing_pkgbases(connection=connection, directory=directory, exclude=names)
+        self.remove_pkgbases(connection=connection, directory=directory, names=names)
+        repo_type = self.repo_types.get(directory)
+
+        for pkgbase in pkgbases:
+            debug(f"Adding pkgbase {pkgbase.base} to catalog {self.path}...")  # type: ignore[attr-defined]
+            pkgbase_id = connection.execute(
+                "INSERT INTO pkgbases "
+                "(directory, repository, architecture, repo_type, name, version, packager, source_url) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(directory),
+                    directory.name,
+                    directory.parent.name,
+                    repo_type.value if repo_type else None,
+                    pkgbase.base,  # type: ignore[attr-defined]
+                    pkgbase.version,  # type: ignore[attr-defined]
+                    pkgbase.packager,  # type: ignore[attr-defined]
+                    str(pkgbase.source_url) if pkgbase.source_url else None,  # type: ignore[attr-defined]
+                ),
+            ).lastrowid
+            connection.executemany(
+                "INSERT INTO dependencies (pkgbase_id, package_id, type, name, value) VALUES (?, NULL, ?, ?, ?)",
+                [
+                    (pkgbase_id, type_, get_dependency_name(value), value)
+                    for type_ in PKGBASE_DEPENDENCY_TYPES
+                    for value in getattr(pkgbase, type_, None) or []
+                ],
+            )
+
+            for package in pkgbase.packages:  # type: ignore[attr-defined]
+                package_id = connection.execute(
+                    "INSERT INTO packages (pkgbase_id, name, arch, filename, builddate, csize, isize) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        pkgbase_id,
+                        package.name,
+                        package.arch,
+                        package.filename,
+                        package.builddate,
+                        package.csize,
+                        package.isize,
+                    ),
+                ).lastrowid
+                connection.executemany(
+                    "INSERT INTO dependencies (pkgbase_id, package_id, type, name, value) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (pkgbase_id, package_id, type_, get_dependency_name(value), value)
+                        for type_ in PACKAGE_DEPENDENCY_TYPES
+                        for value in getattr(package, type_, None) or []
+                    ],
+                )
+                if package.files:
+                    connection.executemany(
+                        "INSERT INTO files (package_id, path) VALUES (?, ?)",
+                        [(package_id, path) for path in package.files.files],
+                    )
+
+    def remove_pkgbases(self, connection: sqlite3.Connection, directory: Path, names: list[str]) -> None:
+        """Remove pkgbases of a management repository directory from the catalog.
+
+        Parameters
+        ----------
+        connection: sqlite3.Connection
+            A connection to the database of the catalog with an active transaction
+        directory: Path
+            The management repository directory of the pkgbases
+        names: list[str]
+            The names of the pkgbases to remove
+        """
+        connection.executemany(
+            "DELETE FROM pkgbases WHERE directory = ? AND name = ?",
+            [(str(directory), name) for name in names],
+        )
+
+    def remove_missing_pkgbases(
+        self,
+        connection: sqlite3.Connection,
+        directory: Path,
+        exclude: list[str] | None = None,
+    ) -> list[str]:
+        """Remove the pkgbases of a management repository directory, whose JSON file does not exist, from the catalog.
+
+        Parameters
+        ----------
+        connection: sqlite3.Connection
+            A connection to the database of the catalog with an active transaction
+        directory: Path
+            A management repository directory
+        exclude: list[str] | None
+            An optional list of names of pkgbases, that are not removed (defaults to None)
+
+        Returns
+        -------
+        list[str]
+            The names of the removed pkgbases
+        """
+        excluded = set(exclude or [])
+        names = [
+            row[0]
+            for row in connection.execute("SELECT name FROM pkgbases WHERE directory = ?", (str(directory),))
+            if row[0] not in excluded and not (directory / f"{row[0]}.json").exists()
+        ]
+        if names:
+            debug(f"Removing pkgbases {names} without JSON file in {directory} from catalog {self.path}...")
+            self.remove_pkgbases(connection=connection, directory=directory, names=names)
+
+        return names
+
+    def update_from_directory(self, directory: Path, names: list[str]) -> None:
+        """Update pkgbases in the catalog from the JSON files in a management repository directory.
+
+        Pkgbases without JSON file in directory are removed from the catalog.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+        names: list[str]
+            The names of the pkgbases to update
+
+        Raises
+        ------
+        RepoManagementFileError
+            If a JSON file can not be read or if the catalog can not be updated
+        """
+        pkgbases = [
+            asyncio.run(OutputPackageBase.from_file(path=directory / f"{name}.json"))
+            for name in names
+            if (directory / f"{name}.json").exists()
+        ]
+
+        with self.transaction() as connection:
+            self.remove_pkgbases(connection=connection, directory=directory, names=names)
+            self.write_pkgbases(connection=connection, directory=directory, pkgbases=pkgbases)
+
+    def rebuild(self, directories: list[Path]) -> int:
+        """Rebuild the catalog from the JSON files in management repository directories.
+
+        All existing entries of the catalog are removed. If the schema version of the catalog does not match
+        CATALOG_SCHEMA_VERSION, the database file is recreated.
+
+        Parameters
+        ----------
+        directories: list[Path]
+            The management repository directories to read JSON files from
+
+        Raises
+        ------
+        RepoManagementFileError
+            If a JSON file can not be read or if the catalog can not be written
+
+        Returns
+        -------
+        int
+            The number of pkgbases written to the catalog
+        """
+        try:
+            self.connect().close()
+        except RepoManagementFileError as e:
+            debug(f"Recreating management repository catalog {self.path}: {e}")
+            for path in [self.path, Path(f"{self.path}-wal"), Path(f"{self.path}-shm")]:
+                path.unlink(missing_ok=True)
+
+        count = 0
+        with self.transaction() as connection:
+            connection.execute("DELETE FROM pkgbases")
+            for directory in directories:
+                debug(f"Adding management repository directory {directory} to catalog {self.path}...")
+                pkgbases = [
+                    asyncio.run(OutputPackageBase.from_file(path=path))
+                    for path in sorted(directory.glob("*.json"))
+                    if path.is_file()
+                ]
+                self.write_pkgbases(connection=connection, directory=directory, pkgbases=pkgbases)
+                count += len(pkgbases)
+
+        return count
+
+    def query(self, sql: str, parameters: tuple[str, ...] = ()) -> list[CatalogEntry]:
+        """Return the CatalogEntries selected by an SQL query.
+
+        Parameters
+        ----------
+        sql: str
+            An SQL query, that selects the directory, repository, architecture, repo_type, name and version of pkgbases
+            and optionally the name of a package (in this order)
+        parameters: tuple[str, ...]
+            The parameters of sql (defaults to an empty tuple)
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the catalog can not be queried
+
+        Returns
+        -------
+        list[CatalogEntry]
+            The CatalogEntries selected by sql
+        """
+        connection = self.connect()
+        try:
+            rows = connection.execute(sql, parameters).fetchall()
+        except sqlite3.Error as e:
+            raise RepoManagementFileError(f"Unable to query the management repository catalog {self.path}: {e}")
+        finally:
+            connection.close()
+
+        return [
+            CatalogEntry(
+                directory=Path(row[0]),
+                repository=row[1],
+                architecture=row[2],
+                repo_type=RepoTypeEnum(row[3]) if row[3] else None,
+                pkgbase=row[4],
+                version=row[5],
+                package=row[6] if len(row) > 6 else None,
+            )
+            for row in rows
+        ]
+
+    def get_pkgbases(self, directory: Path) -> list[CatalogEntry]:
+        """Return the pkgbases of a management repository directory.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+
+        Returns
+        -------
+        list[CatalogEntry]
+            The pkgbases of directory, sorted by name
+        """
+        return self.query(
+            f"SELECT {CATALOG_ENTRY_COLUMNS} FROM pkgbases WHERE directory = ? ORDER BY pkgbases.name",
+            (str(directory),),
+        )
+
+    def find_pkgbase(self, name: str) -> list[CatalogEntry]:
+        """Return the occurrences of a pkgbase in all management repository directories.
+
+        Parameters
+        ----------
+        name: str
+            The name of a pkgbase
+
+        Returns
+        -------
+        list[CatalogEntry]
+            The occurrences of the pkgbase, sorted by directory
+        """
+        return self.query(
+            f"SELECT {CATALOG_ENTRY_COLUMNS} FROM pkgbases WHERE name = ? ORDER BY pkgbases.directory",
+            (name,),
+        )
+
+    def find_package(self, name: str) -> list[CatalogEntry]:
+        """Return the occurrences of a package in all management repository directories.
+
+        Parameters
+        ----------
+        name: str
+            The name of a package
+
+        Returns
+        -------
+        list[CatalogEntry]
+            The occurrences of the package, sorted by directory
+        """
+        return self.query(
+            f"SELECT {CATALOG_ENTRY_COLUMNS}, packages.name FROM packages "
+            "JOIN pkgbases ON packages.pkgbase_id = pkgbases.id WHERE packages.name = ? ORDER BY pkgbases.directory",
+            (name,),
+        )
+
+    def find_dependents(self, name: str, type_: str = "depends") -> list[CatalogEntry]:
+        """Return the packages (or pkgbases) with a dependency of a certain type on a name.
+
+        Parameters
+        ----------
+        name: str
+            The name of a dependency (e.g. a package name or a provided name)
+        type_: str
+            The type of dependency (one of PACKAGE_DEPENDENCY_TYPES or PKGBASE_DEPENDENCY_TYPES, defaults to "depends")
+
+        Returns
+        -------
+        list[CatalogEntry]
+            The packages (or pkgbases, for PKGBASE_DEPENDENCY_TYPES) with the dependency, sorted by directory and name
+        """
+        return self.query(
+            f"SELECT DISTINCT {CATALOG_ENTRY_COLUMNS}, packages.name FROM dependencies "
+            "JOIN pkgbases ON dependencies.pkgbase_id = pkgbases.id "
+            "LEFT JOIN packages ON dependencies.package_id = packages.id "
+            "WHERE dependencies.name = ? AND dependencies.type = ? ORDER BY pkgbases.directory, packages.name",
+            (name, type_),
+        )
+
+    def find_file(self, path: str) -> list[CatalogEntry]:
+        """Return the packages containing a file.
+
+        Parameters
+        ----------
+        path: str
+            The path of a file in a package (e.g. "usr/bin/foo")
+
+        Returns
+        -------
+        list[CatalogEntry]
+            The packages containing path, sorted by directory and name
+        """
+        return self.query(
+            f"SELECT {CATALOG_ENTRY_COLUMNS}, packages.name FROM files JOIN packages ON files.package_id = packages.id "
+            "JOIN pkgbases ON packages.pkgbase_id = pkgbases.id WHERE files.path = ? "
+            "ORDER BY pkgbases.directory, packages.name",
+            (path,),
+        )
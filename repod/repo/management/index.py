@@ -0,0 +1,389 @@
+"""An in-memory index of management repository directories."""
+from __future__ import annotations
+
+import asyncio
+from logging import debug
+from os import scandir
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from repod.repo.management.outputpackage import OutputPackageBase
+
+
+class ManagementRepoIndex:
+    """An in-memory index of the pkgbases and packages in management repository directories.
+
+    Each management repository directory is scanned only once, when it is first queried. Afterwards the existence of
+    pkgbase and package JSON files (and their temporary counterparts) as well as the pkgbase providing a package are
+    looked up without accessing the file system. The JSON files of pkgbases are only read once, when they are first
+    requested.
+
+    An instance is meant to be shared by the Tasks and Checks of a single transaction, which all query the state of
+    the management repository directories before the transaction modifies them. Changes to a directory after it has
+    been scanned are not reflected, unless invalidate() is called.
+
+    All methods may be called concurrently from several threads: Scanning a directory, invalidating and memoizing
+    results is serialized using a lock, while JSON files of pkgbases are read without holding it.
+
+    Attributes
+    ----------
+    pkgbases: dict[Path, set[str]]
+        A dict of management repository directories and the names of the pkgbases (JSON files) in them
+    tmp_pkgbases: dict[Path, set[str]]
+        A dict of management repository directories and the names of the pkgbases with temporary JSON files in them
+    packages: dict[Path, dict[str, bool]]
+        A dict of management repository directories and the names of the packages (JSON files in their pkgnames
+        subdirectory) in them, mapped to whether the JSON file of the package is a symlink
+    tmp_packages: dict[Path, set[str]]
+        A dict of management repository directories and the names of the packages with temporary JSON files in them
+    """
+
+    def __init__(self) -> None:
+        """Initialize an instance of ManagementRepoIndex."""
+        self.pkgbases: dict[Path, set[str]] = {}
+        self.tmp_pkgbases: dict[Path, set[str]] = {}
+        self.packages: dict[Path, dict[str, bool]] = {}
+        self.tmp_packages: dict[Path, set[str]] = {}
+        self._targets: dict[tuple[Path, str], Path] = {}
+        self._models: dict[Path, OutputPackageBase] = {}
+        self._versions: dict[tuple[Path, str], tuple[str, str] | None] = {}
+        self._lock = Lock()
+
+    def scan(self, directory: Path) -> tuple[set[str], set[str], dict[str, bool], set[str]]:
+        """Scan a management repository directory, if it has not been scanned yet.
+
+        Directories that do not exist are treated as empty.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+
+        Returns
+        -------
+        tuple[set[str], set[str], dict[str, bool], set[str]]
+            The entries of directory in pkgbases, tmp_pkgbases, packages and tmp_packages, which remain consistent even
+            if directory is invalidated concurrently
+        """
+        with self._lock:
+            if directory not in self.pkgbases:
+                self._scan(directory=directory)
+
+            return (
+                self.pkgbases[directory],
+                self.tmp_pkgbases[directory],
+                self.packages[directory],
+                self.tmp_packages[directory],
+            )
+
+    def _scan(self, directory: Path) -> None:
+        """Scan a management repository directory and add it to the index (while holding the lock).
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+        """
+        debug(f"Scanning management repository directory {directory}...")
+        pkgbases: set[str] = set()
+        tmp_pkgbases: set[str] = set()
+        packages: dict[str, bool] = {}
+        tmp_packages: set[str] = set()
+
+        if directory.is_dir():
+            with scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        pkgbases.add(entry.name[:-5])
+                    elif entry.name.endswith(".json.tmp") and entry.is_file():
+                        tmp_pkgbases.add(entry.name[:-9])
+
+        if (directory / "pkgnames").is_dir():
+            with scandir(directory / "pkgnames") as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        packages[entry.name[:-5]] = entry.is_symlink()
+                    elif entry.name.endswith(".json.tmp") and entry.is_file():
+                        tmp_packages.add(entry.name[:-9])
+
+        self.pkgbases[directory] = pkgbases
+        self.tmp_pkgbases[directory] = tmp_pkgbases
+        self.packages[directory] = packages
+        self.tmp_packages[directory] = tmp_packages
+
+    def invalidate(self, directory: Path | None = None) -> None:
+        """Remove a management repository directory (or all of them) from the index, so that it is scanned again.
+
+        Parameters
+        ----------
+        directory: Path | None
+            An optional management repository directory (defaults to None, which removes all directories)
+        """
+        with self._lock:
+            indexes: list[dict[Path, Any]] = [self.pkgbases, self.tmp_pkgbases, self.packages, self.tmp_packages]
+            for index in indexes:
+                if directory:
+                    index.pop(directory, None)
+                else:
+                    index.clear()
+
+            self._targets = {key: value for key, value in self._targets.items() if directory and key[0] != directory}
+            self._models = {key: value for key, value in self._models.items() if directory and key.parent != directory}
+            self._versions = {key: value for key, value in self._versions.items() if directory and key[0] != directory}
+
+    def has_pkgbase(self, directory: Path, name: str, with_tmp: bool = False) -> bool:
+        """Return whether a management repository directory contains the JSON file of a pkgbase.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+        name: str
+            The name of a pkgbase
+        with_tmp: bool
+            Whether to also consider temporary JSON files (defaults to False)
+
+        Returns
+        -------
+        bool
+            True if the directory contains the JSON file of the pkgbase, False otherwise
+        """
+        pkgbases, tmp_pkgbases, _, _ = self.scan(directory=directory)
+        return name in pkgbases or (with_tmp and name in tmp_pkgbases)
+
+    def has_package(self, directory: Path, name: str, with_tmp: bool = False) -> bool:
+        """Return whether a management repository directory contains the JSON file of a package.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+        name: str
+            The name of a package
+        with_tmp: bool
+            Whether to also consider temporary JSON files (defaults to False)
+
+        Returns
+        -------
+        bool
+            True if the directory contains the JSON file of the package, False otherwise
+        """
+        _, _, packages, tmp_packages = self.scan(directory=directory)
+        return name in packages or (with_tmp and name in tmp_packages)
+
+    def get_package_target(self, directory: Path, name: str) -> Path | None:
+        """Return the JSON file of the pkgbase, that the JSON file of a package in a management repository links to.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+        name: str
+            The name of a package
+
+        Returns
+        -------
+        Path | None
+            The resolved Path of the JSON file the package's symlink points to, or None if the directory does not
+            contain a symlink for the package
+        """
+        _, _, packages, _ = self.scan(directory=directory)
+        if not packages.get(name):
+            return None
+
+        target = self._targets.get((directory, name))
+        if target is None:
+            target = (directory / "pkgnames" / f"{name}.json").resolve()
+            with self._lock:
+                self._targets[(directory, name)] = target
+
+        return target
+
+    def get_pkgbase_name(self, directory: Path, package: str) -> str | None:
+        """Return the name of the pkgbase providing a package in a management repository directory.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+        package: str
+            The name of a package
+
+        Returns
+        -------
+        str | None
+            The name of the pkgbase providing the package, or None if the directory does not contain a symlink for the
+            package
+        """
+        target = self.get_package_target(directory=directory, name=package)
+        return target.stem if target else None
+
+    def get_pkgbase(self, directory: Path, name: str) -> OutputPackageBase | None:
+        """Return the OutputPackageBase of a pkgbase in a management repository directory.
+
+        The JSON file of the pkgbase is only read on the first request.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+        name: str
+            The name of a pkgbase
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the JSON file of the pkgbase can not be read
+
+        Returns
+        -------
+        OutputPackageBase | None
+            The OutputPackageBase of the pkgbase, or None if the directory does not contain the pkgbase
+        """
+        if not self.has_pkgbase(directory=directory, name=name):
+            return None
+
+        return self.read_pkgbase(path=directory / f"{name}.json")
+
+    def get_pkgbase_of_package(self, directory: Path, package: str) -> OutputPackageBase | None:
+        """Return the OutputPackageBase of the pkgbase providing a package in a management repository directory.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+        package: str
+            The name of a package
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the JSON file of the pkgbase can not be read
+
+        Returns
+        -------
+        OutputPackageBase | None
+            The OutputPackageBase of the pkgbase providing the package, or None if the directory does not contain the
+            package
+        """
+        if not self.has_package(directory=directory, name=package):
+            return None
+
+        return self.read_pkgbase(
+            path=self.get_package_target(directory=directory, name=package)
+            or directory / "pkgnames" / f"{package}.json"
+        )
+
+    def get_package_version(self, directory: Path, package: str) -> tuple[str, str] | None:
+        """Return the version and architecture of a package in a management repository directory.
+
+        The result is only derived on the first request for each package.
+
+        Parameters
+        ----------
+        directory: Path
+            A management repository directory
+        package: str
+            The name of a package
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the JSON file of the pkgbase providing the package can not be read
+
+        Returns
+        -------
+        tuple[str, str] | None
+            The version of the pkgbase providing the package and the architecture of the package, or None if the
+            directory does not contain the package
+        """
+        versions = self._versions
+        if (directory, package) in versions:
+            return versions[(directory, package)]
+
+        version: tuple[str, str] | None = None
+        pkgbase = self.get_pkgbase_of_package(directory=directory, package=package)
+        if pkgbase:
+            for pkg in pkgbase.packages:  # type: ignore[attr-defined]
+                if pkg.name == package:
+                    version = (pkgbase.version, pkg.arch)  # type: ignore[attr-defined]
+                    break
+
+        with self._lock:
+            self._versions[(directory, package)] = version
+
+        return version
+
+    def read_pkgbase(self, path: Path) -> OutputPackageBase:
+        """Read the OutputPackageBase from a JSON file, if it has not been read yet.
+
+        Parameters
+        ----------
+        path: Path
+            The path to a JSON file of a pkgbase
+
+        Raises
+        ------
+        RepoManagementFileError
+            If the JSON file can not be read
+
+        Returns
+        -------
+        OutputPackageBase
+            The OutputPackageBase read from path
+        """
+        model = self._models.get(path)
+        if model is None:
+            # NOTE: the JSON file is read without holding the lock, so it may be read by several threads concurrently
+            model = asyncio.run(OutputPackageBase.from_file(path=path))
+            with self._lock:
+                model = self._models.setdefault(path, model)
+
+        return model
+
+    def find_pkgbase(self, directories: list[Path], name: str, with_tmp: bool = False) -> list[Path]:
+        """Return the management repository directories containing the JSON file of a pkgbase.
+
+        Parameters
+        ----------
+        directories: list[Path]
+            A list of management repository directories
+        name: str
+            The name of a pkgbase
+        with_tmp: bool
+            Whether to also consider temporary JSON files (defaults to False)
+
+        Returns
+        -------
+        list[Path]
+            The directories (in the order of directories) containing the JSON file of the pkgbase
+        """
+        return [
+            directory
+            for directory in directories
+            if self.has_pkgbase(directory=directory, name=name, with_tmp=with_tmp)
+        ]
+
+    def find_package(self, directories: list[Path], name: str, with_tmp: bool = False) -> list[Path]:
+        """Return the management repository directories containing the JSON file of a package.
+
+        Parameters
+        ----------
+        directories: list[Path]
+            A list of management repository directories
+        name: str
+            The name of a package
+        with_tmp: bool
+            Whether to also consider temporary JSON files (defaults to False)
+
+        Returns
+        -------
+        list[Path]
+            The directories (in the order of directories) containing the JSON file of the package
+        """
+        return [
+            directory
+            for directory in directories
+            if self.has_package(directory=directory, name=name, with_tmp=with_tmp)
+        ]
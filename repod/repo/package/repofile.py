@@ -3,14 +3,14 @@ from itertools import zip_longest
 from logging import debug, info
 from pathlib import Path
 from re import Match, fullmatch
-from shutil import copy2
 from typing import Any
 
 from pydantic import BaseModel, root_validator
 
-from repod.common.enums import RepoFileEnum
+from repod.common.enums import FilePlacementEnum, RepoFileEnum
 from repod.common.regex import PACKAGE_FILENAME, SIGNATURE_FILENAME
 from repod.errors import RepoManagementFileError
+from repod.files.common import place_file
 
 
 def filename_parts(file: Path) -> dict[str, str]:
@@ -267,7 +267,7 @@ class RepoFile(BaseModel):
                     "An error occured checking for the existence of a symlink: {self.symlink_path} exists already!"
                 )
 
-    def copy_from(self, path: Path) -> None:
+    def copy_from(self, path: Path, placement: FilePlacementEnum = FilePlacementEnum.COPY) -> None:
         """Copy file from a provided Path to file_path.
 
         Before doing further checks, RepoFile.validate_path() is run on path.
@@ -276,6 +276,9 @@ class RepoFile(BaseModel):
         ----------
         path: Path
             Path to move from
+        placement: FilePlacementEnum
+            A member of FilePlacementEnum, which defines how the file is placed at file_path (defaults to
+            FilePlacementEnum.COPY)
 
         Raises
         ------
@@ -288,7 +291,7 @@ class RepoFile(BaseModel):
             raise RepoManagementFileError(f"Error on trying to move file: The input file {path} does not exist!")
 
         self.check_file_path_exists(exists=False)
-        copy2(src=path, dst=self.file_path)
+        place_file(source=path, destination=self.file_path, placement=placement)
 
     def move_from(self, path: Path) -> None:
         """Move file from a provided Path to file_path.
@@ -3,13 +3,17 @@ from __future__ import annotations
 
 import io
 import re
+from collections import Counter
+from contextlib import ExitStack, closing
 from enum import IntEnum
-from logging import debug, warning
+from functools import lru_cache
+from logging import debug, info, warning
 from pathlib import Path
 from tarfile import DIRTYPE, TarFile, TarInfo
 from time import time
+from typing import AsyncGenerator, Iterator
 
-from jinja2 import Environment, PackageLoader, TemplateNotFound
+from jinja2 import Environment, PackageLoader, Template, TemplateNotFound
 from pydantic import BaseModel, ValidationError
 
 from repod.common.enums import (
@@ -57,6 +61,10 @@ from repod.repo.management import outputpackage
 DB_USER = "root"
 DB_GROUP = "root"
 DB_FILE_MODE = "0644"
+# NOTE: the desc and files versions of a repository sync database are recorded in vendor specific keywords of the pax
+# headers of its first member, which are ignored by other tools
+DB_DESC_VERSION_HEADER = "REPOD.desc_version"
+DB_FILES_VERSION_HEADER = "REPOD.files_version"
 DB_DIR_MODE = "0755"
 DESC_JSON: dict[str, tuple[str, FieldTypeEnum]] = {
     "%BASE%": ("base", FieldTypeEnum.STRING),
@@ -93,6 +101,16 @@ FILES_VERSIONS: dict[int, dict[str, set[str]]] = {
         "optional": set(),
     },
 }
+# NOTE: We are not rendering HTML and need special characters, hence we are not affected by XSS problems and set
+# autoescape=False
+# NOTE: The templates are shipped with repod and do not change at runtime, hence we set auto_reload=False
+TEMPLATE_ENVIRONMENT = Environment(  # nosec: B701
+    autoescape=False,
+    loader=PackageLoader("repod", "templates"),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+)
 DEFAULT_FILES_VERSION = 1
 DEFAULT_PACKAGE_DESC_VERSION = 1
 PACKAGE_DESC_VERSIONS: dict[int, dict[str, set[str] | int]] = {
@@ -313,6 +331,31 @@ def get_files_json_field_type(key: str) -> FieldTypeEnum:
         raise RepoManagementFileError(f"The key {key} is not a known 'files' file identifier.")
 
 
+@lru_cache(maxsize=None)
+def get_template(name: str) -> Template:
+    """Get a compiled jinja template for rendering descriptor files.
+
+    Templates are only loaded and compiled once and afterwards returned from a cache.
+
+    Parameters
+    ----------
+    name: str
+        The file name of the template
+
+    Raises
+    ------
+    TemplateNotFound
+        If no template of the given name can be found
+
+    Returns
+    -------
+    Template
+        The compiled template
+    """
+    debug(f"Compiling template file {name}...")
+    return TEMPLATE_ENVIRONMENT.get_template(name)
+
+
 class SyncDatabase(BaseModel):
     """A model describing a repository sync database.
 
@@ -324,14 +367,47 @@ class SyncDatabase(BaseModel):
         The type of database that the instance manages
     compression_type: CompressionTypeEnum
         The compression type which is used for  the database
+    compression_level: int | None
+        An optional compression level which is used when writing the database (defaults to None, which uses the
+        default of the compression type)
+    compression_workers: int | None
+        The number of threads which are used for compressing when writing the database (defaults to 1).
+        If None, the number of CPUs is used.
     """
 
     database: Path
     database_type: RepoDbTypeEnum | None
     compression_type: CompressionTypeEnum | None
+    compression_level: int | None
+    compression_workers: int | None = 1
     desc_version: PackageDescVersionEnum
     files_version: FilesVersionEnum
 
+    @classmethod
+    def get_pax_headers(
+        cls,
+        packagedesc_version: PackageDescVersionEnum,
+        files_version: FilesVersionEnum,
+    ) -> dict[str, str]:
+        """Return the pax headers, that record the desc and files versions of a repository sync database.
+
+        Parameters
+        ----------
+        packagedesc_version: PackageDescVersionEnum
+            The version of PackageDesc
+        files_version: FilesVersionEnum
+            The version of Files
+
+        Returns
+        -------
+        dict[str, str]
+            A dict of the DB_DESC_VERSION_HEADER and DB_FILES_VERSION_HEADER keywords and their values
+        """
+        return {
+            DB_DESC_VERSION_HEADER: str(packagedesc_version.value),
+            DB_FILES_VERSION_HEADER: str(files_version.value),
+        }
+
     @classmethod
     async def outputpackagebase_to_tarfile(
         cls,
@@ -358,6 +434,41 @@ class SyncDatabase(BaseModel):
         files_version: FilesVersionEnum
             The version of Files to use
         """
+        await SyncDatabase.outputpackagebase_to_tarfiles(
+            tarfiles=[(tarfile, database_type)],
+            model=model,
+            packagedesc_version=packagedesc_version,
+            files_version=files_version,
+        )
+
+    @classmethod
+    async def outputpackagebase_to_tarfiles(
+        cls,
+        tarfiles: list[tuple[TarFile, RepoDbTypeEnum | None]],
+        model: outputpackage.OutputPackageBase,
+        packagedesc_version: PackageDescVersionEnum,
+        files_version: FilesVersionEnum,
+    ) -> None:
+        """Stream descriptor files derived from an OutputPackageBase to several TarFiles at once.
+
+        Each desc file is only rendered once and streamed to all TarFiles, while each files file is only rendered once
+        and streamed to the TarFiles of files databases. The desc and files versions are recorded in the pax headers of
+        the first member of each TarFile (see addfile()).
+
+        Parameters
+        ----------
+        tarfiles: list[tuple[TarFile, RepoDbTypeEnum | None]]
+            A list of tuples of a TarFile to stream data to and the type of database it represents
+        model: OutputPackageBase
+            The OutputPackageBase instance to derive descriptor files from
+        packagedesc_version: PackageDescVersionEnum
+            The version of PackageDesc to use
+        files_version: FilesVersionEnum
+            The version of Files to use
+        """
+        with_files = any(database_type == RepoDbTypeEnum.FILES for (_, database_type) in tarfiles)
+        pax_headers = SyncDatabase.get_pax_headers(packagedesc_version=packagedesc_version, files_version=files_version)
+
         for (desc_model, files_model) in await model.get_packages_as_models(
             packagedesc_version=packagedesc_version,
             files_version=files_version,
@@ -369,28 +480,33 @@ class SyncDatabase(BaseModel):
             directory.uname = DB_USER
             directory.gname = DB_GROUP
             directory.mode = int(DB_DIR_MODE, base=8)
-            tarfile.addfile(directory)
 
             desc_content = io.StringIO()
             await desc_model.render(output=desc_content)
+            desc_data = desc_content.getvalue().encode()
             desc_file = TarInfo(f"{dirname}/desc")
-            desc_file.size = len(desc_content.getvalue().encode())
+            desc_file.size = len(desc_data)
             desc_file.mtime = int(time())
             desc_file.uname = DB_USER
             desc_file.gname = DB_GROUP
             desc_file.mode = int(DB_FILE_MODE, base=8)
-            tarfile.addfile(desc_file, io.BytesIO(desc_content.getvalue().encode()))
 
-            if database_type == RepoDbTypeEnum.FILES:
+            if with_files:
                 files_content = io.StringIO()
                 await files_model.render(output=files_content)
+                files_data = files_content.getvalue().encode()
                 files_file = TarInfo(f"{dirname}/files")
-                files_file.size = len(files_content.getvalue().encode())
+                files_file.size = len(files_data)
                 files_file.mtime = int(time())
                 files_file.uname = DB_USER
                 files_file.gname = DB_GROUP
                 files_file.mode = int(DB_FILE_MODE, base=8)
-                tarfile.addfile(files_file, io.BytesIO(files_content.getvalue().encode()))
+
+            for (tarfile, database_type) in tarfiles:
+                SyncDatabase.addfile(tarfile=tarfile, tarinfo=directory, data=None, pax_headers=pax_headers)
+                tarfile.addfile(desc_file, io.BytesIO(desc_data))
+                if database_type == RepoDbTypeEnum.FILES:
+                    tarfile.addfile(files_file, io.BytesIO(files_data))
 
     async def add(self, model: outputpackage.OutputPackageBase) -> None:
         """Write descriptor files for packages of a single pkgbase to the repository sync database.
@@ -406,6 +522,8 @@ class SyncDatabase(BaseModel):
             path=self.database,
             compression=self.compression_type,
             mode="w",
+            level=self.compression_level,
+            workers=self.compression_workers,
         ) as database_file:
             await SyncDatabase.outputpackagebase_to_tarfile(
                 tarfile=database_file,
@@ -415,92 +533,426 @@ class SyncDatabase(BaseModel):
                 files_version=self.files_version,
             )
 
-    async def outputpackagebases(self) -> list[tuple[str, outputpackage.OutputPackageBase]]:
-        """Read a repo sync database and return the name of each pkgbase and respective data.
+    async def packages(self) -> AsyncGenerator[tuple[PackageDesc, Files | None], None]:
+        """Read a repo sync database and yield the 'desc' and optional 'files' data of each package.
+
+        The members of the database are iterated over sequentially, exactly once, and the data of each package is
+        yielded as soon as all members of its directory have been read.
+
+        Yields
+        ------
+        tuple[PackageDesc, Files | None]
+            A tuple holding the PackageDesc and (if the database contains it) the Files of a package
+        """
+        directory: str | None = None
+        package_desc: PackageDesc | None = None
+        package_files: Files | None = None
+
+        with open_tarfile(path=self.database, compression=self.compression_type) as db_file:
+            for member in db_file:
+                member_directory, _, member_name = member.name.rpartition("/")
+                if not member.isfile() or member_name not in ("desc", "files"):
+                    continue
+
+                if member_directory != directory:
+                    if package_desc:
+                        yield (package_desc, package_files)
+                    directory, package_desc, package_files = member_directory, None, None
+
+                data = io.StringIO(db_file.extractfile(member).read().decode("utf-8"))  # type: ignore[union-attr]
+                if member_name == "desc":
+                    package_desc = await PackageDesc.from_stream(data=data)
+                else:
+                    package_files = await Files.from_stream(data=data)
+
+        if package_desc:
+            yield (package_desc, package_files)
+
+    def count_packages(self) -> Counter[str]:
+        """Count the packages of each pkgbase in a repo sync database.
+
+        Only the pkgbase is read from the desc file of each package, without validating the file.
 
         Returns
         -------
-        list[tuple[str, OutputPackageBase]]:
-            A tuple holding the name of a pkgbase and its accompanying data in an instance of OutputPackageBase
+        Counter[str]
+            The amount of packages by name of their pkgbase
         """
-        packages: dict[str, outputpackage.OutputPackageBase] = {}
-        package_descs: dict[str, PackageDesc] = {}
-        package_files: dict[str, Files] = {}
+        counts: Counter[str] = Counter()
 
         with open_tarfile(path=self.database, compression=self.compression_type) as db_file:
-            for file_name in [
-                file_name for file_name in db_file.getnames() if re.search(r"(/desc|/files)$", file_name)
-            ]:
-                pkgname = "".join(re.split("(-)", re.sub(r"(/desc|/files)$", "", file_name))[:-4])
-
-                if re.search("(/desc)$", file_name):
-                    package_descs.update(
-                        {
-                            pkgname: await PackageDesc.from_stream(
-                                data=io.StringIO(
-                                    io.BytesIO(
-                                        db_file.extractfile(file_name).read(),  # type: ignore[union-attr]
-                                    )
-                                    .read()
-                                    .decode("utf-8"),
-                                )
-                            ),
-                        },
-                    )
-                elif re.search("(/files)$", file_name):
-                    package_files.update(
-                        {
-                            pkgname: await Files.from_stream(
-                                data=io.StringIO(
-                                    io.BytesIO(
-                                        db_file.extractfile(file_name).read(),  # type: ignore[union-attr]
-                                    )
-                                    .read()
-                                    .decode("utf-8"),
-                                )
-                            )
-                        },
-                    )
-                else:  # pragma: no cover
-                    # NOTE: this branch can never be reached, but we add it to make tests happy
-                    raise RuntimeError(
-                        f"The database file {self.database} contains the member {file_name} of an unsupported type!"
-                    )
+            for member in db_file:
+                if not member.isfile() or not member.name.endswith("/desc"):
+                    continue
 
-        for (name, package_desc) in package_descs.items():
-            if packages.get(package_desc.get_base()):
-                packages[package_desc.get_base()].add_packages(
-                    [package_desc.get_output_package(files=package_files.get(name))]
-                )
+                desc = db_file.extractfile(member).read().decode("utf-8")  # type: ignore[union-attr]
+                base = re.search(r"^%BASE%\n(\S+)$", desc, re.MULTILINE)
+                if base:
+                    counts[base.group(1)] += 1
+
+        return counts
+
+    async def outputpackagebases(self) -> AsyncGenerator[tuple[str, outputpackage.OutputPackageBase], None]:
+        """Read a repo sync database and yield the name of each pkgbase and respective data.
+
+        As the members of a sync database are sorted by package name, the packages of a pkgbase may not be consecutive.
+        Therefore the packages of each pkgbase are counted first (see count_packages()) and the packages of a pkgbase
+        are combined until all of them have been read. Each pkgbase is yielded exactly once, as soon as it is complete,
+        so that only the data of pkgbases with packages interleaving those of other pkgbases is kept in memory.
+
+        Yields
+        ------
+        tuple[str, OutputPackageBase]
+            A tuple holding the name of a pkgbase and its accompanying data in an instance of OutputPackageBase
+        """
+        remaining = self.count_packages()
+        bases: dict[str, outputpackage.OutputPackageBase] = {}
+
+        async for (package_desc, package_files) in self.packages():
+            base_name = package_desc.get_base()
+            if base_name in bases:
+                bases[base_name].add_packages([package_desc.get_output_package(files=package_files)])
             else:
-                packages.update(
-                    {
-                        package_desc.get_base(): package_desc.get_output_package_base(files=package_files.get(name)),
-                    }
+                bases[base_name] = package_desc.get_output_package_base(files=package_files)
+
+            remaining[base_name] -= 1
+            if remaining[base_name] <= 0:
+                yield (base_name, bases.pop(base_name))
+
+        # NOTE: only yields pkgbases, if the sync database changed while reading it
+        for base_name, base in bases.items():
+            yield (base_name, base)
+
+    @classmethod
+    def addfile(cls, tarfile: TarFile, tarinfo: TarInfo, data: bytes | None, pax_headers: dict[str, str]) -> None:
+        """Add a member to a TarFile and record the desc and files versions in the pax headers of its first member.
+
+        The desc and files versions are removed from the pax headers of all other members, so that they are only
+        recorded once per repository sync database.
+
+        Parameters
+        ----------
+        tarfile: TarFile
+            A TarFile to add the member to
+        tarinfo: TarInfo
+            The TarInfo of the member
+        data: bytes | None
+            The optional data of the member
+        pax_headers: dict[str, str]
+            The pax headers recording the desc and files versions (see get_pax_headers())
+        """
+        tarinfo.pax_headers = {key: value for key, value in tarinfo.pax_headers.items() if key not in pax_headers}
+        if not tarfile.members:
+            tarinfo.pax_headers.update(pax_headers)
+
+        tarfile.addfile(tarinfo, io.BytesIO(data) if data is not None else None)
+
+    @classmethod
+    def get_base(cls, members: list[tuple[TarInfo, bytes | None]]) -> str | None:
+        """Return the name of the pkgbase of the members of a single package directory in a repository sync database.
+
+        Parameters
+        ----------
+        members: list[tuple[TarInfo, bytes | None]]
+            A list of tuples of TarInfo and optional data, representing the members of a package directory
+
+        Returns
+        -------
+        str | None
+            The name of the pkgbase found in the desc file of the members, or None if there is none
+        """
+        desc = next((data for (member, data) in members if member.name.endswith("/desc")), None)
+        base = re.search(r"^%BASE%\n(\S+)$", desc.decode("utf-8"), re.MULTILINE) if desc is not None else None
+        return base.group(1) if base else None
+
+    def pax_headers_match(self, pax_headers: dict[str, str]) -> bool:
+        """Check whether the pax headers of the first member of a sync database match desc_version and files_version.
+
+        Parameters
+        ----------
+        pax_headers: dict[str, str]
+            The pax headers of the first member of an existing repository sync database
+
+        Returns
+        -------
+        bool
+            True if pax_headers record desc_version and files_version, False otherwise
+        """
+        return all(
+            pax_headers.get(key) == value
+            for key, value in SyncDatabase.get_pax_headers(
+                packagedesc_version=self.desc_version,
+                files_version=self.files_version,
+            ).items()
+        )
+
+    def read_package_directories(self, source: TarFile) -> Iterator[list[tuple[TarInfo, bytes | None]]]:
+        """Read the members of each package directory of an existing repository sync database.
+
+        The members of the existing repository sync database are read sequentially and only as far as the generator is
+        consumed.
+        Nothing is yielded, if the desc and files versions recorded in the existing repository sync database do not
+        match desc_version and files_version (e.g. if it has been written with other versions or by another tool).
+
+        Parameters
+        ----------
+        source: TarFile
+            An existing repository sync database opened for reading
+
+        Yields
+        ------
+        list[tuple[TarInfo, bytes | None]]
+            A list of tuples of TarInfo and optional data, representing the members of a package directory
+        """
+        members: list[tuple[TarInfo, bytes | None]] = []
+        for index, member in enumerate(source):
+            # NOTE: all members of source are written with the same versions, so only the first member is checked
+            if index == 0 and not self.pax_headers_match(pax_headers=member.pax_headers):
+                info(
+                    f"Not copying from {source.name}, as it has not been written with the same desc and files versions!"
                 )
+                return
+
+            if members and members[0][0].name.split("/")[0] != member.name.split("/")[0]:
+                yield members
+                members = []
+
+            data = source.extractfile(member)
+            members.append((member, data.read() if data else None))
+
+        if members:
+            yield members
+
+    def read_pkgbases(
+        self,
+        source: TarFile,
+        pkgbases: set[str],
+    ) -> Iterator[tuple[str, list[tuple[TarInfo, bytes | None]]]]:
+        """Read the members of pkgbases from an existing repository sync database.
+
+        The package directories of a pkgbase are consecutive in a repository sync database, so the members of all
+        package directories of a pkgbase are yielded together, as soon as a package directory of another pkgbase is
+        encountered.
+
+        Parameters
+        ----------
+        source: TarFile
+            An existing repository sync database opened for reading
+        pkgbases: set[str]
+            The names of pkgbases for which members are yielded
+
+        Yields
+        ------
+        tuple[str, list[tuple[TarInfo, bytes | None]]]
+            A tuple of the name of a pkgbase and a list of tuples of TarInfo and optional data, representing the
+            members of its package directories
+        """
+        base: str | None = None
+        members: list[tuple[TarInfo, bytes | None]] = []
+
+        for directory_members in self.read_package_directories(source=source):
+            directory_base = SyncDatabase.get_base(members=directory_members)
+            if base is not None and members and directory_base != base:
+                yield (base, members)
+                members = []
+
+            base = directory_base
+            if base in pkgbases:
+                members += directory_members
+
+        if base is not None and members:
+            yield (base, members)
+
+    @classmethod
+    def take_pkgbase(
+        cls,
+        name: str,
+        pkgbases: Iterator[tuple[str, list[tuple[TarInfo, bytes | None]]]],
+        buffer: dict[str, list[tuple[TarInfo, bytes | None]]],
+        positions: dict[str, int],
+    ) -> list[tuple[TarInfo, bytes | None]] | None:
+        """Take the members of a pkgbase from the pkgbases read from an existing repository sync database.
+
+        As the pkgbases in a repository sync database are written in the order of the JSON files of the management
+        repository, pkgbases are read until the pkgbase is found, or until a pkgbase that is written after it is
+        encountered (in which case the pkgbase is not found in the existing repository sync database and has to be
+        read from its JSON file). Pkgbases that have been read, but not taken, are kept in buffer, so that they can be
+        taken later on.
+
+        Parameters
+        ----------
+        name: str
+            The name of the pkgbase
+        pkgbases: Iterator[tuple[str, list[tuple[TarInfo, bytes | None]]]]
+            An iterator over the names and members of pkgbases in an existing repository sync database (see
+            read_pkgbases())
+        buffer: dict[str, list[tuple[TarInfo, bytes | None]]]
+            A dict of the members of pkgbases (by name) that have been read but not taken yet
+        positions: dict[str, int]
+            A dict of the position of each pkgbase (by name) in the order in which pkgbases are written
+
+        Returns
+        -------
+        list[tuple[TarInfo, bytes | None]] | None
+            A list of tuples of TarInfo and optional data, representing the members of the package directories of the
+            pkgbase, or None if the pkgbase is not found
+        """
+        if name in buffer:
+            return buffer.pop(name)
+
+        for (base, members) in pkgbases:
+            if base == name:
+                return members
 
-        return list(packages.items())
+            buffer[base] = members
+            if positions[base] > positions[name]:
+                return None
 
-    async def stream_management_repo(self, path: Path) -> None:
+        return None
+
+    async def stream_management_repo(
+        self,
+        path: Path,
+        previous: Path | None = None,
+        pkgbases: list[str] | None = None,
+    ) -> None:
         """Stream descriptor files read from JSON files of a management repository to the repository sync database.
 
+        If the path to an existing repository sync database of the same type is provided in previous, the database is
+        written incrementally: The descriptor files of all pkgbases, which still exist in the management repository, are
+        not listed in pkgbases and whose JSON files have not been modified since previous has been written, are copied
+        from it and only the remaining pkgbases are read from their JSON files. Copied pkgbases are written in the same
+        order as the pkgbases read from JSON files. If previous has not been written with the same desc and files
+        versions, all pkgbases are read from their JSON files (see read_package_directories()).
+
+        NOTE: Compressed repository sync databases can only be read sequentially, so previous is read (and
+        decompressed) up to the last pkgbase that is copied from it.
+
+        NOTE: As the management repository is the single source of truth, previous must not be modified by other means
+        than writing it from the management repository.
+
         Parameters
         ----------
         path: Path
             The directory containing the files of the management repository
+        previous: Path | None
+            An optional path to an existing repository sync database from which to copy unchanged pkgbases
+            (defaults to None)
+        pkgbases: list[str] | None
+            An optional list of names of pkgbases which have been added, updated or removed and can not be copied from
+            previous (defaults to None)
         """
+        await SyncDatabase.stream_management_repo_to_databases(
+            path=path,
+            databases=[(self, previous)],
+            pkgbases=pkgbases,
+        )
+
+    @classmethod
+    async def stream_management_repo_to_databases(
+        cls,
+        path: Path,
+        databases: list[tuple[SyncDatabase, Path | None]],
+        pkgbases: list[str] | None = None,
+    ) -> None:
+        """Stream descriptor files read from JSON files of a management repository to several repository sync databases.
+
+        Each JSON file is only read once and its descriptor files are streamed to all repository sync databases (see
+        outputpackagebase_to_tarfiles()).
+        If the path to an existing repository sync database of the same type is provided alongside a database, it is
+        written incrementally (see stream_management_repo()).
+
+        Parameters
+        ----------
+        path: Path
+            The directory containing the files of the management repository
+        databases: list[tuple[SyncDatabase, Path | None]]
+            A list of tuples of a SyncDatabase to write to and an optional path to an existing repository sync database
+            of the same type, from which to copy unchanged pkgbases
+        pkgbases: list[str] | None
+            An optional list of names of pkgbases which have been added, updated or removed and can not be copied from
+            an existing repository sync database (defaults to None)
+
+        Raises
+        ------
+        RuntimeError
+            If the databases do not share the same desc and files versions
+        """
+        if len({(database.desc_version, database.files_version) for (database, _) in databases}) > 1:
+            raise RuntimeError("The sync databases to write to at once must use the same desc and files versions!")
+
         file_list = sorted(path.glob("*.json"))
         if not file_list:
             debug(f"There are no JSON files in {path}! Creating empty sync db.")
+        positions = {json_file.stem: position for position, json_file in enumerate(file_list)}
+        pax_headers = SyncDatabase.get_pax_headers(
+            packagedesc_version=databases[0][0].desc_version,
+            files_version=databases[0][0].files_version,
+        )
+
+        with ExitStack() as stack:
+            tarfiles: list[
+                tuple[
+                    TarFile,
+                    RepoDbTypeEnum | None,
+                    set[str],
+                    Iterator[tuple[str, list[tuple[TarInfo, bytes | None]]]] | None,
+                ]
+            ] = []
+            for (database, previous) in databases:
+                database_file = stack.enter_context(
+                    open_tarfile(
+                        database.database,
+                        compression=database.compression_type,
+                        mode="w",
+                        level=database.compression_level,
+                        workers=database.compression_workers,
+                    )
+                )
+                copyable: set[str] = set()
+                pkgbases_iterator = None
+                if previous:
+                    debug(f"Copying descriptor files of unchanged pkgbases from {previous} to {database.database}...")
+                    previous_mtime = previous.stat().st_mtime_ns
+                    copyable = {
+                        json_file.stem for json_file in file_list if json_file.stat().st_mtime_ns < previous_mtime
+                    } - set(pkgbases or [])
+                    pkgbases_iterator = stack.enter_context(
+                        closing(
+                            database.read_pkgbases(
+                                source=stack.enter_context(open_tarfile(path=previous)),
+                                pkgbases=copyable,
+                            )
+                        )
+                    )
+                tarfiles.append((database_file, database.database_type, copyable, pkgbases_iterator))
 
-        with open_tarfile(self.database, compression=self.compression_type, mode="w") as database_file:
+            buffers: list[dict[str, list[tuple[TarInfo, bytes | None]]]] = [{} for _ in tarfiles]
             for json_file in file_list:
-                await SyncDatabase.outputpackagebase_to_tarfile(
-                    tarfile=database_file,
-                    database_type=self.database_type,
+                targets = []
+                for (database_file, database_type, copyable, pkgbases_iterator), buffer in zip(tarfiles, buffers):
+                    members = (
+                        SyncDatabase.take_pkgbase(
+                            name=json_file.stem, pkgbases=pkgbases_iterator, buffer=buffer, positions=positions
+                        )
+                        if pkgbases_iterator and json_file.stem in copyable
+                        else None
+                    )
+                    if members is None:
+                        targets.append((database_file, database_type))
+                        continue
+
+                    for (member, data) in members:
+                        SyncDatabase.addfile(tarfile=database_file, tarinfo=member, data=data, pax_headers=pax_headers)
+
+                if not targets:
+                    continue
+
+                await SyncDatabase.outputpackagebase_to_tarfiles(
+                    tarfiles=targets,
                     model=await outputpackage.OutputPackageBase.from_file(path=json_file),
-                    packagedesc_version=self.desc_version,
-                    files_version=self.files_version,
+                    packagedesc_version=databases[0][0].desc_version,
+                    files_version=databases[0][0].files_version,
                 )
 
 
@@ -680,24 +1132,15 @@ class PackageDesc(BaseModel):
         RepoManagementFileNotFoundError
             If no matching template can be found
         """
-        # NOTE: We are not rendering HTML and need special characters, hence we are not affected by XSS problems and set
-        # autoescape=False
-        env = Environment(  # nosec: B701
-            autoescape=False,
-            loader=PackageLoader("repod", "templates"),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            enable_async=True,
-        )
         template_file = f"desc_v{self.get_schema_version()}.j2"
 
         debug(f"Rendering PackageDesc data using template file {template_file}...")
 
         try:
-            template = env.get_template(template_file)
+            template = get_template(name=template_file)
         except TemplateNotFound:
             raise RepoManagementFileNotFoundError(f"The 'desc' template file {template_file} could not be found!")
-        output.write(await template.render_async(self.dict()))
+        output.write(template.render(self.dict()))
 
     def get_output_package(self, files: Files | None) -> outputpackage.OutputPackage:
         """Transform the PackageDesc model and an optional Files model into an OutputPackage model.
@@ -1008,23 +1451,15 @@ class Files(BaseModel):
         RepoManagementFileNotFoundError
             If no matching template can be found
         """
-        # NOTE: We are not rendering HTML and need special characters, hence we are not affected by XSS problems and set
-        # autoescape=False
-        env = Environment(  # nosec: B701
-            loader=PackageLoader("repod", "templates"),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            enable_async=True,
-        )
         template_file = f"files_v{self.get_schema_version()}.j2"
 
         debug(f"Rendering Files data using template file {template_file}...")
 
         try:
-            template = env.get_template(template_file)
+            template = get_template(name=template_file)
         except TemplateNotFound:
             raise RepoManagementFileNotFoundError(f"The 'files' template file {template_file} could not be found!")
-        output.write(await template.render_async(self.dict()))
+        output.write(template.render(self.dict()))
 
     def get_schema_version(self) -> int:
         """Get the schema_version of the Files instance.
@@ -2,8 +2,11 @@ from copy import deepcopy
 from logging import DEBUG
 from pathlib import Path
 from shutil import rmtree
+from time import perf_counter
+from typing import Any
 from unittest.mock import patch
 
+from orjson import dumps
 from pydantic import AnyUrl
 from pydantic.tools import parse_obj_as
 from pytest import LogCaptureFixture, mark
@@ -211,6 +214,96 @@ def test_packagesneworupdatedcheck(
         assert check_() == return_value  # nosec: B101
 
 
+def test_packagesneworupdatedcheck_moved_package(
+    outputpackagebasev1: OutputPackageBase,
+    outputpackagebasev1_json_files_in_dir: Path,
+    caplog: LogCaptureFixture,
+) -> None:
+    caplog.set_level(DEBUG)
+
+    # the package bar moves from pkgbase foo to pkgbase beh, while foo now provides a package with a similar name
+    foo = deepcopy(outputpackagebasev1)
+    foo.version = "2:1.0.0-1"  # type: ignore[attr-defined]
+    foo.packages[1].name = "barbaz"  # type: ignore[attr-defined]
+    beh = deepcopy(outputpackagebasev1)
+    beh.base = "beh"  # type: ignore[attr-defined]
+    beh.version = "2:1.0.0-1"  # type: ignore[attr-defined]
+    beh.packages = [beh.packages[1]]  # type: ignore[attr-defined]
+
+    check_ = check.PackagesNewOrUpdatedCheck(
+        directory=outputpackagebasev1_json_files_in_dir,
+        new_pkgbases=[foo, beh],
+        current_pkgbases=[outputpackagebasev1],
+    )
+    assert check_() == ActionStateEnum.SUCCESS  # nosec: B101
+
+    check_ = check.PackagesNewOrUpdatedCheck(
+        directory=outputpackagebasev1_json_files_in_dir,
+        new_pkgbases=[outputpackagebasev1, beh],
+        current_pkgbases=[outputpackagebasev1],
+    )
+    assert check_() == ActionStateEnum.FAILED  # nosec: B101
+
+
+@mark.benchmark
+@mark.parametrize("transaction_size", [2000])
+def test_pkgbase_checks_benchmark(
+    transaction_size: int,
+    outputpackagebasev1: OutputPackageBase,
+    benchmark_result: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    rounds = 5
+    outputpackagebasev1.packages = outputpackagebasev1.packages[:1]  # type: ignore[attr-defined]
+    outputpackagebasev1.packages[0].files = None  # type: ignore[attr-defined]
+    management_dir = tmp_path / "management"
+    (management_dir / "pkgnames").mkdir(parents=True)
+
+    current_pkgbases: list[OutputPackageBase] = []
+    new_pkgbases: list[OutputPackageBase] = []
+    for number in range(transaction_size):
+        name = f"pkgbase{number}"
+        pkgbase = deepcopy(outputpackagebasev1)
+        pkgbase.base = name  # type: ignore[attr-defined]
+        pkgbase.packages[0].name = name  # type: ignore[attr-defined]
+        (management_dir / f"{name}.json").write_bytes(dumps(pkgbase.dict()))
+        (management_dir / "pkgnames" / f"{name}.json").symlink_to(Path("..") / f"{name}.json")
+        current_pkgbases.append(pkgbase)
+
+        new_pkgbase = deepcopy(pkgbase)
+        new_pkgbase.version = "2:1.0.0-1"  # type: ignore[attr-defined]
+        new_pkgbases.append(new_pkgbase)
+
+    start = perf_counter()
+    for _ in range(rounds):
+        version_check = check.PkgbasesVersionUpdateCheck(
+            new_pkgbases=new_pkgbases,
+            current_pkgbases=current_pkgbases,
+        )
+        assert version_check() == ActionStateEnum.SUCCESS  # nosec: B101
+    version_update = (perf_counter() - start) / rounds
+
+    start = perf_counter()
+    for _ in range(rounds):
+        packages_check = check.PackagesNewOrUpdatedCheck(
+            directory=management_dir,
+            new_pkgbases=new_pkgbases,
+            current_pkgbases=current_pkgbases,
+        )
+        assert packages_check() == ActionStateEnum.SUCCESS  # nosec: B101
+    new_or_updated = (perf_counter() - start) / rounds
+
+    benchmark_result.update(
+        transaction_size=transaction_size,
+        rounds=rounds,
+        seconds={"PkgbasesVersionUpdateCheck": version_update, "PackagesNewOrUpdatedCheck": new_or_updated},
+    )
+    print(
+        f"\nChecks of {transaction_size} pkgbases: {version_update * 1e3:.2f}ms (PkgbasesVersionUpdateCheck), "
+        f"{new_or_updated * 1e3:.2f}ms (PackagesNewOrUpdatedCheck)"
+    )
+
+
 @mark.parametrize(
     "require_validation, new_pkgbase_provides_url, current_pkgbase_provides_url, url_matches, return_value",
     [
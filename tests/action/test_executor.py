@@ -0,0 +1,166 @@
+"""Tests for repod.action.executor."""
+from __future__ import annotations
+
+from logging import DEBUG
+from threading import Barrier, Lock
+
+from pytest import LogCaptureFixture, mark, raises
+
+from repod.action import executor
+from repod.action.task import Task
+from repod.common.enums import ActionStateEnum
+from repod.errors import TaskError
+
+
+class RecordingTask(Task):
+    """A Task, that records the order in which Tasks are done and undone.
+
+    Attributes
+    ----------
+    name: str
+        The name of the Task
+    records: list[str]
+        A list shared by several RecordingTasks, to which the names of done (and undone) Tasks are appended
+    fail: bool
+        Whether do() fails
+    fail_undo: bool
+        Whether undo() fails
+    barrier: Barrier | None
+        An optional Barrier, that do() waits for
+    """
+
+    lock = Lock()
+
+    def __init__(
+        self,
+        name: str,
+        records: list[str],
+        dependencies: list[Task] | None = None,
+        fail: bool = False,
+        fail_undo: bool = False,
+        barrier: Barrier | None = None,
+    ):
+        self.name = name
+        self.records = records
+        self.dependencies = dependencies or []
+        self.fail = fail
+        self.fail_undo = fail_undo
+        self.barrier = barrier
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def do(self) -> ActionStateEnum:
+        if self.barrier:
+            self.barrier.wait()
+        with self.lock:
+            self.records.append(f"do {self.name}")
+        self.state = ActionStateEnum.FAILED_TASK if self.fail else ActionStateEnum.SUCCESS_TASK
+        return self.state
+
+    def undo(self) -> ActionStateEnum:
+        self.records.append(f"undo {self.name}")
+        self.state = ActionStateEnum.FAILED_UNDO_TASK if self.fail_undo else ActionStateEnum.NOT_STARTED
+        self.dependency_undo()
+        return self.state
+
+
+def test_taskexecutor() -> None:
+    """Tests for repod.action.executor.TaskExecutor."""
+    records: list[str] = []
+    shared = RecordingTask(name="shared", records=records)
+    foo = RecordingTask(name="foo", records=records, dependencies=[shared])
+    bar = RecordingTask(name="bar", records=records, dependencies=[shared, foo])
+    root = RecordingTask(name="root", records=records, dependencies=[foo, bar, shared])
+
+    task_executor = executor.TaskExecutor(task=root, workers=2)
+    assert task_executor.tasks == [shared, foo, bar, root]  # nosec: B101
+    dependents = {shared: [foo, bar, root], foo: [root, bar], bar: [root], root: []}
+    assert task_executor.dependents == dependents  # nosec: B101
+
+    foo.dependencies = [bar]
+    with raises(TaskError):
+        executor.TaskExecutor(task=root)
+
+
+def test_taskexecutor__call__(caplog: LogCaptureFixture) -> None:
+    """Tests for repod.action.executor.TaskExecutor.__call__."""
+    caplog.set_level(DEBUG)
+
+    records: list[str] = []
+    barrier = Barrier(parties=2, timeout=10)
+    shared = RecordingTask(name="shared", records=records)
+    foo = RecordingTask(name="foo", records=records, dependencies=[shared], barrier=barrier)
+    bar = RecordingTask(name="bar", records=records, dependencies=[shared], barrier=barrier)
+    root = RecordingTask(name="root", records=records, dependencies=[foo, bar, shared])
+
+    assert executor.TaskExecutor(task=root, workers=2)() == ActionStateEnum.SUCCESS  # nosec: B101
+    assert records[0] == "do shared"  # nosec: B101
+    assert sorted(records[1:3]) == ["do bar", "do foo"]  # nosec: B101
+    assert records[3] == "do root"  # nosec: B101
+    assert all(task.state == ActionStateEnum.SUCCESS for task in [shared, foo, bar, root])  # nosec: B101
+
+    assert executor.TaskExecutor(task=root)() == ActionStateEnum.SUCCESS  # nosec: B101
+    assert len(records) == 4  # nosec: B101
+
+
+@mark.parametrize("fail_dependency", [(True), (False)])
+def test_taskexecutor__call___failed(fail_dependency: bool, caplog: LogCaptureFixture) -> None:
+    """Tests for repod.action.executor.TaskExecutor.__call__ with failing Tasks."""
+    caplog.set_level(DEBUG)
+
+    records: list[str] = []
+    foo = RecordingTask(name="foo", records=records, fail=fail_dependency)
+    bar = RecordingTask(name="bar", records=records, dependencies=[foo])
+    baz = RecordingTask(name="baz", records=records, dependencies=[bar])
+    root = RecordingTask(name="root", records=records, dependencies=[baz], fail=not fail_dependency)
+
+    task_executor = executor.TaskExecutor(task=root, workers=1)
+    if fail_dependency:
+        assert task_executor() == ActionStateEnum.FAILED_DEPENDENCY  # nosec: B101
+        assert records == ["do foo"]  # nosec: B101
+        assert foo.state == ActionStateEnum.FAILED_TASK  # nosec: B101
+        assert bar.state == ActionStateEnum.FAILED_DEPENDENCY  # nosec: B101
+        assert baz.state == ActionStateEnum.FAILED_DEPENDENCY  # nosec: B101
+    else:
+        assert task_executor() == ActionStateEnum.FAILED_TASK  # nosec: B101
+        assert records == ["do foo", "do bar", "do baz", "do root"]  # nosec: B101
+
+
+def test_taskexecutor_get_ready_dependents() -> None:
+    """Tests for repod.action.executor.TaskExecutor.get_ready_dependents."""
+    records: list[str] = []
+    foo = RecordingTask(name="foo", records=records)
+    bar = RecordingTask(name="bar", records=records)
+    baz = RecordingTask(name="baz", records=records, dependencies=[foo])
+    root = RecordingTask(name="root", records=records, dependencies=[foo, bar, baz])
+
+    task_executor = executor.TaskExecutor(task=root)
+    remaining = {task: len(task.dependencies) for task in task_executor.tasks}
+    assert task_executor.get_ready_dependents(task=foo, remaining=remaining) == [baz]  # nosec: B101
+    assert task_executor.get_ready_dependents(task=bar, remaining=remaining) == []  # nosec: B101
+    assert task_executor.get_ready_dependents(task=baz, remaining=remaining) == [root]  # nosec: B101
+    assert remaining == {foo: 0, bar: 0, baz: 0, root: 0}  # nosec: B101
+
+
+@mark.parametrize("fail_undo", [(True), (False)])
+def test_taskexecutor_undo(fail_undo: bool, caplog: LogCaptureFixture) -> None:
+    """Tests for repod.action.executor.TaskExecutor.undo."""
+    caplog.set_level(DEBUG)
+
+    records: list[str] = []
+    shared = RecordingTask(name="shared", records=records, fail_undo=fail_undo)
+    foo = RecordingTask(name="foo", records=records, dependencies=[shared])
+    bar = RecordingTask(name="bar", records=records, dependencies=[shared, foo])
+    root = RecordingTask(name="root", records=records, dependencies=[foo, bar])
+
+    task_executor = executor.TaskExecutor(task=root)
+    task_executor()
+    records.clear()
+
+    if fail_undo:
+        assert task_executor.undo() == ActionStateEnum.FAILED_UNDO_DEPENDENCY  # nosec: B101
+    else:
+        assert task_executor.undo() == ActionStateEnum.NOT_STARTED  # nosec: B101
+    assert records == ["undo root", "undo bar", "undo foo", "undo shared"]  # nosec: B101
+    assert all(task.undo_dependencies for task in [shared, foo, bar, root])  # nosec: B101
@@ -1,10 +1,11 @@
 """Tests for repod.action.task."""
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import nullcontext as does_not_raise
 from copy import deepcopy
 from logging import DEBUG
 from pathlib import Path
 from typing import ContextManager
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from orjson import JSONEncodeError
 from pydantic import ValidationError
@@ -12,10 +13,12 @@ from pytest import LogCaptureFixture, mark, raises
 
 from repod.action import task
 from repod.action.check import PacmanKeyPackagesSignatureVerificationCheck
+from repod.archive.index import ArchiveIndex
 from repod.common.enums import (
     ActionStateEnum,
     ArchitectureEnum,
     CompressionTypeEnum,
+    FilePlacementEnum,
     FilesVersionEnum,
     PackageDescVersionEnum,
     PkgVerificationTypeEnum,
@@ -25,7 +28,100 @@ from repod.common.enums import (
 from repod.config import PackageRepo, UserSettings
 from repod.config.defaults import DEFAULT_ARCHITECTURE, DEFAULT_NAME
 from repod.errors import RepoManagementFileError, TaskError
-from repod.repo.management import OutputPackageBase
+from repod.files import Package
+from repod.repo.management import (
+    ManagementRepoCatalog,
+    ManagementRepoIndex,
+    OutputPackageBase,
+)
+
+
+@mark.parametrize("with_signature", [(True), (False)])
+def test_read_package_from_file(with_signature: bool, default_package_file: tuple[Path, ...]) -> None:
+    """Tests for repod.action.task.read_package_from_file."""
+    package_paths = list(default_package_file) if with_signature else [default_package_file[0]]
+    package = task.read_package_from_file(package_paths=package_paths)
+    assert isinstance(package, Package)  # nosec: B101
+    assert (package.pgpsig is not None) is with_signature  # type: ignore[attr-defined]  # nosec: B101
+
+
+@mark.parametrize(
+    "workers, add_invalid_file, expectation",
+    [
+        (1, False, does_not_raise()),
+        (1, True, raises(RepoManagementFileError)),
+        (2, False, does_not_raise()),
+        (2, True, raises(RepoManagementFileError)),
+        (None, False, does_not_raise()),
+    ],
+)
+def test_read_packages_from_files(
+    workers: int | None,
+    add_invalid_file: bool,
+    expectation: ContextManager[str],
+    default_package_file: tuple[Path, ...],
+    default_sync_db_file: tuple[Path, Path],
+    caplog: LogCaptureFixture,
+) -> None:
+    """Tests for repod.action.task.read_packages_from_files."""
+    caplog.set_level(DEBUG)
+
+    package_paths = [[default_package_file[0]], list(default_package_file), [default_package_file[0]]]
+    if add_invalid_file:
+        package_paths.insert(1, [default_sync_db_file[0]])
+
+    with expectation as error:
+        packages = task.read_packages_from_files(package_paths=package_paths, workers=workers)
+        assert len(packages) == len(package_paths)  # nosec: B101
+        assert [package.pgpsig is not None for package in packages] == [  # type: ignore[attr-defined]  # nosec: B101
+            False,
+            True,
+            False,
+        ]
+
+    if add_invalid_file:
+        assert str(default_sync_db_file[0]) in str(error.value)  # type: ignore[attr-defined]  # nosec: B101
+
+
+@mark.parametrize("workers", [1, 2])
+def test_read_packages_from_files_unexpected_error(workers: int, default_package_file: tuple[Path, ...]) -> None:
+    """Tests for repod.action.task.read_packages_from_files with errors other than RepoManagementFileError."""
+    package_paths = [[default_package_file[0]], [default_package_file[0].parent / "foo.pkg.tar.zst"]]
+
+    if workers == 1:
+        context = patch(
+            "repod.action.task.read_package_from_file",
+            side_effect=[Mock(spec=task.Package), ValueError("ERROR")],
+        )
+    else:
+        executor = MagicMock()
+        executor.__enter__.return_value.submit.side_effect = [
+            Mock(result=Mock(return_value=Mock(spec=task.Package))),
+            Mock(result=Mock(side_effect=BrokenProcessPool("ERROR"))),
+        ]
+        context = patch("repod.action.task.ProcessPoolExecutor", return_value=executor)
+
+    with context as context_mock:
+        with raises(RepoManagementFileError) as error:
+            task.read_packages_from_files(package_paths=package_paths, workers=workers)
+
+    if workers != 1:
+        assert context_mock.call_args.kwargs["mp_context"].get_start_method() == "forkserver"  # nosec: B101
+    assert "1 of 2 package files" in str(error.value)  # nosec: B101
+    assert f"{package_paths[1][0]}: ERROR" in str(error.value)  # nosec: B101
+
+
+def test_get_build_requirements(default_installed: list[str], outputpackagebasev1: OutputPackageBase) -> None:
+    """Tests for repod.action.task.get_build_requirements."""
+    other_pkgbase = deepcopy(outputpackagebasev1)
+    other_pkgbase.buildinfo.installed = default_installed + ["build_baz-1.0.0-1-any"]  # type: ignore[attr-defined]
+
+    requirements = task.get_build_requirements(pkgbases=[outputpackagebasev1, other_pkgbase])
+    assert list(requirements) == sorted(default_installed + ["build_baz-1.0.0-1-any"])  # nosec: B101
+    for requirement, (pkgname, pkgver, architecture) in requirements.items():
+        assert requirement == f"{pkgname.pkgname}-{pkgver.pkgver}-{architecture.value}"  # nosec: B101
+
+    assert task.get_build_requirements(pkgbases=[]) == {}  # nosec: B101
 
 
 @mark.parametrize(
@@ -81,6 +177,54 @@ def test_read_build_requirements_from_archive_dir(
         assert return_value == pkgs_in_archive  # nosec: B101
 
 
+@mark.parametrize(
+    "index_exists, index_raises, expectation",
+    [
+        (True, False, does_not_raise()),
+        (True, True, raises(TaskError)),
+        (False, False, does_not_raise()),
+    ],
+)
+def test_read_build_requirements_from_archive_dir_archive_index(
+    index_exists: bool,
+    index_raises: bool,
+    expectation: ContextManager[str],
+    default_installed: list[str],
+    outputpackagebasev1: OutputPackageBase,
+    tmp_path: Path,
+    caplog: LogCaptureFixture,
+) -> None:
+    """Tests for repod.action.task.read_build_requirements_from_archive_dir with an ArchiveIndex."""
+    caplog.set_level(DEBUG)
+
+    archive_dir = tmp_path / "archive"
+    for dep in default_installed[1:]:
+        dep_dir = archive_dir / dep[0] / "-".join(dep.split("-")[0:-3])
+        dep_dir.mkdir(parents=True, exist_ok=True)
+        (dep_dir / f"{dep}.pkg.tar.zst").touch()
+
+    archive_index = ArchiveIndex(path=tmp_path / "index.sqlite", archive_dir=archive_dir)
+    if index_exists:
+        archive_index.rebuild()
+        # NOTE: files only present in the index are found, as the archive directory is not scanned
+        archive_index.add_files(paths=[archive_dir / f"{default_installed[0]}.pkg.tar.zst"])
+
+    if index_raises:
+        archive_index.get_requirements = Mock(side_effect=RepoManagementFileError("ERROR"))  # type: ignore[assignment]
+
+    pkgs_in_archive: set[str] = set()
+    with expectation:
+        task.read_build_requirements_from_archive_dir(
+            pkgbases=[outputpackagebasev1],
+            archive_dir=archive_dir,
+            pkgs_in_archive=pkgs_in_archive,
+            archive_index=archive_index,
+        )
+        assert pkgs_in_archive == (  # nosec: B101
+            set(default_installed) if index_exists else set(default_installed[1:])
+        )
+
+
 @mark.parametrize(
     "dep_exists, dep_in_input_list, dep_search_mismatch, from_file_raises, expectation",
     [
@@ -153,6 +297,37 @@ def test_read_build_requirements_from_management_repo_dirs(
             assert return_value == pkgs_in_repo  # nosec: B101
 
 
+def test_read_build_requirements_from_management_repo_dirs_memoized(
+    outputpackagebasev1: OutputPackageBase,
+    outputpackagebasev1_json_files_in_dir: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.action.task.read_build_requirements_from_management_repo_dirs with several pkgbases."""
+    management_dirs = [tmp_path / "empty_management", outputpackagebasev1_json_files_in_dir]
+    installed = [
+        f"{pkg.name}-{outputpackagebasev1.version}-{pkg.arch}"  # type: ignore[attr-defined]
+        for pkg in outputpackagebasev1.packages  # type: ignore[attr-defined]
+    ]
+    pkgbases = []
+    for name in ["baz", "beh", "bou"]:
+        pkgbase = deepcopy(outputpackagebasev1)
+        pkgbase.base = name  # type: ignore[attr-defined]
+        pkgbase.buildinfo.installed = installed  # type: ignore[attr-defined]
+        pkgbases.append(pkgbase)
+
+    index = ManagementRepoIndex()
+    pkgs_in_repo: set[str] = set()
+    with patch.object(index, "get_package_version", wraps=index.get_package_version) as get_package_version_mock:
+        task.read_build_requirements_from_management_repo_dirs(
+            pkgbases=pkgbases,
+            management_directories=management_dirs,
+            pkgs_in_repo=pkgs_in_repo,
+            index=index,
+        )
+    assert pkgs_in_repo == set(installed)  # nosec: B101
+    assert get_package_version_mock.call_count == len(installed) * len(management_dirs)  # nosec: B101
+
+
 @mark.parametrize(
     "add_above, above_exists, add_below, below_exists",
     [
@@ -695,7 +870,7 @@ def test_movetmpfilestask(
 @mark.parametrize(
     (
         "add_paths, add_dependencies, pkgbases_dep, syncdb_dep, dependency_state, dependency_absolute, "
-        "destination_exists, copy2_raises, rename_raises, return_value"
+        "destination_exists, place_file_raises, rename_raises, return_value"
     ),
     [
         (True, False, False, False, None, True, True, False, False, ActionStateEnum.SUCCESS_TASK),
@@ -764,7 +939,7 @@ def test_movetmpfilestask_do(
     dependency_state: ActionStateEnum | None,
     dependency_absolute: bool,
     destination_exists: bool,
-    copy2_raises: bool,
+    place_file_raises: bool,
     rename_raises: bool,
     return_value: ActionStateEnum,
     caplog: LogCaptureFixture,
@@ -828,7 +1003,7 @@ def test_movetmpfilestask_do(
         dependencies=dependencies if add_dependencies else None,  # type: ignore[arg-type]
     )
 
-    match (destination_exists, copy2_raises, rename_raises):
+    match (destination_exists, place_file_raises, rename_raises):
         case (True, False, False):
             assert task_.do() == return_value  # nosec: B101
             assert not task_.paths[0].source.exists()  # nosec: B101
@@ -836,7 +1011,7 @@ def test_movetmpfilestask_do(
             assert task_.paths[0].destination_backup.exists()  # nosec: B101
             assert task_.paths[0].backup_done  # nosec: B101
         case (True, True, False):
-            with patch("repod.action.task.copy2", side_effect=Exception("ERROR")):
+            with patch("repod.action.task.place_file", side_effect=Exception("ERROR")):
                 assert task_.do() == return_value  # nosec: B101
             assert task_.paths[0].source.exists()  # nosec: B101
             assert task_.paths[0].destination.exists()  # nosec: B101
@@ -857,7 +1032,7 @@ def test_movetmpfilestask_do(
                 assert not task_.paths[0].destination_backup.exists()  # nosec: B101
                 assert not task_.paths[0].backup_done  # nosec: B101
         case (False, True, False):
-            with patch("repod.action.task.copy2", side_effect=Exception("ERROR")):
+            with patch("repod.action.task.place_file", side_effect=Exception("ERROR")):
                 assert task_.do() == return_value  # nosec: B101
             assert not task_.paths[0].source.exists()  # nosec: B101
             assert task_.paths[0].destination.exists()  # nosec: B101
@@ -874,7 +1049,7 @@ def test_movetmpfilestask_do(
 
 
 @mark.parametrize(
-    "do, destination_exists, copy2_raises, rename_raises, remove_backup, return_value",
+    "do, destination_exists, place_file_raises, rename_raises, remove_backup, return_value",
     [
         (False, False, False, False, False, ActionStateEnum.NOT_STARTED),
         (True, True, False, False, False, ActionStateEnum.NOT_STARTED),
@@ -888,7 +1063,7 @@ def test_movetmpfilestask_do(
 def test_movetmpfilestask_undo(
     do: bool,
     destination_exists: bool,
-    copy2_raises: bool,
+    place_file_raises: bool,
     rename_raises: bool,
     remove_backup: bool,
     return_value: ActionStateEnum,
@@ -907,8 +1082,8 @@ def test_movetmpfilestask_undo(
     task_ = task.MoveTmpFilesTask(paths=[[source, destination]])
 
     if do:
-        if copy2_raises:
-            with patch("repod.action.task.copy2", side_effect=Exception("ERROR")):
+        if place_file_raises:
+            with patch("repod.action.task.place_file", side_effect=Exception("ERROR")):
                 task_.do()
         elif rename_raises:
             with patch("repod.action.task.Path.rename", side_effect=Exception("ERROR")):
@@ -922,6 +1097,81 @@ def test_movetmpfilestask_undo(
     assert task_.undo() == return_value  # nosec: B101
 
 
+@mark.parametrize("file_placement", [FilePlacementEnum.COPY, FilePlacementEnum.HARDLINK])
+def test_movetmpfilestask_file_placement(file_placement: FilePlacementEnum, tmp_path: Path) -> None:
+    """Tests for repod.action.task.MoveTmpFilesTask with a FilePlacementEnum."""
+    source = tmp_path / "foo.tmp"
+    source.write_text("new")
+    destination = tmp_path / "foo"
+    destination.write_text("old")
+
+    task_ = task.MoveTmpFilesTask(paths=[[source, destination]], file_placement=file_placement)
+    assert task_.do() == ActionStateEnum.SUCCESS_TASK  # nosec: B101
+    assert destination.read_text() == "new"  # nosec: B101
+    assert task_.paths[0].destination_backup.read_text() == "old"  # nosec: B101
+
+    assert task_.undo() == ActionStateEnum.NOT_STARTED  # nosec: B101
+    assert destination.read_text() == "old"  # nosec: B101
+
+
+@mark.parametrize("rename_raises, commit_raises", [(False, False), (True, False), (False, True)])
+def test_movetmpfilestask_catalog(
+    rename_raises: bool,
+    commit_raises: bool,
+    outputpackagebasev1: OutputPackageBase,
+    caplog: LogCaptureFixture,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.action.task.MoveTmpFilesTask with a ManagementRepoCatalog."""
+    caplog.set_level(DEBUG)
+
+    directory = tmp_path / "management"
+    directory.mkdir()
+    source = directory / "foo.json.tmp"
+    source.touch()
+    catalog = ManagementRepoCatalog(path=tmp_path / "catalog.sqlite")
+
+    task_ = task.MoveTmpFilesTask(
+        catalog=catalog,
+        dependencies=[
+            Mock(
+                spec=task.WriteOutputPackageBasesToTmpFileInDirTask,
+                state=ActionStateEnum.SUCCESS,
+                filenames=[source],
+                directory=directory,
+                pkgbases=[outputpackagebasev1],
+                undo=Mock(return_value=ActionStateEnum.NOT_STARTED),
+            )
+        ],
+    )
+
+    if rename_raises:
+        with patch("repod.action.task.Path.rename", side_effect=Exception("ERROR")):
+            assert task_.do() == ActionStateEnum.FAILED_TASK  # nosec: B101
+        assert catalog.find_pkgbase(name="foo") == []  # nosec: B101
+        assert not task_.catalog_updated  # nosec: B101
+        return
+
+    if commit_raises:
+        with patch(
+            "repod.repo.management.catalog.ManagementRepoCatalog.transaction",
+            side_effect=RepoManagementFileError("ERROR"),
+        ):
+            assert task_.do() == ActionStateEnum.FAILED_TASK  # nosec: B101
+        assert source.exists()  # nosec: B101
+        return
+
+    assert task_.do() == ActionStateEnum.SUCCESS_TASK  # nosec: B101
+    assert (directory / "foo.json").exists()  # nosec: B101
+    assert task_.catalog_updated  # nosec: B101
+    assert [entry.directory for entry in catalog.find_pkgbase(name="foo")] == [directory]  # nosec: B101
+
+    assert task_.undo() == ActionStateEnum.NOT_STARTED  # nosec: B101
+    assert not (directory / "foo.json").exists()  # nosec: B101
+    assert not task_.catalog_updated  # nosec: B101
+    assert catalog.find_pkgbase(name="foo") == []  # nosec: B101
+
+
 @mark.parametrize(
     "file_type, add_dependencies",
     [
@@ -1206,6 +1456,70 @@ def test_writesyncdbstotmpfilesindirtask_do(
         assert task_.files_syncdb_path.exists()  # nosec: B101
 
 
+@mark.parametrize(
+    "dependency_state, current_exists, current_corrupt, return_value",
+    [
+        (ActionStateEnum.SUCCESS, True, False, ActionStateEnum.SUCCESS_TASK),
+        (ActionStateEnum.SUCCESS, False, False, ActionStateEnum.SUCCESS_TASK),
+        (ActionStateEnum.SUCCESS, True, True, ActionStateEnum.FAILED_TASK),
+        (ActionStateEnum.FAILED, True, False, ActionStateEnum.FAILED_DEPENDENCY),
+    ],
+)
+def test_writesyncdbstotmpfilesindirtask_do_incremental(
+    dependency_state: ActionStateEnum,
+    current_exists: bool,
+    current_corrupt: bool,
+    return_value: ActionStateEnum,
+    outputpackagebasev1: OutputPackageBase,
+    outputpackagebasev1_json_files_in_dir: Path,
+    tmp_path: Path,
+    caplog: LogCaptureFixture,
+) -> None:
+    """Tests for repod.action.task.WriteSyncDbsToTmpFilesInDirTask.do in incremental mode."""
+    caplog.set_level(DEBUG)
+
+    package_repo_dir = tmp_path / "repo" / "package"
+    package_repo_dir.mkdir(parents=True)
+    if current_exists:
+        full_task = task.WriteSyncDbsToTmpFilesInDirTask(
+            compression=CompressionTypeEnum.NONE,
+            desc_version=PackageDescVersionEnum.DEFAULT,
+            files_version=FilesVersionEnum.DEFAULT,
+            management_repo_dir=outputpackagebasev1_json_files_in_dir,
+            package_repo_dir=package_repo_dir,
+        )
+        assert full_task.do() == ActionStateEnum.SUCCESS_TASK  # nosec: B101
+        full_task.default_syncdb_path.rename(full_task.default_syncdb_current_path)
+        full_task.files_syncdb_path.rename(full_task.files_syncdb_current_path)
+        full_task.default_syncdb_symlink_path.unlink()
+        full_task.files_syncdb_symlink_path.unlink()
+        if current_corrupt:
+            full_task.default_syncdb_current_path.write_bytes(b"foo")
+
+    task_ = task.WriteSyncDbsToTmpFilesInDirTask(
+        compression=CompressionTypeEnum.NONE,
+        desc_version=PackageDescVersionEnum.DEFAULT,
+        files_version=FilesVersionEnum.DEFAULT,
+        management_repo_dir=outputpackagebasev1_json_files_in_dir,
+        package_repo_dir=package_repo_dir,
+        incremental=True,
+        dependencies=[
+            Mock(),
+            Mock(
+                spec=task.CreateOutputPackageBasesTask,
+                state=dependency_state,
+                pkgbases=[outputpackagebasev1],
+            ),
+        ],
+    )
+
+    assert task_.do() == return_value  # nosec: B101
+    if return_value == ActionStateEnum.SUCCESS_TASK:
+        assert task_.default_syncdb_path.exists()  # nosec: B101
+        assert task_.files_syncdb_path.exists()  # nosec: B101
+        assert ("Only writing changed pkgbases ['foo']" in caplog.text) is True  # nosec: B101
+
+
 @mark.parametrize(
     "add_dependencies, return_value, do, target_is_dir",
     [
@@ -1509,6 +1823,8 @@ def test_consolidateoutputpackagebasestask_do(
     else:
         assert task_.do() == return_value  # nosec: B101
 
+    assert task.Task.post_checks == []  # nosec: B101
+
 
 @mark.parametrize(
     "dep_undo_success, add_dependencies, add_pkgbases, do, return_value",
@@ -2048,6 +2364,145 @@ def test_addtoarchivetask_undo(
         assert not task_.files  # nosec: B101
 
 
+@mark.parametrize("index_exists, index_raises", [(True, False), (True, True), (False, False)])
+def test_addtoarchivetask_archive_index(
+    index_exists: bool,
+    index_raises: bool,
+    tmp_path: Path,
+    default_package_file: tuple[Path, ...],
+    caplog: LogCaptureFixture,
+) -> None:
+    """Tests for repod.action.task.AddToArchiveTask with an ArchiveIndex."""
+    caplog.set_level(DEBUG)
+
+    archive_dir = tmp_path / "archive"
+    archive_index = ArchiveIndex(path=tmp_path / "index.sqlite", archive_dir=archive_dir)
+    if index_exists:
+        archive_index.rebuild()
+    requirement = default_package_file[0].name.split(".pkg.tar")[0]
+
+    task_ = task.AddToArchiveTask(
+        archive_dir=archive_dir,
+        filenames=list(default_package_file),
+        archive_index=archive_index,
+    )
+    if index_raises:
+        with patch("repod.archive.index.ArchiveIndex.transaction", side_effect=RepoManagementFileError("ERROR")):
+            assert task_.do() == ActionStateEnum.FAILED_TASK  # nosec: B101
+            assert task_.undo() == ActionStateEnum.NOT_STARTED  # nosec: B101
+        return
+
+    assert task_.do() == ActionStateEnum.SUCCESS_TASK  # nosec: B101
+    assert archive_index.exists() == index_exists  # nosec: B101
+    if index_exists:
+        assert archive_index.get_requirements(requirements=[requirement]) == {requirement}  # nosec: B101
+
+    assert task_.undo() == ActionStateEnum.NOT_STARTED  # nosec: B101
+    if index_exists:
+        assert archive_index.get_requirements(requirements=[requirement]) == set()  # nosec: B101
+
+
+@mark.parametrize("file_placement", [FilePlacementEnum.COPY, FilePlacementEnum.HARDLINK])
+def test_addtoarchivetask_file_placement(
+    file_placement: FilePlacementEnum,
+    tmp_path: Path,
+    default_package_file: tuple[Path, ...],
+) -> None:
+    """Tests for repod.action.task.AddToArchiveTask with a FilePlacementEnum."""
+    task_ = task.AddToArchiveTask(
+        archive_dir=tmp_path / "archive",
+        filenames=list(default_package_file),
+        file_placement=file_placement,
+    )
+    assert task_.do() == ActionStateEnum.SUCCESS_TASK  # nosec: B101
+    for cp_source_destination in task_.files:
+        assert cp_source_destination.destination.samefile(cp_source_destination.source) == (  # nosec: B101
+            file_placement == FilePlacementEnum.HARDLINK
+        )
+
+
+def test_addtoarchivetask_objects_dir(
+    tmp_path: Path,
+    default_package_file: tuple[Path, ...],
+) -> None:
+    """Tests for repod.action.task.AddToArchiveTask with a content-addressed object directory."""
+    objects_dir = tmp_path / "objects"
+    tasks = [
+        task.AddToArchiveTask(
+            archive_dir=tmp_path / name, filenames=list(default_package_file), objects_dir=objects_dir
+        )
+        for name in ["first", "second"]
+    ]
+    for task_ in tasks:
+        assert task_.do() == ActionStateEnum.SUCCESS_TASK  # nosec: B101
+        for cp_source_destination in task_.files:
+            assert cp_source_destination.destination.is_symlink()  # nosec: B101
+            assert cp_source_destination.destination.read_bytes() == (  # nosec: B101
+                cp_source_destination.source.read_bytes()
+            )
+
+    assert len(tasks[0].objects) == len(default_package_file)  # nosec: B101
+    assert tasks[1].objects == []  # nosec: B101
+    assert len(list(objects_dir.glob("*/*"))) == len(default_package_file)  # nosec: B101
+
+    assert tasks[1].undo() == ActionStateEnum.NOT_STARTED  # nosec: B101
+    assert len(list(objects_dir.glob("*/*"))) == len(default_package_file)  # nosec: B101
+    assert tasks[0].undo() == ActionStateEnum.NOT_STARTED  # nosec: B101
+    assert list(objects_dir.glob("*/*")) == []  # nosec: B101
+
+
+def test_addtoarchivetask_objects_dir_sha256sums(
+    tmp_path: Path,
+    default_package_file: tuple[Path, ...],
+) -> None:
+    """Tests for repod.action.task.AddToArchiveTask using the SHA-256 checksums of a CreateOutputPackageBasesTask."""
+    objects_dir = tmp_path / "objects"
+    sha256sum = "a" * 64
+    task_ = task.AddToArchiveTask(
+        archive_dir=tmp_path / "archive",
+        dependencies=[
+            Mock(
+                spec=task.FilesToRepoDirTask,
+                state=ActionStateEnum.SUCCESS,
+                files=[default_package_file[0]],
+                dependencies=[
+                    Mock(
+                        spec=task.CreateOutputPackageBasesTask,
+                        pkgbases=[
+                            Mock(packages=[Mock(filename=default_package_file[0].name, sha256sum=sha256sum)]),
+                        ],
+                    ),
+                ],
+            ),
+        ],
+        objects_dir=objects_dir,
+    )
+    assert task_.do() == ActionStateEnum.SUCCESS_TASK  # nosec: B101
+    assert task_.objects == [objects_dir / "aa" / sha256sum]  # nosec: B101
+    assert task_.files[0].destination.resolve() == objects_dir / "aa" / sha256sum  # nosec: B101
+
+
+@mark.parametrize("with_objects_dir", [(True), (False)])
+def test_addtoarchivetask_get_sha256sums(with_objects_dir: bool, tmp_path: Path) -> None:
+    """Tests for repod.action.task.AddToArchiveTask.get_sha256sums."""
+    dependency = Mock(
+        spec=task.FilesToRepoDirTask,
+        dependencies=[
+            Mock(
+                spec=task.CreateOutputPackageBasesTask,
+                pkgbases=[Mock(packages=[Mock(filename="foo", sha256sum="a" * 64)])],
+            ),
+            Mock(spec=task.Task),
+        ],
+    )
+    task_ = task.AddToArchiveTask(
+        archive_dir=tmp_path / "archive",
+        dependencies=[dependency],
+        objects_dir=tmp_path / "objects" if with_objects_dir else None,
+    )
+    assert task_.get_sha256sums(dependency=dependency) == ({"foo": "a" * 64} if with_objects_dir else {})  # nosec: B101
+
+
 @mark.parametrize(
     (
         "add_archive_dir, add_management_dirs, management_dirs_exist, "
@@ -0,0 +1,69 @@
+"""Tests for repod.action.trace."""
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from orjson import loads
+from pytest import raises
+
+from repod.action import trace
+from repod.action.task import AddToRepoTask
+from repod.common.enums import ActionStateEnum
+
+
+def test_read_thread_io(tmp_path: Path) -> None:
+    """Tests for repod.action.trace.read_thread_io."""
+    if trace.THREAD_IO_PATH.exists():
+        io_start = trace.read_thread_io()
+        (tmp_path / "foo").write_bytes(b"foo" * 1024)
+        io_end = trace.read_thread_io()
+        assert io_start and io_end and io_end[1] - io_start[1] >= 3072  # nosec: B101
+
+    with patch("repod.action.trace.THREAD_IO_PATH", tmp_path / "does_not_exist"):
+        assert trace.read_thread_io() is None  # nosec: B101
+    (tmp_path / "io").write_text("rchar: 1\nwchar: foo\n")
+    with patch("repod.action.trace.THREAD_IO_PATH", tmp_path / "io"):
+        assert trace.read_thread_io() is None  # nosec: B101
+
+
+def test_tracer(tmp_path: Path) -> None:
+    """Tests for repod.action.trace.Tracer."""
+    tracer = trace.Tracer()
+    action = Mock(state=ActionStateEnum.SUCCESS, item_count=Mock(return_value=2))
+
+    with tracer.trace(action=action, category="task"):
+        pass
+    with raises(RuntimeError):
+        with tracer.trace(
+            action=Mock(state=ActionStateEnum.FAILED, item_count=Mock(return_value=None)), category="check"
+        ):
+            raise RuntimeError("ERROR")
+
+    assert [(event.category, event.state, event.items) for event in tracer.events] == [  # nosec: B101
+        ("task", "SUCCESS", 2),
+        ("check", "FAILED", None),
+    ]
+
+    tracer.write(path=tmp_path / "trace.json")
+    trace_events = loads((tmp_path / "trace.json").read_bytes())["traceEvents"]
+    assert [event["cat"] for event in trace_events] == ["task", "check"]  # nosec: B101
+    assert trace_events[0]["ph"] == "X"  # nosec: B101
+    assert trace_events[0]["args"]["items"] == 2  # nosec: B101
+
+
+def test_trace() -> None:
+    """Tests for repod.action.trace.trace."""
+    task = AddToRepoTask(dependencies=[])
+    task.run()
+    assert trace.get_tracer() is None  # nosec: B101
+
+    tracer = trace.Tracer()
+    trace.set_tracer(tracer)
+    try:
+        task = AddToRepoTask(dependencies=[])
+        task.post_checks = [Mock(run=Mock(return_value=ActionStateEnum.SUCCESS))]
+        assert task.run() == ActionStateEnum.SUCCESS  # nosec: B101
+        assert task.run() == ActionStateEnum.SUCCESS  # nosec: B101
+    finally:
+        trace.set_tracer(None)
+
+    assert [(event.name, event.state) for event in tracer.events] == [("AddToRepoTask", "SUCCESS")]  # nosec: B101
@@ -1,12 +1,18 @@
 """Tests for repod.action.workflow."""
 from logging import DEBUG
+from pathlib import Path
+from time import perf_counter
+from typing import Any
 from unittest.mock import Mock, patch
 
 from pytest import LogCaptureFixture, mark
 
 from repod.action import workflow
-from repod.common.enums import ActionStateEnum
-from repod.config.settings import UserSettings
+from repod.action.task import Task
+from repod.common.enums import ActionStateEnum, CompressionTypeEnum, RepoTypeEnum
+from repod.config.settings import ArchiveSettings, UserSettings
+from repod.errors import RepoManagementFileError
+from tests.conftest import create_synthetic_package
 
 
 @patch("repod.action.workflow.exit")
@@ -17,6 +23,119 @@ def test_exit_on_error(exit_mock: Mock) -> None:
     exit_mock.assert_called_once_with(1)
 
 
+@mark.parametrize("with_catalog", [(True), (False)])
+def test_get_management_repo_catalog(with_catalog: bool, usersettings: UserSettings, tmp_path: Path) -> None:
+    """Tests for repod.action.workflow.get_management_repo_catalog."""
+    repo_name = usersettings.repositories[0].name
+    repo_architecture = usersettings.repositories[0].architecture
+    management_repo = usersettings.get_repo_management_repo(name=repo_name, architecture=repo_architecture)
+    if with_catalog:
+        management_repo.catalog = tmp_path / "catalog.sqlite"
+
+    catalog = workflow.get_management_repo_catalog(
+        settings=usersettings,
+        repo_name=repo_name,
+        repo_architecture=repo_architecture,
+    )
+    if with_catalog:
+        assert catalog and catalog.path == tmp_path / "catalog.sqlite"  # nosec: B101
+        assert catalog.repo_types == usersettings.get_management_repo_types(  # nosec: B101
+            management_repo=management_repo
+        )
+    else:
+        assert catalog is None  # nosec: B101
+
+
+@mark.parametrize("with_catalog, rebuild_raises", [(True, False), (True, True), (False, False)])
+@patch("repod.action.workflow.exit_on_error")
+@patch("repod.action.workflow.get_management_repo_catalog")
+def test_rebuild_management_repo_catalog(
+    get_management_repo_catalog_mock: Mock,
+    exit_on_error_mock: Mock,
+    with_catalog: bool,
+    rebuild_raises: bool,
+    usersettings: UserSettings,
+    caplog: LogCaptureFixture,
+) -> None:
+    """Tests for repod.action.workflow.rebuild_management_repo_catalog."""
+    caplog.set_level(DEBUG)
+    catalog_mock = Mock(repo_types={Path("foo"): RepoTypeEnum.STABLE})
+    if rebuild_raises:
+        catalog_mock.rebuild.side_effect = RepoManagementFileError("ERROR")
+    get_management_repo_catalog_mock.return_value = catalog_mock if with_catalog else None
+
+    workflow.rebuild_management_repo_catalog(
+        settings=usersettings,
+        repo_name=usersettings.repositories[0].name,
+        repo_architecture=usersettings.repositories[0].architecture,
+    )
+
+    if with_catalog:
+        catalog_mock.rebuild.assert_called_once_with(directories=[Path("foo")])
+    if rebuild_raises or not with_catalog:
+        exit_on_error_mock.assert_called_once()
+    else:
+        exit_on_error_mock.assert_not_called()
+
+
+@mark.parametrize(
+    "with_archiving, with_index",
+    [
+        (True, True),
+        (True, False),
+        (False, False),
+    ],
+)
+def test_get_archive_index(with_archiving: bool, with_index: bool) -> None:
+    """Tests for repod.action.workflow.get_archive_index."""
+    archiving = None
+    if with_archiving:
+        archiving = ArchiveSettings(
+            packages=Path("/packages"),
+            sources=Path("/sources"),
+            index=Path("/index.sqlite") if with_index else None,
+        )
+
+    archive_index = workflow.get_archive_index(archiving=archiving)
+    if with_index:
+        assert archive_index and archive_index.path == Path("/index.sqlite")  # nosec: B101
+        assert archive_index.archive_dir == Path("/packages")  # nosec: B101
+    else:
+        assert archive_index is None  # nosec: B101
+
+
+@mark.parametrize("with_index, rebuild_raises", [(True, False), (True, True), (False, False)])
+@patch("repod.action.workflow.exit_on_error")
+@patch("repod.action.workflow.get_archive_index")
+def test_rebuild_archive_index(
+    get_archive_index_mock: Mock,
+    exit_on_error_mock: Mock,
+    with_index: bool,
+    rebuild_raises: bool,
+    usersettings: UserSettings,
+    caplog: LogCaptureFixture,
+) -> None:
+    """Tests for repod.action.workflow.rebuild_archive_index."""
+    caplog.set_level(DEBUG)
+    archive_index_mock = Mock()
+    if rebuild_raises:
+        archive_index_mock.rebuild.side_effect = RepoManagementFileError("ERROR")
+    get_archive_index_mock.return_value = archive_index_mock if with_index else None
+
+    workflow.rebuild_archive_index(
+        settings=usersettings,
+        repo_name=usersettings.repositories[0].name,
+        repo_architecture=usersettings.repositories[0].architecture,
+    )
+
+    if with_index:
+        archive_index_mock.rebuild.assert_called_once_with()
+    if rebuild_raises or not with_index:
+        exit_on_error_mock.assert_called_once()
+    else:
+        exit_on_error_mock.assert_not_called()
+
+
 @mark.parametrize("task_return_value", [(ActionStateEnum.FAILED), (ActionStateEnum.SUCCESS)])
 @patch("repod.action.workflow.exit_on_error")
 @patch("repod.action.workflow.PrintOutputPackageBasesTask")
@@ -79,6 +198,7 @@ def test_add_packages_dryrun(
     ],
 )
 @patch("repod.action.workflow.exit_on_error")
+@patch("repod.action.workflow.TaskExecutor")
 @patch("repod.action.workflow.AddToRepoTask")
 @patch("repod.action.workflow.AddToArchiveTask")
 @patch("repod.action.workflow.CleanupRepoTask")
@@ -108,6 +228,7 @@ def test_add_packages(
     cleanuprepotask_mock: Mock,
     addtoarchivetask_mock: Mock,
     addtorepotask_mock: Mock,
+    taskexecutor_mock: Mock,
     exit_on_error_mock: Mock,
     build_requirements_exist: bool,
     with_archiving: bool,
@@ -134,8 +255,9 @@ def test_add_packages(
     cleanuprepotask_mock.spec = workflow.CleanupRepoTask
     addtoarchivetask_mock.spec = workflow.AddToArchiveTask
     addtorepotask_mock.spec = workflow.AddToRepoTask
-    addtorepotask_mock.return_value = Mock(return_value=task_return_value)
     (addtorepotask_mock.return_value).dependencies = []
+    taskexecutor_mock.spec = workflow.TaskExecutor
+    taskexecutor_mock.return_value = Mock(return_value=task_return_value)
 
     if not build_requirements_exist:
         usersettings.build_requirements_exist = None
@@ -160,12 +282,75 @@ def test_add_packages(
         pkgbase_urls=None,
     )
 
+    taskexecutor_mock.assert_called_once_with(task=addtorepotask_mock.return_value)
     if task_return_value != ActionStateEnum.SUCCESS:
+        taskexecutor_mock.return_value.undo.assert_called_once()
         exit_on_error_mock.assert_called_once()
     else:
         removebackupfilestask_mock.assert_called_once()
 
 
+@mark.benchmark
+@mark.parametrize("package_count, file_count", [(10, 100), (50, 1000)])
+def test_add_packages_benchmark(
+    package_count: int,
+    file_count: int,
+    benchmark_result: dict[str, Any],
+    usersettings: UserSettings,
+    tmp_path: Path,
+) -> None:
+    """Benchmark for repod.action.workflow.add_packages, adding synthetic packages to an empty repository."""
+    usersettings.build_requirements_exist = None
+    usersettings.repositories[0].build_requirements_exist = None
+    management_dir = usersettings.repositories[0]._stable_management_repo_dir
+    for directory in [
+        management_dir,
+        usersettings.repositories[0]._stable_repo_dir,
+        usersettings.repositories[0].package_pool,
+    ]:
+        assert tmp_path in directory.parents  # nosec: B101
+        assert not directory.exists() or not any(directory.iterdir())  # nosec: B101
+    package_dir = tmp_path / "packages"
+    package_dir.mkdir()
+    files = [
+        create_synthetic_package(
+            directory=package_dir,
+            name=f"foo{number}",
+            compression=CompressionTypeEnum.ZSTANDARD,
+            file_count=file_count,
+        )
+        for number in range(package_count)
+    ]
+
+    # NOTE: isolate the benchmark from checks added to the lists shared by all Tasks
+    with patch.object(Task, "pre_checks", []), patch.object(Task, "post_checks", []):
+        start = perf_counter()
+        workflow.add_packages(
+            settings=usersettings,
+            files=files,
+            repo_name=usersettings.repositories[0].name,
+            repo_architecture=usersettings.repositories[0].architecture,
+            debug_repo=False,
+            staging_repo=False,
+            testing_repo=False,
+            with_signature=False,
+            pkgbase_urls=None,
+        )
+        add_packages = perf_counter() - start
+
+    assert sorted(path.stem for path in management_dir.glob("*.json")) == sorted(  # nosec: B101
+        f"foo{number}" for number in range(package_count)
+    )
+
+    benchmark_result.update(
+        file_count=file_count,
+        package_count=package_count,
+        rounds=1,
+        seconds=add_packages,
+    )
+    print(f"\nadd_packages with {package_count} packages of {file_count} files: {add_packages * 1e3:.2f}ms")
+
+
 @mark.parametrize("task_return_value", [(ActionStateEnum.SUCCESS), (ActionStateEnum.FAILED)])
 @patch("repod.action.workflow.exit_on_error")
 @patch("repod.action.workflow.WriteSyncDbsToTmpFilesInDirTask")
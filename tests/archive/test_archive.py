@@ -1,11 +1,15 @@
 """Tests for repod.archive.archive."""
 from contextlib import nullcontext as does_not_raise
+from hashlib import sha256
 from pathlib import Path
+from shutil import copy2
 from typing import ContextManager
+from unittest.mock import patch
 
 from pytest import mark, raises
 
 from repod.archive import archive
+from repod.common.enums import FilePlacementEnum
 from repod.errors import RepoManagementValidationError
 
 
@@ -50,7 +54,9 @@ def test_copysourcedestination_from_archive_dir(
         )
 
 
+@mark.parametrize("placement", [FilePlacementEnum.COPY, FilePlacementEnum.REFLINK, FilePlacementEnum.HARDLINK])
 def test_copysourcedestination_copy_file(
+    placement: FilePlacementEnum,
     text_file: Path,
 ) -> None:
     """Tests for repod.archive.archive.CopySourceDestination.copy_file."""
@@ -64,10 +70,83 @@ def test_copysourcedestination_copy_file(
         source=source,
         destination=destination,
     )
-    obj.copy_file()
+    obj.copy_file(placement=placement)
 
     assert source.exists()  # nosec: B101
-    assert destination.exists()  # nosec: B101
+    assert destination.read_text() == source.read_text()  # nosec: B101
+
+
+def test_get_object_path() -> None:
+    """Tests for repod.archive.archive.get_object_path."""
+    assert archive.get_object_path(objects_dir=Path("/objects"), sha256sum="abcdef") == Path(  # nosec: B101
+        "/objects/ab/abcdef"
+    )
+
+
+@mark.parametrize("with_sha256sum, object_exists", [(True, False), (False, False), (True, True)])
+def test_copysourcedestination_store_file(
+    with_sha256sum: bool,
+    object_exists: bool,
+    text_file: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.archive.archive.CopySourceDestination.store_file."""
+    objects_dir = tmp_path / "objects"
+    sha256sum = sha256(text_file.read_bytes()).hexdigest()
+    object_path = objects_dir / sha256sum[:2] / sha256sum
+    if object_exists:
+        object_path.parent.mkdir(parents=True)
+        object_path.write_text(text_file.read_text())
+
+    obj = archive.CopySourceDestination(
+        source=text_file,
+        destination=tmp_path / "archive" / "f" / "foo" / text_file.name,
+    )
+    obj.destination.parent.mkdir(parents=True)
+    obj.destination.write_text("outdated")
+
+    assert obj.store_file(  # nosec: B101
+        objects_dir=objects_dir,
+        sha256sum=sha256sum if with_sha256sum else None,
+    ) == (None if object_exists else object_path)
+    assert obj.destination.is_symlink()  # nosec: B101
+    assert not obj.destination.readlink().is_absolute()  # nosec: B101
+    assert obj.destination.resolve() == object_path  # nosec: B101
+    assert obj.destination.read_text() == text_file.read_text()  # nosec: B101
+    assert not list(object_path.parent.glob("*.tmp"))  # nosec: B101
+
+
+@mark.parametrize("object_created, expectation", [(True, does_not_raise()), (False, raises(OSError))])
+def test_copysourcedestination_store_file_concurrently(
+    object_created: bool,
+    expectation: ContextManager[str],
+    text_file: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.archive.archive.CopySourceDestination.store_file with a concurrently stored or failing file."""
+    objects_dir = tmp_path / "objects"
+    sha256sum = sha256(text_file.read_bytes()).hexdigest()
+    object_path = objects_dir / sha256sum[:2] / sha256sum
+
+    def place_file(source: Path, destination: Path, placement: FilePlacementEnum) -> None:
+        assert destination.parent == object_path.parent  # nosec: B101
+        assert destination != object_path.with_name(f"{sha256sum}.tmp")  # nosec: B101
+        if not object_created:
+            raise OSError("ERROR")
+
+        copy2(source, destination)
+        copy2(source, object_path)
+
+    obj = archive.CopySourceDestination(
+        source=text_file,
+        destination=tmp_path / "archive" / "f" / "foo" / text_file.name,
+    )
+    with patch("repod.archive.archive.place_file", side_effect=place_file):
+        with expectation:
+            assert obj.store_file(objects_dir=objects_dir, sha256sum=sha256sum) is None  # nosec: B101
+            assert obj.destination.resolve() == object_path  # nosec: B101
+
+    assert not list(object_path.parent.glob("*.tmp"))  # nosec: B101
 
 
 def test_copysourcedestination_remove_destination(
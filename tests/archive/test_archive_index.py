@@ -0,0 +1,121 @@
+"""Tests for repod.archive.index."""
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import mark, raises
+
+from repod.archive import index
+from repod.errors import RepoManagementFileError
+
+
+@mark.parametrize(
+    "path, entry",
+    [
+        (Path("/foo/foo-1.0.0-1-any.pkg.tar.zst"), ("foo-1.0.0-1-any.pkg.tar.zst", "foo", "foo-1.0.0-1-any")),
+        (
+            Path("/foo/foo-bar-1:1.0.0-1-x86_64.pkg.tar.xz"),
+            ("foo-bar-1:1.0.0-1-x86_64.pkg.tar.xz", "foo-bar", "foo-bar-1:1.0.0-1-x86_64"),
+        ),
+        (Path("/foo/foo-1.0.0-1-any.pkg.tar.zst.sig"), None),
+        (Path("/foo/foo-1.0.0-1-any.txt"), None),
+        (Path("/foo/foo"), None),
+    ],
+)
+def test_get_archive_index_entry(path: Path, entry: tuple[str, str, str] | None) -> None:
+    """Tests for repod.archive.index.get_archive_index_entry."""
+    assert index.get_archive_index_entry(path=path) == entry  # nosec: B101
+
+
+def test_archiveindex_connect(tmp_path: Path) -> None:
+    """Tests for repod.archive.index.ArchiveIndex.connect."""
+    archive_index = index.ArchiveIndex(path=tmp_path / "index" / "index.sqlite", archive_dir=tmp_path)
+    assert not archive_index.exists()  # nosec: B101
+    connection = archive_index.connect()
+    schema_version = connection.execute("PRAGMA user_version").fetchone()[0]
+    assert schema_version == index.ARCHIVE_INDEX_SCHEMA_VERSION  # nosec: B101
+    connection.close()
+    assert archive_index.exists()  # nosec: B101
+
+    connection = sqlite3.connect(archive_index.path)
+    connection.execute(f"PRAGMA user_version = {index.ARCHIVE_INDEX_SCHEMA_VERSION + 1}")
+    connection.close()
+    with raises(RepoManagementFileError, match="must be rebuilt"):
+        archive_index.connect()
+
+    with raises(RepoManagementFileError):
+        index.ArchiveIndex(path=tmp_path, archive_dir=tmp_path).connect()
+
+
+def test_archiveindex_add_files_remove_files(tmp_path: Path) -> None:
+    """Tests for repod.archive.index.ArchiveIndex.add_files and repod.archive.index.ArchiveIndex.remove_files."""
+    archive_index = index.ArchiveIndex(path=tmp_path / "index.sqlite", archive_dir=tmp_path / "archive")
+    files = [
+        tmp_path / "archive" / "f" / "foo" / "foo-1.0.0-1-any.pkg.tar.zst",
+        tmp_path / "archive" / "f" / "foo" / "foo-1.0.0-1-any.pkg.tar.zst.sig",
+        tmp_path / "archive" / "f" / "foo" / "foo-1.0.0-1-any.pkg.tar.xz",
+        tmp_path / "archive" / "b" / "bar" / "bar-1.0.0-1-x86_64.pkg.tar.zst",
+    ]
+
+    archive_index.add_files(paths=files)
+    archive_index.add_files(paths=files[:1])
+    requirements = ["foo-1.0.0-1-any", "bar-1.0.0-1-x86_64", "foo-2.0.0-1-any", "foo-1.0.0-1"]
+    assert archive_index.get_requirements(requirements=requirements) == {  # nosec: B101
+        "foo-1.0.0-1-any",
+        "bar-1.0.0-1-x86_64",
+    }
+
+    archive_index.remove_files(paths=files[:2])
+    assert archive_index.get_requirements(requirements=requirements) == {  # nosec: B101
+        "foo-1.0.0-1-any",
+        "bar-1.0.0-1-x86_64",
+    }
+    archive_index.remove_files(paths=files)
+    assert archive_index.get_requirements(requirements=requirements) == set()  # nosec: B101
+
+
+def test_archiveindex_transaction(tmp_path: Path) -> None:
+    """Tests for repod.archive.index.ArchiveIndex.transaction."""
+    archive_index = index.ArchiveIndex(path=tmp_path / "index.sqlite", archive_dir=tmp_path)
+    path = tmp_path / "f" / "foo" / "foo-1.0.0-1-any.pkg.tar.zst"
+
+    with raises(RuntimeError):
+        with archive_index.transaction() as connection:
+            connection.execute("INSERT INTO files VALUES (?, ?, ?)", index.get_archive_index_entry(path=path))
+            raise RuntimeError("ERROR")
+    assert archive_index.get_requirements(requirements=["foo-1.0.0-1-any"]) == set()  # nosec: B101
+
+    with raises(RepoManagementFileError):
+        with archive_index.transaction() as connection:
+            connection.execute("INSERT INTO files VALUES (?, ?, ?)", index.get_archive_index_entry(path=path))
+            connection.execute("INSERT INTO foo VALUES (1)")
+    assert archive_index.get_requirements(requirements=["foo-1.0.0-1-any"]) == set()  # nosec: B101
+
+    with patch("repod.archive.index.ArchiveIndex.connect") as connect_mock:
+        connect_mock.return_value.execute.side_effect = sqlite3.Error("ERROR")
+        with raises(RepoManagementFileError):
+            archive_index.get_requirements(requirements=["foo-1.0.0-1-any"])
+
+
+def test_archiveindex_rebuild(tmp_path: Path) -> None:
+    """Tests for repod.archive.index.ArchiveIndex.rebuild."""
+    archive_dir = tmp_path / "archive"
+    archive_index = index.ArchiveIndex(path=tmp_path / "index.sqlite", archive_dir=archive_dir)
+    assert archive_index.rebuild() == 0  # nosec: B101
+
+    (archive_dir / "f" / "foo").mkdir(parents=True)
+    (archive_dir / "f" / "foo" / "foo-1.0.0-1-any.pkg.tar.zst").touch()
+    (archive_dir / "f" / "foo" / "foo-1.0.0-1-any.pkg.tar.zst.sig").touch()
+    (archive_dir / "f" / "foo" / "foo.txt").touch()
+    (archive_dir / "f" / "foo" / "foo-2.0.0-1-any.pkg.tar.zst").mkdir()
+    for version in range(1000):
+        (archive_dir / "f" / "foo" / f"foo-{version}-1-x86_64.pkg.tar.zst").touch()
+
+    assert archive_index.rebuild() == 1001  # nosec: B101
+    requirements = [f"foo-{version}-1-x86_64" for version in range(1000)] + ["foo-1.0.0-1-any", "foo-2.0.0-1-any"]
+    assert archive_index.get_requirements(requirements=requirements) == set(requirements[:-1])  # nosec: B101
+
+    connection = sqlite3.connect(archive_index.path)
+    connection.execute(f"PRAGMA user_version = {index.ARCHIVE_INDEX_SCHEMA_VERSION + 1}")
+    connection.close()
+    assert archive_index.rebuild() == 1001  # nosec: B101
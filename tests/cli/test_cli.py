@@ -7,9 +7,12 @@ from re import Match, fullmatch
 from tempfile import TemporaryDirectory
 from unittest.mock import Mock, patch
 
+from orjson import loads
 from pytest import LogCaptureFixture, mark, raises
 
 from repod import commands
+from repod.action.task import AddToRepoTask
+from repod.action.trace import get_tracer
 from repod.cli import cli
 from repod.common.enums import (
     ArchitectureEnum,
@@ -19,6 +22,8 @@ from repod.common.enums import (
 )
 from repod.config import UserSettings
 from repod.config.defaults import DEFAULT_DATABASE_COMPRESSION
+from repod.config.settings import PackageCacheSettings
+from repod.repo import OutputPackageBase, SyncDatabase
 
 
 @mark.parametrize(
@@ -62,6 +67,7 @@ def test_repod_file_package(
     caplog.set_level(DEBUG)
 
     settings_mock = Mock()
+    settings_mock.package_cache = None
     args.file = [default_package_file[0]]
 
     cli.repod_file_package(args=args, settings=settings_mock)
@@ -69,6 +75,23 @@ def test_repod_file_package(
         exit_on_error_mock.assert_called_once()
 
 
+def test_repod_file_package_with_package_cache(default_package_file: tuple[Path, ...], tmp_path: Path) -> None:
+    """Tests for repod.cli.cli.repod_file_package with a package cache."""
+    settings_mock = Mock()
+    settings_mock.package_cache = PackageCacheSettings(directory=tmp_path / "cache")
+    args = Namespace(
+        package="inspect",
+        buildinfo=False,
+        mtree=False,
+        pkginfo=False,
+        with_signature=False,
+        file=[default_package_file[0]],
+    )
+
+    cli.repod_file_package(args=args, settings=settings_mock)
+    assert len(list((tmp_path / "cache").iterdir())) == 1  # nosec: B101
+
+
 @mark.parametrize(
     "args, calls_exit_on_error",
     [
@@ -98,15 +121,21 @@ def test_repod_file_package(
             ),
             False,
         ),
+        (Namespace(repo="archiveindex", architecture=ArchitectureEnum.ANY), False),
+        (Namespace(repo="catalog", architecture=ArchitectureEnum.ANY), False),
         (Namespace(repo="foo"), True),
     ],
 )
 @patch("repod.cli.cli.repod_file_repo_importpkg")
+@patch("repod.cli.cli.rebuild_management_repo_catalog")
+@patch("repod.cli.cli.rebuild_archive_index")
 @patch("repod.cli.cli.write_sync_databases")
 @patch("repod.cli.cli.exit_on_error")
 def test_repod_file_repo(
     exit_on_error_mock: Mock,
     write_sync_databases_mock: Mock,
+    rebuild_archive_index_mock: Mock,
+    rebuild_management_repo_catalog_mock: Mock,
     repod_file_repo_importpkg_mock: Mock,
     caplog: LogCaptureFixture,
     default_package_file: tuple[Path, ...],
@@ -130,18 +159,69 @@ def test_repod_file_repo(
     if args.repo == "importdb":
         args.file = default_sync_db_file[1]
         args.name = tmp_path
-    if args.repo == "writedb":
+    if args.repo in ["archiveindex", "catalog", "writedb"]:
         args.name = "default"
 
     cli.repod_file_repo(args=args, settings=settings_mock)
     if args.repo == "importpkg":
         repod_file_repo_importpkg_mock.assert_called_once()
+    if args.repo == "archiveindex":
+        rebuild_archive_index_mock.assert_called_once()
+    if args.repo == "catalog":
+        rebuild_management_repo_catalog_mock.assert_called_once()
     if args.repo == "writedb":
         write_sync_databases_mock.assert_called_once()
     if calls_exit_on_error:
         exit_on_error_mock.assert_called_once()
 
 
+@patch("repod.cli.cli.repod_file_repo")
+@patch("repod.cli.argparse.ArgumentParser.parse_args")
+@patch("repod.cli.cli.UserSettings")
+def test_repod_file_profile_output(
+    usersettings_mock: Mock,
+    parse_args_mock: Mock,
+    repod_file_repo_mock: Mock,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.cli.cli.repod_file with the profile_output option."""
+    parse_args_mock.return_value = Namespace(
+        subcommand="repo",
+        config=None,
+        system=False,
+        verbose_mode=False,
+        debug_mode=False,
+        profile_output=tmp_path / "trace.json",
+    )
+    repod_file_repo_mock.side_effect = lambda args, settings: AddToRepoTask(dependencies=[]).run()
+
+    cli.repod_file()
+    assert get_tracer() is None  # nosec: B101
+    trace_events = loads((tmp_path / "trace.json").read_bytes())["traceEvents"]
+    assert [event["name"] for event in trace_events if event["cat"] == "task"] == ["AddToRepoTask"]  # nosec: B101
+
+
+@mark.asyncio
+async def test_import_sync_database(split_pkgbase_sync_db_file: Path, tmp_path: Path) -> None:
+    """Tests for repod.cli.cli.import_sync_database."""
+    management_repo_dir = tmp_path / "management"
+    management_repo_dir.mkdir()
+    (management_repo_dir / "foo.json").write_text("stale")
+
+    await cli.import_sync_database(
+        database=SyncDatabase(
+            database=split_pkgbase_sync_db_file,
+            desc_version=PackageDescVersionEnum.DEFAULT,
+            files_version=FilesVersionEnum.DEFAULT,
+        ),
+        path=management_repo_dir,
+    )
+
+    assert sorted(path.name for path in management_repo_dir.iterdir()) == ["baz.json", "foo.json"]  # nosec: B101
+    foo = await OutputPackageBase.from_file(path=management_repo_dir / "foo.json")
+    assert [package.name for package in foo.packages] == ["bar", "foo"]  # type: ignore[attr-defined]  # nosec: B101
+
+
 @mark.parametrize("dry_run", [(True), (False)])
 @patch("repod.cli.cli.add_packages_dryrun")
 @patch("repod.cli.cli.add_packages")
@@ -1,9 +1,10 @@
 """Tests for repod.common.models."""
 from contextlib import nullcontext as does_not_raise
-from typing import ContextManager
+from time import perf_counter
+from typing import Any, ContextManager
 from unittest.mock import patch
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError, constr
 from pytest import mark, raises
 from pytest_lazyfixture import lazy_fixture
 
@@ -15,6 +16,58 @@ from tests.conftest import (
 )
 
 
+@mark.parametrize(
+    "value, expectation",
+    [
+        ("foo", does_not_raise()),
+        ("Foo", raises(ValidationError)),
+        ("foo1", raises(ValidationError)),
+        (1, raises(ValidationError)),
+    ],
+)
+def test_cached_constr(value: str, expectation: ContextManager[str]) -> None:
+    """Tests for repod.common.models.cached_constr."""
+
+    class Model(BaseModel):
+        foo: models.cached_constr(regex=r"^[a-z]+$")  # type: ignore[valid-type]  # noqa: F722
+
+    assert models.cached_constr(regex=r"^[a-z]+$") is models.cached_constr(regex=r"^[a-z]+$")  # nosec: B101
+    assert Model.schema()["properties"]["foo"]["pattern"] == r"^[a-z]+$"  # nosec: B101
+    with expectation:
+        assert Model(foo=value).foo == value  # nosec: B101
+
+
+@mark.benchmark
+def test_cached_constr_benchmark(benchmark_result: dict[str, Any]) -> None:
+    """Benchmark for repod.common.models.cached_constr compared to pydantic.constr with recurring values."""
+
+    class ConstrainedDepends(BaseModel):
+        depends: list[constr(regex=r"^[a-z0-9@._+-]+$")]  # type: ignore[valid-type]  # noqa: F722
+
+    class CachedConstrainedDepends(BaseModel):
+        depends: list[models.cached_constr(regex=r"^[a-z0-9@._+-]+$")]  # type: ignore[valid-type]  # noqa: F722
+
+    rounds = 1000
+    depends = [f"foo{number}-bar-baz-libraries" for number in range(50)]
+
+    start = perf_counter()
+    for _ in range(rounds):
+        ConstrainedDepends(depends=depends)
+    uncached = (perf_counter() - start) / rounds
+
+    start = perf_counter()
+    for _ in range(rounds):
+        CachedConstrainedDepends(depends=depends)
+    cached = (perf_counter() - start) / rounds
+
+    print(
+        f"\nvalidating {len(depends)} recurring values: {uncached * 1e6:.2f}us (constr), "
+        f"{cached * 1e6:.2f}us (cached_constr)"
+    )
+    benchmark_result.update(rounds=rounds, seconds={"cached_constr": cached, "constr": uncached})
+    assert cached < uncached  # nosec: B101
+
+
 @mark.parametrize(
     "backup, expectation",
     [
@@ -143,6 +196,10 @@ def test_packager(default_packager: str, default_invalid_packager: str) -> None:
         models.Packager(packager=default_packager)
     with raises(ValidationError):
         models.Packager(packager=default_invalid_packager)
+    with raises(ValidationError):
+        models.Packager(packager="Foobar McFooface <foo@>")
+    assert models.validate_packager_email(email="foobar@mcfooface.com") is None  # nosec: B101
+    assert isinstance(models.validate_packager_email(email="foo@"), str)  # nosec: B101
 
 
 @mark.parametrize(
@@ -6,6 +6,36 @@ from pytest import mark
 from repod.common import regex
 
 
+@mark.parametrize(
+    "values, result",
+    [
+        ([], True),
+        (["foo"], True),
+        (["foo", "bar"], True),
+        (["foo", "Bar"], False),
+        (["foo\nbar"], False),
+        (["foo"] * 100 + [""], False),
+    ],
+)
+def test_fullmatch_list(values: list[str], result: bool) -> None:
+    """Tests for repod.common.regex.compile_list_regex and repod.common.regex.fullmatch_list."""
+    assert (
+        regex.fullmatch_list(regex=regex.compile_list_regex(pattern=r"[a-z]+"), values=values) is result
+    )  # nosec: B101
+
+
+def test_match_regex() -> None:
+    """Tests for repod.common.regex.compile_regex and repod.common.regex.match_regex."""
+    assert regex.compile_regex(pattern=r"^[a-z]+$") is regex.compile_regex(pattern=r"^[a-z]+$")  # nosec: B101
+
+    regex.match_regex.cache_clear()
+    assert regex.match_regex(pattern=r"^[a-z]+$", value="foo")  # nosec: B101
+    assert regex.match_regex(pattern=r"^[a-z]+$", value="foo")  # nosec: B101
+    assert not regex.match_regex(pattern=r"^[a-z]+$", value="Foo")  # nosec: B101
+    cache_info = regex.match_regex.cache_info()
+    assert cache_info.hits == 1 and cache_info.misses == 2  # nosec: B101
+
+
 @mark.regex
 def test_architectures(arch: str) -> None:
     """Tests for repod.common.regex.ARCHITECTURE."""
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import ContextManager
 from unittest.mock import Mock, call, patch
 
-from pydantic import AnyUrl
+from pydantic import AnyUrl, ValidationError
 from pytest import LogCaptureFixture, mark, raises
 
 from repod.common.enums import (
@@ -47,6 +47,25 @@ def test_mangement_repo(
         )
 
 
+@mark.parametrize(
+    "catalog, expectation",
+    [
+        (None, does_not_raise()),
+        (Path("/catalog.sqlite"), does_not_raise()),
+        (Path("~/catalog.sqlite"), does_not_raise()),
+        (Path("catalog.sqlite"), raises(ValueError)),
+    ],
+)
+def test_management_repo_validate_catalog(
+    catalog: Path | None,
+    expectation: ContextManager[str],
+    empty_dir: Path,
+) -> None:
+    with expectation:
+        management_repo = settings.ManagementRepo(directory=empty_dir, catalog=catalog)
+        assert management_repo.catalog is None or management_repo.catalog.is_absolute()  # nosec: B101
+
+
 @mark.parametrize(
     "name, debug_repo, staging_repo, staging_debug_repo, testing_repo, testing_debug_repo, expectation",
     [
@@ -190,6 +209,40 @@ def test_package_repo_get_all_management_repo_dirs(
     packagerepo_in_tmp_path.get_all_management_repo_dirs()
 
 
+@mark.parametrize(
+    "debug, staging, testing",
+    [
+        (True, True, True),
+        (False, True, True),
+        (False, False, True),
+        (False, False, False),
+        (True, False, False),
+        (True, True, False),
+        (False, True, False),
+    ],
+)
+def test_package_repo_get_management_repo_types(
+    debug: bool,
+    staging: bool,
+    testing: bool,
+    packagerepo_in_tmp_path: settings.PackageRepo,
+) -> None:
+    if not debug:
+        packagerepo_in_tmp_path.debug = None
+    if not staging:
+        packagerepo_in_tmp_path.staging = None
+    if not testing:
+        packagerepo_in_tmp_path.testing = None
+
+    repo_types = packagerepo_in_tmp_path.get_management_repo_types()
+    assert list(repo_types) == packagerepo_in_tmp_path.get_all_management_repo_dirs()  # nosec: B101
+    assert repo_types[packagerepo_in_tmp_path._stable_management_repo_dir] == RepoTypeEnum.STABLE  # nosec: B101
+    if testing and debug:
+        assert (  # nosec: B101
+            repo_types[packagerepo_in_tmp_path._testing_debug_management_repo_dir] == RepoTypeEnum.TESTING_DEBUG
+        )
+
+
 @mark.parametrize(
     "debug, staging, testing",
     [
@@ -553,6 +606,7 @@ def test_settings_consolidate_repositories_with_defaults(  # noqa: C901
                             archiving=None,
                             build_requirements_exist=True,
                             database_compression=settings.DEFAULT_DATABASE_COMPRESSION,
+                            database_compression_level=None,
                             management_repo=settings.ManagementRepo(directory=tmp_path / settings.DEFAULT_NAME),
                             package_pool=tmp_path / "package_pool_dir",
                             repositories=[packagerepo_in_tmp_path],
@@ -1661,6 +1715,20 @@ def test_settings_get_repo_management_repo(usersettings: settings.UserSettings)
     )
 
 
+def test_settings_get_management_repo_types(usersettings: settings.UserSettings) -> None:
+    management_repo = usersettings.get_repo_management_repo(
+        name=Path(settings.DEFAULT_NAME),
+        architecture=settings.DEFAULT_ARCHITECTURE,
+    )
+    assert (
+        usersettings.get_management_repo_types(management_repo=management_repo)  # nosec: B101
+        == usersettings.repositories[0].get_management_repo_types()
+    )
+    assert (  # nosec: B101
+        usersettings.get_management_repo_types(management_repo=settings.ManagementRepo(directory=Path("/other"))) == {}
+    )
+
+
 def test_settings_get_repo_architecture(usersettings: settings.UserSettings) -> None:
     assert isinstance(  # nosec: B101
         usersettings.get_repo_architecture(
@@ -1681,6 +1749,91 @@ def test_settings_get_repo_database_compression(usersettings: settings.UserSetti
     )
 
 
+def test_settings_get_repo_database_compression_level(usersettings: settings.UserSettings) -> None:
+    usersettings.repositories[0].database_compression_level = 5
+    assert (  # nosec: B101
+        usersettings.get_repo_database_compression_level(
+            name=Path(settings.DEFAULT_NAME),
+            architecture=settings.DEFAULT_ARCHITECTURE,
+        )
+        == 5
+    )
+
+
+@mark.parametrize(
+    "compression, level, expectation",
+    [
+        (CompressionTypeEnum.GZIP, 9, does_not_raise()),
+        (CompressionTypeEnum.GZIP, 10, raises(ValueError)),
+        (CompressionTypeEnum.ZSTANDARD, -5, does_not_raise()),
+        (CompressionTypeEnum.ZSTANDARD, 23, raises(ValueError)),
+        (CompressionTypeEnum.NONE, 1, raises(ValueError)),
+    ],
+)
+def test_raise_on_invalid_database_compression_level(
+    compression: CompressionTypeEnum,
+    level: int,
+    expectation: ContextManager[str],
+) -> None:
+    with expectation:
+        settings.raise_on_invalid_database_compression_level(compression=compression, level=level)
+
+
+@mark.parametrize(
+    "compression, level, expectation",
+    [
+        (CompressionTypeEnum.BZIP2, 9, does_not_raise()),
+        (CompressionTypeEnum.BZIP2, 0, raises(ValidationError)),
+        (None, 0, does_not_raise()),
+        (CompressionTypeEnum.LZMA, None, does_not_raise()),
+    ],
+)
+def test_databasecompression_validate_database_compression_level(
+    compression: CompressionTypeEnum | None,
+    level: int | None,
+    expectation: ContextManager[str],
+) -> None:
+    with expectation:
+        settings.DatabaseCompression(database_compression=compression, database_compression_level=level)
+
+
+@mark.parametrize(
+    "repo_compression, repo_level, global_level, return_value, expectation",
+    [
+        (None, None, 5, 5, does_not_raise()),
+        (settings.DEFAULT_DATABASE_COMPRESSION, None, 5, 5, does_not_raise()),
+        (CompressionTypeEnum.ZSTANDARD, None, 5, None, does_not_raise()),
+        (CompressionTypeEnum.ZSTANDARD, 19, 5, 19, does_not_raise()),
+        (None, 19, None, None, raises(ValueError)),
+    ],
+)
+def test_settings_consolidate_repositories_with_database_compression_level(
+    repo_compression: CompressionTypeEnum | None,
+    repo_level: int | None,
+    global_level: int | None,
+    return_value: int | None,
+    expectation: ContextManager[str],
+    packagerepo_in_tmp_path: settings.PackageRepo,
+    tmp_path: Path,
+) -> None:
+    packagerepo_in_tmp_path.database_compression = repo_compression
+    packagerepo_in_tmp_path.database_compression_level = repo_level
+
+    with expectation:
+        repos = settings.UserSettings.consolidate_repositories_with_defaults(
+            architecture=settings.DEFAULT_ARCHITECTURE,
+            archiving=None,
+            build_requirements_exist=True,
+            database_compression=settings.DEFAULT_DATABASE_COMPRESSION,
+            database_compression_level=global_level,
+            management_repo=settings.ManagementRepo(directory=tmp_path / settings.DEFAULT_NAME),
+            package_pool=tmp_path / "package_pool_dir",
+            repositories=[packagerepo_in_tmp_path],
+            source_pool=tmp_path / "source_pool_dir",
+        )
+        assert repos[0].database_compression_level == return_value  # nosec: B101
+
+
 @mark.parametrize("add_group", [(True), (False)])
 def test_settings_get_repos_by_group(add_group: bool, usersettings: settings.UserSettings) -> None:
     if add_group:
@@ -2029,6 +2182,43 @@ def test_archivesettings_validate_packages(
 
         assert packages_return_value == archiving.packages  # nosec: B101
         assert sources_return_value == archiving.sources  # nosec: B101
+        assert archiving.index is None  # nosec: B101
+
+
+@mark.parametrize(
+    "index, expectation, return_value",
+    [
+        (None, does_not_raise(), None),
+        (Path("/index.sqlite"), does_not_raise(), Path("/index.sqlite")),
+        (Path("index.sqlite"), raises(ValueError), None),
+    ],
+)
+def test_archivesettings_validate_index(
+    index: Path | None,
+    expectation: ContextManager[str],
+    return_value: Path | None,
+) -> None:
+    with expectation:
+        archiving = settings.ArchiveSettings(packages=Path("/packages"), sources=Path("/sources"), index=index)
+        assert archiving.index == return_value  # nosec: B101
+
+
+@mark.parametrize(
+    "objects, expectation, return_value",
+    [
+        (None, does_not_raise(), None),
+        (Path("/objects"), does_not_raise(), Path("/objects")),
+        (Path("objects"), raises(ValueError), None),
+    ],
+)
+def test_archivesettings_validate_objects(
+    objects: Path | None,
+    expectation: ContextManager[str],
+    return_value: Path | None,
+) -> None:
+    with expectation:
+        archiving = settings.ArchiveSettings(packages=Path("/packages"), sources=Path("/sources"), objects=objects)
+        assert archiving.objects == return_value  # nosec: B101
 
 
 @mark.parametrize(
@@ -2042,3 +2232,68 @@ def test_archivesettings_validate_packages(
 def test_get_default_archive_settings(settings_type: SettingsTypeEnum, expectation: ContextManager[str]) -> None:
     with expectation:
         settings.get_default_archive_settings(settings_type=settings_type)
+
+
+@mark.parametrize(
+    "directory, expanduser_raises, expanduser_absolute, expectation, return_value",
+    [
+        (Path("/cache"), False, True, does_not_raise(), Path("/cache")),
+        (Path("~/cache"), False, True, does_not_raise(), Path("/expanded")),
+        (Path("~/cache"), False, False, raises(ValueError), None),
+        (Path("~/cache"), True, True, raises(ValueError), None),
+        (Path("cache"), False, True, raises(ValueError), None),
+    ],
+)
+@patch("repod.config.settings.Path.expanduser")
+def test_packagecachesettings_validate_directory(
+    expanduser_mock: Mock,
+    directory: Path,
+    expanduser_raises: bool,
+    expanduser_absolute: bool,
+    expectation: ContextManager[str],
+    return_value: Path | None,
+    caplog: LogCaptureFixture,
+) -> None:
+    caplog.set_level(DEBUG)
+
+    expanduser_mock.return_value = Path("/expanded") if expanduser_absolute else Path("expanded")
+    if expanduser_raises:
+        expanduser_mock.side_effect = RuntimeError
+
+    with expectation:
+        assert settings.PackageCacheSettings(directory=directory).directory == return_value  # nosec: B101
+
+
+@mark.parametrize(
+    "settings_type, expectation",
+    [
+        (SettingsTypeEnum.USER, does_not_raise()),
+        (SettingsTypeEnum.SYSTEM, does_not_raise()),
+        (None, raises(RuntimeError)),
+    ],
+)
+def test_get_default_package_cache_settings(settings_type: SettingsTypeEnum, expectation: ContextManager[str]) -> None:
+    with expectation:
+        assert (  # nosec: B101
+            settings.get_default_package_cache_settings(settings_type=settings_type).directory
+            == settings.PACKAGE_CACHE_DIR[settings_type]
+        )
+
+
+@mark.parametrize(
+    "package_cache, return_value",
+    [
+        (None, None),
+        (False, None),
+        (True, settings.PackageCacheSettings(directory=settings.PACKAGE_CACHE_DIR[SettingsTypeEnum.USER])),
+        (
+            settings.PackageCacheSettings(directory=Path("/cache"), max_size=1),
+            settings.PackageCacheSettings(directory=Path("/cache"), max_size=1),
+        ),
+    ],
+)
+def test_settings_validate_package_cache(
+    package_cache: settings.PackageCacheSettings | bool | None,
+    return_value: settings.PackageCacheSettings | None,
+) -> None:
+    assert settings.UserSettings.validate_package_cache(package_cache) == return_value  # nosec: B101
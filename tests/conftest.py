@@ -1,12 +1,18 @@
 """Pytest conftest."""
 import gzip
+import platform
 import sys
 from copy import deepcopy
+from datetime import datetime, timezone
+from hashlib import md5, sha256
+from importlib import metadata
 from io import BytesIO, StringIO
 from os import chdir
 from pathlib import Path
-from random import choice
+from random import Random, choice
 from string import ascii_lowercase, ascii_uppercase, digits
+from sys import getswitchinterval, setswitchinterval
+from tarfile import DIRTYPE, TarInfo
 from tarfile import open as tarfile_open
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from textwrap import dedent
@@ -16,7 +22,7 @@ from unittest.mock import Mock, patch
 import orjson
 import pytest_asyncio
 from pydantic import BaseModel
-from pytest import fixture
+from pytest import FixtureRequest, Metafunc, Parser, TempPathFactory, fixture
 
 from repod.common.enums import (
     ArchitectureEnum,
@@ -38,7 +44,7 @@ from repod.files import open_tarfile
 from repod.files.buildinfo import BuildInfo, BuildInfoV1, BuildInfoV2
 from repod.files.common import ZstdTarFile
 from repod.files.mtree import MTree, MTreeEntryV1
-from repod.files.package import PackageV1
+from repod.files.package import Package, PackageV1
 from repod.files.pkginfo import PkgInfo, PkgInfoV1, PkgInfoV2, PkgType
 from repod.repo.management import OutputBuildInfo, OutputPackageBase
 from repod.repo.management.outputpackage import OutputPackageBaseV1, OutputPackageV1
@@ -82,6 +88,73 @@ class PackageDescV9999(PackageDesc, SchemaVersion9999):
     pass
 
 
+def pytest_addoption(parser: Parser) -> None:
+    """Add command line options to pytest."""
+    parser.addoption(
+        "--benchmark-results",
+        action="store",
+        default=None,
+        type=Path,
+        help="Write the results of benchmark tests (using the benchmark marker) to a JSON file",
+    )
+    parser.addoption(
+        "--benchmark-pkgbases",
+        action="store",
+        default="1000",
+        help="A comma-separated list of amounts of pkgbases in synthetic repositories used by benchmark tests",
+    )
+
+
+def pytest_generate_tests(metafunc: Metafunc) -> None:
+    """Parametrize tests using pkgbase_count with the amounts of pkgbases provided by --benchmark-pkgbases."""
+    if "pkgbase_count" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "pkgbase_count",
+            [int(count) for count in metafunc.config.getoption("--benchmark-pkgbases").split(",")],
+        )
+
+
+@fixture(scope="session")
+def benchmark_results(pytestconfig: Any) -> Generator[dict[str, dict[str, Any]], None, None]:
+    """Yield a dict session-wide, that collects the results of benchmark tests.
+
+    If the --benchmark-results option is provided, the results are written to the JSON file it points to at the end of
+    the session, together with information about the environment, so that they can be compared across releases.
+    """
+    results: dict[str, dict[str, Any]] = {}
+    yield results
+
+    output: Path | None = pytestconfig.getoption("--benchmark-results")
+    if not output or not results:
+        return
+
+    try:
+        repod_version: str | None = metadata.version("repod")
+    except metadata.PackageNotFoundError:
+        repod_version = None
+
+    output.write_bytes(
+        orjson.dumps(
+            {
+                "date": datetime.now(tz=timezone.utc).isoformat(),
+                "machine": platform.machine(),
+                "python": platform.python_version(),
+                "repod": repod_version,
+                "results": results,
+            },
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SORT_KEYS,
+        )
+    )
+
+
+@fixture(scope="function")
+def benchmark_result(benchmark_results: dict[str, dict[str, Any]], request: FixtureRequest) -> dict[str, Any]:
+    """Return a dict function-wide, in which a benchmark test stores its results (e.g. timings and parameters)."""
+    result: dict[str, Any] = {}
+    benchmark_results[request.node.nodeid] = result
+    return result
+
+
 def create_default_arch() -> str:
     """Return a (pseudo-randomly selected) ArchitectureEnum as string."""
     return str(choice([arch.value for arch in ArchitectureEnum]))  # nosec: B311
@@ -818,7 +891,7 @@ def valid_mtree(
     mtreeentryv1_internals: list[MTreeEntryV1],
 ) -> Generator[MTree, None, None]:
     """Yield an MTree function-wide representing a set of files and directories."""
-    yield MTree(
+    yield MTree.from_entries(
         entries=[
             mtreeentryv1_dir,
             mtreeentryv1_file,
@@ -1553,6 +1626,35 @@ async def files_sync_db_file(
         yield (sync_db_tarfile, sync_db_symlink)
 
 
+@pytest_asyncio.fixture(scope="function")
+async def split_pkgbase_sync_db_file(outputpackagebasev1: OutputPackageBaseV1, tmp_path: Path) -> Path:
+    """Return a Path function-wide, representing a files repo sync db with non-consecutive packages of a pkgbase.
+
+    The sync database contains the packages "bar" (pkgbase "foo"), "baz" (pkgbase "baz") and "foo" (pkgbase "foo").
+    """
+    first = deepcopy(outputpackagebasev1)
+    first.packages = [outputpackagebasev1.packages[1]]
+    last = deepcopy(outputpackagebasev1)
+    last.packages = [outputpackagebasev1.packages[0]]
+    other = deepcopy(last)
+    other.base = "baz"
+    other.packages[0].filename = other.packages[0].filename.replace("foo", "baz")  # type: ignore[attr-defined]
+    other.packages[0].name = "baz"  # type: ignore[attr-defined]
+
+    sync_db_tarfile = tmp_path / "split.files.tar.gz"
+    with open_tarfile(path=sync_db_tarfile, compression=CompressionTypeEnum.GZIP, mode="w") as tarfile:
+        for model in [first, other, last]:
+            await SyncDatabase.outputpackagebase_to_tarfile(
+                tarfile=tarfile,
+                database_type=RepoDbTypeEnum.FILES,
+                model=model,
+                packagedesc_version=PackageDescVersionEnum.DEFAULT,
+                files_version=FilesVersionEnum.DEFAULT,
+            )
+
+    return sync_db_tarfile
+
+
 @fixture(
     scope="function",
     params=[name for name in CompressionTypeEnum],
@@ -1633,6 +1735,225 @@ def default_package_file(
     return (pkg_path, sig_path)
 
 
+def create_synthetic_package_files(name: str, file_count: int, file_size: int) -> dict[str, bytes | None]:
+    """Create the contents of a synthetic package.
+
+    The files are distributed over several directories and their data is only partially compressible, to approximate
+    the contents of real packages. The data is derived from name and the number of each file, so that it is identical
+    across invocations.
+
+    Parameters
+    ----------
+    name: str
+        The name of the package
+    file_count: int
+        The amount of files in the package
+    file_size: int
+        The size of each file in bytes
+
+    Returns
+    -------
+    dict[str, bytes | None]
+        The relative paths of directories (with None as value) and files (with their data as value) in the package
+    """
+    generator = Random(name)  # nosec: B311
+    files: dict[str, bytes | None] = {"usr": None, "usr/share": None, f"usr/share/{name}": None}
+    for number in range(file_count):
+        directory = f"usr/share/{name}/{number // 100}"
+        files.setdefault(directory, None)
+        text = f"{name} file {number}\n".encode()
+        files[f"{directory}/file{number}"] = (
+            generator.randbytes(file_size // 2) + text * (file_size // 2 // len(text) + 1)
+        )[:file_size]
+
+    return files
+
+
+def create_synthetic_mtree(files: dict[str, bytes | None], time: float = 1651787473.0) -> str:
+    """Create the contents of an .MTREE file for the contents of a synthetic package.
+
+    Parameters
+    ----------
+    files: dict[str, bytes | None]
+        The relative paths of directories (with None as value) and files (with their data as value) in a package
+    time: float
+        The modification time of all files and directories
+
+    Returns
+    -------
+    str
+        The contents of an .MTREE file
+    """
+    lines = ["#mtree", "/set type=file uid=0 gid=0 mode=644"]
+    for path, data in files.items():
+        if data is None:
+            lines.append(f"./{path} time={time} mode=755 type=dir")
+        else:
+            lines.append(
+                f"./{path} time={time} size={len(data)} md5digest={md5(data).hexdigest()} "  # nosec: B324
+                f"sha256digest={sha256(data).hexdigest()}"
+            )
+
+    return "\n".join(lines) + "\n"
+
+
+def create_synthetic_package(
+    directory: Path,
+    name: str,
+    compression: CompressionTypeEnum,
+    base: str | None = None,
+    file_count: int = 100,
+    file_size: int = 4096,
+    installed_count: int = 100,
+    depends_count: int = 10,
+) -> Path:
+    """Create a synthetic package file with configurable size.
+
+    The package file contains valid .BUILDINFO, .MTREE and .PKGINFO files and is used in benchmarks.
+
+    Parameters
+    ----------
+    directory: Path
+        The directory in which to create the package file
+    name: str
+        The name of the package
+    compression: CompressionTypeEnum
+        The compression type of the package file
+    base: str | None
+        The optional pkgbase of the package (defaults to name)
+    file_count: int
+        The amount of files in the package (defaults to 100)
+    file_size: int
+        The size of each file in the package in bytes (defaults to 4096)
+    installed_count: int
+        The amount of installed packages in the .BUILDINFO file (defaults to 100)
+    depends_count: int
+        The amount of run-time dependencies in the .PKGINFO file (defaults to 10)
+
+    Returns
+    -------
+    Path
+        The path to the package file
+    """
+    base = base or name
+    packager = create_default_packager()
+    files = create_synthetic_package_files(name=name, file_count=file_count, file_size=file_size)
+    buildinfo = "\n".join(
+        [
+            "format = 2",
+            f"pkgname = {name}",
+            f"pkgbase = {base}",
+            "pkgver = 1:1.0.0-1",
+            "pkgarch = any",
+            f"pkgbuild_sha256sum = {sha256(base.encode()).hexdigest()}",
+            f"packager = {packager}",
+            "builddate = 1651787473",
+            "builddir = /build",
+            "startdir = /startdir",
+            "buildtool = devtools",
+            "buildtoolver = 1:1.0.0-1-any",
+            "buildenv = check",
+            "options = strip",
+        ]
+        + [f"installed = lib{number}-1:1.0.{number}-1-x86_64" for number in range(installed_count)]
+    ).encode()
+    pkginfo = "\n".join(
+        [
+            "# Generated by makepkg 6.0.1",
+            "# using fakeroot version 1.29",
+            f"pkgname = {name}",
+            f"pkgbase = {base}",
+            "xdata = pkgtype=pkg",
+            "pkgver = 1:1.0.0-1",
+            f"pkgdesc = Synthetic package {name}",
+            "url = https://archlinux.org",
+            "builddate = 1651787473",
+            f"packager = {packager}",
+            f"size = {sum(len(data) for data in files.values() if data)}",
+            "arch = any",
+            "license = GPL",
+        ]
+        + [f"depend = lib{number}" for number in range(depends_count)]
+    ).encode()
+    metadata = {".BUILDINFO": buildinfo, ".PKGINFO": pkginfo}
+    mtree = gzip.compress(create_synthetic_mtree(files=metadata | files).encode())
+
+    suffix = f".{compression.value}" if compression.value else ""
+    path = directory / f"{name}-1:1.0.0-1-any.pkg.tar{suffix}"
+    with open_tarfile(path=path, compression=compression, mode="x") as tarfile:
+        for file_name, data in (metadata | {".MTREE": mtree} | files).items():
+            tarinfo = TarInfo(name=file_name)
+            tarinfo.mtime = 1651787473
+            if data is None:
+                tarinfo.type = DIRTYPE
+                tarinfo.mode = 0o755
+                tarfile.addfile(tarinfo)
+            else:
+                tarinfo.mode = 0o644
+                tarinfo.size = len(data)
+                tarfile.addfile(tarinfo, BytesIO(data))
+
+    return path
+
+
+async def create_synthetic_management_repo(directory: Path, pkgbase_count: int, file_count: int = 100) -> Path:
+    """Create a synthetic management repository with the JSON files of pkgbases with a single package each.
+
+    The JSON files are derived from a single synthetic package (see create_synthetic_package()), which is only read
+    once, so that management repositories with many pkgbases are created quickly.
+
+    Parameters
+    ----------
+    directory: Path
+        The directory in which to create the management repository
+    pkgbase_count: int
+        The amount of pkgbases in the management repository
+    file_count: int
+        The amount of files in each package (defaults to 100)
+
+    Returns
+    -------
+    Path
+        The path to the directory containing the JSON files of the management repository
+    """
+    with TemporaryDirectory() as tmp:
+        template = orjson.dumps(
+            OutputPackageBase.from_package(
+                packages=[
+                    await Package.from_file(
+                        package=create_synthetic_package(
+                            directory=Path(tmp),
+                            name="synthetic",
+                            compression=CompressionTypeEnum.NONE,
+                            file_count=file_count,
+                            file_size=0,
+                            installed_count=10,
+                        )
+                    )
+                ]
+            ).dict(),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SORT_KEYS,
+        )
+
+    management_dir = directory / "management"
+    management_dir.mkdir(parents=True)
+    for number in range(pkgbase_count):
+        name = f"pkgbase{number}"
+        (management_dir / f"{name}.json").write_bytes(template.replace(b"synthetic", name.encode()))
+
+    return management_dir
+
+
+@pytest_asyncio.fixture(scope="function")
+async def synthetic_management_repo(pkgbase_count: int, tmp_path_factory: TempPathFactory) -> Path:
+    """Return the Path to a synthetic management repository, that is created once session-wide per pkgbase_count."""
+    directory = tmp_path_factory.getbasetemp() / f"synthetic_management_repo_{pkgbase_count}"
+    if not directory.exists():
+        await create_synthetic_management_repo(directory=directory, pkgbase_count=pkgbase_count)
+
+    return directory / "management"
+
+
 @fixture(scope="function")
 def outputpackagebasev1_json_files_in_dir(
     tmp_path: Path,
@@ -1661,6 +1982,15 @@ def outputpackagebasev1_json_files_in_dir(
     return management_dir
 
 
+@fixture(scope="function")
+def short_switch_interval() -> Generator[None, None, None]:
+    """Set a short thread switch interval function-wide, so that races between threads are more likely to occur."""
+    switch_interval = getswitchinterval()
+    setswitchinterval(1e-6)
+    yield
+    setswitchinterval(switch_interval)
+
+
 @fixture(scope="function")
 def empty_dir(tmp_path: Path) -> Path:
     """Return a Path function-wide, representing an empty directory."""
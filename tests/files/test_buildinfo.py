@@ -5,11 +5,13 @@ from pathlib import Path
 from random import sample
 from re import Match, fullmatch
 from tempfile import TemporaryDirectory
-from typing import ContextManager
+from time import perf_counter
+from typing import Any, ContextManager
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError, constr
 from pytest import mark, raises
 
+from repod.common import regex
 from repod.common.enums import (
     ArchitectureEnum,
     tar_compression_types_for_filename_regex,
@@ -98,6 +100,18 @@ def test_installed(installed: list[str], expectation: ContextManager[str]) -> No
         buildinfo.Installed(installed=installed)
 
 
+def test_installed_many() -> None:
+    """Tests for repod.files.buildinfo.Installed with many entries."""
+    installed = [f"foo{number}-1:1.0.{number}-1-any" for number in range(1000)]
+    assert buildinfo.Installed(installed=installed).installed == installed  # nosec: B101
+
+    with raises(ValidationError, match="foo-1-1-foo"):
+        buildinfo.Installed(installed=installed + ["foo-1-1-foo"] + installed)
+
+    with raises(ValidationError):
+        buildinfo.Installed(installed=["foo-1-1-any\nbar-1-1-any"])
+
+
 def test_installed_as_models(
     default_arch: str,
     default_full_version: str,
@@ -205,6 +219,58 @@ def test_buildinfo_from_file(
         buildinfo.BuildInfo.from_file(data=StringIO(initial_value="foo = bar\n"))
 
 
+def test_buildinfo_from_file_values(buildinfov2_stringio: StringIO) -> None:
+    """Tests for the values of repod.files.buildinfo.BuildInfo.from_file."""
+    model = buildinfo.BuildInfo.from_file(data=buildinfov2_stringio)
+    assert model.builddate == 1  # type: ignore[attr-defined]  # nosec: B101
+    assert model.buildenv == ["check", "color"]  # type: ignore[attr-defined]  # nosec: B101
+    assert model.installed == ["baz-1:1.0.1-1-any", "beh-1:1.0.1-1-any"]  # type: ignore[attr-defined]  # nosec: B101
+    assert model.pkgver == "1:1.0.0-1"  # type: ignore[attr-defined]  # nosec: B101
+
+
+@mark.benchmark
+def test_buildinfo_from_file_benchmark(buildinfov2_stringio: StringIO, benchmark_result: dict[str, Any]) -> None:
+    """Benchmark for repod.files.buildinfo.BuildInfo.from_file with a large list of installed packages.
+
+    The cost of validating the installed packages in a single pass is compared to that of validating each of them
+    separately.
+    """
+
+    class ConstrainedInstalled(BaseModel):
+        installed: list[constr(regex=rf"^{regex.INSTALLED}$")]  # type: ignore[valid-type]  # noqa: F722
+
+    rounds = 100
+    installed = [f"foo{number}-1:1.0.{number}-1-x86_64" for number in range(1000)]
+    data = buildinfov2_stringio.getvalue() + "".join(f"\ninstalled = {entry}" for entry in installed)
+
+    start = perf_counter()
+    for _ in range(rounds):
+        ConstrainedInstalled(installed=installed)
+    separately = (perf_counter() - start) / rounds
+
+    start = perf_counter()
+    for _ in range(rounds):
+        buildinfo.Installed(installed=installed)
+    single_pass = (perf_counter() - start) / rounds
+
+    start = perf_counter()
+    for _ in range(rounds):
+        buildinfo.BuildInfo.from_file(data=StringIO(initial_value=data))
+    from_file = (perf_counter() - start) / rounds
+
+    print(
+        f"\nvalidating {len(installed)} installed packages: {separately * 1e3:.2f}ms (separately), "
+        f"{single_pass * 1e3:.2f}ms (single pass)\n"
+        f"BuildInfo.from_file with {len(installed)} installed packages: {from_file * 1e3:.2f}ms"
+    )
+    benchmark_result.update(
+        installed_count=len(installed),
+        rounds=rounds,
+        seconds={"from_file": from_file, "separately": separately, "single_pass": single_pass},
+    )
+    assert single_pass < separately  # nosec: B101
+
+
 def test_buildinfov2_validate_devtools_version(
     default_full_version: str,
     default_invalid_full_version: str,
@@ -1,14 +1,18 @@
 """Tests for repod.files.common."""
 from contextlib import nullcontext as does_not_raise
-from io import StringIO
+from gzip import decompress as gzip_decompress
+from hashlib import md5, sha256
+from io import SEEK_END, BytesIO, StringIO
+from os import urandom
 from pathlib import Path
-from tarfile import TarFile
-from typing import ContextManager
+from tarfile import TarFile, TarInfo
+from time import perf_counter
+from typing import Any, ContextManager, Literal
 from unittest.mock import patch
 
-from pytest import mark, raises
+from pytest import MonkeyPatch, mark, raises
 
-from repod.common.enums import CompressionTypeEnum
+from repod.common.enums import CompressionTypeEnum, FilePlacementEnum
 from repod.errors import RepoManagementFileError, RepoManagementFileNotFoundError
 from repod.files import common
 
@@ -75,6 +79,56 @@ def test_open_tarfile_sync_db_file(
             assert isinstance(tarfile_file, TarFile)  # nosec: B101
 
 
+@mark.parametrize(
+    "compression, level, workers",
+    [
+        (CompressionTypeEnum.NONE, None, 1),
+        (CompressionTypeEnum.BZIP2, 1, 1),
+        (CompressionTypeEnum.GZIP, 1, 1),
+        (CompressionTypeEnum.GZIP, 1, 2),
+        (CompressionTypeEnum.GZIP, None, None),
+        (CompressionTypeEnum.LZMA, 0, 1),
+        (CompressionTypeEnum.ZSTANDARD, 19, 1),
+        (CompressionTypeEnum.ZSTANDARD, None, 2),
+        (CompressionTypeEnum.ZSTANDARD, None, None),
+    ],
+)
+def test_open_tarfile_write(
+    compression: CompressionTypeEnum,
+    level: int | None,
+    workers: int | None,
+    tmp_path: Path,
+) -> None:
+    """Tests for writing files using repod.files.common.open_tarfile with compression level and workers."""
+    path = tmp_path / f"foo.tar.{compression.value}"
+    data = b"foo" * 100000
+    with common.open_tarfile(path=path, compression=compression, mode="w", level=level, workers=workers) as tar_file:
+        if compression == CompressionTypeEnum.GZIP and workers != 1:
+            assert isinstance(tar_file, common.ParallelGzipTarFile)  # nosec: B101
+        tarinfo = TarInfo("foo")
+        tarinfo.size = len(data)
+        tar_file.addfile(tarinfo, BytesIO(data))
+
+    with common.open_tarfile(path=path) as tar_file:
+        assert tar_file.extractfile("foo").read() == data  # type: ignore[union-attr]  # nosec: B101
+
+
+@mark.parametrize("mode, level, size", [("w", None, 0), ("w", 1, 1), ("x", 6, 1024 * 1024)])
+def test_parallelgzipfile(mode: Literal["w", "x"], level: int | None, size: int, tmp_path: Path) -> None:
+    """Tests for repod.files.common.ParallelGzipFile."""
+    path = tmp_path / "foo.gz"
+    data = urandom(size // 2) + b"foo" * (size // 6)
+    with common.ParallelGzipFile(path=path, mode=mode, level=level, workers=2, block_size=64 * 1024) as gzip_file:
+        assert gzip_file.writable()  # nosec: B101
+        for start in range(0, len(data), 1000):
+            end = start + 1000
+            gzip_file.write(data[start:end])
+        assert gzip_file.tell() == len(data)  # nosec: B101
+    gzip_file.close()
+
+    assert gzip_decompress(path.read_bytes()) == data  # nosec: B101
+
+
 def test_open_tarfile_relative_path() -> None:
     """Tests for opening relative paths using repod.files.common.open_tarfile."""
     with raises(RepoManagementFileError):
@@ -124,6 +178,48 @@ def test_zstdtarfile_raises(zst_file: Path) -> None:
             common.ZstdTarFile(name=zst_file, mode="r")
 
 
+@mark.parametrize(
+    "chunk_size, reads",
+    [
+        (1, []),
+        (3, [(0, 10), (5, 10), (0, 2)]),
+        (1024, [(100, 10), (0, 50), (-10, -1)]),
+        (common.DIGEST_CHUNK_SIZE, [(0, -1), (0, -1)]),
+    ],
+)
+def test_digestreader(chunk_size: int, reads: list[tuple[int, int]], tmp_path: Path) -> None:
+    """Tests for repod.files.common.DigestReader."""
+    data = bytes(range(256)) * 64
+    path = tmp_path / "file"
+    path.write_bytes(data)
+
+    with common.DigestReader(path=path, chunk_size=chunk_size) as reader:
+        assert reader.readable() and reader.seekable()  # nosec: B101
+        assert reader.name == str(path)  # nosec: B101
+        for offset, size in reads:
+            if offset < 0:
+                position = reader.seek(offset, SEEK_END)
+            else:
+                position = reader.seek(offset)
+            assert reader.tell() == position  # nosec: B101
+            end = position + size if size > 0 else len(data)
+            assert reader.read(size) == data[position:end]  # nosec: B101
+        assert reader.digests() == (md5(data).hexdigest(), sha256(data).hexdigest())  # nosec: B101, B324
+
+
+def test_open_tarfile_with_digestreader(default_package_file: tuple[Path, ...]) -> None:
+    """Tests for reading a package file using a DigestReader with repod.files.common.open_tarfile."""
+    data = default_package_file[0].read_bytes()
+    with common.DigestReader(path=default_package_file[0]) as reader:
+        with common.open_tarfile(
+            path=default_package_file[0],
+            fileobj=reader,  # type: ignore[arg-type]
+        ) as tarfile:
+            assert ".PKGINFO" in tarfile.getnames()  # nosec: B101
+            assert tarfile.extractfile(".PKGINFO") is not None  # nosec: B101
+        assert reader.digests() == (md5(data).hexdigest(), sha256(data).hexdigest())  # nosec: B101, B324
+
+
 @mark.parametrize(
     "file_type, expectation",
     [
@@ -171,6 +267,97 @@ def test_compression_type_of_tarfile(
         assert common.compression_type_of_tarfile(path=path) == result  # nosec: B101
 
 
+@mark.parametrize(
+    "data, result",
+    [
+        (b"BZh91AY&SY", CompressionTypeEnum.BZIP2),
+        (b"\x1f\x8b\x08\x00", CompressionTypeEnum.GZIP),
+        (b"\xfd7zXZ\x00\x00\x04", CompressionTypeEnum.LZMA),
+        (b"\x28\xb5\x2f\xfd\x00", CompressionTypeEnum.ZSTANDARD),
+        (b"\x00" * 257 + b"ustar\x0000", CompressionTypeEnum.NONE),
+        (b"\x00" * 257 + b"ustar  \x00", CompressionTypeEnum.NONE),
+        (b"\x00" * 257 + b"foo", None),
+        (b"foo", None),
+        (b"", None),
+    ],
+)
+def test_compression_type_from_magic_number(data: bytes, result: CompressionTypeEnum | None) -> None:
+    """Tests for repod.files.common.compression_type_from_magic_number."""
+    assert common.compression_type_from_magic_number(data=data) == result  # nosec: B101
+
+
+@mark.parametrize(
+    "file_type, expectation",
+    [
+        (".bz2", does_not_raise()),
+        (".gz", does_not_raise()),
+        (".tar", does_not_raise()),
+        (".txt", raises(RepoManagementFileError)),
+        (".xz", does_not_raise()),
+        (".zst", does_not_raise()),
+    ],
+)
+def test_compression_type_from_libmagic(
+    file_type: str,
+    expectation: ContextManager[str],
+    bz2_file: Path,
+    gz_file: Path,
+    tar_file: Path,
+    text_file: Path,
+    xz_file: Path,
+    zst_file: Path,
+) -> None:
+    """Tests for repod.files.common.compression_type_from_libmagic."""
+    paths = {
+        ".bz2": (bz2_file, CompressionTypeEnum.BZIP2),
+        ".gz": (gz_file, CompressionTypeEnum.GZIP),
+        ".tar": (tar_file, CompressionTypeEnum.NONE),
+        ".txt": (text_file, None),
+        ".xz": (xz_file, CompressionTypeEnum.LZMA),
+        ".zst": (zst_file, CompressionTypeEnum.ZSTANDARD),
+    }
+    path, result = paths[file_type]
+    with expectation:
+        assert common.compression_type_from_libmagic(path=path, data=path.read_bytes()[:2048]) == result  # nosec: B101
+
+
+@mark.benchmark
+def test_compression_type_of_tarfile_benchmark(
+    bz2_file: Path,
+    gz_file: Path,
+    tar_file: Path,
+    xz_file: Path,
+    zst_file: Path,
+    benchmark_result: dict[str, Any],
+) -> None:
+    """Benchmark for repod.files.common.compression_type_of_tarfile.
+
+    The per-file cost of detecting the compression type using magic numbers is compared to that of using libmagic.
+    """
+    paths = [bz2_file, gz_file, tar_file, xz_file, zst_file]
+    rounds = 200
+
+    start = perf_counter()
+    for _ in range(rounds):
+        for path in paths:
+            with open(path, "rb") as f:
+                common.compression_type_from_libmagic(path=path, data=f.read(2048))
+    libmagic = (perf_counter() - start) / (rounds * len(paths))
+
+    start = perf_counter()
+    for _ in range(rounds):
+        for path in paths:
+            common.compression_type_of_tarfile(path=path)
+    magic_number = (perf_counter() - start) / (rounds * len(paths))
+
+    print(
+        f"\ncompression_type_of_tarfile per file: {libmagic * 1e6:.1f}us (libmagic), "
+        f"{magic_number * 1e6:.1f}us (magic numbers)"
+    )
+    benchmark_result.update(rounds=rounds, seconds={"libmagic": libmagic, "magic_number": magic_number})
+    assert magic_number < libmagic  # nosec: B101
+
+
 @mark.parametrize(
     "names, expectation",
     [
@@ -190,6 +377,42 @@ def test_names_in_tarfile(
         assert common.names_in_tarfile(tarfile=tarfile, names=names) is expectation  # nosec: B101
 
 
+@mark.parametrize(
+    "names, result",
+    [
+        ({".BUILDINFO", ".MTREE", ".PKGINFO"}, {".BUILDINFO", ".MTREE", ".PKGINFO"}),
+        ([".PKGINFO", "foo"], {".PKGINFO"}),
+        (["empty_dir"], set()),
+        (set(), set()),
+    ],
+)
+def test_read_files_from_tarfile(
+    names: list[str] | set[str],
+    result: set[str],
+    default_package_file: tuple[Path, ...],
+) -> None:
+    """Tests for repod.files.common.read_files_from_tarfile."""
+    with common.open_tarfile(path=default_package_file[0]) as tarfile:
+        files = common.read_files_from_tarfile(tarfile=tarfile, names=names)
+        assert set(files.keys()) == result  # nosec: B101
+        for name, data in files.items():
+            assert data == tarfile.extractfile(name).read()  # type: ignore[union-attr]  # nosec: B101
+
+
+def test_read_files_from_tarfile_stops_early(tmp_path: Path) -> None:
+    """Tests that repod.files.common.read_files_from_tarfile stops reading once all files are found."""
+    path = tmp_path / "file.tar"
+    with TarFile.open(name=path, mode="w") as tarfile:
+        for name in ["first", "second", "third"]:
+            file = tmp_path / name
+            file.write_text(name)
+            tarfile.add(file, arcname=name)
+
+    with common.open_tarfile(path=path) as tarfile:
+        assert common.read_files_from_tarfile(tarfile=tarfile, names=["first"]) == {"first": b"first"}  # nosec: B101
+        assert [member.name for member in tarfile.members] == ["first"]  # type: ignore[attr-defined]  # nosec: B101
+
+
 @mark.parametrize(
     "as_string, exists, expectation",
     [
@@ -215,3 +438,146 @@ def test_read_text_from_file(
 
     with expectation:
         assert isinstance(common.read_text_from_file(path=path), StringIO)  # nosec: B101
+
+
+@mark.parametrize(
+    "placement, destination_exists, expectation",
+    [
+        (FilePlacementEnum.COPY, False, does_not_raise()),
+        (FilePlacementEnum.COPY, True, does_not_raise()),
+        (FilePlacementEnum.REFLINK, False, does_not_raise()),
+        (FilePlacementEnum.REFLINK, True, does_not_raise()),
+        (FilePlacementEnum.HARDLINK, False, does_not_raise()),
+        (FilePlacementEnum.HARDLINK, True, does_not_raise()),
+    ],
+)
+def test_place_file(
+    placement: FilePlacementEnum,
+    destination_exists: bool,
+    expectation: ContextManager[str],
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.files.common.place_file."""
+    source = tmp_path / "source"
+    source.write_bytes(urandom(1024))
+    source.chmod(0o640)
+    destination = tmp_path / "destination"
+    if destination_exists:
+        destination.write_text("foo")
+
+    with expectation:
+        common.place_file(source=source, destination=destination, placement=placement)
+        assert destination.read_bytes() == source.read_bytes()  # nosec: B101
+        assert destination.stat().st_mode == source.stat().st_mode  # nosec: B101
+        assert destination.stat().st_mtime == source.stat().st_mtime  # nosec: B101
+        if placement == FilePlacementEnum.HARDLINK:
+            assert source.stat().st_nlink == 2  # nosec: B101
+        else:
+            assert source.stat().st_nlink == 1  # nosec: B101
+
+
+@mark.parametrize("placement", [FilePlacementEnum.REFLINK, FilePlacementEnum.HARDLINK])
+def test_place_file_same_file(placement: FilePlacementEnum, tmp_path: Path) -> None:
+    """Tests for repod.files.common.place_file with source and destination being the same file."""
+    source = tmp_path / "source"
+    source.write_text("foo")
+    destination = tmp_path / "destination"
+    destination.hardlink_to(source)
+
+    with raises(OSError):
+        common.place_file(source=source, destination=destination, placement=placement)
+    assert source.read_text() == "foo"  # nosec: B101
+
+
+@mark.parametrize(
+    "placement, reflink, hardlink, in_kernel, calls",
+    [
+        (FilePlacementEnum.REFLINK, True, True, True, ["reflink"]),
+        (FilePlacementEnum.REFLINK, False, True, True, ["reflink", "in_kernel"]),
+        (FilePlacementEnum.REFLINK, False, True, False, ["reflink", "in_kernel", "copy2"]),
+        (FilePlacementEnum.HARDLINK, False, True, True, ["reflink", "hardlink"]),
+        (FilePlacementEnum.HARDLINK, False, False, True, ["reflink", "hardlink", "in_kernel"]),
+        (FilePlacementEnum.HARDLINK, False, False, False, ["reflink", "hardlink", "in_kernel", "copy2"]),
+    ],
+)
+def test_place_file_fallback(
+    placement: FilePlacementEnum,
+    reflink: bool,
+    hardlink: bool,
+    in_kernel: bool,
+    calls: list[str],
+    tmp_path: Path,
+) -> None:
+    """Tests for the fallback strategies of repod.files.common.place_file."""
+    source = tmp_path / "source"
+    source.write_text("foo")
+    destination = tmp_path / "destination"
+    called: list[str] = []
+
+    def record(name: str, result: bool) -> Any:
+        def function(source: Path, destination: Path) -> bool:
+            called.append(name)
+            if result:
+                destination.write_bytes(source.read_bytes())
+            return result
+
+        return function
+
+    with (
+        patch("repod.files.common.reflink_file", side_effect=record("reflink", reflink)),
+        patch("repod.files.common.hardlink_file", side_effect=record("hardlink", hardlink)),
+        patch("repod.files.common.copy_file_in_kernel", side_effect=record("in_kernel", in_kernel)),
+        patch("repod.files.common.copy2", side_effect=lambda **_: called.append("copy2")),
+    ):
+        common.place_file(source=source, destination=destination, placement=placement)
+
+    assert called == calls  # nosec: B101
+
+
+def test_reflink_file(tmp_path: Path) -> None:
+    """Tests for repod.files.common.reflink_file."""
+    source = tmp_path / "source"
+    source.write_text("foo")
+    destination = tmp_path / "destination"
+
+    if common.reflink_file(source=source, destination=destination):
+        assert destination.read_text() == "foo"  # nosec: B101
+    else:
+        assert not destination.exists()  # nosec: B101
+
+    destination.write_text("bar")
+    assert not common.reflink_file(source=source, destination=destination)  # nosec: B101
+    assert destination.read_text() == "bar"  # nosec: B101
+
+
+def test_hardlink_file(tmp_path: Path) -> None:
+    """Tests for repod.files.common.hardlink_file."""
+    source = tmp_path / "source"
+    source.write_text("foo")
+    destination = tmp_path / "destination"
+
+    assert common.hardlink_file(source=source, destination=destination)  # nosec: B101
+    assert destination.samefile(source)  # nosec: B101
+    assert not common.hardlink_file(source=source, destination=destination)  # nosec: B101
+
+
+def test_copy_file_in_kernel(tmp_path: Path) -> None:
+    """Tests for repod.files.common.copy_file_in_kernel."""
+    source = tmp_path / "source"
+    source.write_bytes(urandom(1024 * 1024))
+    destination = tmp_path / "destination"
+
+    if common.copy_file_in_kernel(source=source, destination=destination):
+        assert destination.read_bytes() == source.read_bytes()  # nosec: B101
+        assert not destination.samefile(source)  # nosec: B101
+    else:
+        assert not destination.exists()  # nosec: B101
+
+    with patch("os.copy_file_range", side_effect=OSError("error")):
+        assert not common.copy_file_in_kernel(source=source, destination=tmp_path / "other")  # nosec: B101
+    assert not (tmp_path / "other").exists()  # nosec: B101
+    with MonkeyPatch.context() as monkeypatch:
+        monkeypatch.delattr("os.copy_file_range", raising=False)
+        assert not common.copy_file_in_kernel(source=source, destination=tmp_path / "other")  # nosec: B101
+    assert not (tmp_path / "other").exists()  # nosec: B101
+    assert not common.copy_file_in_kernel(source=source, destination=destination)  # nosec: B101
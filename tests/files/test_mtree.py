@@ -1,21 +1,26 @@
 """Tests for repod.files.mtree."""
+import gzip
 from contextlib import nullcontext as does_not_raise
 from io import StringIO
+from json import loads
 from logging import DEBUG
 from pathlib import Path
 from random import choice, randrange, sample
 from re import Match, fullmatch
 from string import ascii_lowercase, digits
 from tempfile import TemporaryDirectory
-from typing import ContextManager
+from time import perf_counter
+from typing import Any, ContextManager
 
 from pydantic import ValidationError
 from pytest import LogCaptureFixture, mark, raises
 
 from repod.common.enums import tar_compression_types_for_filename_regex
-from repod.errors import RepoManagementValidationError
+from repod.common.regex import fullmatch_list
+from repod.errors import RepoManagementFileError, RepoManagementValidationError
 from repod.files import mtree
 from repod.files.common import extract_file_from_tarfile, open_tarfile
+from tests.conftest import create_synthetic_mtree, create_synthetic_package_files
 
 
 @mark.parametrize(
@@ -409,9 +414,115 @@ def test_mtreefilev1_get_type() -> None:
     )
 
 
-def test_mtree_get_paths(valid_mtree: mtree.MTree) -> None:
-    """Tests for repod.files.mtree.MTreeEntryV1.get_paths."""
-    assert valid_mtree.get_paths()  # nosec: B101
+@mark.parametrize("show_all", [(True), (False)])
+def test_mtree_get_paths(show_all: bool, valid_mtree: mtree.MTree) -> None:
+    """Tests for repod.files.mtree.MTree.get_paths."""
+    paths = valid_mtree.get_paths(show_all=show_all)
+    assert paths == [  # nosec: B101
+        entry.get_file_path()
+        for entry in valid_mtree.iter_entries()
+        if show_all or entry.name not in mtree.MTREE_INTERNAL_FILE_NAMES
+    ]
+    assert (Path("/.PKGINFO") in paths) is show_all  # nosec: B101
+
+
+def test_mtree_from_entries(
+    mtreeentryv1_dir: mtree.MTreeEntryV1,
+    mtreeentryv1_file: mtree.MTreeEntryV1,
+    mtreeentryv1_link: mtree.MTreeEntryV1,
+) -> None:
+    """Tests for repod.files.mtree.MTree.from_entries and repod.files.mtree.MTree.iter_entries."""
+    entries = [mtreeentryv1_dir, mtreeentryv1_file, mtreeentryv1_link]
+    model = mtree.MTree.from_entries(entries=entries)
+
+    assert list(model.iter_entries()) == entries  # nosec: B101
+    assert model.entries == entries  # nosec: B101
+    assert model.dict() == {"entries": [entry.dict() for entry in entries]}  # nosec: B101
+
+
+def test_mtree_serialization(valid_mtree: mtree.MTree) -> None:
+    """Tests for the dict, JSON and JSON schema representations of repod.files.mtree.MTree."""
+    assert mtree.MTree.parse_obj(valid_mtree.dict()) == valid_mtree  # nosec: B101
+    assert mtree.MTree.parse_raw(valid_mtree.json()) == valid_mtree  # nosec: B101
+    assert mtree.MTree(entries=valid_mtree.entries).entries == valid_mtree.entries  # nosec: B101
+    assert loads(valid_mtree.json()) == valid_mtree.dict()  # nosec: B101
+    assert mtree.MTree.parse_obj({"entries": []}).entries == []  # nosec: B101
+
+    schema = mtree.MTree.schema()
+    assert schema["properties"] == {  # nosec: B101
+        "entries": {"title": "Entries", "type": "array", "items": mtree.MTreeEntryV1.schema()}
+    }
+    assert schema["required"] == ["entries"]  # nosec: B101
+
+
+@mark.parametrize(
+    "data",
+    [
+        ({}),
+        ({"entries": [{"name": "/foo"}]}),
+        ({"entries": "foo"}),
+    ],
+)
+def test_mtree_parse_obj_raises(data: dict[str, Any]) -> None:
+    """Tests for repod.files.mtree.MTree.parse_obj with invalid data."""
+    with raises(ValidationError):
+        mtree.MTree.parse_obj(data)
+
+
+@mark.parametrize(
+    "mode, expectation",
+    [
+        ("644", does_not_raise()),
+        ("0644", does_not_raise()),
+        ("4755", does_not_raise()),
+        ("4", raises(RepoManagementValidationError)),
+        ("44", raises(RepoManagementValidationError)),
+        ("00644", raises(RepoManagementValidationError)),
+        ("0648", raises(RepoManagementValidationError)),
+    ],
+)
+def test_mtree_from_entries_mode(mode: str, expectation: ContextManager[str]) -> None:
+    """Tests for the file modes of repod.files.mtree.MTree.from_columns and repod.files.mtree.MTree.iter_entries."""
+    with expectation:
+        model = mtree.MTree.from_columns(
+            names=["/foo"],
+            links={},
+            types=["file"],
+            modes=[mode],
+            uids=[0],
+            gids=[0],
+            sizes=[0],
+            times=[200],
+            md5s=[None],
+            sha256s=[None],
+        )
+        assert [entry.mode for entry in model.iter_entries()] == [mode]  # nosec: B101
+
+
+def test_mtree_from_file_entries(mtreeentryv1_stringio: StringIO) -> None:
+    """Tests for the entries of repod.files.mtree.MTree.from_file."""
+    entries = list(mtree.MTree.from_file(data=mtreeentryv1_stringio).iter_entries())
+
+    assert len(entries) == 15  # nosec: B101
+    assert entries[0] == mtree.MTreeEntryV1(  # nosec: B101
+        gid=0,
+        link=None,
+        md5="f712adf35b8a74755b3a93997b05793c",
+        mode="0644",
+        name="/.BUILDINFO",
+        sha256="ed4e5855da200753eaf00cd584f017bef6910c09f70d72e4a642515312919804",
+        size=5651,
+        time=1651787473.0,
+        type_="file",
+        uid=0,
+    )
+    assert entries[3].type_ == "dir"  # nosec: B101
+    assert entries[3].mode == "0755"  # nosec: B101
+    assert entries[3].md5 is None  # nosec: B101
+    assert entries[3].size is None  # nosec: B101
+    assert entries[6].mode == "0044"  # nosec: B101
+    assert entries[12].get_link_path() == Path("/etc/foo.conf.d/override.conf")  # nosec: B101
+    assert entries[13].mode == "0066"  # nosec: B101
 
 
 @mark.parametrize("valid, expectation", [(True, does_not_raise()), (False, raises(RepoManagementValidationError))])
@@ -434,6 +545,97 @@ def test_mtree_from_file(
         assert isinstance(mtree.MTree.from_file(data=data), mtree.MTree)  # nosec: B101
 
 
+def test_mtree_links_regex() -> None:
+    """Tests for repod.files.mtree.MTREE_LINKS_REGEX."""
+    assert fullmatch_list(regex=mtree.MTREE_LINKS_REGEX, values=["/foo", "foo", "../foo"])  # nosec: B101
+    assert not fullmatch_list(regex=mtree.MTREE_LINKS_REGEX, values=["/foo"] * 100 + ["/äüö"])  # nosec: B101
+
+
+def test_mtree_from_gzip(valid_mtree_file: Path, mtreeentryv1_stringio: StringIO) -> None:
+    """Tests for repod.files.mtree.MTree.from_gzip."""
+    model = mtree.MTree.from_gzip(data=valid_mtree_file.read_bytes())
+    assert model._names is None  # nosec: B101
+    assert model._types is None  # nosec: B101
+
+    assert model.get_paths() == mtree.MTree.from_file(data=mtreeentryv1_stringio).get_paths()  # nosec: B101
+    assert model._names is not None  # nosec: B101
+    assert model._types is None  # nosec: B101
+
+    mtreeentryv1_stringio.seek(0)
+    assert model.entries == mtree.MTree.from_file(data=mtreeentryv1_stringio).entries  # nosec: B101
+    assert model._types is not None  # nosec: B101
+
+
+@mark.parametrize(
+    "data, expectation",
+    [
+        (gzip.compress(b"#mtree\n./foo type=file uid=0 gid=0 mode=644 time=1.0\n"), does_not_raise()),
+        (
+            gzip.compress(b"#mtree\n./f\xc3\xb6 type=file uid=0 gid=0 mode=644 time=1.0\n"),
+            raises(RepoManagementValidationError),
+        ),
+        (b"foo", raises(RepoManagementFileError)),
+        (None, raises(RuntimeError)),
+    ],
+)
+def test_mtree_parse_names(data: bytes | None, expectation: ContextManager[str]) -> None:
+    """Tests for repod.files.mtree.MTree.parse_names."""
+    model = mtree.MTree.construct() if data is None else mtree.MTree.from_gzip(data=data)
+    with expectation:
+        model.parse_names()
+        assert model._names == ["/foo"]  # nosec: B101
+
+
+@mark.parametrize(
+    "data, expectation",
+    [
+        (gzip.compress(b"#mtree\n./foo type=file uid=0 gid=0 mode=644 time=1.0\n"), does_not_raise()),
+        (
+            gzip.compress(b"#mtree\n./foo type=file uid=0 gid=2000 mode=644 time=1.0\n"),
+            raises(RepoManagementValidationError),
+        ),
+        (b"foo", raises(RepoManagementFileError)),
+        (None, raises(RuntimeError)),
+    ],
+)
+def test_mtree_parse(data: bytes | None, expectation: ContextManager[str]) -> None:
+    """Tests for repod.files.mtree.MTree.parse."""
+    model = mtree.MTree.construct() if data is None else mtree.MTree.from_gzip(data=data)
+    with expectation:
+        model.parse()
+        assert [entry.name for entry in model.iter_entries()] == ["/foo"]  # nosec: B101
+        assert model._data is None  # nosec: B101
+
+
+@mark.benchmark
+@mark.parametrize("file_count", [1000, 20000])
+def test_mtree_from_file_benchmark(file_count: int, benchmark_result: dict[str, Any]) -> None:
+    """Benchmark for repod.files.mtree.MTree.from_file with the .MTREE files of synthetic packages of varying size."""
+    rounds = 5
+    data = create_synthetic_mtree(files=create_synthetic_package_files(name="foo", file_count=file_count, file_size=16))
+    compressed_data = gzip.compress(data.encode())
+
+    start = perf_counter()
+    for _ in range(rounds):
+        mtree.MTree.from_file(data=StringIO(initial_value=data))
+    from_file = (perf_counter() - start) / rounds
+
+    start = perf_counter()
+    for _ in range(rounds):
+        mtree.MTree.from_gzip(data=compressed_data).parse()
+    from_gzip = (perf_counter() - start) / rounds
+
+    benchmark_result.update(
+        file_count=file_count,
+        rounds=rounds,
+        seconds={"from_file": from_file, "from_gzip": from_gzip},
+    )
+    print(
+        f"\nMTree with {file_count} files: {from_file * 1e3:.2f}ms (from_file), "
+        f"{from_gzip * 1e3:.2f}ms (from_gzip and parse)"
+    )
+
+
 def test_export_schemas() -> None:
     """Tests for repod.files.mtree.export_schemas."""
     with TemporaryDirectory() as tmp:
@@ -1,13 +1,22 @@
 """Tests for repod.files.package."""
+import os
+import pickle  # nosec: B403
 from contextlib import nullcontext as does_not_raise
+from gzip import BadGzipFile
+from hashlib import md5, sha256
+from json import loads
 from logging import DEBUG
 from pathlib import Path
-from typing import ContextManager
+from time import perf_counter
+from typing import Any, ContextManager
+from unittest.mock import patch
 
 from pytest import LogCaptureFixture, mark, raises
 
+from repod.common.enums import CompressionTypeEnum
 from repod.errors import RepoManagementFileError
 from repod.files import package
+from tests.conftest import create_synthetic_package
 
 
 @mark.parametrize(
@@ -52,6 +61,81 @@ async def test_package_from_file(
         await package.Package.from_file(package=default_sync_db_file[0])
 
 
+async def test_package_from_file_checksums(default_package_file: tuple[Path, ...]) -> None:
+    """Tests for the checksums created by repod.files.package.Package.from_file."""
+    data = default_package_file[0].read_bytes()
+    model = await package.Package.from_file(package=default_package_file[0])
+    assert model.md5sum == md5(data).hexdigest()  # type: ignore[attr-defined]  # nosec: B101, B324
+    assert model.sha256sum == sha256(data).hexdigest()  # type: ignore[attr-defined]  # nosec: B101
+
+
+@mark.parametrize("lazy_mtree", [(True), (False)])
+async def test_package_from_file_lazy_mtree(lazy_mtree: bool, default_package_file: tuple[Path, ...]) -> None:
+    """Tests for repod.files.package.Package.from_file with a lazily parsed .MTREE file."""
+    model = await package.Package.from_file(package=default_package_file[0], lazy_mtree=lazy_mtree)
+    assert (model.mtree._types is None) is lazy_mtree  # type: ignore[attr-defined]  # nosec: B101
+    assert model.mtree.get_paths()  # type: ignore[attr-defined]  # nosec: B101
+    assert (model.mtree._types is None) is lazy_mtree  # type: ignore[attr-defined]  # nosec: B101
+
+
+async def test_package_from_file_invalid_mtree(default_package_file: tuple[Path, ...]) -> None:
+    """Tests for repod.files.package.Package.from_file with an invalid .MTREE file."""
+    with patch("repod.files.mtree.decompress", side_effect=BadGzipFile):
+        with raises(RepoManagementFileError):
+            await package.Package.from_file(package=default_package_file[0])
+
+
+@mark.benchmark
+@mark.parametrize(
+    "compression", [name for name in CompressionTypeEnum], ids=[name.value for name in CompressionTypeEnum]
+)
+@mark.parametrize(
+    "file_count, file_size, installed_count",
+    [(10, 1024, 10), (2000, 4096, 1000)],
+    ids=["small", "large"],
+)
+async def test_package_from_file_benchmark(
+    compression: CompressionTypeEnum,
+    file_count: int,
+    file_size: int,
+    installed_count: int,
+    benchmark_result: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    """Benchmark for repod.files.package.Package.from_file with synthetic packages of varying size and compression."""
+    rounds = 5
+    path = create_synthetic_package(
+        directory=tmp_path,
+        name="foo",
+        compression=compression,
+        file_count=file_count,
+        file_size=file_size,
+        installed_count=installed_count,
+    )
+
+    timings = {}
+    for lazy_mtree in [False, True]:
+        start = perf_counter()
+        for _ in range(rounds):
+            await package.Package.from_file(package=path, lazy_mtree=lazy_mtree)
+        timings["lazy_mtree" if lazy_mtree else "default"] = (perf_counter() - start) / rounds
+
+    benchmark_result.update(
+        compression=compression.value,
+        file_count=file_count,
+        file_size=file_size,
+        installed_count=installed_count,
+        package_size=path.stat().st_size,
+        rounds=rounds,
+        seconds=timings,
+    )
+    print(
+        f"\nPackage.from_file with {file_count} files and {installed_count} installed packages "
+        f"({compression.value or 'uncompressed'}, {path.stat().st_size} bytes): {timings['default'] * 1e3:.2f}ms "
+        f"(default), {timings['lazy_mtree'] * 1e3:.2f}ms (lazy_mtree)"
+    )
+
+
 async def test_packagev1_top_level_dict(
     caplog: LogCaptureFixture,
     packagev1: package.PackageV1,
@@ -65,13 +149,252 @@ async def test_packagev1_top_level_dict(
     assert len({"csize", "filename", "md5sum", "pgpsig", "sha256sum"} - keys) == 0  # nosec: B101
 
 
+def test_packagev1_serialization(packagev1: package.PackageV1) -> None:
+    """Tests for the MTree in the dict and JSON representations of repod.files.package.PackageV1."""
+    assert package.PackageV1.parse_obj(packagev1.dict()).mtree == packagev1.mtree  # nosec: B101
+    assert package.PackageV1.parse_raw(packagev1.json()).mtree == packagev1.mtree  # nosec: B101
+    assert loads(packagev1.json())["mtree"] == packagev1.mtree.dict()  # nosec: B101
+
+
 def test_export_schemas(tmp_path: Path) -> None:
     """Tests for repod.files.package.export_schemas."""
     package.export_schemas(output=str(tmp_path))
     package.export_schemas(output=tmp_path)
+    schema = loads((tmp_path / "PackageV1.json").read_text())
+    assert list(schema["definitions"]["MTree"]["properties"]) == ["entries"]  # nosec: B101
 
     with raises(RuntimeError):
         package.export_schemas(output="/foobar")
 
     with raises(RuntimeError):
         package.export_schemas(output=Path("/foobar"))
+
+
+@mark.parametrize("with_signature", [(True), (False)])
+async def test_package_from_file_with_cache(
+    with_signature: bool,
+    default_package_file: tuple[Path, ...],
+    tmp_path: Path,
+    caplog: LogCaptureFixture,
+) -> None:
+    """Tests for repod.files.package.Package.from_file using a PackageCache."""
+    caplog.set_level(DEBUG)
+
+    cache = package.PackageCache(directory=tmp_path / "cache", max_size=1024 * 1024 * 1024)
+    signature = default_package_file[1] if with_signature else None
+
+    model = await package.Package.from_file(package=default_package_file[0], signature=signature, cache=cache)
+    assert cache.entry_path(package=default_package_file[0]).exists()  # nosec: B101
+
+    with patch("repod.files.package.open_tarfile") as open_tarfile_mock:
+        cached_model = await package.Package.from_file(
+            package=default_package_file[0],
+            signature=signature,
+            cache=cache,
+        )
+        open_tarfile_mock.assert_not_called()
+
+    assert cached_model == model  # nosec: B101
+
+
+async def test_package_from_file_with_cache_invalid_mtree(
+    default_package_file: tuple[Path, ...],
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.files.package.Package.from_file using a PackageCache with an unreadable cached .MTREE file."""
+    cache = package.PackageCache(directory=tmp_path / "cache", max_size=1024 * 1024 * 1024)
+    await package.Package.from_file(package=default_package_file[0], cache=cache, lazy_mtree=True)
+
+    with patch("repod.files.mtree.MTree.parse", side_effect=RepoManagementFileError("ERROR")):
+        with raises(RepoManagementFileError, match=str(default_package_file[0])):
+            await package.Package.from_file(package=default_package_file[0], cache=cache)
+
+
+@mark.parametrize(
+    "verify_checksum, entry_data, checksum_matches, return_none",
+    [
+        (False, None, True, False),
+        (True, None, True, False),
+        (True, None, False, True),
+        (False, b"foo", True, True),
+        (False, pickle.dumps("foo"), True, True),
+    ],
+)
+def test_packagecache_get(
+    verify_checksum: bool,
+    entry_data: bytes | None,
+    checksum_matches: bool,
+    return_none: bool,
+    packagev1: package.PackageV1,
+    default_package_file: tuple[Path, ...],
+    tmp_path: Path,
+    caplog: LogCaptureFixture,
+) -> None:
+    """Tests for repod.files.package.PackageCache.get."""
+    caplog.set_level(DEBUG)
+
+    cache = package.PackageCache(directory=tmp_path, max_size=1024 * 1024, verify_checksum=verify_checksum)
+    path = default_package_file[0]
+    assert cache.get(package=path) is None  # nosec: B101
+
+    sha256sum = sha256(path.read_bytes()).hexdigest() if checksum_matches else "0" * 64
+    cache.put(package=path, model=packagev1.copy(update={"sha256sum": sha256sum}))
+    if entry_data is not None:
+        cache.entry_path(package=path).write_bytes(entry_data)
+
+    model = cache.get(package=path)
+    if return_none:
+        assert model is None  # nosec: B101
+        assert not cache.entry_path(package=path).exists()  # nosec: B101
+    else:
+        assert model == packagev1.copy(update={"pgpsig": None, "sha256sum": sha256sum})  # nosec: B101
+
+
+@mark.parametrize("lazy_mtree", [(True), (False)])
+def test_packagecache_get_package(
+    lazy_mtree: bool,
+    packagev1: package.PackageV1,
+    default_package_file: tuple[Path, ...],
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.files.package.PackageCache.get_package."""
+    cache = package.PackageCache(directory=tmp_path, max_size=1024 * 1024)
+    path = default_package_file[0]
+    assert cache.get_package(package=path, pgpsig="foo", lazy_mtree=lazy_mtree) is None  # nosec: B101
+
+    cache.put(package=path, model=packagev1)
+    with patch("repod.files.mtree.MTree.parse") as parse_mock:
+        model = cache.get_package(package=path, pgpsig="foo", lazy_mtree=lazy_mtree)
+        assert parse_mock.called != lazy_mtree  # nosec: B101
+
+    assert model == packagev1.copy(update={"pgpsig": "foo"})  # nosec: B101
+
+
+def test_parse_mtree(default_package_file: tuple[Path, ...], packagev1: package.PackageV1) -> None:
+    """Tests for repod.files.package.parse_mtree."""
+    package.parse_mtree(package=default_package_file[0], mtree=packagev1.mtree)
+
+    with patch("repod.files.mtree.MTree.parse", side_effect=RepoManagementFileError("ERROR")):
+        with raises(RepoManagementFileError, match=str(default_package_file[0])):
+            package.parse_mtree(package=default_package_file[0], mtree=packagev1.mtree)
+
+
+@mark.parametrize(
+    "directory_mode, entry_mode, other_uid, return_none",
+    [
+        (0o700, 0o600, False, False),
+        (0o770, 0o600, False, True),
+        (0o707, 0o600, False, True),
+        (0o700, 0o660, False, True),
+        (0o700, 0o606, False, True),
+        (0o700, 0o600, True, True),
+    ],
+)
+def test_packagecache_get_untrusted(
+    directory_mode: int,
+    entry_mode: int,
+    other_uid: bool,
+    return_none: bool,
+    packagev1: package.PackageV1,
+    default_package_file: tuple[Path, ...],
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.files.package.PackageCache.get with untrusted cache directories and entries."""
+    directory = tmp_path / "cache"
+    package.PackageCache(directory=directory, max_size=1024 * 1024).put(
+        package=default_package_file[0], model=packagev1
+    )
+    directory.chmod(directory_mode)
+    cache = package.PackageCache(directory=directory, max_size=1024 * 1024)
+    cache.entry_path(package=default_package_file[0]).chmod(entry_mode)
+
+    with patch("repod.files.package.os.getuid", return_value=os.getuid() + 1 if other_uid else os.getuid()):
+        assert (cache.get(package=default_package_file[0]) is None) == return_none  # nosec: B101
+    assert cache.entry_path(package=default_package_file[0]).exists()  # nosec: B101
+
+
+def test_packagecache_put_untrusted(
+    packagev1: package.PackageV1,
+    default_package_file: tuple[Path, ...],
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.files.package.PackageCache.put with an untrusted cache directory."""
+    directory = tmp_path / "cache"
+    directory.mkdir(mode=0o777)
+    directory.chmod(0o777)
+    cache = package.PackageCache(directory=directory, max_size=1024 * 1024)
+    cache.put(package=default_package_file[0], model=packagev1)
+    assert list(directory.iterdir()) == []  # nosec: B101
+
+
+def test_packagecache_entry_path(default_package_file: tuple[Path, ...], tmp_path: Path) -> None:
+    """Tests for repod.files.package.PackageCache.entry_path."""
+    cache = package.PackageCache(directory=tmp_path, max_size=1)
+    path = default_package_file[0]
+    entry_path = cache.entry_path(package=path)
+    assert entry_path.parent == tmp_path  # nosec: B101
+
+    path.write_bytes(path.read_bytes() + b"\0")
+    assert cache.entry_path(package=path) != entry_path  # nosec: B101
+
+
+def test_packagecache_put_raises(packagev1: package.PackageV1, default_package_file: tuple[Path, ...]) -> None:
+    """Tests for repod.files.package.PackageCache.put with an unwritable cache directory."""
+    cache = package.PackageCache(directory=default_package_file[0] / "cache", max_size=1)
+    cache.put(package=default_package_file[0], model=packagev1)
+    assert not cache.entry_path(package=default_package_file[0]).exists()  # nosec: B101
+
+
+def test_packagecache_put_evict(packagev1: package.PackageV1, tmp_path: Path) -> None:
+    """Tests for repod.files.package.PackageCache.put evicting cache entries."""
+    packages = []
+    for index in range(10):
+        path = tmp_path / f"package{index}"
+        path.write_bytes(b"")
+        packages.append(path)
+
+    cache = package.PackageCache(directory=tmp_path / "cache", max_size=1024 * 1024)
+    cache.put(package=packages[0], model=packagev1)
+    entry_size = cache.entry_path(package=packages[0]).stat().st_size
+    cache.max_size = entry_size * 5
+    os.utime(cache.entry_path(package=packages[0]), ns=(0, 0))
+
+    with patch.object(cache, "get_entries", wraps=cache.get_entries) as get_entries:
+        for index, path in enumerate(packages[1:5], start=1):
+            cache.put(package=path, model=packagev1)
+            os.utime(cache.entry_path(package=path), ns=(index, index))
+        get_entries.assert_not_called()
+
+        cache.put(package=packages[5], model=packagev1)
+        get_entries.assert_called_once()
+
+    assert len(list(cache.directory.iterdir())) == 4  # nosec: B101
+    assert not cache.entry_path(package=packages[0]).exists()  # nosec: B101
+    assert not cache.entry_path(package=packages[1]).exists()  # nosec: B101
+
+
+def test_packagecache_evict(packagev1: package.PackageV1, tmp_path: Path) -> None:
+    """Tests for repod.files.package.PackageCache.evict."""
+    packages = []
+    for index in range(3):
+        path = tmp_path / f"package{index}"
+        path.write_bytes(b"")
+        packages.append(path)
+
+    cache = package.PackageCache(directory=tmp_path / "cache", max_size=1024 * 1024)
+    for path in packages:
+        cache.put(package=path, model=packagev1)
+    entry_size = cache.entry_path(package=packages[0]).stat().st_size
+
+    for index, path in enumerate(packages):
+        os.utime(cache.entry_path(package=path), ns=(index, index))
+
+    (cache.directory / f"dangling{package.PACKAGE_CACHE_FILE_SUFFIX}").symlink_to(tmp_path / "foo")
+
+    cache.max_size = entry_size * 2
+    cache.evict()
+    assert [cache.entry_path(package=path).exists() for path in packages] == [False, True, True]  # nosec: B101
+
+    cache.max_size = 0
+    cache.evict()
+    assert not any(cache.entry_path(package=path).exists() for path in packages)  # nosec: B101
@@ -157,6 +157,12 @@ def test_pkginfo_from_file(
     with raises(RepoManagementError):
         pkginfo.PkgInfo.from_file(data=StringIO(initial_value="base = foo\n"))
 
+    with raises(RepoManagementFileError):
+        pkginfo.PkgInfo.from_file(data=StringIO(initial_value="foo = bar\n"))
+
+    with raises(RepoManagementFileError):
+        pkginfo.PkgInfo.from_file(data=StringIO(initial_value="foobar\n"))
+
 
 @mark.integration
 @mark.skipif(
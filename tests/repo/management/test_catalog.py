@@ -0,0 +1,181 @@
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import mark, raises
+
+from repod.common.enums import RepoTypeEnum
+from repod.errors import RepoManagementFileError
+from repod.repo.management import catalog
+from repod.repo.management.outputpackage import OutputPackageBase
+
+
+@mark.parametrize(
+    "value, name",
+    [
+        ("foo", "foo"),
+        ("foo>=1.0.0-1", "foo"),
+        ("foo<1", "foo"),
+        ("foo=1:1.0.0-1", "foo"),
+        ("foo: for bar support", "foo"),
+        ("libfoo.so=1-64", "libfoo.so"),
+    ],
+)
+def test_get_dependency_name(value: str, name: str) -> None:
+    assert catalog.get_dependency_name(value=value) == name  # nosec: B101
+
+
+def test_managementrepocatalog_connect(tmp_path: Path) -> None:
+    repo_catalog = catalog.ManagementRepoCatalog(path=tmp_path / "catalog" / "catalog.sqlite")
+    connection = repo_catalog.connect()
+    assert connection.execute("PRAGMA user_version").fetchone()[0] == catalog.CATALOG_SCHEMA_VERSION  # nosec: B101
+    connection.close()
+    repo_catalog.connect().close()
+
+    connection = sqlite3.connect(repo_catalog.path)
+    connection.execute(f"PRAGMA user_version = {catalog.CATALOG_SCHEMA_VERSION + 1}")
+    connection.close()
+    with raises(RepoManagementFileError, match="must be rebuilt"):
+        repo_catalog.connect()
+
+    with raises(RepoManagementFileError):
+        catalog.ManagementRepoCatalog(path=tmp_path).connect()
+
+
+def test_managementrepocatalog_write_pkgbases(outputpackagebasev1: OutputPackageBase, tmp_path: Path) -> None:
+    directory = tmp_path / "management" / "any" / "default"
+    outputpackagebasev1.makedepends = ["baz>=1.0.0-1"]  # type: ignore[attr-defined]
+    outputpackagebasev1.packages[1].depends = ["foo", "beh: for beh support"]  # type: ignore[attr-defined]
+    outputpackagebasev1.packages[1].provides = ["libbar.so=1-64"]  # type: ignore[attr-defined]
+
+    repo_catalog = catalog.ManagementRepoCatalog(
+        path=tmp_path / "catalog.sqlite",
+        repo_types={directory: RepoTypeEnum.TESTING},
+    )
+    with repo_catalog.transaction() as connection:
+        repo_catalog.write_pkgbases(connection=connection, directory=directory, pkgbases=[outputpackagebasev1])
+    with repo_catalog.transaction() as connection:
+        repo_catalog.write_pkgbases(connection=connection, directory=directory, pkgbases=[outputpackagebasev1])
+        repo_catalog.write_pkgbases(
+            connection=connection,
+            directory=tmp_path / "management" / "any" / "other",
+            pkgbases=[outputpackagebasev1],
+        )
+
+    entries = repo_catalog.find_pkgbase(name="foo")
+    assert len(entries) == 2  # nosec: B101
+    assert entries[0] == catalog.CatalogEntry(  # nosec: B101
+        directory=directory,
+        repository="default",
+        architecture="any",
+        repo_type=RepoTypeEnum.TESTING,
+        pkgbase="foo",
+        version=outputpackagebasev1.version,  # type: ignore[attr-defined]
+    )
+    assert entries[1].repo_type is None  # nosec: B101
+    assert repo_catalog.get_pkgbases(directory=directory) == [entries[0]]  # nosec: B101
+    assert repo_catalog.find_pkgbase(name="bar") == []  # nosec: B101
+
+    assert [entry.package for entry in repo_catalog.find_package(name="bar")] == ["bar", "bar"]  # nosec: B101
+    assert [entry.package for entry in repo_catalog.find_dependents(name="foo")] == ["bar", "bar"]  # nosec: B101
+    assert len(repo_catalog.find_dependents(name="beh")) == 2  # nosec: B101
+    assert len(repo_catalog.find_dependents(name="libbar.so", type_="provides")) == 2  # nosec: B101
+    assert repo_catalog.find_dependents(name="foo", type_="conflicts") == []  # nosec: B101
+    makedepends = repo_catalog.find_dependents(name="baz", type_="makedepends")
+    assert [(entry.pkgbase, entry.package) for entry in makedepends] == [("foo", None), ("foo", None)]  # nosec: B101
+    assert [entry.package for entry in repo_catalog.find_file(path="foo")] == ["foo", "foo"]  # nosec: B101
+    packages = [entry.package for entry in repo_catalog.find_file(path="bar")]
+    assert packages == ["bar", "foo", "bar", "foo"]  # nosec: B101
+
+    with repo_catalog.transaction() as connection:
+        repo_catalog.remove_pkgbases(connection=connection, directory=directory, names=["foo"])
+    assert len(repo_catalog.find_pkgbase(name="foo")) == 1  # nosec: B101
+    assert len(repo_catalog.find_file(path="foo")) == 1  # nosec: B101
+
+    connection = repo_catalog.connect()
+    assert connection.execute("SELECT COUNT(*) FROM packages").fetchone()[0] == 2  # nosec: B101
+    assert connection.execute("SELECT COUNT(*) FROM dependencies").fetchone()[0] == 4  # nosec: B101
+    connection.close()
+
+
+def test_managementrepocatalog_transaction(outputpackagebasev1: OutputPackageBase, tmp_path: Path) -> None:
+    repo_catalog = catalog.ManagementRepoCatalog(path=tmp_path / "catalog.sqlite")
+
+    with raises(RuntimeError):
+        with repo_catalog.transaction() as connection:
+            repo_catalog.write_pkgbases(connection=connection, directory=tmp_path, pkgbases=[outputpackagebasev1])
+            raise RuntimeError("ERROR")
+    assert repo_catalog.find_pkgbase(name="foo") == []  # nosec: B101
+
+    with raises(RepoManagementFileError):
+        with repo_catalog.transaction() as connection:
+            repo_catalog.write_pkgbases(connection=connection, directory=tmp_path, pkgbases=[outputpackagebasev1])
+            connection.execute("INSERT INTO foo VALUES (1)")
+    assert repo_catalog.find_pkgbase(name="foo") == []  # nosec: B101
+
+    with patch("repod.repo.management.catalog.ManagementRepoCatalog.connect") as connect_mock:
+        connect_mock.return_value.execute.side_effect = sqlite3.Error("ERROR")
+        with raises(RepoManagementFileError):
+            repo_catalog.find_pkgbase(name="foo")
+
+
+def test_managementrepocatalog_update_from_directory(
+    outputpackagebasev1_json_files_in_dir: Path,
+    tmp_path: Path,
+) -> None:
+    directory = outputpackagebasev1_json_files_in_dir
+    repo_catalog = catalog.ManagementRepoCatalog(path=tmp_path / "catalog.sqlite")
+
+    repo_catalog.update_from_directory(directory=directory, names=["foo", "baz"])
+    assert [entry.pkgbase for entry in repo_catalog.get_pkgbases(directory=directory)] == ["foo"]  # nosec: B101
+
+    (directory / "foo.json").rename(directory / "foo.json.bkp")
+    repo_catalog.update_from_directory(directory=directory, names=["foo"])
+    assert repo_catalog.get_pkgbases(directory=directory) == []  # nosec: B101
+
+    (directory / "foo.json").write_text("foo")
+    with raises(RepoManagementFileError):
+        repo_catalog.update_from_directory(directory=directory, names=["foo"])
+
+
+def test_managementrepocatalog_rebuild(outputpackagebasev1_json_files_in_dir: Path, tmp_path: Path) -> None:
+    directory = outputpackagebasev1_json_files_in_dir
+    repo_catalog = catalog.ManagementRepoCatalog(path=tmp_path / "catalog.sqlite")
+
+    assert repo_catalog.rebuild(directories=[directory, tmp_path / "does_not_exist"]) == 1  # nosec: B101
+    assert [entry.pkgbase for entry in repo_catalog.get_pkgbases(directory=directory)] == ["foo"]  # nosec: B101
+    assert repo_catalog.rebuild(directories=[]) == 0  # nosec: B101
+    assert repo_catalog.get_pkgbases(directory=directory) == []  # nosec: B101
+
+    connection = sqlite3.connect(repo_catalog.path)
+    connection.execute(f"PRAGMA user_version = {catalog.CATALOG_SCHEMA_VERSION + 1}")
+    connection.close()
+    assert repo_catalog.rebuild(directories=[directory]) == 1  # nosec: B101
+    assert len(repo_catalog.find_package(name="bar")) == 1  # nosec: B101
+
+
+def test_managementrepocatalog_remove_missing_pkgbases(
+    outputpackagebasev1: OutputPackageBase,
+    outputpackagebasev1_json_files_in_dir: Path,
+    tmp_path: Path,
+) -> None:
+    directory = outputpackagebasev1_json_files_in_dir
+    repo_catalog = catalog.ManagementRepoCatalog(path=tmp_path / "catalog.sqlite")
+    assert repo_catalog.rebuild(directories=[directory]) == 1  # nosec: B101
+
+    outputpackagebasev1.base = "baz"  # type: ignore[attr-defined]
+    with repo_catalog.transaction() as connection:
+        repo_catalog.write_pkgbases(connection=connection, directory=directory, pkgbases=[outputpackagebasev1])
+    assert [entry.pkgbase for entry in repo_catalog.get_pkgbases(directory=directory)] == ["baz", "foo"]  # nosec: B101
+
+    (directory / "foo.json").unlink()
+    with repo_catalog.transaction() as connection:
+        repo_catalog.write_pkgbases(connection=connection, directory=directory, pkgbases=[outputpackagebasev1])
+    assert [entry.pkgbase for entry in repo_catalog.get_pkgbases(directory=directory)] == ["baz"]  # nosec: B101
+    assert repo_catalog.find_package(name="foo")[0].pkgbase == "baz"  # nosec: B101
+
+    with repo_catalog.transaction() as connection:
+        assert repo_catalog.remove_missing_pkgbases(connection=connection, directory=directory) == [  # nosec: B101
+            "baz"
+        ]
+    assert repo_catalog.get_pkgbases(directory=directory) == []  # nosec: B101
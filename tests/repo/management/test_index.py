@@ -0,0 +1,182 @@
+from pathlib import Path
+from threading import Event, Thread
+from typing import Any, Callable
+
+from pytest import mark, raises
+
+from repod.errors import RepoManagementFileError
+from repod.repo.management import index
+
+
+def test_managementrepoindex_scan(outputpackagebasev1_json_files_in_dir: Path, tmp_path: Path) -> None:
+    management_dir = outputpackagebasev1_json_files_in_dir
+    (management_dir / "baz.json.tmp").touch()
+    (management_dir / "pkgnames" / "baz.json.tmp").touch()
+    (management_dir / "pkgnames" / "beh.json").touch()
+    (management_dir / "pkgnames" / "directory.json").mkdir()
+
+    repo_index = index.ManagementRepoIndex()
+    repo_index.scan(directory=management_dir)
+    assert repo_index.pkgbases[management_dir] == {"foo"}  # nosec: B101
+    assert repo_index.tmp_pkgbases[management_dir] == {"baz"}  # nosec: B101
+    assert repo_index.packages[management_dir] == {"foo": True, "bar": True, "beh": False}  # nosec: B101
+    assert repo_index.tmp_packages[management_dir] == {"baz"}  # nosec: B101
+
+    (management_dir / "qux.json").touch()
+    repo_index.scan(directory=management_dir)
+    assert repo_index.pkgbases[management_dir] == {"foo"}  # nosec: B101
+
+    repo_index.scan(directory=tmp_path / "does_not_exist")
+    assert repo_index.pkgbases[tmp_path / "does_not_exist"] == set()  # nosec: B101
+    assert repo_index.packages[tmp_path / "does_not_exist"] == {}  # nosec: B101
+
+
+def test_managementrepoindex_has_pkgbase_and_package(outputpackagebasev1_json_files_in_dir: Path) -> None:
+    management_dir = outputpackagebasev1_json_files_in_dir
+    (management_dir / "baz.json.tmp").touch()
+    (management_dir / "pkgnames" / "baz.json.tmp").touch()
+
+    repo_index = index.ManagementRepoIndex()
+    assert repo_index.has_pkgbase(directory=management_dir, name="foo")  # nosec: B101
+    assert not repo_index.has_pkgbase(directory=management_dir, name="bar")  # nosec: B101
+    assert not repo_index.has_pkgbase(directory=management_dir, name="baz")  # nosec: B101
+    assert repo_index.has_pkgbase(directory=management_dir, name="baz", with_tmp=True)  # nosec: B101
+
+    assert repo_index.has_package(directory=management_dir, name="bar")  # nosec: B101
+    assert not repo_index.has_package(directory=management_dir, name="baz")  # nosec: B101
+    assert repo_index.has_package(directory=management_dir, name="baz", with_tmp=True)  # nosec: B101
+
+    assert repo_index.find_pkgbase(directories=[management_dir, management_dir / "foo"], name="foo") == [  # nosec: B101
+        management_dir
+    ]
+    assert repo_index.find_package(directories=[management_dir], name="baz") == []  # nosec: B101
+    assert repo_index.find_package(directories=[management_dir], name="baz", with_tmp=True) == [  # nosec: B101
+        management_dir
+    ]
+
+
+def test_managementrepoindex_get_pkgbase(outputpackagebasev1_json_files_in_dir: Path) -> None:
+    management_dir = outputpackagebasev1_json_files_in_dir
+    (management_dir / "pkgnames" / "beh.json").touch()
+
+    repo_index = index.ManagementRepoIndex()
+    target = repo_index.get_package_target(directory=management_dir, name="bar")
+    assert target == (management_dir / "foo.json").resolve()  # nosec: B101
+    assert repo_index.get_package_target(directory=management_dir, name="beh") is None  # nosec: B101
+    assert repo_index.get_pkgbase_name(directory=management_dir, package="bar") == "foo"  # nosec: B101
+    assert repo_index.get_pkgbase_name(directory=management_dir, package="baz") is None  # nosec: B101
+
+    pkgbase = repo_index.get_pkgbase(directory=management_dir, name="foo")
+    assert pkgbase and pkgbase.base == "foo"  # type: ignore[attr-defined]  # nosec: B101
+    assert repo_index.get_pkgbase(directory=management_dir, name="foo") is pkgbase  # nosec: B101
+    assert repo_index.get_pkgbase(directory=management_dir, name="bar") is None  # nosec: B101
+
+    package_pkgbase = repo_index.get_pkgbase_of_package(directory=management_dir, package="bar")
+    assert package_pkgbase and package_pkgbase.base == "foo"  # type: ignore[attr-defined]  # nosec: B101
+    assert repo_index.get_pkgbase_of_package(directory=management_dir, package="baz") is None  # nosec: B101
+    with raises(RepoManagementFileError):
+        repo_index.get_pkgbase_of_package(directory=management_dir, package="beh")
+
+
+def test_managementrepoindex_get_package_version(outputpackagebasev1_json_files_in_dir: Path) -> None:
+    management_dir = outputpackagebasev1_json_files_in_dir
+
+    repo_index = index.ManagementRepoIndex()
+    pkgbase = repo_index.get_pkgbase(directory=management_dir, name="foo")
+    assert pkgbase  # nosec: B101
+    version = (pkgbase.version, pkgbase.packages[1].arch)  # type: ignore[attr-defined]
+    assert repo_index.get_package_version(directory=management_dir, package="bar") == version  # nosec: B101
+    assert repo_index.get_package_version(directory=management_dir, package="baz") is None  # nosec: B101
+
+    pkgbase.version = "2.0.0-1"  # type: ignore[attr-defined]
+    assert repo_index.get_package_version(directory=management_dir, package="bar") == version  # nosec: B101
+    repo_index.invalidate(directory=management_dir)
+    assert repo_index.get_package_version(directory=management_dir, package="bar") == version  # nosec: B101
+
+    pkgbase = repo_index.get_pkgbase(directory=management_dir, name="foo")
+    pkgbase.packages[1].name = "beh"  # type: ignore[attr-defined,union-attr]
+    repo_index._versions.clear()
+    assert repo_index.get_package_version(directory=management_dir, package="bar") is None  # nosec: B101
+
+
+def test_managementrepoindex_invalidate(outputpackagebasev1_json_files_in_dir: Path) -> None:
+    management_dir = outputpackagebasev1_json_files_in_dir
+
+    repo_index = index.ManagementRepoIndex()
+    pkgbase = repo_index.get_pkgbase(directory=management_dir, name="foo")
+    (management_dir / "baz.json").touch()
+    assert not repo_index.has_pkgbase(directory=management_dir, name="baz")  # nosec: B101
+
+    repo_index.invalidate(directory=management_dir / "other")
+    assert not repo_index.has_pkgbase(directory=management_dir, name="baz")  # nosec: B101
+    assert repo_index.get_pkgbase(directory=management_dir, name="foo") is pkgbase  # nosec: B101
+
+    repo_index.invalidate(directory=management_dir)
+    assert repo_index.has_pkgbase(directory=management_dir, name="baz")  # nosec: B101
+    assert repo_index.get_pkgbase(directory=management_dir, name="foo") is not pkgbase  # nosec: B101
+
+    (management_dir / "baz.json").unlink()
+    repo_index.invalidate()
+    assert repo_index.pkgbases == {}  # nosec: B101
+    assert not repo_index.has_pkgbase(directory=management_dir, name="baz")  # nosec: B101
+
+
+def run_query(query: Callable[[], Any], errors: list[Exception]) -> None:
+    """Run query repeatedly and add any error raised (or a failed assertion of its result) to errors."""
+    try:
+        for _ in range(2000):
+            assert query()  # nosec: B101
+    except Exception as e:
+        errors.append(e)
+
+
+def run_invalidate(invalidate: Callable[[], Any], done: Event, errors: list[Exception]) -> None:
+    """Run invalidate repeatedly until done is set and add any error raised to errors."""
+    try:
+        while not done.is_set():
+            invalidate()
+    except Exception as e:
+        errors.append(e)
+
+
+def run_repo_index_threads(query: Callable[[], Any], invalidate: Callable[[], Any]) -> list[Exception]:
+    """Run query and invalidate repeatedly in several threads at the same time and return all errors raised."""
+    errors: list[Exception] = []
+    done = Event()
+
+    invalidators = [Thread(target=run_invalidate, args=(invalidate, done, errors)) for _ in range(2)]
+    queries = [Thread(target=run_query, args=(query, errors)) for _ in range(4)]
+    for thread in invalidators + queries:
+        thread.start()
+    for thread in queries:
+        thread.join()
+    done.set()
+    for thread in invalidators:
+        thread.join()
+
+    return errors
+
+
+@mark.parametrize(
+    "method, kwargs",
+    [
+        ("has_package", {"name": "bar"}),
+        ("has_pkgbase", {"name": "foo"}),
+        ("get_pkgbase_name", {"package": "bar"}),
+        ("get_package_version", {"package": "bar"}),
+    ],
+)
+@mark.usefixtures("short_switch_interval")
+def test_managementrepoindex_threads(
+    method: str,
+    kwargs: dict[str, str],
+    outputpackagebasev1_json_files_in_dir: Path,
+) -> None:
+    management_dir = outputpackagebasev1_json_files_in_dir
+    repo_index = index.ManagementRepoIndex()
+
+    errors = run_repo_index_threads(
+        query=lambda: getattr(repo_index, method)(directory=management_dir, **kwargs),
+        invalidate=lambda: (repo_index.invalidate(directory=management_dir), repo_index.invalidate()),
+    )
+    assert errors == []  # nosec: B101
@@ -2,11 +2,16 @@ from contextlib import nullcontext as does_not_raise
 from copy import deepcopy
 from logging import DEBUG
 from pathlib import Path
+from time import perf_counter
 from typing import Any, ContextManager
 
 from pytest import LogCaptureFixture, mark, raises
 
-from repod.common.enums import FilesVersionEnum, PackageDescVersionEnum
+from repod.common.enums import (
+    CompressionTypeEnum,
+    FilesVersionEnum,
+    PackageDescVersionEnum,
+)
 from repod.errors import RepoManagementFileError, RepoManagementValidationError
 from repod.files.buildinfo import BuildInfo
 from repod.files.package import Package
@@ -22,6 +27,7 @@ from tests.conftest import (
     create_default_packager,
     create_md5sum,
     create_sha256sum,
+    create_synthetic_package,
     create_url,
 )
 
@@ -276,6 +282,56 @@ def test_outputpackagebase_add_packages(
         model.add_packages(packages=[input_])
 
 
+@mark.benchmark
+@mark.parametrize("lazy_mtree", [False, True])
+@mark.parametrize(
+    "package_count, file_count",
+    [(1, 100), (5, 2000)],
+    ids=["single", "split"],
+)
+async def test_outputpackagebase_from_package_benchmark(
+    lazy_mtree: bool,
+    package_count: int,
+    file_count: int,
+    benchmark_result: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    """Benchmark for repod.repo.management.outputpackage.OutputPackageBase.from_package with synthetic packages."""
+    rounds = 5
+    packages = []
+    for number in range(package_count):
+        packages.append(
+            await Package.from_file(
+                package=create_synthetic_package(
+                    directory=tmp_path,
+                    name=f"foo{number}",
+                    base="foo",
+                    compression=CompressionTypeEnum.ZSTANDARD,
+                    file_count=file_count,
+                    file_size=16,
+                ),
+                lazy_mtree=lazy_mtree,
+            )
+        )
+
+    start = perf_counter()
+    for _ in range(rounds):
+        outputpackage.OutputPackageBase.from_package(packages=packages)
+    from_package = (perf_counter() - start) / rounds
+
+    benchmark_result.update(
+        file_count=file_count,
+        lazy_mtree=lazy_mtree,
+        package_count=package_count,
+        rounds=rounds,
+        seconds=from_package,
+    )
+    print(
+        f"\nOutputPackageBase.from_package with {package_count} packages of {file_count} files "
+        f"({'lazy' if lazy_mtree else 'parsed'} .MTREE): {from_package * 1e3:.2f}ms"
+    )
+
+
 def test_outputpackagebase_get_version() -> None:
     model = outputpackage.OutputPackageBase()
     with raises(RuntimeError):
@@ -5,7 +5,7 @@ from typing import ContextManager
 
 from pytest import LogCaptureFixture, mark, raises
 
-from repod.common.enums import RepoFileEnum
+from repod.common.enums import FilePlacementEnum, RepoFileEnum
 from repod.errors import RepoManagementFileError
 from repod.repo.package import repofile
 
@@ -262,9 +262,18 @@ def test_repofile_check_symlink_path_exists(
         file.check_symlink_path_exists(exists=exists)
 
 
-@mark.parametrize("source_exists, expectation", [(True, does_not_raise()), (False, raises(RepoManagementFileError))])
+@mark.parametrize(
+    "source_exists, placement, expectation",
+    [
+        (True, FilePlacementEnum.COPY, does_not_raise()),
+        (True, FilePlacementEnum.REFLINK, does_not_raise()),
+        (True, FilePlacementEnum.HARDLINK, does_not_raise()),
+        (False, FilePlacementEnum.COPY, raises(RepoManagementFileError)),
+    ],
+)
 def test_repofile_copy_from(
     source_exists: bool,
+    placement: FilePlacementEnum,
     expectation: ContextManager[str],
     caplog: LogCaptureFixture,
     default_package_file: tuple[Path, ...],
@@ -286,9 +295,9 @@ def test_repofile_copy_from(
     )
 
     with expectation:
-        file.copy_from(path=source_path)
+        file.copy_from(path=source_path, placement=placement)
         assert source_path.exists()  # nosec: B101
-        assert destination_path.exists()  # nosec: B101
+        assert destination_path.read_bytes() == source_path.read_bytes()  # nosec: B101
 
 
 @mark.parametrize("source_exists, expectation", [(True, does_not_raise()), (False, raises(RepoManagementFileError))])
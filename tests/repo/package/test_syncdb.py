@@ -1,13 +1,22 @@
 """Tests for repod.repo.package.syncdb."""
+import asyncio
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import nullcontext as does_not_raise
-from io import StringIO
+from io import BytesIO, StringIO
 from logging import DEBUG
 from pathlib import Path
+from resource import RUSAGE_SELF, getrusage
+from tarfile import DIRTYPE, TarInfo
 from textwrap import dedent
+from time import perf_counter
 from typing import Any, ContextManager
 from unittest.mock import patch
 
+from jinja2 import Environment, PackageLoader
 from pytest import LogCaptureFixture, mark, raises
+from pytest_lazyfixture import lazy_fixture
 
 from repod.common.enums import (
     CompressionTypeEnum,
@@ -31,6 +40,7 @@ from tests.conftest import (
     create_default_packager,
     create_md5sum,
     create_sha256sum,
+    create_synthetic_management_repo,
     create_url,
 )
 
@@ -83,6 +93,151 @@ async def test_files_render(filesv1: syncdb.Files) -> None:
     assert output.getvalue()  # nosec: B101
 
 
+@mark.benchmark
+@mark.parametrize(
+    "model, template_file",
+    [
+        (lazy_fixture("packagedescv1"), "desc_v1.j2"),
+        (lazy_fixture("filesv1"), "files_v1.j2"),
+    ],
+)
+@mark.asyncio
+async def test_render_benchmark(
+    model: syncdb.PackageDesc | syncdb.Files,
+    template_file: str,
+    benchmark_result: dict[str, Any],
+) -> None:
+    """Benchmark for repod.repo.package.syncdb.PackageDesc.render and repod.repo.package.syncdb.Files.render.
+
+    The per-entry cost of rendering with the cached template is compared to that of creating a jinja environment and
+    compiling the template for each entry.
+    """
+    entries = 1000
+
+    start = perf_counter()
+    for _ in range(entries):
+        env = Environment(  # nosec: B701
+            autoescape=False,
+            loader=PackageLoader("repod", "templates"),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            enable_async=True,
+        )
+        StringIO().write(await env.get_template(template_file).render_async(model.dict()))
+    uncached = (perf_counter() - start) / entries
+
+    start = perf_counter()
+    for _ in range(entries):
+        await model.render(output=StringIO())
+    cached = (perf_counter() - start) / entries
+
+    print(
+        f"\n{type(model).__name__}.render per entry: {uncached * 1e6:.1f}us (environment per entry), "
+        f"{cached * 1e6:.1f}us (cached template)"
+    )
+    benchmark_result.update(rounds=entries, seconds={"cached": cached, "uncached": uncached})
+    assert cached < uncached  # nosec: B101
+
+
+def get_peak_rss() -> int:
+    """Return the peak resident set size of the current process in bytes."""
+    return getrusage(RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def run_syncdatabase_benchmark(database: syncdb.SyncDatabase, path: Path | None) -> dict[str, float | int]:
+    """Write a repository sync database from a management repository, or read all pkgbases from it.
+
+    This function is run in a separate process, so that the peak resident set size of the operation can be measured.
+
+    Parameters
+    ----------
+    database: syncdb.SyncDatabase
+        The repository sync database to write or read
+    path: Path | None
+        The directory containing the files of a management repository to write database from, or None to read database
+
+    Returns
+    -------
+    dict[str, float | int]
+        The duration of the operation in seconds, the amount of pkgbases written or read, the peak resident set size of
+        the process and its increase during the operation in bytes
+    """
+
+    async def read() -> int:
+        names = [name async for (name, _) in database.outputpackagebases()]
+        assert len(names) == len(set(names))  # nosec: B101
+        return len(names)
+
+    initial_rss = get_peak_rss()
+    start = perf_counter()
+    if path:
+        asyncio.run(database.stream_management_repo(path=path))
+        pkgbases = len(list(path.glob("*.json")))
+    else:
+        pkgbases = asyncio.run(read())
+    seconds = perf_counter() - start
+    peak_rss = get_peak_rss()
+
+    return {"seconds": seconds, "pkgbases": pkgbases, "peak_rss": peak_rss, "peak_rss_increase": peak_rss - initial_rss}
+
+
+@mark.benchmark
+@mark.parametrize("database_type", [syncdb.RepoDbTypeEnum.DEFAULT, syncdb.RepoDbTypeEnum.FILES], ids=["db", "files"])
+@mark.parametrize("desc_version", [version for version in PackageDescVersionEnum], ids=["desc_v1", "desc_v2"])
+@mark.parametrize(
+    "compression", [name for name in CompressionTypeEnum], ids=[name.value for name in CompressionTypeEnum]
+)
+def test_syncdatabase_benchmark(
+    compression: CompressionTypeEnum,
+    desc_version: PackageDescVersionEnum,
+    database_type: syncdb.RepoDbTypeEnum,
+    pkgbase_count: int,
+    synthetic_management_repo: Path,
+    benchmark_result: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    """Benchmark for writing and reading repository sync databases of synthetic management repositories.
+
+    Writing uses repod.repo.package.syncdb.SyncDatabase.stream_management_repo and reading uses
+    repod.repo.package.syncdb.SyncDatabase.outputpackagebases. The amounts of pkgbases are set using the
+    --benchmark-pkgbases option. Each operation is run in a separate process to measure its peak resident set size.
+    """
+    database = syncdb.SyncDatabase(
+        database=tmp_path
+        / f"test.{database_type.name.lower()}.tar{'.' + compression.value if compression.value else ''}",
+        database_type=database_type,
+        compression_type=compression,
+        desc_version=desc_version,
+        files_version=FilesVersionEnum.DEFAULT,
+    )
+
+    results = {}
+    for (operation, path) in [("write", synthetic_management_repo), ("read", None)]:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results[operation] = executor.submit(run_syncdatabase_benchmark, database, path).result()
+        assert results[operation]["pkgbases"] == pkgbase_count  # nosec: B101
+        results[operation]["pkgbases_per_second"] = pkgbase_count / results[operation]["seconds"]
+
+    benchmark_result.update(
+        compression=compression.value,
+        database_type=database_type.name.lower(),
+        database_size=database.database.stat().st_size,
+        desc_version=desc_version.value,
+        pkgbase_count=pkgbase_count,
+        results=results,
+    )
+    print(
+        f"\nSyncDatabase ({database_type.name.lower()}, {compression.value or 'uncompressed'}, "
+        f"desc version {desc_version.value}) "
+        f"with {pkgbase_count} pkgbases ({database.database.stat().st_size} bytes): "
+        + ", ".join(
+            f"{operation} {result['seconds'] * 1e3:.2f}ms ({result['pkgbases_per_second']:.0f} pkgbases/s, "
+            f"peak RSS {result['peak_rss'] / 2**20:.1f}MiB, +{result['peak_rss_increase'] / 2**20:.1f}MiB)"
+            for (operation, result) in results.items()
+        )
+    )
+
+
 @mark.asyncio
 async def test_files_render_raise_on_missing_template() -> None:
     """Tests for repod.repo.package.syncdb.FilesV1.render."""
@@ -1216,13 +1371,486 @@ async def test_syncdatabase_stream_management_repo_empty_dir(
     ).stream_management_repo(path=tmp_path)
 
 
+@mark.parametrize(
+    "database_type, pkgbases, remove_json, copied",
+    [
+        (syncdb.RepoDbTypeEnum.DEFAULT, [], False, True),
+        (syncdb.RepoDbTypeEnum.FILES, [], False, True),
+        (syncdb.RepoDbTypeEnum.DEFAULT, ["foo"], False, False),
+        (syncdb.RepoDbTypeEnum.FILES, ["foo"], False, False),
+        (syncdb.RepoDbTypeEnum.DEFAULT, [], True, False),
+        (syncdb.RepoDbTypeEnum.FILES, [], True, False),
+    ],
+)
 @mark.asyncio
-async def test_syncdatabase_outputpackagebases(files_sync_db_file: tuple[Path, Path]) -> None:
-    """Tests for repod.repo.package.syncdb.SyncDatabase.outputpackagebases."""
-    for (name, model) in await syncdb.SyncDatabase(
-        database=files_sync_db_file[0],
+async def test_syncdatabase_stream_management_repo_incremental(
+    caplog: LogCaptureFixture,
+    database_type: syncdb.RepoDbTypeEnum,
+    pkgbases: list[str],
+    remove_json: bool,
+    copied: bool,
+    outputpackagebasev1_json_files_in_dir: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.stream_management_repo using a previous database."""
+    caplog.set_level(DEBUG)
+    previous = tmp_path / "previous.db.tar.gz"
+    current = tmp_path / "current.db.tar.gz"
+    await syncdb.SyncDatabase(
+        database=previous,
+        database_type=database_type,
+        compression_type=CompressionTypeEnum.GZIP,
+        desc_version=PackageDescVersionEnum.DEFAULT,
+        files_version=FilesVersionEnum.DEFAULT,
+    ).stream_management_repo(path=outputpackagebasev1_json_files_in_dir)
+
+    if remove_json:
+        for json_file in outputpackagebasev1_json_files_in_dir.glob("*.json"):
+            json_file.unlink()
+
+    await syncdb.SyncDatabase(
+        database=current,
+        database_type=database_type,
+        compression_type=CompressionTypeEnum.GZIP,
+        desc_version=PackageDescVersionEnum.DEFAULT,
+        files_version=FilesVersionEnum.DEFAULT,
+    ).stream_management_repo(path=outputpackagebasev1_json_files_in_dir, previous=previous, pkgbases=pkgbases)
+
+    with open_tarfile(path=previous) as previous_file, open_tarfile(path=current) as current_file:
+        if remove_json:
+            assert current_file.getnames() == []  # nosec: B101
+        else:
+            assert current_file.getnames() == previous_file.getnames()  # nosec: B101
+            assert (  # nosec: B101
+                [member.mtime for member in current_file.getmembers()]
+                == [member.mtime for member in previous_file.getmembers()]
+            ) or not copied
+
+    assert ("Copying descriptor files of unchanged pkgbases" in caplog.text) is True  # nosec: B101
+
+
+@mark.parametrize(
+    "desc_version, files_version, touch_json, copied",
+    [
+        (PackageDescVersionEnum.DEFAULT, FilesVersionEnum.DEFAULT, False, True),
+        (PackageDescVersionEnum.DEFAULT, FilesVersionEnum.DEFAULT, True, False),
+        (PackageDescVersionEnum.TWO, FilesVersionEnum.DEFAULT, False, False),
+    ],
+)
+@mark.asyncio
+async def test_syncdatabase_stream_management_repo_incremental_outdated_previous(
+    caplog: LogCaptureFixture,
+    desc_version: PackageDescVersionEnum,
+    files_version: FilesVersionEnum,
+    touch_json: bool,
+    copied: bool,
+    outputpackagebasev1_json_files_in_dir: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.stream_management_repo using an outdated previous database."""
+    caplog.set_level(DEBUG)
+    previous = tmp_path / "previous.db.tar.gz"
+    current = tmp_path / "current.db.tar.gz"
+    with patch("repod.repo.package.syncdb.time", return_value=0):
+        await syncdb.SyncDatabase(
+            database=previous,
+            database_type=syncdb.RepoDbTypeEnum.DEFAULT,
+            compression_type=CompressionTypeEnum.GZIP,
+            desc_version=desc_version,
+            files_version=files_version,
+        ).stream_management_repo(path=outputpackagebasev1_json_files_in_dir)
+
+    if touch_json:
+        for json_file in outputpackagebasev1_json_files_in_dir.glob("*.json"):
+            json_file.touch()
+
+    await syncdb.SyncDatabase(
+        database=current,
+        database_type=syncdb.RepoDbTypeEnum.DEFAULT,
+        compression_type=CompressionTypeEnum.GZIP,
+        desc_version=PackageDescVersionEnum.ONE,
+        files_version=FilesVersionEnum.ONE,
+    ).stream_management_repo(path=outputpackagebasev1_json_files_in_dir, previous=previous, pkgbases=[])
+
+    with open_tarfile(path=current) as current_file:
+        members = current_file.getmembers()
+        assert members  # nosec: B101
+        assert all(member.mtime == 0 for member in members) is copied  # nosec: B101
+        assert members[0].pax_headers.get(syncdb.DB_DESC_VERSION_HEADER) == "1"  # nosec: B101
+        assert members[0].pax_headers.get(syncdb.DB_FILES_VERSION_HEADER) == "1"  # nosec: B101
+        assert not [  # nosec: B101
+            member for member in members[1:] if syncdb.DB_DESC_VERSION_HEADER in member.pax_headers
+        ]
+
+    assert ("as it has not been written with the same desc and files versions" in caplog.text) is (  # nosec: B101
+        desc_version != PackageDescVersionEnum.DEFAULT
+    )
+
+
+@mark.asyncio
+async def test_syncdatabase_stream_management_repo_incremental_empty_previous(
+    outputpackagebasev1_json_files_in_dir: Path,
+    empty_dir: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.stream_management_repo using an empty previous database."""
+    previous = tmp_path / "previous.db.tar.gz"
+    current = tmp_path / "current.db.tar.gz"
+    for (database, path) in [(previous, empty_dir), (current, outputpackagebasev1_json_files_in_dir)]:
+        await syncdb.SyncDatabase(
+            database=database,
+            database_type=syncdb.RepoDbTypeEnum.DEFAULT,
+            compression_type=CompressionTypeEnum.GZIP,
+            desc_version=PackageDescVersionEnum.DEFAULT,
+            files_version=FilesVersionEnum.DEFAULT,
+        ).stream_management_repo(path=path, previous=previous if database == current else None, pkgbases=[])
+
+    with open_tarfile(path=current) as current_file:
+        assert len(current_file.getnames()) > 0  # nosec: B101
+
+
+@mark.parametrize(
+    "files_version, with_previous, expectation",
+    [
+        (FilesVersionEnum.DEFAULT, False, does_not_raise()),
+        (FilesVersionEnum.DEFAULT, True, does_not_raise()),
+        (9999, False, raises(RuntimeError)),
+    ],
+)
+@mark.asyncio
+async def test_syncdatabase_stream_management_repo_to_databases(
+    files_version: FilesVersionEnum,
+    with_previous: bool,
+    expectation: ContextManager[str],
+    outputpackagebasev1_json_files_in_dir: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.stream_management_repo_to_databases."""
+    default_db = syncdb.SyncDatabase(
+        database=tmp_path / "foo.db.tar.gz",
+        database_type=syncdb.RepoDbTypeEnum.DEFAULT,
+        compression_type=CompressionTypeEnum.GZIP,
+        desc_version=PackageDescVersionEnum.DEFAULT,
+        files_version=FilesVersionEnum.DEFAULT,
+    )
+    files_db = syncdb.SyncDatabase.construct(
+        database=tmp_path / "foo.files.tar.gz",
+        database_type=syncdb.RepoDbTypeEnum.FILES,
+        compression_type=CompressionTypeEnum.GZIP,
+        desc_version=PackageDescVersionEnum.DEFAULT,
+        files_version=files_version,
+    )
+    previous = tmp_path / "previous.db.tar.gz"
+    if with_previous:
+        await default_db.copy(update={"database": previous}).stream_management_repo(
+            path=outputpackagebasev1_json_files_in_dir
+        )
+
+    with expectation:
+        await syncdb.SyncDatabase.stream_management_repo_to_databases(
+            path=outputpackagebasev1_json_files_in_dir,
+            databases=[(default_db, previous if with_previous else None), (files_db, None)],
+            pkgbases=[],
+        )
+
+        with open_tarfile(path=default_db.database) as default_file, open_tarfile(path=files_db.database) as files_file:
+            default_names = default_file.getnames()
+            files_names = files_file.getnames()
+            assert not [name for name in default_names if name.endswith("/files")]  # nosec: B101
+            assert [name for name in files_names if name.endswith("/files")]  # nosec: B101
+            assert default_names == [name for name in files_names if not name.endswith("/files")]  # nosec: B101
+
+
+def rewrite_sync_database(path: Path, reverse: bool, per_directory: bool) -> None:
+    """Rewrite a repository sync database, optionally reversing the order of its package directories.
+
+    If per_directory is True, the desc and files versions are recorded in the pax headers of each package directory
+    (as done by older versions of repod) instead of only in those of the first member.
+    """
+    directories: list[list[tuple[TarInfo, bytes | None]]] = []
+    with open_tarfile(path=path) as tar_file:
+        pax_headers = {
+            key: value for key, value in tar_file.getmembers()[0].pax_headers.items() if key.startswith("REPOD.")
+        }
+        for member in tar_file.getmembers():
+            data = tar_file.extractfile(member)
+            if member.isdir():
+                directories.append([])
+            directories[-1].append((member, data.read() if data else None))
+
+    with open_tarfile(path=path, compression=CompressionTypeEnum.GZIP, mode="w") as tar_file:
+        for members in reversed(directories) if reverse else directories:
+            for (member, data) in members:
+                member.pax_headers = pax_headers if per_directory and member.isdir() else {}
+                if not per_directory and not tar_file.members:
+                    member.pax_headers = pax_headers
+                tar_file.addfile(member, BytesIO(data) if data is not None else None)
+
+
+@mark.parametrize(
+    "pkgbases, removed, added",
+    [
+        ([], [], []),
+        (["pkgbase1", "pkgbase3"], [], []),
+        (["pkgbase0"], ["pkgbase2"], ["pkgbase5"]),
+        ([], ["pkgbase4"], ["pkgbase1"]),
+    ],
+)
+@mark.asyncio
+async def test_syncdatabase_stream_management_repo_incremental_order(
+    pkgbases: list[str],
+    removed: list[str],
+    added: list[str],
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.stream_management_repo keeping the order of pkgbases."""
+    management_dir = await create_synthetic_management_repo(directory=tmp_path, pkgbase_count=6, file_count=1)
+    added_json = {name: (management_dir / f"{name}.json").read_bytes() for name in added}
+    for name in added:
+        (management_dir / f"{name}.json").unlink()
+
+    database = syncdb.SyncDatabase(
+        database=tmp_path / "previous.files.tar.gz",
+        database_type=syncdb.RepoDbTypeEnum.FILES,
+        compression_type=CompressionTypeEnum.GZIP,
         desc_version=PackageDescVersionEnum.DEFAULT,
         files_version=FilesVersionEnum.DEFAULT,
-    ).outputpackagebases():
+    )
+    await database.stream_management_repo(path=management_dir)
+
+    for name in removed:
+        (management_dir / f"{name}.json").unlink()
+    for (name, data) in added_json.items():
+        (management_dir / f"{name}.json").write_bytes(data)
+
+    current = database.copy(update={"database": tmp_path / "current.files.tar.gz"})
+    await current.stream_management_repo(path=management_dir, previous=database.database, pkgbases=pkgbases)
+    full = database.copy(update={"database": tmp_path / "full.files.tar.gz"})
+    await full.stream_management_repo(path=management_dir)
+
+    with open_tarfile(path=current.database) as current_file, open_tarfile(path=full.database) as full_file:
+        members = current_file.getmembers()
+        assert current_file.getnames() == full_file.getnames()  # nosec: B101
+        assert [  # nosec: B101
+            member.name for member in members if syncdb.DB_DESC_VERSION_HEADER in member.pax_headers
+        ] == [members[0].name]
+
+
+@mark.parametrize(
+    "reverse, per_directory",
+    [
+        (False, True),
+        (True, False),
+        (True, True),
+    ],
+)
+@mark.asyncio
+async def test_syncdatabase_stream_management_repo_incremental_rewritten_previous(
+    reverse: bool,
+    per_directory: bool,
+    tmp_path: Path,
+) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.stream_management_repo using a previous database.
+
+    The previous database is either not in order or records the desc and files versions on each package directory.
+    """
+    management_dir = await create_synthetic_management_repo(directory=tmp_path, pkgbase_count=4, file_count=1)
+    database = syncdb.SyncDatabase(
+        database=tmp_path / "previous.db.tar.gz",
+        database_type=syncdb.RepoDbTypeEnum.DEFAULT,
+        compression_type=CompressionTypeEnum.GZIP,
+        desc_version=PackageDescVersionEnum.DEFAULT,
+        files_version=FilesVersionEnum.DEFAULT,
+    )
+    with patch("repod.repo.package.syncdb.time", return_value=0):
+        await database.stream_management_repo(path=management_dir)
+    with open_tarfile(path=database.database) as previous_file:
+        names = previous_file.getnames()
+
+    rewrite_sync_database(path=database.database, reverse=reverse, per_directory=per_directory)
+    current = database.copy(update={"database": tmp_path / "current.db.tar.gz"})
+    await current.stream_management_repo(path=management_dir, previous=database.database, pkgbases=[])
+
+    with open_tarfile(path=current.database) as current_file:
+        members = current_file.getmembers()
+        assert current_file.getnames() == names  # nosec: B101
+        # NOTE: pkgbases that are not in order in the previous database are read from their JSON files instead
+        assert all(member.mtime == 0 for member in members) is not reverse  # nosec: B101
+        assert [  # nosec: B101
+            member.name for member in members if syncdb.DB_DESC_VERSION_HEADER in member.pax_headers
+        ] == [members[0].name]
+
+
+@mark.parametrize(
+    "members, expectation",
+    [
+        ([(TarInfo("foo-1.0.0-1"), None)], None),
+        ([(TarInfo("foo-1.0.0-1"), None), (TarInfo("foo-1.0.0-1/desc"), b"%NAME%\nfoo\n\n%BASE%\nbar\n\n")], "bar"),
+        ([(TarInfo("foo-1.0.0-1"), None), (TarInfo("foo-1.0.0-1/desc"), b"%NAME%\nfoo\n\n")], None),
+    ],
+)
+def test_syncdatabase_get_base(members: list[tuple[TarInfo, bytes | None]], expectation: str | None) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.get_base."""
+    assert syncdb.SyncDatabase.get_base(members=members) == expectation  # nosec: B101
+
+
+def test_syncdatabase_addfile(tmp_path: Path) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.addfile."""
+    pax_headers = syncdb.SyncDatabase.get_pax_headers(
+        packagedesc_version=PackageDescVersionEnum.DEFAULT,
+        files_version=FilesVersionEnum.DEFAULT,
+    )
+    with open_tarfile(path=tmp_path / "foo.db.tar", compression=CompressionTypeEnum.NONE, mode="w") as tar_file:
+        for name in ["foo-1.0.0-1", "bar-1.0.0-1"]:
+            directory = TarInfo(name)
+            directory.type = DIRTYPE
+            directory.pax_headers = dict(pax_headers)
+            syncdb.SyncDatabase.addfile(tarfile=tar_file, tarinfo=directory, data=None, pax_headers=pax_headers)
+        syncdb.SyncDatabase.addfile(
+            tarfile=tar_file, tarinfo=TarInfo("bar-1.0.0-1/desc"), data=b"", pax_headers=pax_headers
+        )
+
+    with open_tarfile(path=tmp_path / "foo.db.tar") as tar_file:
+        assert [member.pax_headers for member in tar_file.getmembers()] == [pax_headers, {}, {}]  # nosec: B101
+
+
+@mark.parametrize(
+    "name, read, buffer, expectation, remaining",
+    [
+        ("foo", [("foo", [])], {}, [], {}),
+        ("foo", [("baz", []), ("foo", [])], {}, [], {"baz": []}),
+        ("foo", [], {"foo": []}, [], {}),
+        ("foo", [("qux", []), ("baz", [])], {}, None, {"qux": []}),
+        ("foo", [("bar", [])], {}, None, {"bar": []}),
+    ],
+)
+def test_syncdatabase_take_pkgbase(
+    name: str,
+    read: list[tuple[str, list[tuple[TarInfo, bytes | None]]]],
+    buffer: dict[str, list[tuple[TarInfo, bytes | None]]],
+    expectation: list[tuple[TarInfo, bytes | None]] | None,
+    remaining: dict[str, list[tuple[TarInfo, bytes | None]]],
+) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.take_pkgbase."""
+    assert (  # nosec: B101
+        syncdb.SyncDatabase.take_pkgbase(
+            name=name,
+            pkgbases=iter(read),
+            buffer=buffer,
+            positions={"bar": 0, "baz": 1, "foo": 2, "qux": 3},
+        )
+        == expectation
+    )
+    assert buffer == remaining  # nosec: B101
+
+
+@mark.asyncio
+async def test_syncdatabase_outputpackagebases(files_sync_db_file: tuple[Path, Path]) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.outputpackagebases."""
+    outputpackagebases = [
+        (name, model)
+        async for (name, model) in syncdb.SyncDatabase(
+            database=files_sync_db_file[0],
+            desc_version=PackageDescVersionEnum.DEFAULT,
+            files_version=FilesVersionEnum.DEFAULT,
+        ).outputpackagebases()
+    ]
+    assert len(outputpackagebases) == 1  # nosec: B101
+    for (name, model) in outputpackagebases:
         assert isinstance(name, str)  # nosec: B101
         assert isinstance(model, OutputPackageBase)  # nosec: B101
+        assert len(model.packages) == 2  # type: ignore[attr-defined]  # nosec: B101
+
+
+@mark.asyncio
+async def test_syncdatabase_outputpackagebases_split_pkgbase(split_pkgbase_sync_db_file: Path) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.outputpackagebases with non-consecutive packages."""
+    outputpackagebases = [
+        (name, [package.name for package in model.packages])  # type: ignore[attr-defined]
+        async for (name, model) in syncdb.SyncDatabase(
+            database=split_pkgbase_sync_db_file,
+            desc_version=PackageDescVersionEnum.DEFAULT,
+            files_version=FilesVersionEnum.DEFAULT,
+        ).outputpackagebases()
+    ]
+    assert outputpackagebases == [("baz", ["baz"]), ("foo", ["bar", "foo"])]  # nosec: B101
+
+
+@mark.asyncio
+async def test_syncdatabase_count_packages(split_pkgbase_sync_db_file: Path) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.count_packages."""
+    assert syncdb.SyncDatabase(  # nosec: B101
+        database=split_pkgbase_sync_db_file,
+        desc_version=PackageDescVersionEnum.DEFAULT,
+        files_version=FilesVersionEnum.DEFAULT,
+    ).count_packages() == {"foo": 2, "baz": 1}
+
+
+@mark.asyncio
+async def test_syncdatabase_outputpackagebases_changed_database(split_pkgbase_sync_db_file: Path) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.outputpackagebases with packages missing from the counts."""
+    database = syncdb.SyncDatabase(
+        database=split_pkgbase_sync_db_file,
+        desc_version=PackageDescVersionEnum.DEFAULT,
+        files_version=FilesVersionEnum.DEFAULT,
+    )
+    with patch.object(syncdb.SyncDatabase, "count_packages", return_value=Counter({"foo": 3, "baz": 1})):
+        outputpackagebases = [
+            (name, [package.name for package in model.packages])  # type: ignore[attr-defined]
+            async for (name, model) in database.outputpackagebases()
+        ]
+
+    assert outputpackagebases == [("baz", ["baz"]), ("foo", ["bar", "foo"])]  # nosec: B101
+
+
+@mark.asyncio
+async def test_syncdatabase_outputpackagebases_empty(tmp_path: Path) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.outputpackagebases with an empty sync database."""
+    database = tmp_path / "test.db.tar.gz"
+    with open_tarfile(path=database, compression=CompressionTypeEnum.GZIP, mode="w"):
+        pass
+
+    assert [  # nosec: B101
+        outputpackagebase
+        async for outputpackagebase in syncdb.SyncDatabase(
+            database=database,
+            desc_version=PackageDescVersionEnum.DEFAULT,
+            files_version=FilesVersionEnum.DEFAULT,
+        ).outputpackagebases()
+    ] == []
+
+
+@mark.parametrize("with_files", [(True), (False)])
+@mark.asyncio
+async def test_syncdatabase_packages(
+    outputpackagebasev1: OutputPackageBase,
+    tmp_path: Path,
+    with_files: bool,
+) -> None:
+    """Tests for repod.repo.package.syncdb.SyncDatabase.packages."""
+    database = tmp_path / "test.db.tar.gz"
+    with open_tarfile(path=database, compression=CompressionTypeEnum.GZIP, mode="w") as tar_file:
+        await syncdb.SyncDatabase.outputpackagebase_to_tarfile(
+            tarfile=tar_file,
+            database_type=syncdb.RepoDbTypeEnum.FILES if with_files else syncdb.RepoDbTypeEnum.DEFAULT,
+            model=outputpackagebasev1,
+            packagedesc_version=PackageDescVersionEnum.DEFAULT,
+            files_version=FilesVersionEnum.DEFAULT,
+        )
+        tar_file.addfile(TarInfo("foo-1.0.0-1/foo"), StringIO(""))  # type: ignore[arg-type]
+
+    packages = [
+        (package_desc, package_files)
+        async for (package_desc, package_files) in syncdb.SyncDatabase(
+            database=database,
+            desc_version=PackageDescVersionEnum.DEFAULT,
+            files_version=FilesVersionEnum.DEFAULT,
+        ).packages()
+    ]
+    assert [package_desc.get_name() for (package_desc, _) in packages] == ["foo", "bar"]  # nosec: B101
+    for (package_desc, package_files) in packages:
+        assert isinstance(package_desc, syncdb.PackageDesc)  # nosec: B101
+        if with_files:
+            assert isinstance(package_files, syncdb.Files)  # nosec: B101
+        else:
+            assert package_files is None  # nosec: B101